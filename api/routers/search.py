@@ -176,8 +176,8 @@ async def search_complex(query: SearchQuery):
         # Try to get embedding for semantic search
         query_embedding = None
         try:
-            from embeddings import embed_text
-            query_embedding = embed_text(query.query)
+            from embedding_service import embed_query
+            query_embedding = embed_query(query.query)
         except Exception:
             pass
 
@@ -194,18 +194,19 @@ async def search_complex(query: SearchQuery):
         results = search_result.get("results", [])
         mode = search_result.get("mode", "keyword_only")
 
+        # Get full artifact data if needed (one batch for all results)
+        full_artifacts = {}
+        if state.artifact_store:
+            full_ids = [r["id"] for r in results if r.get("file_path")]
+            try:
+                loaded, _ = state.artifact_store.get_artifacts_many(full_ids)
+                full_artifacts = dict(zip(full_ids, loaded))
+            except Exception:
+                pass
+
         # Process results
         for result in results:
-            artifact = result
-
-            # Get full artifact data if needed
-            if state.artifact_store and artifact.get("file_path"):
-                try:
-                    full_artifact = state.artifact_store.get_artifact(artifact["id"])
-                    if full_artifact:
-                        artifact = full_artifact
-                except Exception:
-                    pass
+            artifact = full_artifacts.get(result["id"]) or result
 
             # Apply confidence filter
             conf = artifact.get("confidence", artifact.get("outcome", {}).get("confidence", 0.5) if isinstance(artifact.get("outcome"), dict) else 0.5)
@@ -1,6 +1,7 @@
 """Proactive Insights endpoint - surfaces actionable intelligence about memory health."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any
@@ -16,42 +17,45 @@ DECISIONS_DIR = MEMORY_DIR / "decisions"
 VALIDATIONS_DIR = MEMORY_DIR / "decision_validations"
 FACTS_DIR = MEMORY_DIR / "facts"
 
+# Artifact files are read on a small thread pool (file I/O releases the GIL)
+READ_WORKERS = 4
+PARALLEL_READ_MIN = 16
 
-def get_decision_outcome_status(decision_id: str, file_path: str | None) -> str | None:
-    """Get outcome_status from decision file or validation files."""
-    # First check decision file
-    if file_path:
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if "data" in data and data["data"].get("outcome_status"):
-                    return data["data"]["outcome_status"]
-                if data.get("outcome_status"):
-                    return data["outcome_status"]
-        except (json.JSONDecodeError, FileNotFoundError, OSError):
-            pass
-
-    # Check validation files
-    if VALIDATIONS_DIR.exists():
-        latest_time = None
-        latest_status = None
-
-        for val_file in VALIDATIONS_DIR.glob("dval_*.json"):
-            try:
-                with open(val_file, "r", encoding="utf-8") as f:
-                    val_data = json.load(f)
-                    if val_data.get("data", {}).get("decision_id") == decision_id:
-                        val_time = val_data.get("created_at", "")
-                        if latest_time is None or val_time > latest_time:
-                            latest_time = val_time
-                            latest_status = val_data.get("data", {}).get("status")
-            except (json.JSONDecodeError, OSError):
-                continue
-
-        if latest_status:
-            return latest_status
-
-    return None
+
+def get_latest_validation_statuses() -> dict[str, str]:
+    """Map decision_id -> status of its most recent validation file (one scan)."""
+    latest: dict[str, tuple[str, str]] = {}
+    if not VALIDATIONS_DIR.exists():
+        return {}
+
+    for val_data in load_artifact_files(list(VALIDATIONS_DIR.glob("dval_*.json"))):
+        if not val_data:
+            continue
+        data = val_data.get("data", {})
+        decision_id = data.get("decision_id")
+        status = data.get("status")
+        if not decision_id or not status:
+            continue
+        val_time = val_data.get("created_at", "")
+        if decision_id not in latest or val_time > latest[decision_id][0]:
+            latest[decision_id] = (val_time, status)
+
+    return {decision_id: status for decision_id, (_, status) in latest.items()}
+
+
+def get_decision_outcome_status(
+    decision_id: str,
+    content: dict | None,
+    validation_statuses: dict[str, str],
+) -> str | None:
+    """Get outcome_status from the decision file, else its latest validation."""
+    if content:
+        if "data" in content and content["data"].get("outcome_status"):
+            return content["data"]["outcome_status"]
+        if content.get("outcome_status"):
+            return content["outcome_status"]
+
+    return validation_statuses.get(decision_id)
 
 
 def calculate_age_days(created_at: str) -> int:
@@ -119,11 +123,14 @@ async def get_insights() -> dict[str, Any]:
             ORDER BY created_at ASC
         """)
 
+        rows = cursor.fetchall()
+        contents = load_artifact_files([row["file_path"] for row in rows])
+        validation_statuses = get_latest_validation_statuses()
+
         pending_decisions = []
-        for row in cursor.fetchall():
+        for row, content in zip(rows, contents):
             decision_id = row["id"]
-            file_path = row["file_path"]
-            outcome_status = get_decision_outcome_status(decision_id, file_path)
+            outcome_status = get_decision_outcome_status(decision_id, content, validation_statuses)
 
             # If no outcome_status or pending, it needs review
             if outcome_status is None or outcome_status == "pending":
@@ -161,8 +168,10 @@ async def get_insights() -> dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def load_artifact_file(file_path: str) -> dict | None:
+def load_artifact_file(file_path: str | Path | None) -> dict | None:
     """Load artifact JSON file safely."""
+    if not file_path:
+        return None
     try:
         with open(file_path, "r", encoding="utf-8") as f:
             return json.load(f)
@@ -170,6 +179,14 @@ def load_artifact_file(file_path: str) -> dict | None:
         return None
 
 
+def load_artifact_files(file_paths: list) -> list[dict | None]:
+    """Load many artifact files, in input order (None where unreadable)."""
+    if len(file_paths) < PARALLEL_READ_MIN:
+        return [load_artifact_file(path) for path in file_paths]
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        return list(pool.map(load_artifact_file, file_paths))
+
+
 def parse_iso_date(date_str: str) -> datetime | None:
     """Parse ISO date string."""
     if not date_str:
@@ -211,19 +228,18 @@ async def get_stale_knowledge(
         ORDER BY created_at ASC
     """)
 
+    # Only rows old enough to be stale need their files
+    rows = []
     for row in cursor.fetchall():
-        content = load_artifact_file(row["file_path"])
+        created_at = parse_iso_date(row["created_at"])
+        if created_at and created_at <= cutoff:
+            rows.append(row)
+    for row, content in zip(rows, load_artifact_files([row["file_path"] for row in rows])):
         if not content:
             continue
 
         data = content.get("data", {})
         created_at = parse_iso_date(row["created_at"])
-        if not created_at:
-            continue
-
-        # Skip if too recent
-        if created_at > cutoff:
-            continue
 
         # Calculate staleness
         confidence = data.get("confidence", 0.5)
@@ -279,19 +295,17 @@ async def get_stale_knowledge(
         ORDER BY created_at ASC
     """)
 
+    rows = []
     for row in cursor.fetchall():
-        content = load_artifact_file(row["file_path"])
+        created_at = parse_iso_date(row["created_at"])
+        if created_at and created_at <= cutoff:
+            rows.append(row)
+    for row, content in zip(rows, load_artifact_files([row["file_path"] for row in rows])):
         if not content:
             continue
 
         data = content.get("data", {})
         created_at = parse_iso_date(row["created_at"])
-        if not created_at:
-            continue
-
-        # Skip if too recent
-        if created_at > cutoff:
-            continue
 
         # Get validation status
         outcome_status = data.get("outcome_status")
@@ -59,121 +59,77 @@ class ActionRisk(Enum):
 
         This is the canonical entry point for action risk classification.
         Uses exact matches first, then pattern matching, then context hints.
+        The tables are compiled once (ActionPolicy) and the name-based part
+        of the result is memoized per action.
         """
-        context = context if isinstance(context, dict) else {}
-
-        # === EXACT MATCH SETS ===
-        # Ordered by specificity - check destructive first
-        DESTRUCTIVE_ACTIONS = {
-            # File operations
-            "delete_file", "remove_file", "rm", "unlink",
-            # Artifact operations
-            "delete_artifact", "duro_delete_artifact",
-            # Database
-            "drop_table", "drop_database", "truncate", "delete_row",
-            # Git destructive
-            "git_push", "git_push_force", "git_reset_hard", "force_push",
-            # Deploy/Prod
-            "deploy", "deploy_prod", "deploy_production",
-            # Bash (inherently risky)
-            "bash_command", "shell_exec", "run_command",
-        }
-
-        SAFE_WRITE_ACTIONS = {
-            # File editing
-            "edit_file", "write_file", "create_file", "patch_file",
-            # Artifact storage
-            "store_fact", "store_decision", "store_incident",
-            "store_change", "store_checklist", "store_design_ref",
-            "save_memory", "save_learning", "log_task", "log_failure",
-            # Code generation
-            "scaffold", "generate_code", "refactor",
-            # Git safe
-            "git_commit", "git_add", "git_checkout",
-        }
-
-        PLAN_ACTIONS = {
-            "plan", "propose", "draft", "estimate", "compare",
-            "adversarial_planning", "suggest", "design", "architect",
-            "review", "analyze_approach",
-        }
-
-        READ_ACTIONS = {
-            "read_file", "glob_files", "grep", "search", "query",
-            "get_artifact", "list_artifacts", "batch_get",
-            "get_screenshot", "read_webpage", "web_search",
-            "duro_query_memory", "duro_semantic_search", "duro_get_artifact",
-        }
-
-        action_lower = action.lower().strip()
-
-        # Exact match (highest priority)
-        if action_lower in DESTRUCTIVE_ACTIONS:
-            return cls.DESTRUCTIVE
-        if action_lower in SAFE_WRITE_ACTIONS:
-            return cls.SAFE_WRITE
-        if action_lower in PLAN_ACTIONS:
-            return cls.PLAN
-        if action_lower in READ_ACTIONS:
-            return cls.READ
-
-        # === PATTERN MATCHING (more precise than "in") ===
-        # Destructive patterns - action must START with or END with these
-        destructive_prefixes = ("delete_", "remove_", "drop_", "destroy_", "force_")
-        destructive_suffixes = ("_delete", "_remove", "_drop", "_destroy", "_force")
-        if any(action_lower.startswith(p) for p in destructive_prefixes):
-            return cls.DESTRUCTIVE
-        if any(action_lower.endswith(s) for s in destructive_suffixes):
-            return cls.DESTRUCTIVE
-
-        # Safe write patterns
-        safe_prefixes = ("edit_", "write_", "update_", "store_", "save_", "create_")
-        safe_suffixes = ("_edit", "_write", "_update", "_store", "_save", "_create")
-        if any(action_lower.startswith(p) for p in safe_prefixes):
-            return cls.SAFE_WRITE
-        if any(action_lower.endswith(s) for s in safe_suffixes):
-            return cls.SAFE_WRITE
-
-        # Plan patterns
-        plan_prefixes = ("plan_", "propose_", "draft_", "design_")
-        plan_suffixes = ("_plan", "_proposal", "_draft")
-        if any(action_lower.startswith(p) for p in plan_prefixes):
-            return cls.PLAN
-        if any(action_lower.endswith(s) for s in plan_suffixes):
-            return cls.PLAN
-
-        # Read patterns
-        read_prefixes = ("read_", "get_", "fetch_", "query_", "list_", "search_")
-        read_suffixes = ("_read", "_get", "_fetch", "_query", "_list", "_search")
-        if any(action_lower.startswith(p) for p in read_prefixes):
-            return cls.READ
-        if any(action_lower.endswith(s) for s in read_suffixes):
-            return cls.READ
-
-        # === ARGS_HINT DESTRUCTIVE KEYWORDS ===
-        # Check for destructive patterns in args_hint (e.g., "bash_command:rm -rf")
-        if ":" in action_lower:
-            _, args_part = action_lower.split(":", 1)
-            destructive_args_keywords = (
-                "rm -rf", "rm -r", "rmdir", "del /s", "rd /s",  # File deletion
-                "drop ", "truncate ", "delete from",            # Database
-                "git push -f", "git push --force",              # Git force push
-                "git reset --hard",                             # Git destructive
-                "--force", "-f ",                               # Generic force flags
-            )
-            if any(keyword in args_part for keyword in destructive_args_keywords):
-                return cls.DESTRUCTIVE
-
-        # === CONTEXT HINTS (override patterns) ===
-        if context.get("is_destructive"):
-            return cls.DESTRUCTIVE
-        if context.get("affects_production") and not context.get("is_reversible", True):
-            return cls.CRITICAL
-        if context.get("affects_production"):
-            return cls.DESTRUCTIVE
-
-        # Default to safe write for unknown (conservative)
-        return cls.SAFE_WRITE
+        return get_action_policy().classify_risk(action, context)
+
+
+# === ACTION CLASSIFICATION TABLES ===
+# Exact match sets, ordered by specificity - destructive is checked first
+
+DESTRUCTIVE_ACTIONS = frozenset({
+    # File operations
+    "delete_file", "remove_file", "rm", "unlink",
+    # Artifact operations
+    "delete_artifact", "duro_delete_artifact",
+    # Database
+    "drop_table", "drop_database", "truncate", "delete_row",
+    # Git destructive
+    "git_push", "git_push_force", "git_reset_hard", "force_push",
+    # Deploy/Prod
+    "deploy", "deploy_prod", "deploy_production",
+    # Bash (inherently risky)
+    "bash_command", "shell_exec", "run_command",
+})
+
+SAFE_WRITE_ACTIONS = frozenset({
+    # File editing
+    "edit_file", "write_file", "create_file", "patch_file",
+    # Artifact storage
+    "store_fact", "store_decision", "store_incident",
+    "store_change", "store_checklist", "store_design_ref",
+    "save_memory", "save_learning", "log_task", "log_failure",
+    # Code generation
+    "scaffold", "generate_code", "refactor",
+    # Git safe
+    "git_commit", "git_add", "git_checkout",
+})
+
+PLAN_ACTIONS = frozenset({
+    "plan", "propose", "draft", "estimate", "compare",
+    "adversarial_planning", "suggest", "design", "architect",
+    "review", "analyze_approach",
+})
+
+READ_ACTIONS = frozenset({
+    "read_file", "glob_files", "grep", "search", "query",
+    "get_artifact", "list_artifacts", "batch_get",
+    "get_screenshot", "read_webpage", "web_search",
+    "duro_query_memory", "duro_semantic_search", "duro_get_artifact",
+})
+
+# Pattern matching (more precise than "in"): action must START or END with these.
+# (risk, prefixes, suffixes), checked in order
+ACTION_RISK_PATTERNS = (
+    ("risk", ("delete_", "remove_", "drop_", "destroy_", "force_"),
+             ("_delete", "_remove", "_drop", "_destroy", "_force")),
+    ("safe", ("edit_", "write_", "update_", "store_", "save_", "create_"),
+             ("_edit", "_write", "_update", "_store", "_save", "_create")),
+    ("plan", ("plan_", "propose_", "draft_", "design_"),
+             ("_plan", "_proposal", "_draft")),
+    ("read", ("read_", "get_", "fetch_", "query_", "list_", "search_"),
+             ("_read", "_get", "_fetch", "_query", "_list", "_search")),
+)
+
+# Destructive keywords in an args hint (e.g., "bash_command:rm -rf")
+DESTRUCTIVE_ARGS_KEYWORDS = (
+    "rm -rf", "rm -r", "rmdir", "del /s", "rd /s",  # File deletion
+    "drop ", "truncate ", "delete from",            # Database
+    "git push -f", "git push --force",              # Git force push
+    "git reset --hard",                             # Git destructive
+    "--force", "-f ",                               # Generic force flags
+)
 
 
 # Capability mapping: what each level can do
@@ -842,12 +798,7 @@ def classify_action_domain(action: str) -> str:
     Handles both raw action names (e.g., 'delete_artifact') and
     MCP tool names (e.g., 'duro_delete_artifact') by stripping the 'duro_' prefix.
     """
-    # Normalize: strip 'duro_' prefix if present
-    normalized = action
-    if action.startswith("duro_"):
-        normalized = action[5:]  # len("duro_") == 5
-
-    return ACTION_DOMAINS.get(normalized, "general")
+    return get_action_policy().classify_domain(action)
 
 
 def classify_action_risk(action: str, context: Dict[str, Any] = None) -> ActionRisk:
@@ -865,6 +816,120 @@ def classify_action_risk(action: str, context: Dict[str, Any] = None) -> ActionR
     return ActionRisk.from_action(action, context)
 
 
+
+# === COMPILED ACTION POLICY ===
+
+class ActionPolicy:
+    """
+    Action classification tables compiled once, with per-action memoization.
+
+    policy_gate() and check_action() both classify every tool call; the
+    tables used to be rebuilt on each from_action() call. The name-based
+    result (exact sets, prefix/suffix patterns, args-hint keywords) and
+    the domain only depend on the action string, so they are cached per
+    action. Context hints only apply when the name matched nothing, so
+    the argument shape that matters is just is_destructive /
+    affects_production / is_reversible, checked after the cached lookup.
+
+    Call reload_action_policy() after changing the tables at runtime.
+    """
+
+    MAX_CACHED_ACTIONS = 4096  # Args hints ("bash_command:...") make names unbounded
+
+    def __init__(self):
+        # Earlier sets win, as in the original if-chain
+        self.exact: Dict[str, ActionRisk] = {}
+        for actions, risk in [
+            (READ_ACTIONS, ActionRisk.READ),
+            (PLAN_ACTIONS, ActionRisk.PLAN),
+            (SAFE_WRITE_ACTIONS, ActionRisk.SAFE_WRITE),
+            (DESTRUCTIVE_ACTIONS, ActionRisk.DESTRUCTIVE),
+        ]:
+            self.exact.update(dict.fromkeys(actions, risk))
+        self.patterns = tuple(
+            (ActionRisk(risk), prefixes, suffixes) for risk, prefixes, suffixes in ACTION_RISK_PATTERNS
+        )
+        self.domains = dict(ACTION_DOMAINS)
+        self._entries: Dict[str, Tuple[Optional[ActionRisk], str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _name_risk(self, action_lower: str) -> Optional[ActionRisk]:
+        """Risk from the action string alone (None = fall through to context hints)."""
+        risk = self.exact.get(action_lower)
+        if risk is not None:
+            return risk
+
+        for risk, prefixes, suffixes in self.patterns:
+            if action_lower.startswith(prefixes) or action_lower.endswith(suffixes):
+                return risk
+
+        if ":" in action_lower:
+            _, args_part = action_lower.split(":", 1)
+            if any(keyword in args_part for keyword in DESTRUCTIVE_ARGS_KEYWORDS):
+                return ActionRisk.DESTRUCTIVE
+
+        return None
+
+    def _entry(self, action: str) -> Tuple[Optional[ActionRisk], str]:
+        entry = self._entries.get(action)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        normalized = action[5:] if action.startswith("duro_") else action  # len("duro_") == 5
+        entry = (self._name_risk(action.lower().strip()), self.domains.get(normalized, "general"))
+        if len(self._entries) >= self.MAX_CACHED_ACTIONS:
+            self._entries.clear()
+        self._entries[action] = entry
+        return entry
+
+    def classify_risk(self, action: str, context: Dict[str, Any] = None) -> ActionRisk:
+        """Same result as the uncompiled from_action() matching."""
+        risk = self._entry(action)[0]
+        if risk is not None:
+            return risk
+
+        # === CONTEXT HINTS ===
+        context = context if isinstance(context, dict) else {}
+        if context.get("is_destructive"):
+            return ActionRisk.DESTRUCTIVE
+        if context.get("affects_production") and not context.get("is_reversible", True):
+            return ActionRisk.CRITICAL
+        if context.get("affects_production"):
+            return ActionRisk.DESTRUCTIVE
+
+        # Default to safe write for unknown (conservative)
+        return ActionRisk.SAFE_WRITE
+
+    def classify_domain(self, action: str) -> str:
+        return self._entry(action)[1]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"cached_actions": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_action_policy: Optional[ActionPolicy] = None
+
+
+def get_action_policy() -> ActionPolicy:
+    """Get or build the global compiled action policy."""
+    global _action_policy
+
+    if _action_policy is None:
+        _action_policy = ActionPolicy()
+
+    return _action_policy
+
+
+def reload_action_policy() -> ActionPolicy:
+    """Recompile the classification tables (e.g., after editing ACTION_DOMAINS)."""
+    global _action_policy
+    _action_policy = ActionPolicy()
+    return _action_policy
+
+
 # === INTEGRATION WITH VALIDATION HISTORY ===
 
 def compute_scores_from_history(
@@ -9,18 +9,27 @@ Token budget model:
 - Project Constitution: 1-3K tokens (project-specific laws)
 - Task Pack: 2-8K tokens (dynamic, task-specific)
 - Deep Archive: On-demand retrieval
+
+Skills are read through a process-wide SkillCatalog that parses each YAML
+file once (re-parsed when its mtime changes) and compiles every trigger
+phrase into one automaton, so scoring a task is a single pass over the
+task text instead of a YAML load and substring scan per skill.
 """
 
 import json
 import re
+import threading
+import time
 import yaml
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 # Sibling imports
 from constitution_loader import load_constitution, render_constitution, list_constitutions
+from rule_retriever import KeywordAutomaton
 
 def _resolve_dir(name: str) -> Path:
     """Resolve data directory: project-local first, then ~/.agent/."""
@@ -62,6 +71,7 @@ class AssemblyDebug:
     skills_selected: int
     skill_candidates: List[Dict[str, Any]]  # Top 10 candidates with scores
     domain_hints: List[str]  # Keywords detected from task
+    timings_ms: Dict[str, float] = field(default_factory=dict)  # Per-phase assembly time
 
 @dataclass
 class ContextPack:
@@ -108,40 +118,243 @@ def load_skills_from_index() -> Dict[str, Dict[str, Any]]:
         if not skill_id:
             continue
 
-        # Start with index metadata
-        skill = {
-            "id": skill_id,
-            "name": skill_meta.get("name", ""),
-            "description": skill_meta.get("description", ""),
-            "keywords": skill_meta.get("keywords", []),
-            "tier": skill_meta.get("tier", "unknown"),
-            "path": skill_meta.get("path", ""),
-        }
-
-        # For YAML files, try to load triggers
+        yaml_data = None
         skill_path = skill_meta.get("path", "")
         if skill_path.endswith(".yaml"):
-            full_path = SKILLS_DIR / skill_path
-            if full_path.exists():
-                try:
-                    with open(full_path, 'r', encoding='utf-8') as f:
-                        yaml_data = yaml.safe_load(f)
-                    if yaml_data:
-                        # Merge in triggers and renderings from YAML
-                        if "triggers" in yaml_data:
-                            skill["triggers"] = yaml_data["triggers"]
-                        if "renderings" in yaml_data:
-                            skill["renderings"] = yaml_data["renderings"]
-                        if "description" in yaml_data and isinstance(yaml_data["description"], dict):
-                            skill["description"] = yaml_data["description"]
-                except Exception:
-                    pass  # Use index metadata only
-
-        skills[skill_id] = skill
+            yaml_data = _read_skill_yaml(SKILLS_DIR / skill_path)
+
+        skills[skill_id] = _build_skill(skill_id, skill_meta, yaml_data)
 
     return skills
 
 
+def _read_skill_yaml(full_path: Path) -> Optional[Any]:
+    """Parse a YAML skill file, None if missing or unreadable."""
+    if not full_path.exists():
+        return None
+    try:
+        with open(full_path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f)
+    except Exception:
+        return None  # Use index metadata only
+
+
+def _build_skill(skill_id: str, skill_meta: Dict[str, Any], yaml_data: Optional[Any]) -> Dict[str, Any]:
+    """Skill dict from index metadata, with triggers/renderings merged from YAML."""
+    # Start with index metadata
+    skill = {
+        "id": skill_id,
+        "name": skill_meta.get("name", ""),
+        "description": skill_meta.get("description", ""),
+        "keywords": skill_meta.get("keywords", []),
+        "tier": skill_meta.get("tier", "unknown"),
+        "path": skill_meta.get("path", ""),
+    }
+
+    if isinstance(yaml_data, dict):
+        # Merge in triggers and renderings from YAML
+        if "triggers" in yaml_data:
+            skill["triggers"] = yaml_data["triggers"]
+        if "renderings" in yaml_data:
+            skill["renderings"] = yaml_data["renderings"]
+        if "description" in yaml_data and isinstance(yaml_data["description"], dict):
+            skill["description"] = yaml_data["description"]
+
+    return skill
+
+
+def _skill_trigger_phrases(skill: Dict[str, Any]) -> Tuple[List[str], List[str], List[str]]:
+    """Lowercased (intents, soft keywords, legacy keywords), as score_skill_for_task reads them."""
+    triggers = skill.get("triggers", {})
+    if not isinstance(triggers, dict):
+        triggers = {}
+    hard_triggers = triggers.get("hard", {})
+    if not isinstance(hard_triggers, dict):
+        hard_triggers = {}
+    soft_triggers = triggers.get("soft", {})
+    if not isinstance(soft_triggers, dict):
+        soft_triggers = {}
+
+    intents = [i.lower() for i in hard_triggers.get("intents", []) or []]
+    soft = [k.lower() for k in soft_triggers.get("keywords", []) or []]
+    legacy = [k.lower() for k in skill.get("keywords", []) or []]
+    return intents, soft, legacy
+
+
+class SkillCatalog:
+    """
+    Process-wide cache of the skill index, parsed YAML skills and stats.
+
+    index.json, stats.json and each YAML skill file are re-read only when
+    their mtime/size change. Trigger phrases of all skills are compiled into
+    one KeywordAutomaton with phrase -> skill postings, so score_all() finds
+    the phrases present in a task in one pass and only touches skills that
+    share a phrase with it. Scores equal score_skill_for_task's.
+
+    Skill dicts are shared between callers; treat them as read-only.
+    """
+
+    INTENT_SCORE = 10.0
+    SOFT_KEYWORD_SCORE = 2.0
+    LEGACY_KEYWORD_SCORE = 1.5
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index_key = None
+        self._index_entries: List[Dict[str, Any]] = []
+        self._yaml: Dict[str, Tuple[Any, Any]] = {}  # path -> (signature, parsed)
+        self._stats_key = None
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._skills: Dict[str, Dict[str, Any]] = {}
+        self._automaton: Optional[KeywordAutomaton] = None
+        self._postings: Dict[str, List[Tuple[str, str]]] = {}
+        self.yaml_parses = 0
+        self.rebuilds = 0
+
+    @staticmethod
+    def _signature(path: Path):
+        try:
+            st = path.stat()
+            return (str(path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            return (str(path), None, None)
+
+    def refresh(self) -> bool:
+        """Re-read whatever changed on disk. Returns True if skills were rebuilt."""
+        with self._lock:
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> bool:
+        changed = False
+
+        index_key = self._signature(INDEX_FILE)
+        if index_key != self._index_key:
+            entries = []
+            if index_key[1] is not None:
+                with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+                    entries = json.load(f).get("skills", [])
+            self._index_entries = entries
+            self._index_key = index_key
+            changed = True
+
+        yaml_cache = {}
+        for skill_meta in self._index_entries:
+            skill_path = skill_meta.get("path", "")
+            if not skill_meta.get("id") or not skill_path.endswith(".yaml"):
+                continue
+            full_path = SKILLS_DIR / skill_path
+            sig = self._signature(full_path)
+            cached = self._yaml.get(str(full_path))
+            if cached is not None and cached[0] == sig:
+                yaml_cache[str(full_path)] = cached
+                continue
+            yaml_cache[str(full_path)] = (sig, _read_skill_yaml(full_path))
+            self.yaml_parses += 1
+            changed = True
+        if len(yaml_cache) != len(self._yaml):
+            changed = True
+        self._yaml = yaml_cache
+
+        if changed or self._automaton is None:
+            self._rebuild_locked()
+        return changed
+
+    def _rebuild_locked(self):
+        skills = {}
+        for skill_meta in self._index_entries:
+            skill_id = skill_meta.get("id")
+            if not skill_id:
+                continue
+            yaml_data = None
+            skill_path = skill_meta.get("path", "")
+            if skill_path.endswith(".yaml"):
+                yaml_data = self._yaml[str(SKILLS_DIR / skill_path)][1]
+            skills[skill_id] = _build_skill(skill_id, skill_meta, yaml_data)
+
+        postings: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        for skill_id, skill in skills.items():
+            intents, soft, legacy = _skill_trigger_phrases(skill)
+            for phrase in dict.fromkeys(intents):
+                postings[phrase].append((skill_id, "intent"))
+            # Repeated keywords score once per listing, as in score_skill_for_task
+            for phrase in soft:
+                postings[phrase].append((skill_id, "soft"))
+            for phrase in legacy:
+                postings[phrase].append((skill_id, "legacy"))
+
+        self._skills = skills
+        self._postings = dict(postings)
+        self._automaton = KeywordAutomaton(self._postings)
+        self.rebuilds += 1
+
+    def skills(self) -> Dict[str, Dict[str, Any]]:
+        """skill_id -> skill, as load_skills_from_index() returns."""
+        with self._lock:
+            self._refresh_locked()
+            return self._skills
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Skill stats, as load_skill_stats() returns."""
+        with self._lock:
+            stats_key = self._signature(STATS_FILE)
+            if stats_key != self._stats_key:
+                self._stats = load_skill_stats()
+                self._stats_key = stats_key
+            return self._stats
+
+    def score_all(
+        self,
+        task_description: str,
+        stats: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Tuple[Dict[str, Any], float]]:
+        """
+        Score every skill for a task.
+
+        Returns:
+            skill_id -> (skill, score) in index order; unmatched skills score 0.0
+        """
+        if stats is None:
+            stats = self.stats()
+        with self._lock:
+            self._refresh_locked()
+            skills, automaton, postings = self._skills, self._automaton, self._postings
+
+        base: Dict[str, float] = defaultdict(float)
+        intent_hits = set()
+        for phrase in automaton.find(task_description.lower()):
+            for skill_id, kind in postings[phrase]:
+                if kind == "intent":
+                    intent_hits.add(skill_id)
+                elif kind == "soft":
+                    base[skill_id] += self.SOFT_KEYWORD_SCORE
+                else:
+                    base[skill_id] += self.LEGACY_KEYWORD_SCORE
+        for skill_id in intent_hits:
+            base[skill_id] += self.INTENT_SCORE
+
+        scored = {}
+        for skill_id, skill in skills.items():
+            base_score = base.get(skill_id, 0.0)
+            if base_score == 0:
+                scored[skill_id] = (skill, 0.0)
+                continue
+            scored[skill_id] = (skill, base_score * (1 + _stats_multiplier(skill_id, stats)))
+        return scored
+
+
+_catalog: Optional[SkillCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_skill_catalog() -> SkillCatalog:
+    """Get the process-wide SkillCatalog."""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = SkillCatalog()
+        return _catalog
+
+
 def load_skill(skill_path: Path) -> Optional[Dict[str, Any]]:
     """Load a skill definition from YAML file."""
     if not skill_path.exists():
@@ -220,16 +433,18 @@ def score_skill_for_task(skill: Dict[str, Any], task_description: str, stats: Di
         return 0.0
 
     # === PHASE 2: Stats multiplier (amplify, don't create) ===
+    return base_score * (1 + _stats_multiplier(skill.get("id", ""), stats))
+
+
+def _stats_multiplier(skill_id: str, stats: Dict[str, Any]) -> float:
     stats_mult = 0.0
-    skill_id = skill.get("id", "")
     if skill_id in stats:
         s = stats[skill_id]
         # Success rate contribution (0-0.3)
         stats_mult += s.get("success_rate", 0.5) * 0.3
         # Confidence contribution (0-0.2)
         stats_mult += s.get("confidence", 0.5) * 0.2
-
-    return base_score * (1 + stats_mult)
+    return stats_mult
 
 
 # Domain detection keywords
@@ -285,7 +500,8 @@ def detect_task_domains(task_description: str) -> List[Tuple[str, int]]:
 def select_skills_for_task(
     task_description: str,
     budget_tokens: int = 30000,
-    mode: RenderMode = RenderMode.COMPACT
+    mode: RenderMode = RenderMode.COMPACT,
+    scored_skills: Optional[Dict[str, Tuple[Dict[str, Any], float]]] = None
 ) -> List[Tuple[Dict[str, Any], str, float, str]]:
     """
     Select and rank skills for a task within token budget.
@@ -294,17 +510,17 @@ def select_skills_for_task(
     1. Anchor match (strict) - skills with base_score > 0
     2. Domain expansion - pull foundational skills if domain detected + anchors exist
 
+    Args:
+        scored_skills: Precomputed SkillCatalog.score_all() result for this task
+
     Returns: List of (skill, rendered_content, score, reason) tuples.
     """
-    stats = load_skill_stats()
     task_domains = detect_task_domains(task_description)  # Now returns [(domain, hits), ...]
 
-    # Load all skills from index.json (canonical source - includes YAML and Python skills)
-    all_skills = {}  # id -> (skill, score)
-    indexed_skills = load_skills_from_index()
-    for skill_id, skill in indexed_skills.items():
-        score = score_skill_for_task(skill, task_description, stats)
-        all_skills[skill_id] = (skill, score)
+    # All skills from index.json (canonical source - includes YAML and Python skills)
+    all_skills = scored_skills  # id -> (skill, score)
+    if all_skills is None:
+        all_skills = get_skill_catalog().score_all(task_description)
 
     # === STAGE 1: Anchor match (strict) ===
     anchors = []
@@ -459,6 +675,14 @@ def assemble_context(
     Returns:
         ContextPack with assembled context ready for injection
     """
+    started = time.perf_counter()
+    timings_ms = {}
+
+    def lap(phase: str, since: float) -> float:
+        now = time.perf_counter()
+        timings_ms[phase] = round((now - since) * 1000, 3)
+        return now
+
     if budget is None:
         budget = TokenBudget()
 
@@ -478,6 +702,7 @@ def assemble_context(
     domain_hints = [kw for kw in domain_keywords if kw in task_lower]
 
     # 1. Load Project Constitution
+    phase_start = time.perf_counter()
     constitution_text = None
     constitution_reason = "no project detected"
     project_id, detection_method = detect_project_from_path(working_dir)
@@ -492,6 +717,7 @@ def assemble_context(
             constitution_reason = f"project {project_id} detected but constitution not found"
     else:
         constitution_reason = "no project detected from path"
+    phase_start = lap("constitution", phase_start)
 
     # 2. Select Skills - with debug tracking
     available_skill_budget = budget.skills
@@ -500,12 +726,14 @@ def assemble_context(
         available_skill_budget = max(10000, budget.skills - overflow)
 
     # Count total skills scanned (from index.json - canonical source)
-    stats = load_skill_stats()
-    indexed_skills = load_skills_from_index()
+    catalog = get_skill_catalog()
+    catalog.refresh()
+    phase_start = lap("skill_catalog", phase_start)
+
+    scored_skills = catalog.score_all(task_description)
     all_skills = []
-    skills_scanned = len(indexed_skills)
-    for skill_id, skill in indexed_skills.items():
-        score = score_skill_for_task(skill, task_description, stats)
+    skills_scanned = len(scored_skills)
+    for skill_id, (skill, score) in scored_skills.items():
         all_skills.append({
             "id": skill_id,
             "name": skill.get("name"),
@@ -518,10 +746,13 @@ def assemble_context(
     skill_candidates = all_skills[:10]
     skills_matched = sum(1 for s in all_skills if s["matched"])
 
+    phase_start = lap("skill_scoring", phase_start)
+
     selected_skills = select_skills_for_task(
         task_description,
         budget_tokens=available_skill_budget,
-        mode=skill_mode
+        mode=skill_mode,
+        scored_skills=scored_skills
     )
 
     skills_data = []
@@ -539,6 +770,8 @@ def assemble_context(
     task_context = None
 
     total_tokens = sum(budget_used.values())
+    lap("skill_selection", phase_start)
+    lap("total", started)
 
     # Build debug info
     debug = AssemblyDebug(
@@ -551,7 +784,8 @@ def assemble_context(
         skills_matched=skills_matched,
         skills_selected=len(skills_data),
         skill_candidates=skill_candidates,
-        domain_hints=domain_hints
+        domain_hints=domain_hints,
+        timings_ms=timings_ms
     )
 
     return ContextPack(
@@ -2,12 +2,19 @@
 Rule Retriever - Match rules to current task context.
 
 Enhanced keyword matching with scoring and priority handling.
+
+Rules are compiled once into an in-memory index (token -> rules inverted
+index plus an Aho-Corasick automaton over keyword phrases) and rebuilt
+only when index.json changes, so matching cost scales with the task
+description rather than rules x keywords.
 """
 
 import json
 import re
+import threading
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple
 from dataclasses import dataclass
 
 
@@ -46,6 +53,153 @@ def load_rules_index() -> dict:
         return json.load(f)
 
 
+def list_index_rules(index: dict) -> List[dict]:
+    """Rules from either index format ("rules", or "active_rules" + "soft_rules")."""
+    if "rules" in index:
+        return index["rules"]
+    return index.get("active_rules", []) + index.get("soft_rules", [])
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton: finds every pattern that occurs in a text
+    (overlapping and nested included) in one pass over the text.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        patterns = list(patterns)
+        self.patterns = list(dict.fromkeys(p for p in patterns if p))
+        self._matches_empty = "" in patterns
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(pattern_id)
+
+        # Breadth-first failure links (depth-1 states fail to the root);
+        # outputs inherit their failure state's
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> Set[str]:
+        """All patterns that occur in text."""
+        found: Set[int] = set()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        result = {self.patterns[i] for i in found}
+        if self._matches_empty:
+            result.add("")
+        return result
+
+
+class CompiledRuleIndex:
+    """
+    Rules compiled for matching against task descriptions.
+
+    A keyword matches a task when its lowercased text occurs in the
+    space-joined task tokens (automaton) or when it shares a token with the
+    task (inverted index), the same test calculate_match_score applies.
+    """
+
+    def __init__(self, rules: List[dict]):
+        self.rules = rules
+        self.keywords: List[List[str]] = [list(r.get("trigger_keywords", []) or []) for r in rules]
+        self._by_phrase: Dict[str, List[Tuple[int, int]]] = {}
+        self._by_token: Dict[str, List[Tuple[int, int]]] = {}
+        self._by_name_token: Dict[str, Set[int]] = {}
+
+        for rule_idx, keywords in enumerate(self.keywords):
+            for kw_idx, keyword in enumerate(keywords):
+                keyword_lower = keyword.lower()
+                self._by_phrase.setdefault(keyword_lower, []).append((rule_idx, kw_idx))
+                for token in set(tokenize(keyword_lower)):
+                    self._by_token.setdefault(token, []).append((rule_idx, kw_idx))
+            for token in tokenize(rules[rule_idx].get("name", "")):
+                self._by_name_token.setdefault(token, set()).add(rule_idx)
+
+        self._automaton = KeywordAutomaton(self._by_phrase)
+
+    def match(self, task_tokens: List[str]) -> Dict[int, Tuple[Set[int], bool]]:
+        """
+        Rules with any keyword or name hit.
+
+        Returns:
+            {rule_idx: (matched keyword indexes, name matched)}
+        """
+        hits: Dict[int, Tuple[Set[int], bool]] = {}
+
+        def keyword_hit(rule_idx: int, kw_idx: int):
+            hits.setdefault(rule_idx, (set(), False))[0].add(kw_idx)
+
+        for phrase in self._automaton.find(' '.join(task_tokens)):
+            for rule_idx, kw_idx in self._by_phrase[phrase]:
+                keyword_hit(rule_idx, kw_idx)
+        task_set = set(task_tokens)
+        for token in task_set:
+            for rule_idx, kw_idx in self._by_token.get(token, ()):
+                keyword_hit(rule_idx, kw_idx)
+            for rule_idx in self._by_name_token.get(token, ()):
+                hits[rule_idx] = (hits.get(rule_idx, (set(), False))[0], True)
+        return hits
+
+
+_compiled_lock = threading.Lock()
+_compiled: Dict[str, Tuple[Optional[Tuple[int, int]], CompiledRuleIndex]] = {}
+
+
+def get_compiled_index(index_file: Optional[Path] = None) -> CompiledRuleIndex:
+    """
+    The compiled index for a rules index file, rebuilt when its mtime/size change.
+    """
+    index_file = Path(index_file or INDEX_FILE)
+    try:
+        st = index_file.stat()
+        signature = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        signature = None
+
+    key = str(index_file)
+    with _compiled_lock:
+        cached = _compiled.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+    rules: List[dict] = []
+    if signature is not None:
+        with open(index_file, 'r', encoding='utf-8') as f:
+            rules = list_index_rules(json.load(f))
+    compiled = CompiledRuleIndex(rules)
+
+    with _compiled_lock:
+        _compiled[key] = (signature, compiled)
+    return compiled
+
+
 def load_rule_content(rule_entry: dict) -> Optional[dict]:
     """Load the full rule content from its file."""
     file_path = RULES_DIR / rule_entry.get("file", "")
@@ -91,14 +245,18 @@ def calculate_match_score(task_tokens: List[str], rule_keywords: List[str]) -> t
     if not matched:
         return 0.0, []
 
+    return _keyword_score(len(matched), len(rule_keywords)), matched
+
+
+def _keyword_score(matched_count: int, keyword_count: int) -> float:
     # Score based on proportion of keywords matched
-    score = len(matched) / len(rule_keywords)
+    score = matched_count / keyword_count
 
     # Bonus for matching multiple keywords
-    if len(matched) >= 3:
+    if matched_count >= 3:
         score = min(1.0, score * 1.2)
 
-    return round(score, 3), matched
+    return round(score, 3)
 
 
 def retrieve_rules(
@@ -121,25 +279,29 @@ def retrieve_rules(
     Returns:
         List of matched rules, sorted by priority then score
     """
-    index = load_rules_index()
-    rules = index.get("rules", [])
-
+    compiled = get_compiled_index()
     task_tokens = tokenize(task_description)
-    task_text = task_description.lower()
+    hits = compiled.match(task_tokens)
+
+    # A rule with no hit scores 0, so it can only qualify when min_score <= 0
+    candidates = range(len(compiled.rules)) if min_score <= 0 else sorted(hits)
 
     matches = []
 
-    for rule in rules:
+    for rule_idx in candidates:
+        rule = compiled.rules[rule_idx]
+
         # Type filter
         if rule_type and rule.get("type") != rule_type:
             continue
 
-        keywords = rule.get("trigger_keywords", [])
-        score, matched_kw = calculate_match_score(task_tokens, keywords)
+        keywords = compiled.keywords[rule_idx]
+        kw_hits, name_hit = hits.get(rule_idx, ((), False))
+        matched_kw = [keywords[i] for i in sorted(kw_hits)]
+        score = _keyword_score(len(matched_kw), len(keywords)) if matched_kw else 0.0
 
         # Also check rule name
-        name_tokens = tokenize(rule.get("name", ""))
-        if any(t in task_tokens for t in name_tokens):
+        if name_hit:
             score = min(1.0, score + 0.2)
             matched_kw.append(f"[name:{rule.get('name')}]")
 
@@ -1297,44 +1297,229 @@ class RuleEngine:
     def run_rules(
         self,
         rules: List[RuleSpec],
-        files: List[Path]
+        files: List[Path],
+        workers: Optional[int] = None
     ) -> List[CheckResult]:
-        """Run multiple rules against multiple files."""
-        results = []
+        """
+        Run multiple rules against multiple files.
 
-        for rule in rules:
-            rule_findings = []
-            rule_start = time.time()
-
-            for file_path in files:
-                # Check scope
-                rel_path = str(file_path)
-                in_scope = any(
-                    fnmatch.fnmatch(rel_path, pattern)
-                    for pattern in rule.scope
+        Files are the outer loop: each file is read and split once and all
+        in-scope rules are evaluated against it in one pass (see
+        _scan_file). Large file sets are spread over a process pool.
+
+        Each file gets a time budget (the largest timeout_ms of its rules).
+        Rules that do not finish on a file within it are reported in the
+        rule's CheckResult.error.
+        """
+        rule_start = time.time()
+        results: List[Optional[CheckResult]] = [None] * len(rules)
+
+        # Compile up front so a bad pattern fails once, not once per file
+        runnable = []
+        for idx, rule in enumerate(rules):
+            try:
+                self._get_pattern(rule)
+                runnable.append(idx)
+            except re.error as e:
+                results[idx] = CheckResult(
+                    name=rule.name,
+                    success=False,
+                    duration_ms=0.0,
+                    error=f"Invalid regex pattern: {e}"
                 )
-                if not in_scope:
-                    continue
 
-                # Check file size
-                if not self.runner.check_file_size(file_path):
-                    continue
+        # Scope per file (rules sharing a scope are checked once)
+        jobs = []
+        scope_cache: Dict[Tuple[str, ...], bool] = {}
+        for file_path in files:
+            rel_path = str(file_path)
+            scope_cache.clear()
+            in_scope = []
+            for idx in runnable:
+                scope = tuple(rules[idx].scope)
+                if scope not in scope_cache:
+                    scope_cache[scope] = any(fnmatch.fnmatch(rel_path, pattern) for pattern in scope)
+                if scope_cache[scope]:
+                    in_scope.append(idx)
+            if not in_scope:
+                continue
 
-                # Read and check
-                content = self.runner.safe_read_file(file_path)
-                if content:
-                    result = self.run_rule(rule, file_path, content)
-                    rule_findings.extend(result.findings)
+            # Check file size
+            if not self.runner.check_file_size(file_path):
+                continue
 
-            results.append(CheckResult(
+            path = self.runner.path_validator.validate(file_path)
+            budget_ms = max(rules[idx].timeout_ms for idx in in_scope)
+            jobs.append((str(file_path), str(path), [rules[idx] for idx in in_scope], budget_ms, in_scope))
+
+        scans = self._scan_files(jobs, workers)
+
+        findings: Dict[int, List[Finding]] = {idx: [] for idx in runnable}
+        durations: Dict[int, float] = {idx: 0.0 for idx in runnable}
+        timeouts: Dict[int, int] = {idx: 0 for idx in runnable}
+        for (_, _, _, _, in_scope), scan in zip(jobs, scans):
+            for pos, idx in enumerate(in_scope):
+                findings[idx].extend(scan["findings"][pos])
+                durations[idx] += scan["durations_ms"][pos]
+                if pos in scan["timed_out"]:
+                    timeouts[idx] += 1
+
+        for idx in runnable:
+            rule = rules[idx]
+            error = None
+            if timeouts[idx]:
+                error = f"Rule timed out on {timeouts[idx]} file(s) after {rule.timeout_ms}ms budget"
+            results[idx] = CheckResult(
                 name=rule.name,
-                success=len(rule_findings) == 0,
-                duration_ms=(time.time() - rule_start) * 1000,
-                findings=rule_findings
-            ))
+                success=len(findings[idx]) == 0 and error is None,
+                duration_ms=durations[idx] if jobs else (time.time() - rule_start) * 1000,
+                findings=findings[idx],
+                error=error
+            )
 
         return results
 
+    def _scan_files(self, jobs: List[tuple], workers: Optional[int]) -> List[Dict[str, Any]]:
+        """Run _scan_file for every job, in a process pool for large batches."""
+        suppressions = self.runner.suppressions
+        workers = workers if workers is not None else RULE_SCAN_WORKERS
+
+        if workers <= 1 or len(jobs) < PARALLEL_MIN_FILES:
+            return [
+                _scan_file(label, path, job_rules, suppressions, budget_ms)
+                for label, path, job_rules, budget_ms, _ in jobs
+            ]
+
+        import multiprocessing
+
+        # Cooperative budgets stop slow files between lines; the deadline
+        # below catches a single regex that never returns. Hung workers are
+        # killed by terminate() instead of leaking a thread per check.
+        max_budget_ms = max(job[3] for job in jobs)
+        rounds = -(-len(jobs) // workers) + 1
+        deadline = time.monotonic() + max_budget_ms * rounds / 1000
+
+        pool = multiprocessing.Pool(processes=workers)
+        try:
+            pending = [
+                pool.apply_async(_scan_file, (label, path, job_rules, suppressions, budget_ms))
+                for label, path, job_rules, budget_ms, _ in jobs
+            ]
+            scans = []
+            for job, async_result in zip(jobs, pending):
+                try:
+                    scans.append(async_result.get(timeout=max(0.0, deadline - time.monotonic())))
+                except multiprocessing.TimeoutError:
+                    scans.append(_timed_out_scan(len(job[2])))
+            return scans
+        finally:
+            pool.terminate()
+            pool.join()
+
+
+# Rule scanning across files
+RULE_SCAN_WORKERS = min(8, os.cpu_count() or 1)
+PARALLEL_MIN_FILES = 64  # Below this, process startup costs more than it saves
+
+# Constructs whose meaning differs between a lone line and a line inside the
+# whole file; rules using them skip the whole-file prefilter.
+_LINE_ONLY_CONSTRUCTS = re.compile(r'\\[AZ]|\(\?<?!')
+
+_SCAN_PATTERNS: Dict[Tuple[str, bool], re.Pattern] = {}
+
+
+def _scan_pattern(rule: RuleSpec, multiline: bool = False) -> re.Pattern:
+    """Per-process cache of compiled rule patterns (line and whole-file forms)."""
+    key = (rule.pattern, multiline)
+    if key not in _SCAN_PATTERNS:
+        _SCAN_PATTERNS[key] = re.compile(rule.pattern, re.MULTILINE if multiline else 0)
+    return _SCAN_PATTERNS[key]
+
+
+def _timed_out_scan(rule_count: int) -> Dict[str, Any]:
+    return {
+        "findings": [[] for _ in range(rule_count)],
+        "durations_ms": [0.0] * rule_count,
+        "timed_out": set(range(rule_count)),
+    }
+
+
+def _scan_file(
+    label: str,
+    path: str,
+    rules: List[RuleSpec],
+    suppressions: SuppressionManager,
+    budget_ms: int
+) -> Dict[str, Any]:
+    """
+    Evaluate all in-scope rules against one file in a single pass.
+
+    The file is read and split once. For each rule, one search over the
+    whole file (lines re-joined with "\\n", so ^/$ line up under MULTILINE)
+    decides whether the per-line loop is needed at all; a rule can only
+    match a line if it matches somewhere in the file. Findings are the same
+    as RuleEngine.run_rule per (rule, file).
+
+    budget_ms is checked between rules and every few hundred lines. A rule
+    that is cut off contributes no findings for this file (as run_rule does
+    on timeout) and is listed in timed_out along with the rules after it.
+
+    Module-level so it can run in a process pool.
+    """
+    scan = {
+        "findings": [[] for _ in rules],
+        "durations_ms": [0.0] * len(rules),
+        "timed_out": set(),
+    }
+
+    content = Path(path).read_text(encoding='utf-8')
+    if not content:
+        return scan
+
+    deadline = time.monotonic() + budget_ms / 1000
+    lines = content.splitlines()
+    joined = "\n".join(lines)
+
+    for pos, rule in enumerate(rules):
+        if time.monotonic() > deadline:
+            scan["timed_out"].update(range(pos, len(rules)))
+            break
+
+        start = time.perf_counter()
+        try:
+            if not _LINE_ONLY_CONSTRUCTS.search(rule.pattern):
+                if not _scan_pattern(rule, multiline=True).search(joined):
+                    continue
+
+            pattern = _scan_pattern(rule)
+            rule_findings = []
+            for i, line in enumerate(lines, 1):
+                if i % 256 == 0 and time.monotonic() > deadline:
+                    raise TimeoutError(f"Rule timed out after {budget_ms}ms")
+                if pattern.search(line):
+                    # Check inline suppression
+                    if not suppressions.is_rule_suppressed(rule.id, label, line):
+                        rule_findings.append(Finding(
+                            id=f"{rule.id}_{i}",
+                            type="quality_violation",
+                            severity=rule.severity,
+                            confidence=rule.confidence,
+                            file=label,
+                            line=i,
+                            snippet=line[:100] if len(line) > 100 else line,
+                            message=rule.message,
+                            suggested_fix=rule.suggested_fix,
+                            rule_id=rule.id
+                        ))
+            scan["findings"][pos] = rule_findings
+        except TimeoutError:
+            scan["timed_out"].update(range(pos, len(rules)))
+            break
+        finally:
+            scan["durations_ms"][pos] = (time.perf_counter() - start) * 1000
+
+    return scan
+
 
 # CLI for testing
 if __name__ == "__main__":
@@ -0,0 +1,176 @@
+"""
+Migration 005: Add normalized artifact_tags table.
+
+Creates:
+- artifact_tags(artifact_id, tag) table, one row per tag per artifact
+- Index on (tag, artifact_id) for tag filters and census queries
+- Backfill from the JSON tags column on artifacts
+
+Replaces `tags LIKE '%"x"%'` full-table scans. ArtifactIndex keeps the
+table in sync on upsert/delete once it exists.
+
+Note: INDEX-ONLY table - truth lives in JSON.
+"""
+
+MIGRATION_ID = "005_add_artifact_tags"
+DEPENDS_ON = ["003_add_reinforcement"]
+
+
+def up(db_path: str) -> dict:
+    """
+    Apply migration.
+
+    Returns:
+        {
+            "success": bool,
+            "tags_backfilled": int,
+            "message": str
+        }
+    """
+    import sqlite3
+
+    conn = sqlite3.connect(db_path)
+    result = {
+        "success": False,
+        "tags_backfilled": 0,
+        "message": ""
+    }
+
+    try:
+        # Check if already applied via schema_migrations
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='schema_migrations'"
+        )
+        if cursor.fetchone():
+            cursor = conn.execute(
+                "SELECT 1 FROM schema_migrations WHERE migration_id = ?", (MIGRATION_ID,)
+            )
+            if cursor.fetchone():
+                result["success"] = True
+                result["message"] = "Migration already applied"
+                return result
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS artifact_tags (
+                artifact_id TEXT NOT NULL,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (artifact_id, tag)
+            ) WITHOUT ROWID
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_artifact_tags_tag ON artifact_tags(tag, artifact_id)"
+        )
+
+        # Backfill from the JSON tags column (malformed JSON is skipped, not fatal)
+        cursor = conn.execute("""
+            INSERT OR IGNORE INTO artifact_tags (artifact_id, tag)
+            SELECT a.id, j.value
+            FROM artifacts a,
+                 json_each(CASE WHEN json_valid(a.tags) THEN a.tags ELSE '[]' END) j
+            WHERE j.type = 'text' AND j.value != ''
+        """)
+        result["tags_backfilled"] = cursor.rowcount
+
+        conn.commit()
+        result["success"] = True
+        result["message"] = f"Created artifact_tags, backfilled {result['tags_backfilled']} tag rows"
+
+    except Exception as e:
+        result["message"] = f"Migration failed: {e}"
+        conn.rollback()
+    finally:
+        conn.close()
+
+    return result
+
+
+def down(db_path: str) -> dict:
+    """Rollback migration: drop artifact_tags (index falls back to JSON scans)."""
+    import sqlite3
+
+    conn = sqlite3.connect(db_path)
+    result = {"success": False, "message": ""}
+
+    try:
+        conn.execute("DROP INDEX IF EXISTS idx_artifact_tags_tag")
+        conn.execute("DROP TABLE IF EXISTS artifact_tags")
+
+        # Remove migration record (best-effort)
+        try:
+            conn.execute("DELETE FROM schema_migrations WHERE migration_id = ?", (MIGRATION_ID,))
+        except Exception:
+            pass
+
+        conn.commit()
+        result["success"] = True
+        result["message"] = "Migration rolled back"
+
+    except Exception as e:
+        result["message"] = f"Rollback failed: {e}"
+        conn.rollback()
+    finally:
+        conn.close()
+
+    return result
+
+
+def check_status(db_path: str) -> dict:
+    """
+    Check migration status.
+    """
+    import sqlite3
+
+    conn = sqlite3.connect(db_path)
+    status = {
+        "applied": False,
+        "table_exists": False,
+        "tag_rows": 0
+    }
+
+    try:
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='schema_migrations'"
+        )
+        if cursor.fetchone():
+            cursor = conn.execute(
+                "SELECT 1 FROM schema_migrations WHERE migration_id = ?", (MIGRATION_ID,)
+            )
+            status["applied"] = cursor.fetchone() is not None
+
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='artifact_tags'"
+        )
+        status["table_exists"] = cursor.fetchone() is not None
+        if status["table_exists"]:
+            status["tag_rows"] = conn.execute("SELECT COUNT(*) FROM artifact_tags").fetchone()[0]
+
+    except Exception:
+        pass
+    finally:
+        conn.close()
+
+    return status
+
+
+if __name__ == "__main__":
+    import sys
+    import json
+
+    if len(sys.argv) < 2:
+        print("Usage: python m005_add_artifact_tags.py <db_path> [up|down|status]")
+        sys.exit(1)
+
+    db_path = sys.argv[1]
+    action = sys.argv[2] if len(sys.argv) > 2 else "up"
+
+    if action == "up":
+        result = up(db_path)
+    elif action == "down":
+        result = down(db_path)
+    elif action == "status":
+        result = check_status(db_path)
+    else:
+        print(f"Unknown action: {action}")
+        sys.exit(1)
+
+    print(json.dumps(result, indent=2))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+Benchmark policy gate audit overhead: inline JSONL appends vs the async writer.
+
+Logs the same ALLOW decision through _log_gate_decision() N times with
+DURO_AUDIT_ASYNC off (every call appends and rewrites the head) and then
+on (every call only enqueues), against a throwaway audit directory, and
+prints the per-call cost of each.
+
+Usage:
+    python scripts/bench_audit_gate.py [--calls 2000]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import audit_log
+import policy_gate
+from policy_gate import GateDecision, _log_gate_decision
+
+
+def log_decisions(n: int) -> float:
+    decision = GateDecision(
+        allowed=True, action_needed="none", reason="allowed", tool_name="duro_store_fact",
+        risk_level="write", domain="memory", args_hash="h", safe_summary="s",
+    )
+    start = time.perf_counter()
+    for _ in range(n):
+        _log_gate_decision(decision, {"claim": "a fact", "tags": ["x"]})
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    n = parser.parse_args().calls
+
+    temp_dir = Path(tempfile.mkdtemp())
+    patches = [
+        patch.object(audit_log, "AUDIT_DIR", temp_dir),
+        patch.object(audit_log, "UNIFIED_AUDIT_FILE", temp_dir / "security_audit.jsonl"),
+        patch.object(audit_log, "AUDIT_HEAD_FILE", temp_dir / "audit_head.json"),
+        patch.object(audit_log, "VERIFY_CHECKPOINT_FILE", temp_dir / "verify_checkpoint.json"),
+        patch.object(audit_log, "AUDIT_BACKEND", "jsonl"),
+        patch.object(audit_log, "_sink", None),
+        patch.object(audit_log, "should_rotate", return_value=False),
+        patch.object(policy_gate, "UNIFIED_AUDIT_AVAILABLE", True),
+        patch.dict(os.environ, {audit_log.HMAC_KEY_ENV: "bench-key"}),
+    ]
+    for p in patches:
+        p.start()
+    try:
+        with patch.object(audit_log, "AUDIT_ASYNC", False):
+            sync = log_decisions(n)
+        with patch.object(audit_log, "AUDIT_ASYNC", True):
+            async_ = log_decisions(n)
+            audit_log.flush_audit_sink()
+            stats = audit_log.get_audit_sink().get_stats()
+            audit_log.get_audit_sink().stop()
+
+        result = audit_log.verify_log()
+        print(f"_log_gate_decision x{n}")
+        print(f"  sync:  {sync / n * 1e6:.0f}us/call")
+        print(f"  async: {async_ / n * 1e6:.0f}us/call ({stats['batches']} batches)")
+        print(f"  speedup: {sync / async_:.1f}x")
+        print(f"  chain valid: {result.valid} ({result.total_events} events)")
+    finally:
+        for p in reversed(patches):
+            p.stop()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
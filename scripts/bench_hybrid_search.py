@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""
+Regression benchmark for ArtifactIndex.hybrid_search on a synthetic index.
+
+Builds a throwaway index of N artifacts (50k by default), then reports
+p50/p95 latency for unfiltered, tag-filtered and type-filtered searches.
+Exits 1 if any p95 is over the budget.
+
+Usage:
+    python scripts/bench_hybrid_search.py [--artifacts 50000] [--iterations 40] [--p95-budget 0.1]
+"""
+import argparse
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from index import ArtifactIndex
+from migrations import run_all_pending
+from time_utils import utc_now_iso
+
+MIGRATIONS_DIR = ROOT / "migrations"
+
+# Topic words mixed into synthetic claims so queries hit a realistic
+# slice of the index rather than every row
+VOCAB = [
+    "sqlite", "python", "embedding", "vector", "cache", "deploy", "audit",
+    "schema", "latency", "queue", "worker", "policy", "search", "token",
+    "memory", "thread", "socket", "render", "video", "image", "review",
+    "secret", "decay", "ranking", "index", "backup", "restore", "webhook",
+    "gateway", "monitor", "metric", "budget", "session", "bridge", "parser",
+    "compiler", "runtime", "network", "storage", "snapshot",
+]
+
+
+def build_index(root: str, count: int, batch: int = 5000) -> ArtifactIndex:
+    db_path = Path(root) / "index.db"
+    index = ArtifactIndex(db_path)
+    run_all_pending(MIGRATIONS_DIR, str(db_path))
+
+    now = utc_now_iso()
+    entries = []
+    for i in range(count):
+        topic = f"{VOCAB[i % len(VOCAB)]} {VOCAB[(i * 7 + 3) % len(VOCAB)]}"
+        claim = f"searchable widget {topic} number {i}"
+        artifact = {
+            "id": f"art_{i:06d}",
+            "type": "decision" if i % 3 == 0 else "fact",
+            "created_at": now,
+            "sensitivity": "public",
+            "tags": ["rare"] if i % 10 == 0 else ["common"],
+            "source": {"workflow": "bench"},
+            "data": {"claim": claim, "decision": claim, "rationale": claim},
+        }
+        entries.append((artifact, f"facts/art_{i:06d}.json", f"hash{i}"))
+        if len(entries) >= batch:
+            index.upsert_many(entries)
+            entries = []
+    if entries:
+        index.upsert_many(entries)
+    return index
+
+
+def measure(index: ArtifactIndex, iterations: int, **kwargs) -> tuple:
+    index.hybrid_search("sqlite", **kwargs)  # warm caches
+    timings = []
+    for i in range(iterations):
+        query = VOCAB[i % len(VOCAB)]
+        start = time.perf_counter()
+        index.hybrid_search(query, **kwargs)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--artifacts", type=int, default=50_000)
+    parser.add_argument("--iterations", type=int, default=40)
+    parser.add_argument("--p95-budget", type=float, default=0.1, help="seconds")
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp()
+    index = build_index(temp_dir, args.artifacts)
+    over_budget = False
+    try:
+        for label, kwargs in (
+            ("unfiltered", {"limit": 50}),
+            ("tag-filtered", {"limit": 50, "tags": ["rare"]}),
+            ("type-filtered", {"limit": 50, "artifact_type": "decision"}),
+        ):
+            p50, p95 = measure(index, args.iterations, **kwargs)
+            over_budget = over_budget or p95 > args.p95_budget
+            print(f"hybrid_search {label} @ {args.artifacts} artifacts: "
+                  f"p50={p50 * 1000:.1f}ms p95={p95 * 1000:.1f}ms")
+    finally:
+        index.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    if over_budget:
+        print(f"p95 over budget ({args.p95_budget * 1000:.0f}ms)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
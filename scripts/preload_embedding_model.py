@@ -11,8 +11,9 @@ import sys
 import time
 
 # Set cache paths BEFORE importing fastembed
-os.environ["FASTEMBED_CACHE_PATH"] = r"C:\Users\sibag\.cache\fastembed"
-os.environ["HF_HOME"] = r"C:\Users\sibag\.cache\huggingface"
+CACHE_HOME = os.path.join(os.path.expanduser("~"), ".cache")
+os.environ.setdefault("FASTEMBED_CACHE_PATH", os.path.join(CACHE_HOME, "fastembed"))
+os.environ.setdefault("HF_HOME", os.path.join(CACHE_HOME, "huggingface"))
 
 # Ensure cache directories exist
 os.makedirs(os.environ["FASTEMBED_CACHE_PATH"], exist_ok=True)
@@ -161,6 +161,20 @@ def build_tag_census(artifacts: List[Dict]) -> Dict[str, Dict[str, int]]:
     return dict(census)
 
 
+def normalize_tag_census(raw: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+    """
+    Normalize an index-side census (tag -> {artifact_type: count}) the same
+    way build_tag_census does: lowercase, strip, drop 1-char tags, merge.
+    """
+    census = defaultdict(lambda: defaultdict(int))
+    for tag, type_counts in raw.items():
+        tag_lower = tag.lower().strip()
+        if tag_lower and len(tag_lower) > 1:
+            for art_type, count in type_counts.items():
+                census[tag_lower][art_type] += count
+    return dict(census)
+
+
 def find_unarticulated_tags(
     census: Dict[str, Dict[str, int]],
     min_log_count: int = 3
@@ -401,6 +415,8 @@ def run(args: Dict[str, Any], tools: Dict[str, Any], context: Dict[str, Any]) ->
         tools: {
             query_memory: callable
             semantic_search: callable
+            tag_census: callable (optional) - SQL tag aggregate; when present
+                only logs are loaded (for term extraction)
         }
         context: {run_id, timeout}
 
@@ -428,6 +444,7 @@ def run(args: Dict[str, Any], tools: Dict[str, Any], context: Dict[str, Any]) ->
 
     query_memory = tools.get("query_memory")
     semantic_search = tools.get("semantic_search")
+    tag_census_tool = tools.get("tag_census")
 
     if not query_memory:
         return {"success": False, "error": "query_memory tool is required"}
@@ -438,10 +455,19 @@ def run(args: Dict[str, Any], tools: Dict[str, Any], context: Dict[str, Any]) ->
     from datetime import datetime, timedelta
     since_date = (datetime.utcnow() - timedelta(days=days_back)).strftime("%Y-%m-%d")
 
+    # Prefer the index-side tag aggregate over loading every type
+    aggregate = None
+    if tag_census_tool:
+        try:
+            aggregate = tag_census_tool(artifact_types=scan_types, since=since_date)
+        except Exception:
+            aggregate = None
+    load_types = [t for t in scan_types if t == "log"] if aggregate else scan_types
+
     all_artifacts = []
     artifacts_by_type = defaultdict(list)
 
-    for art_type in scan_types:
+    for art_type in load_types:
         if time.time() - start_time >= timeout * 0.8:
             break
         try:
@@ -465,7 +491,12 @@ def run(args: Dict[str, Any], tools: Dict[str, Any], context: Dict[str, Any]) ->
         except Exception:
             continue
 
-    if not all_artifacts:
+    if aggregate:
+        total_artifacts = sum(aggregate.get("type_counts", {}).values())
+    else:
+        total_artifacts = len(all_artifacts)
+
+    if not total_artifacts:
         return {
             "success": True,
             "report": f"No artifacts found in last {days_back} days.",
@@ -475,13 +506,15 @@ def run(args: Dict[str, Any], tools: Dict[str, Any], context: Dict[str, Any]) ->
             "elapsed_seconds": round(time.time() - start_time, 2),
         }
 
-    total_artifacts = len(all_artifacts)
     logs = artifacts_by_type.get("log", [])
 
     # ==============================
     # Phase 2: Tag Census
     # ==============================
-    tag_census = build_tag_census(all_artifacts)
+    if aggregate:
+        tag_census = normalize_tag_census(aggregate.get("tags", {}))
+    else:
+        tag_census = build_tag_census(all_artifacts)
     all_tag_names = set(tag_census.keys())
 
     # Find tags that are mostly unarticulated (heavy in logs, light in facts)
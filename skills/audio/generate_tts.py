@@ -16,6 +16,15 @@ import sys
 import os
 import argparse
 
+# Shared media cache (skills/production/media_cache.py)
+_PRODUCTION_SKILLS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "production")
+if _PRODUCTION_SKILLS_DIR not in sys.path:
+    sys.path.append(_PRODUCTION_SKILLS_DIR)
+
+from media_cache import get_media_cache, make_key
+
+CACHE_NAMESPACE = "tts"
+
 
 # Voice presets for common characters
 VOICE_PRESETS = {
@@ -27,7 +36,14 @@ VOICE_PRESETS = {
 }
 
 
-def generate_speech(text: str, voice: str, output_path: str, rate: str = "+0%") -> dict:
+def generate_speech(
+    text: str,
+    voice: str,
+    output_path: str,
+    rate: str = "+0%",
+    cache_dir: str = None,
+    cache_max_mb: float = None
+) -> dict:
     """
     Generate speech audio from text.
 
@@ -36,9 +52,11 @@ def generate_speech(text: str, voice: str, output_path: str, rate: str = "+0%")
         voice: Voice ID (e.g., "en-GB-SoniaNeural") or preset name (e.g., "rachel")
         output_path: Path to save the MP3 file
         rate: Speech rate adjustment (e.g., "+10%", "-5%")
+        cache_dir: Media cache directory; reuses earlier renders of the same line
+        cache_max_mb: Cache size bound (LRU eviction), default 2GB
 
     Returns:
-        dict with keys: success, file_path, file_size, error
+        dict with keys: success, file_path, file_size, error (and cached)
     """
     # Resolve voice preset if provided
     actual_voice = VOICE_PRESETS.get(voice.lower(), voice)
@@ -46,6 +64,22 @@ def generate_speech(text: str, voice: str, output_path: str, rate: str = "+0%")
     # Ensure output directory exists
     os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
 
+    cache = None
+    cache_key = make_key(text=text, voice=actual_voice, rate=rate)
+    if cache_dir:
+        cache = get_media_cache(
+            cache_dir,
+            max_bytes=int(cache_max_mb * 1024 * 1024) if cache_max_mb is not None else None
+        )
+        if cache.get(cache_key, namespace=CACHE_NAMESPACE, dest_path=output_path):
+            return {
+                "success": True,
+                "file_path": output_path,
+                "file_size": os.path.getsize(output_path),
+                "error": None,
+                "cached": True
+            }
+
     try:
         cmd = [
             sys.executable, "-m", "edge_tts",
@@ -74,6 +108,11 @@ def generate_speech(text: str, voice: str, output_path: str, rate: str = "+0%")
 
         if os.path.exists(output_path):
             file_size = os.path.getsize(output_path)
+            if cache:
+                try:
+                    cache.put(cache_key, output_path, namespace=CACHE_NAMESPACE, meta={"voice": actual_voice})
+                except Exception:
+                    pass  # The audio was generated; a cache write failure isn't an error
             return {
                 "success": True,
                 "file_path": output_path,
@@ -131,6 +170,7 @@ if __name__ == "__main__":
     parser.add_argument("--rate", default="+0%", help="Speech rate adjustment")
     parser.add_argument("--list-voices", action="store_true", help="List available voices")
     parser.add_argument("--filter", default=None, help="Filter voices by language code")
+    parser.add_argument("--cache-dir", default=None, help="Reuse earlier renders from this media cache")
 
     args = parser.parse_args()
 
@@ -139,7 +179,7 @@ if __name__ == "__main__":
         for v in voices:
             print(v)
     else:
-        result = generate_speech(args.text, args.voice, args.output, args.rate)
+        result = generate_speech(args.text, args.voice, args.output, args.rate, cache_dir=args.cache_dir)
         if result["success"]:
             print(f"Success: {result['file_path']} ({result['file_size']} bytes)")
         else:
@@ -30,6 +30,8 @@ Usage:
         "fix": True,  # Auto-apply safe refactors
         "config": {
             "review": {"fail_on": "error"},
+            "review_cache": True,  # reuse findings for unchanged files
+            "review_cache_dir": None,  # default: ~/.agent/cache/review/<project hash>
             "coverage": {"threshold": 80},
             "test_generate": {"max_files": 10},
             "fix": {"operations": ["remove_unused_imports", "sort_imports"]}
@@ -41,6 +43,7 @@ import os
 import sys
 import json
 import time
+import hashlib
 from pathlib import Path
 
 # Add agent skills to path for imports
@@ -58,7 +61,7 @@ SKILL_META = {
     "name": "code_pipeline",
     "description": "Orchestrate code quality pipeline - review, coverage, test generation, auto-fix",
     "tier": "tested",
-    "version": "1.1.2",
+    "version": "1.1.3",
     "author": "duro",
     "phase": "4.4",
     "triggers": ["run pipeline", "code pipeline", "project health", "quality check", "fix code"],
@@ -121,6 +124,16 @@ class PipelineResult:
     recommendations: List[str] = field(default_factory=list)
 
 
+# Per-user data dir; review caches live here, never inside the reviewed project
+AGENT_HOME = Path(os.environ.get("DURO_AGENT_HOME", str(Path.home() / ".agent")))
+
+
+def _review_cache_dir(project_path: str) -> str:
+    """Findings cache for a project, keyed by its absolute path."""
+    digest = hashlib.sha256(os.path.abspath(project_path).encode("utf-8")).hexdigest()[:16]
+    return str(AGENT_HOME / "cache" / "review" / digest)
+
+
 # === Stage Runners ===
 
 def run_code_review_stage(
@@ -167,16 +180,16 @@ def run_code_review_stage(
                 summary={"message": "No Python files found"},
             )
 
-        # Run review
-        result = run_review(
-            args={
-                "files": files,
-                "config": config.get("review", {}),
-                "fail_on": config.get("fail_on", "error"),
-            },
-            tools=tools,
-            context={}
-        )
+        # Run review; unchanged files come from the findings cache
+        review_args = {
+            "files": files,
+            "config": config.get("review", {}),
+            "fail_on": config.get("fail_on", "error"),
+        }
+        if config.get("review_cache", True):
+            review_args["cache_dir"] = config.get("review_cache_dir") or _review_cache_dir(project_path)
+
+        result = run_review(args=review_args, tools=tools, context={})
 
         duration_ms = int((time.time() - start) * 1000)
 
@@ -189,6 +202,8 @@ def run_code_review_stage(
             "warnings": sum(1 for f in findings if f.get("severity") == "warn"),
             "info": sum(1 for f in findings if f.get("severity") == "info"),
         }
+        if "cache" in result:
+            summary["cache_hits"] = result["cache"]["hits"]
 
         passed = result.get("passed", summary["errors"] == 0)
 
@@ -5,7 +5,7 @@ Capabilities:
 - Multi-backend: Flux (excellent) -> Pollinations (free) -> DALL-E -> Stock photos
 - Face detection routing to Face Distortion rule
 - Prompt enhancement with style modifiers
-- Caching and deduplication
+- Caching and deduplication (size-bounded, content-addressed media cache)
 - Progress callbacks for batch operations
 - Cost tracking per generation
 
@@ -14,12 +14,15 @@ Phase 3.2.2
 
 import os
 import re
+import sys
 import json
 import hashlib
+import threading
 import time
 import urllib.request
 import urllib.parse
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field, asdict
@@ -41,12 +44,21 @@ try:
 except ImportError:
     _comfyui_available = False
 
+# Shared media cache (skills/production/media_cache.py)
+_PRODUCTION_SKILLS_DIR = str(Path(__file__).resolve().parent.parent / "production")
+if _PRODUCTION_SKILLS_DIR not in sys.path:
+    sys.path.append(_PRODUCTION_SKILLS_DIR)
+
+from media_cache import default_cache_dir, get_media_cache
+
+CACHE_NAMESPACE = "image"
+
 
 SKILL_META = {
     "name": "image_generate",
     "description": "Generate images with multi-backend fallback chain (Flux, Pollinations, DALL-E)",
     "tier": "tested",
-    "version": "1.2.0",
+    "version": "1.3.0",
     "phase": "3.2",
     "keywords": [
         "image", "generate", "ai", "picture", "photo",
@@ -130,8 +142,9 @@ class ImageRequest:
 
 DEFAULT_CONFIG = {
     "cache_enabled": True,
-    "cache_dir": ".image_cache",
+    "cache_dir": None,  # None = per-user dir under DURO_AGENT_HOME (~/.agent/cache/media/image)
     "cache_expiry_hours": 168,  # 1 week
+    "cache_max_mb": 2048,  # LRU eviction past this size
     "face_detection_keywords": [
         "face", "portrait", "person", "people", "human", "man", "woman",
         "child", "girl", "boy", "headshot", "selfie", "photo of"
@@ -159,6 +172,7 @@ DEFAULT_CONFIG = {
     # General settings
     "max_retries": 2,
     "retry_delay_seconds": 1,
+    "batch_workers": 4,  # Concurrent generations in generate_batch
 }
 
 
@@ -250,41 +264,36 @@ def get_cache_key(request: ImageRequest) -> str:
     return hashlib.sha256(key_str.encode()).hexdigest()[:16]
 
 
+def _media_cache(config: Dict[str, Any]):
+    cache_mb = config.get("cache_max_mb", DEFAULT_CONFIG["cache_max_mb"])
+    return get_media_cache(
+        config.get("cache_dir") or default_cache_dir(CACHE_NAMESPACE),
+        max_bytes=int(cache_mb * 1024 * 1024) if cache_mb is not None else None
+    )
+
+
 def get_cached_image(
     request: ImageRequest,
     config: Dict[str, Any]
 ) -> Optional[str]:
-    """Check if image exists in cache."""
-    if not config.get("cache_enabled", True) or request.skip_cache:
-        return None
-
-    cache_dir = Path(config.get("cache_dir", DEFAULT_CONFIG["cache_dir"]))
-    if not cache_dir.exists():
-        return None
-
-    cache_key = get_cache_key(request)
-    cache_meta_path = cache_dir / f"{cache_key}.json"
+    """
+    Check if image exists in cache.
 
-    if not cache_meta_path.exists():
+    A hit copies the cached bytes to request.output_path and returns it.
+    """
+    if not config.get("cache_enabled", True) or request.skip_cache:
         return None
 
+    expiry_hours = config.get("cache_expiry_hours", DEFAULT_CONFIG["cache_expiry_hours"])
     try:
-        with open(cache_meta_path) as f:
-            meta = json.load(f)
-
-        # Check expiry
-        expiry_hours = config.get("cache_expiry_hours", DEFAULT_CONFIG["cache_expiry_hours"])
-        cached_time = meta.get("timestamp", 0)
-        if time.time() - cached_time > expiry_hours * 3600:
-            return None
-
-        cached_path = meta.get("path")
-        if cached_path and Path(cached_path).exists():
-            return cached_path
+        return _media_cache(config).get(
+            get_cache_key(request),
+            namespace=CACHE_NAMESPACE,
+            dest_path=request.output_path,
+            max_age_seconds=expiry_hours * 3600 if expiry_hours is not None else None
+        )
     except Exception:
-        pass
-
-    return None
+        return None
 
 
 def save_to_cache(
@@ -296,22 +305,20 @@ def save_to_cache(
     if not config.get("cache_enabled", True):
         return
 
-    cache_dir = Path(config.get("cache_dir", DEFAULT_CONFIG["cache_dir"]))
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        _media_cache(config).put(
+            get_cache_key(request),
+            result_path,
+            namespace=CACHE_NAMESPACE,
+            meta={"prompt": request.prompt, "width": request.width, "height": request.height}
+        )
+    except Exception:
+        pass  # A cache write failure shouldn't fail a successful generation
 
-    cache_key = get_cache_key(request)
-    cache_meta_path = cache_dir / f"{cache_key}.json"
 
-    meta = {
-        "prompt": request.prompt,
-        "path": result_path,
-        "timestamp": time.time(),
-        "width": request.width,
-        "height": request.height,
-    }
-
-    with open(cache_meta_path, "w") as f:
-        json.dump(meta, f)
+def get_cache_stats(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Hit / miss / eviction stats for the image cache."""
+    return _media_cache({**DEFAULT_CONFIG, **(config or {})}).get_stats()
 
 
 # === Backend Implementations ===
@@ -706,23 +713,37 @@ def generate_batch(
 ) -> List[GenerationResult]:
     """
     Generate multiple images with progress reporting.
+
+    Up to config["batch_workers"] images are generated at once (the
+    backends are network-bound); results are returned in request order.
     """
-    results = []
     total = len(requests)
-
-    for i, request in enumerate(requests):
-        if progress_callback:
-            progress_callback({
+    workers = max(1, config.get("batch_workers", DEFAULT_CONFIG["batch_workers"]))
+    callback = None
+    if progress_callback:
+        callback_lock = threading.Lock()
+
+        def callback(update):
+            with callback_lock:
+                progress_callback(update)
+
+    def generate_one(indexed: Tuple[int, ImageRequest]) -> GenerationResult:
+        i, request = indexed
+        if callback:
+            callback({
                 "stage": "batch",
                 "current": i + 1,
                 "total": total,
                 "prompt": request.prompt[:50],
             })
 
-        result = generate_image(request, config, progress_callback)
-        results.append(result)
+        return generate_image(request, config, callback)
+
+    if workers == 1 or total <= 1:
+        return [generate_one(item) for item in enumerate(requests)]
 
-    return results
+    with ThreadPoolExecutor(max_workers=min(workers, total)) as pool:
+        return list(pool.map(generate_one, enumerate(requests)))
 
 
 # === Skill Entry Point ===
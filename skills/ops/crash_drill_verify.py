@@ -132,8 +132,8 @@ def step_3_run_mini_reembed(limit: int = 5):
         failed = 0
         start = time.time()
 
-        for fact in facts:
-            artifact = store.get_artifact(fact["id"])
+        artifacts, _ = store.get_artifacts_many([fact["id"] for fact in facts])
+        for fact, artifact in zip(facts, artifacts):
             if artifact:
                 emb = embed_artifact(artifact)
                 if emb:
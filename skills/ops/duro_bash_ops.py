@@ -114,8 +114,8 @@ def cmd_reembed(limit: int = 10):
         failed = 0
         start = time.time()
 
-        for i, fact in enumerate(facts):
-            artifact = store.get_artifact(fact["id"])
+        artifacts, _ = store.get_artifacts_many([fact["id"] for fact in facts])
+        for i, (fact, artifact) in enumerate(zip(facts, artifacts)):
             if artifact:
                 emb = embed_artifact(artifact)
                 if emb:
@@ -178,10 +178,9 @@ def cmd_prune(dry_run: bool = True):
             if len(orphans) > 10:
                 print(f"  ... and {len(orphans) - 10} more")
         else:
-            with store.index._connect() as conn:
+            with store.index._connect_writer() as conn:
                 for oid in orphans:
                     conn.execute("DELETE FROM embeddings WHERE artifact_id = ?", (oid,))
-                conn.commit()
             print(f"[OK] Deleted {len(orphans)} orphan(s)")
 
         return True
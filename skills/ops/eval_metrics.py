@@ -97,8 +97,12 @@ def compute_decision_metrics(store):
 
         real_decisions.append(d)
 
-        # Get full artifact for status
-        artifact = store.get_artifact(d["id"])
+        for tag in tags:
+            by_tag[tag] += 1
+
+    # Get full artifacts for status
+    artifacts, _ = store.get_artifacts_many([d["id"] for d in real_decisions])
+    for artifact in artifacts:
         if artifact:
             data = artifact.get("data") or {}
             outcome = data.get("outcome") or {}
@@ -108,9 +112,6 @@ def compute_decision_metrics(store):
             if status == "unverified":
                 unreviewed_count += 1
 
-        for tag in tags:
-            by_tag[tag] += 1
-
     return {
         "total": total,
         "smoke_test_count": smoke_test_count,
@@ -142,8 +143,9 @@ def compute_episode_metrics(store):
 
         real_episodes.append(e)
 
-        # Get full artifact
-        artifact = store.get_artifact(e["id"])
+    # Get full artifacts
+    artifacts, _ = store.get_artifacts_many([e["id"] for e in real_episodes])
+    for artifact in artifacts:
         if artifact:
             data = artifact.get("data") or {}
             result = data.get("result", "unknown") if isinstance(data, dict) else "unknown"
@@ -173,8 +175,8 @@ def compute_evaluation_metrics(store):
     by_grade = defaultdict(int)
     outcome_scores = []
 
-    for e in evaluations:
-        artifact = store.get_artifact(e["id"])
+    artifacts, _ = store.get_artifacts_many([e["id"] for e in evaluations])
+    for artifact in artifacts:
         if artifact:
             data = artifact.get("data") or {}
             grade = data.get("grade", "unknown") if isinstance(data, dict) else "unknown"
@@ -12,6 +12,14 @@ Composes:
 
 This is the main multi-modal composition skill that orchestrates all media
 production skills to create a complete video episode from a script.
+
+Stages run as a small dependency graph: audio and images only need the
+parsed script, so they run concurrently (unless continue_on_error is off,
+which keeps audio-then-images fail-fast order), each generating its
+lines/scenes on its own bounded pool (audio_workers / image_workers).
+Compose waits for both; subtitles wait for compose. With resume enabled, completed assets
+are checkpointed in a private per-user work directory, so re-running a failed production
+skips them.
 """
 
 import os
@@ -19,7 +27,11 @@ import sys
 import re
 import json
 import shutil
+import hashlib
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
@@ -32,6 +44,10 @@ sys.path.insert(0, str(SKILLS_DIR / "audio"))
 sys.path.insert(0, str(SKILLS_DIR / "image"))
 sys.path.insert(0, str(SKILLS_DIR / "video"))
 
+# Resumable work dirs live under the Duro data dir, not the shared temp dir
+AGENT_HOME = Path(os.environ.get("DURO_AGENT_HOME", str(Path.home() / ".agent")))
+EPISODE_WORK_ROOT = AGENT_HOME / "tmp" / "episodes"
+
 
 # === Skill Metadata ===
 
@@ -39,7 +55,7 @@ SKILL_META = {
     "name": "episode_produce",
     "description": "Full episode production: script -> audio -> images -> video",
     "tier": "tested",
-    "version": "1.0.0",
+    "version": "1.1.0",
     "phase": "3.4",
     "composes": [
         "audio/generate_tts.py",
@@ -64,6 +80,15 @@ DEFAULT_CONFIG = {
     "video_fps": 30,
     "duration_per_scene": 5.0,
     "image_style": "cinematic",
+    # Concurrency: per-backend pool sizes for per-line / per-scene generation
+    "audio_workers": 4,
+    "image_workers": 2,
+    # Resume (opt-in): reuse checkpointed assets from an earlier run of the same
+    # script. work_dir defaults to EPISODE_WORK_ROOT/episode_<script digest> (mode 0700).
+    "resume": False,
+    "work_dir": None,
+    # Shared media cache (media_cache.py) for TTS renders across episodes
+    "media_cache_dir": None,
     "subtitle_style": {
         "font_size": 24,
         "font_color": "white",
@@ -147,6 +172,10 @@ class ProductionResult:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     assets: Dict[str, List[str]] = field(default_factory=dict)
+    # stage -> {"start", "end", "duration"} in seconds from the start of the run
+    stage_timings: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    wall_clock_seconds: float = 0.0
+    resumed_assets: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -170,10 +199,131 @@ class ProductionResult:
             "image_files": self.image_files,
             "errors": self.errors,
             "warnings": self.warnings,
-            "assets": self.assets
+            "assets": self.assets,
+            "stage_timings": self.stage_timings,
+            "wall_clock_seconds": self.wall_clock_seconds,
+            "resumed_assets": self.resumed_assets
         }
 
 
+# === Checkpointing ===
+
+class AssetCheckpoint:
+    """
+    Successful assets of a production run, persisted in the work directory.
+
+    Assets are keyed by what produced them (character + text + voice for
+    audio, prompt + size + style for images), so an edited line or prompt
+    is regenerated while everything else is reused. An entry only counts
+    if its file still exists inside the work directory.
+    """
+
+    FILENAME = "checkpoint.json"
+
+    def __init__(self, work_dir: Path):
+        self.work_dir = Path(work_dir).resolve()
+        self.path = self.work_dir / self.FILENAME
+        self.resumed = 0
+        self._lock = threading.Lock()
+        self._assets: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._assets = json.load(f).get("assets", {})
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def key(asset_type: str, *parts: Any) -> str:
+        payload = json.dumps([asset_type, *parts], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def get(self, key: str) -> Optional[ProductionAsset]:
+        entry = self._assets.get(key)
+        if not entry:
+            return None
+        path = Path(entry.get("path") or "").resolve()
+        if not path.is_relative_to(self.work_dir) or not path.exists():
+            return None
+        with self._lock:
+            self.resumed += 1
+        asset = ProductionAsset(**entry)
+        asset.metadata = {**asset.metadata, "resumed": True}
+        return asset
+
+    def record(self, key: str, asset: ProductionAsset):
+        """Checkpoint a successful asset (atomic rewrite of the checkpoint file)."""
+        with self._lock:
+            self._assets[key] = asdict(asset)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"assets": self._assets}, f, default=str)
+            os.replace(tmp_path, self.path)
+
+
+# === Concurrency Helpers ===
+
+def _map_bounded(
+    fn: Callable[[Any], Any],
+    items: List[Any],
+    max_workers: int,
+    is_failure: Callable[[Any], bool],
+    stop_on_failure: bool
+) -> List[Tuple[Any, Optional[Exception]]]:
+    """
+    Run fn over items on a bounded thread pool; (value, exception) per item, in order.
+
+    With stop_on_failure, items that haven't started when one fails are
+    skipped and the outcomes end at the first failure in input order - the
+    same prefix the sequential loop's break produced.
+    """
+    stop = threading.Event()
+
+    def call(item):
+        if stop.is_set():
+            return None
+        try:
+            value = fn(item)
+        except Exception as e:
+            if stop_on_failure:
+                stop.set()
+            return (None, e)
+        if stop_on_failure and is_failure(value):
+            stop.set()
+        return (value, None)
+
+    if max_workers <= 1 or len(items) <= 1:
+        outcomes = []
+        for item in items:
+            outcome = call(item)
+            if outcome is None:
+                break
+            outcomes.append(outcome)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            outcomes = list(pool.map(call, items))
+
+    trimmed = []
+    for outcome in outcomes:
+        if outcome is None:
+            break
+        trimmed.append(outcome)
+        if stop_on_failure and (outcome[1] is not None or is_failure(outcome[0])):
+            break
+    return trimmed
+
+
+def _locked_callback(progress_callback: Optional[Callable]) -> Optional[Callable]:
+    """Serialize progress callbacks coming from worker threads."""
+    if not progress_callback:
+        return None
+    lock = threading.Lock()
+
+    def callback(update):
+        with lock:
+            progress_callback(update)
+    return callback
+
+
 # === Script Parsing ===
 
 def parse_script(script_content: str) -> Tuple[List[SceneInfo], List[DialogueLine]]:
@@ -378,16 +528,21 @@ def generate_audio_assets(
     dialogue_lines: List[DialogueLine],
     output_dir: Path,
     config: Dict[str, Any],
-    progress_callback: Optional[Callable] = None
+    progress_callback: Optional[Callable] = None,
+    checkpoint: Optional[AssetCheckpoint] = None
 ) -> StageResult:
     """
     Generate audio for all dialogue lines.
 
+    Lines are generated concurrently on up to audio_workers threads;
+    assets and errors are reported in dialogue order.
+
     Args:
         dialogue_lines: List of dialogue to generate
         output_dir: Directory for audio files
         config: Configuration options
         progress_callback: Optional progress callback
+        checkpoint: Reuse / record completed assets here
 
     Returns:
         StageResult with audio assets
@@ -405,8 +560,11 @@ def generate_audio_assets(
 
     total = len(dialogue_lines)
     continue_on_error = config.get("continue_on_error", True)
+    progress_callback = _locked_callback(progress_callback)
+    tts_options = {"cache_dir": config["media_cache_dir"]} if config.get("media_cache_dir") else {}
 
-    for i, line in enumerate(dialogue_lines):
+    def generate_line(indexed: Tuple[int, DialogueLine]) -> ProductionAsset:
+        i, line = indexed
         if progress_callback:
             progress_callback({
                 "stage": "generate_audio",
@@ -422,44 +580,60 @@ def generate_audio_assets(
         # Get voice for character
         voice = VOICE_PRESETS.get(line.character, "en-GB-SoniaNeural")
 
-        try:
-            tts_result = generate_speech(line.text, voice, str(output_path))
-
-            if tts_result.get("success"):
-                line.audio_path = str(output_path)
-                result.assets.append(ProductionAsset(
-                    asset_type="audio",
-                    path=str(output_path),
-                    scene_number=line.scene_number,
-                    character=line.character,
-                    success=True,
-                    metadata={
-                        "line_number": line.line_number,
-                        "duration": tts_result.get("duration", 0),
-                        "file_size": tts_result.get("file_size", 0)
-                    }
-                ))
-            else:
-                error_msg = tts_result.get("error", "Unknown TTS error")
-                result.errors.append(f"Audio for {line.character} line {line.line_number}: {error_msg}")
-                result.assets.append(ProductionAsset(
-                    asset_type="audio",
-                    path=str(output_path),
-                    scene_number=line.scene_number,
-                    character=line.character,
-                    success=False,
-                    error=error_msg
-                ))
-                if not continue_on_error:
-                    result.success = False
-                    break
+        key = AssetCheckpoint.key("audio", str(output_path), line.text, voice)
+        cached = checkpoint.get(key) if checkpoint else None
+        if cached:
+            line.audio_path = cached.path
+            return cached
 
-        except Exception as e:
-            error_msg = str(e)
-            result.errors.append(f"Audio for {line.character} line {line.line_number}: {error_msg}")
-            if not continue_on_error:
-                result.success = False
-                break
+        tts_result = generate_speech(line.text, voice, str(output_path), **tts_options)
+
+        if tts_result.get("success"):
+            line.audio_path = str(output_path)
+            asset = ProductionAsset(
+                asset_type="audio",
+                path=str(output_path),
+                scene_number=line.scene_number,
+                character=line.character,
+                success=True,
+                metadata={
+                    "line_number": line.line_number,
+                    "duration": tts_result.get("duration", 0),
+                    "file_size": tts_result.get("file_size", 0)
+                }
+            )
+            if checkpoint:
+                checkpoint.record(key, asset)
+            return asset
+
+        return ProductionAsset(
+            asset_type="audio",
+            path=str(output_path),
+            scene_number=line.scene_number,
+            character=line.character,
+            success=False,
+            error=tts_result.get("error", "Unknown TTS error")
+        )
+
+    outcomes = _map_bounded(
+        generate_line, list(enumerate(dialogue_lines)),
+        max_workers=config.get("audio_workers", 1),
+        is_failure=lambda asset: not asset.success,
+        stop_on_failure=not continue_on_error
+    )
+
+    for line, (asset, error) in zip(dialogue_lines, outcomes):
+        if error is None:
+            result.assets.append(asset)
+            if asset.success:
+                continue
+            error_msg = asset.error
+        else:
+            error_msg = str(error)
+        result.errors.append(f"Audio for {line.character} line {line.line_number}: {error_msg}")
+        if not continue_on_error:
+            result.success = False
+            break
 
     # Check if we have enough successful audio
     successful_audio = [a for a in result.assets if a.success]
@@ -477,23 +651,28 @@ def generate_image_assets(
     scenes: List[SceneInfo],
     output_dir: Path,
     config: Dict[str, Any],
-    progress_callback: Optional[Callable] = None
+    progress_callback: Optional[Callable] = None,
+    checkpoint: Optional[AssetCheckpoint] = None
 ) -> StageResult:
     """
     Generate images for all scenes.
 
+    Scenes are generated concurrently on up to image_workers threads;
+    assets and errors are reported in scene order.
+
     Args:
         scenes: List of scenes
         output_dir: Directory for images
         config: Configuration options
         progress_callback: Optional progress callback
+        checkpoint: Reuse / record completed assets here
 
     Returns:
         StageResult with image assets
     """
     # Import image generation
     try:
-        from image_generate import generate_image, ImageConfig
+        from image_generate import generate_image, ImageRequest, DEFAULT_CONFIG as IMAGE_CONFIG
     except ImportError:
         # Fallback: return placeholder result
         return StageResult(
@@ -522,8 +701,10 @@ def generate_image_assets(
     width = config.get("video_width", 1920)
     height = config.get("video_height", 1080)
     style = config.get("image_style", "cinematic")
+    progress_callback = _locked_callback(progress_callback)
 
-    for i, scene in enumerate(scenes):
+    def generate_scene(indexed: Tuple[int, SceneInfo]) -> ProductionAsset:
+        i, scene = indexed
         if progress_callback:
             progress_callback({
                 "stage": "generate_images",
@@ -535,50 +716,63 @@ def generate_image_assets(
         filename = f"scene_{scene.scene_number:03d}.png"
         output_path = image_dir / filename
 
-        try:
-            img_config = ImageConfig(
-                width=width,
-                height=height,
-                style=style
-            )
+        key = AssetCheckpoint.key("image", str(output_path), scene.image_prompt, width, height, style)
+        cached = checkpoint.get(key) if checkpoint else None
+        if cached:
+            return cached
 
-            img_result = generate_image(
-                prompt=scene.image_prompt,
-                output_path=str(output_path),
-                config=img_config
+        img_request = ImageRequest(
+            prompt=scene.image_prompt,
+            output_path=str(output_path),
+            width=width,
+            height=height,
+            style=style
+        )
+
+        img_result = generate_image(img_request, IMAGE_CONFIG)
+
+        if img_result.success:
+            asset = ProductionAsset(
+                asset_type="image",
+                path=str(output_path),
+                scene_number=scene.scene_number,
+                success=True,
+                metadata={
+                    "prompt": scene.image_prompt,
+                    "backend": getattr(img_result.backend_used, "value", img_result.backend_used)
+                }
             )
+            if checkpoint:
+                checkpoint.record(key, asset)
+            return asset
 
-            if img_result.success:
-                result.assets.append(ProductionAsset(
-                    asset_type="image",
-                    path=str(output_path),
-                    scene_number=scene.scene_number,
-                    success=True,
-                    metadata={
-                        "prompt": scene.image_prompt,
-                        "backend": img_result.backend_used
-                    }
-                ))
-            else:
-                error_msg = img_result.error or "Unknown image generation error"
-                result.errors.append(f"Image for scene {scene.scene_number}: {error_msg}")
-                result.assets.append(ProductionAsset(
-                    asset_type="image",
-                    path=str(output_path),
-                    scene_number=scene.scene_number,
-                    success=False,
-                    error=error_msg
-                ))
-                if not continue_on_error:
-                    result.success = False
-                    break
+        return ProductionAsset(
+            asset_type="image",
+            path=str(output_path),
+            scene_number=scene.scene_number,
+            success=False,
+            error=img_result.error or "Unknown image generation error"
+        )
 
-        except Exception as e:
-            error_msg = str(e)
-            result.errors.append(f"Image for scene {scene.scene_number}: {error_msg}")
-            if not continue_on_error:
-                result.success = False
-                break
+    outcomes = _map_bounded(
+        generate_scene, list(enumerate(scenes)),
+        max_workers=config.get("image_workers", 1),
+        is_failure=lambda asset: not asset.success,
+        stop_on_failure=not continue_on_error
+    )
+
+    for scene, (asset, error) in zip(scenes, outcomes):
+        if error is None:
+            result.assets.append(asset)
+            if asset.success:
+                continue
+            error_msg = asset.error
+        else:
+            error_msg = str(error)
+        result.errors.append(f"Image for scene {scene.scene_number}: {error_msg}")
+        if not continue_on_error:
+            result.success = False
+            break
 
     # Check if we have enough successful images
     successful_images = [a for a in result.assets if a.success]
@@ -815,8 +1009,99 @@ def add_subtitles(
     return result
 
 
+# === Stage Scheduling ===
+
+@dataclass
+class StageNode:
+    """A production stage in the dependency graph."""
+    name: str
+    run: Callable[[Dict[str, Optional[StageResult]]], Optional[StageResult]]  # None = skipped
+    depends_on: Tuple[str, ...] = ()
+    fatal: bool = False  # A failure stops stages that haven't started
+
+
+def run_stage_graph(
+    nodes: List[StageNode],
+    clock_start: Optional[float] = None
+) -> Tuple[Dict[str, Optional[StageResult]], Dict[str, Dict[str, float]], Optional[str]]:
+    """
+    Run stages as soon as their dependencies finish, independent ones concurrently.
+
+    Each stage is called with the results of the stages finished so far
+    (all of its dependencies included). A failed stage doesn't block its dependents unless it is fatal, in which
+    case nothing new is started (running stages finish). An exception in a
+    stage is re-raised once running stages have finished.
+
+    Returns:
+        (results by name for stages that ran, timings by name, name of the
+        fatal stage that stopped the run or None)
+    """
+    clock_start = clock_start if clock_start is not None else time.perf_counter()
+    results: Dict[str, Optional[StageResult]] = {}
+    timings: Dict[str, Dict[str, float]] = {}
+    stopped_by: Optional[str] = None
+
+    def timed(node: StageNode):
+        start = time.perf_counter()
+        try:
+            return node.run(dict(results))
+        finally:
+            end = time.perf_counter()
+            timings[node.name] = {
+                "start": round(start - clock_start, 3),
+                "end": round(end - clock_start, 3),
+                "duration": round(end - start, 3),
+            }
+
+    pending = list(nodes)
+    running = {}
+    with ThreadPoolExecutor(max_workers=max(1, len(nodes))) as pool:
+        while pending or running:
+            if stopped_by is None:
+                for node in [n for n in pending if all(d in results for d in n.depends_on)]:
+                    pending.remove(node)
+                    running[pool.submit(timed, node)] = node
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                stage_result = future.result()
+                results[node.name] = stage_result
+                if node.fatal and stage_result is not None and not stage_result.success:
+                    stopped_by = stopped_by or node.name
+
+    return results, timings, stopped_by
+
+
 # === Main Production Pipeline ===
 
+def _work_dir(script_content: str, config: Dict[str, Any]) -> Path:
+    """
+    Directory for intermediate files; stable across runs when resuming.
+
+    The default resume directory is keyed by the script alone and created
+    under EPISODE_WORK_ROOT with mode 0700, so other users can neither read
+    nor plant checkpointed assets. Checkpoint keys already cover the
+    settings that change an asset (voice, prompt, size, style), so a config
+    change regenerates only what it affects.
+    """
+    if config.get("work_dir"):
+        work_dir = Path(config["work_dir"])
+    elif config.get("resume"):
+        digest = hashlib.sha256(script_content.encode("utf-8")).hexdigest()[:12]
+        EPISODE_WORK_ROOT.mkdir(mode=0o700, parents=True, exist_ok=True)
+        work_dir = EPISODE_WORK_ROOT / f"episode_{digest}"
+        work_dir.mkdir(mode=0o700, exist_ok=True)
+        os.chmod(work_dir, 0o700)
+        return work_dir
+    else:
+        return Path(tempfile.mkdtemp(prefix="episode_"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    return work_dir
+
+
 def produce_episode(
     script_path: Optional[str] = None,
     script_content: Optional[str] = None,
@@ -839,9 +1124,11 @@ def produce_episode(
     """
     config = {**DEFAULT_CONFIG, **(config or {})}
     result = ProductionResult(success=True)
+    clock_start = time.perf_counter()
 
-    # Create temp directory for intermediate files
-    temp_dir = Path(tempfile.mkdtemp(prefix="episode_"))
+    temp_dir = None
+    resumable = bool(config.get("resume"))
+    owns_work_dir = not config.get("work_dir")
     cleanup_on_failure = config.get("cleanup_on_failure", True)
 
     try:
@@ -863,76 +1150,94 @@ def produce_episode(
             result.errors.append("No script content provided")
             return result
 
+        parse_start = time.perf_counter()
         scenes, dialogue_lines = parse_script(script_content)
         scenes = generate_image_prompts(scenes, config.get("image_style", "cinematic"))
+        parse_end = time.perf_counter()
 
         result.scenes_count = len(scenes)
         result.stages.append(StageResult(
             stage=ProductionStage.PARSE_SCRIPT,
             success=True,
-            warnings=[f"Parsed {len(scenes)} scenes, {len(dialogue_lines)} dialogue lines"]
+            warnings=[f"Parsed {len(scenes)} scenes, {len(dialogue_lines)} dialogue lines"],
+            duration_seconds=parse_end - parse_start
         ))
+        result.stage_timings["parse_script"] = {
+            "start": round(parse_start - clock_start, 3),
+            "end": round(parse_end - clock_start, 3),
+            "duration": round(parse_end - parse_start, 3),
+        }
 
         if not scenes and not dialogue_lines:
             result.success = False
             result.errors.append("No scenes or dialogue found in script")
             return result
 
-        # Stage 2: Generate audio
-        audio_result = generate_audio_assets(
-            dialogue_lines, temp_dir, config, progress_callback
-        )
-        result.stages.append(audio_result)
-        result.audio_files = len([a for a in audio_result.assets if a.success])
-        result.errors.extend(audio_result.errors)
-        result.warnings.extend(audio_result.warnings)
-
-        if not audio_result.success and not config.get("continue_on_error"):
-            result.success = False
-            return result
-
-        # Stage 3: Generate images
-        image_result = generate_image_assets(
-            scenes, temp_dir, config, progress_callback
-        )
-        result.stages.append(image_result)
-        result.image_files = len([a for a in image_result.assets if a.success])
-        result.errors.extend(image_result.errors)
-        result.warnings.extend(image_result.warnings)
-
-        if not image_result.success and not config.get("continue_on_error"):
-            result.success = False
-            return result
-
-        # Stage 4: Compose video
-        video_result = compose_video_assets(
-            image_result.assets, audio_result.assets,
-            temp_dir, config, progress_callback
-        )
-        result.stages.append(video_result)
-        result.errors.extend(video_result.errors)
-        result.warnings.extend(video_result.warnings)
-
-        if not video_result.success:
-            result.success = False
-            return result
-
+        # Intermediate files (and the asset checkpoint) live here
+        temp_dir = _work_dir(script_content, config)
+        checkpoint = AssetCheckpoint(temp_dir) if resumable else None
         raw_video_path = temp_dir / "episode_raw.mp4"
+        final_video_path = temp_dir / "episode_final.mp4"
+        continue_on_error = bool(config.get("continue_on_error"))
+
+        # Stages 2-5 as a dependency graph: audio || images -> compose -> subtitles.
+        # Without continue_on_error, images wait for audio so a failed audio
+        # stage stops the run before any image is paid for.
+        def audio_stage(done):
+            return generate_audio_assets(dialogue_lines, temp_dir, config, progress_callback, checkpoint)
+
+        def image_stage(done):
+            return generate_image_assets(scenes, temp_dir, config, progress_callback, checkpoint)
+
+        def compose_stage(done):
+            return compose_video_assets(
+                done["generate_images"].assets, done["generate_audio"].assets,
+                temp_dir, config, progress_callback
+            )
 
-        # Stage 5: Add subtitles (if enabled)
-        if config.get("generate_subtitles", True) and raw_video_path.exists():
-            final_video_path = temp_dir / "episode_final.mp4"
-
-            subtitle_result = add_subtitles(
+        def subtitle_stage(done):
+            if not config.get("generate_subtitles", True) or not raw_video_path.exists():
+                return None
+            return add_subtitles(
                 raw_video_path, dialogue_lines, final_video_path,
                 config, progress_callback
             )
-            result.stages.append(subtitle_result)
-            result.errors.extend(subtitle_result.errors)
-            result.warnings.extend(subtitle_result.warnings)
 
-            if subtitle_result.success:
-                raw_video_path = final_video_path
+        stage_results, timings, stopped_by = run_stage_graph([
+            StageNode("generate_audio", audio_stage, fatal=not continue_on_error),
+            StageNode(
+                "generate_images", image_stage,
+                () if continue_on_error else ("generate_audio",),
+                fatal=not continue_on_error
+            ),
+            StageNode("compose_video", compose_stage, ("generate_audio", "generate_images"), fatal=True),
+            StageNode("add_subtitles", subtitle_stage, ("compose_video",)),
+        ], clock_start)
+
+        result.stage_timings.update(timings)
+        result.resumed_assets = checkpoint.resumed if checkpoint else 0
+        for name in ("generate_audio", "generate_images", "compose_video", "add_subtitles"):
+            stage_result = stage_results.get(name)
+            if stage_result is None:
+                continue
+            result.stages.append(stage_result)
+            result.errors.extend(stage_result.errors)
+            result.warnings.extend(stage_result.warnings)
+
+        audio_result = stage_results.get("generate_audio")
+        image_result = stage_results.get("generate_images")
+        subtitle_result = stage_results.get("add_subtitles")
+        if audio_result:
+            result.audio_files = len([a for a in audio_result.assets if a.success])
+        if image_result:
+            result.image_files = len([a for a in image_result.assets if a.success])
+
+        if stopped_by:
+            result.success = False
+            return result
+
+        if subtitle_result is not None and subtitle_result.success:
+            raw_video_path = final_video_path
 
         # Stage 6: Finalize - move to output
         if output_path and raw_video_path.exists():
@@ -960,9 +1265,13 @@ def produce_episode(
         result.success = False
         result.errors.append(f"Production error: {str(e)}")
 
-        if cleanup_on_failure and temp_dir.exists():
+        # A resumable work dir keeps its checkpointed assets for the next run
+        if cleanup_on_failure and not resumable and owns_work_dir and temp_dir and temp_dir.exists():
             shutil.rmtree(temp_dir, ignore_errors=True)
 
+    finally:
+        result.wall_clock_seconds = round(time.perf_counter() - clock_start, 3)
+
     return result
 
 
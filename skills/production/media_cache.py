@@ -0,0 +1,338 @@
+"""
+Media Cache - Shared content-addressed cache for generated media.
+
+Used by image_generate, generate_tts and video_generate so repeated
+requests reuse earlier renders instead of calling a paid backend again.
+
+Layout under the cache root:
+    index.sqlite           key -> blob index, access times, sizes
+    blobs/ab/abcd....png   file bytes, named by their sha256
+
+Capabilities:
+- Content addressing: two keys that render to identical bytes share one blob
+- Size bound: least recently used entries are evicted past max_bytes
+- Optional expiry by age (checked on lookup)
+- One SQLite lookup per get(), no directory scans or JSON sidecars
+- Hit / miss / eviction stats
+
+Thread-safe; several processes can share a root (SQLite WAL, blobs are
+written to a temp file and renamed into place).
+
+Phase 3.2.2
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GiB
+AGENT_HOME = Path(os.environ.get("DURO_AGENT_HOME", str(Path.home() / ".agent")))
+DEFAULT_CACHE_ROOT = AGENT_HOME / "cache" / "media"
+INDEX_FILE = "index.sqlite"
+BLOB_DIR = "blobs"
+HASH_CHUNK_BYTES = 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    ext TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    blob_hash TEXT NOT NULL REFERENCES blobs(hash),
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    meta TEXT,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_lru ON entries(accessed_at);
+CREATE INDEX IF NOT EXISTS idx_entries_blob ON entries(blob_hash);
+"""
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """sha256 of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def make_key(**parts: Any) -> str:
+    """Stable cache key from request parameters."""
+    key_str = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(key_str.encode()).hexdigest()
+
+
+def _copy_atomic(src: Path, dest: Path):
+    """Copy src to dest via a temp file so readers never see a partial file."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(dest.parent), prefix=f".{dest.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(str(src), tmp)
+        os.replace(tmp, str(dest))
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class MediaCache:
+    """
+    Content-addressed media store with an SQLite key index and LRU eviction.
+
+    Entries are (namespace, key) -> blob. get() copies the blob to the
+    caller's output path, so callers can edit or delete their file without
+    touching the cache.
+    """
+
+    def __init__(self, root: Union[str, Path], max_bytes: Optional[int] = None):
+        """
+        Args:
+            root: Cache directory (created on first use)
+            max_bytes: Total blob size before LRU eviction (None = DEFAULT_MAX_BYTES)
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes if max_bytes is not None else DEFAULT_MAX_BYTES
+        self.blob_dir = self.root / BLOB_DIR
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stats = {"hits": 0, "misses": 0, "puts": 0, "deduped": 0, "evictions": 0, "expired": 0}
+
+    # --- internals ---
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.blob_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.root / INDEX_FILE), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _blob_path(self, blob_hash: str, ext: str) -> Path:
+        return self.blob_dir / blob_hash[:2] / f"{blob_hash}{ext}"
+
+    def _drop_entry(self, conn: sqlite3.Connection, namespace: str, key: str, blob_hash: str):
+        """Delete an entry and its blob once nothing else references it."""
+        conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+        if conn.execute("SELECT 1 FROM entries WHERE blob_hash = ? LIMIT 1", (blob_hash,)).fetchone():
+            return
+        row = conn.execute("SELECT ext FROM blobs WHERE hash = ?", (blob_hash,)).fetchone()
+        conn.execute("DELETE FROM blobs WHERE hash = ?", (blob_hash,))
+        if row:
+            try:
+                self._blob_path(blob_hash, row[0]).unlink()
+            except OSError:
+                pass
+
+    def _total_bytes(self, conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection, max_bytes: int) -> int:
+        total = self._total_bytes(conn)
+        evicted = 0
+        if total <= max_bytes:
+            return 0
+        lru = conn.execute(
+            "SELECT namespace, key, blob_hash FROM entries ORDER BY accessed_at ASC"
+        ).fetchall()
+        for namespace, key, blob_hash in lru:
+            if total <= max_bytes:
+                break
+            before = conn.execute("SELECT size FROM blobs WHERE hash = ?", (blob_hash,)).fetchone()
+            self._drop_entry(conn, namespace, key, blob_hash)
+            if before and not conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (blob_hash,)).fetchone():
+                total -= before[0]
+            evicted += 1
+        self._stats["evictions"] += evicted
+        return evicted
+
+    # --- public API ---
+
+    def get(
+        self,
+        key: str,
+        namespace: str = "",
+        dest_path: Optional[Union[str, Path]] = None,
+        max_age_seconds: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Look up a key.
+
+        Args:
+            key: Cache key (see make_key)
+            namespace: Skill namespace ("image", "tts", ...)
+            dest_path: Copy the cached bytes here (recommended)
+            max_age_seconds: Treat older entries as expired and drop them
+
+        Returns:
+            dest_path (or the blob path without one) on a hit, None on a miss
+        """
+        if not (self.root / INDEX_FILE).exists():
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+
+        with self._lock:
+            conn = self._db()
+            row = conn.execute(
+                "SELECT e.blob_hash, e.created_at, b.ext FROM entries e "
+                "JOIN blobs b ON b.hash = e.blob_hash WHERE e.namespace = ? AND e.key = ?",
+                (namespace, key)
+            ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+
+            blob_hash, created_at, ext = row
+            blob_path = self._blob_path(blob_hash, ext)
+            now = time.time()
+            if max_age_seconds is not None and now - created_at > max_age_seconds:
+                self._drop_entry(conn, namespace, key, blob_hash)
+                conn.commit()
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            if not blob_path.exists():
+                self._drop_entry(conn, namespace, key, blob_hash)
+                conn.commit()
+                self._stats["misses"] += 1
+                return None
+
+            conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, namespace, key)
+            )
+            conn.commit()
+            self._stats["hits"] += 1
+
+        if dest_path is None:
+            return str(blob_path)
+        dest = Path(dest_path)
+        try:
+            _copy_atomic(blob_path, dest)
+        except FileNotFoundError:
+            return None  # Evicted by another process since the lookup
+        return str(dest)
+
+    def put(
+        self,
+        key: str,
+        source_path: Union[str, Path],
+        namespace: str = "",
+        meta: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Store a file under a key, reusing an existing blob with the same bytes.
+
+        Returns:
+            The blob's sha256
+        """
+        source = Path(source_path)
+        blob_hash = file_digest(source)
+        ext = source.suffix.lower()
+        size = source.stat().st_size
+        now = time.time()
+
+        with self._lock:
+            conn = self._db()
+            existing = conn.execute("SELECT ext FROM blobs WHERE hash = ?", (blob_hash,)).fetchone()
+            if existing and self._blob_path(blob_hash, existing[0]).exists():
+                self._stats["deduped"] += 1
+            else:
+                _copy_atomic(source, self._blob_path(blob_hash, ext))
+                conn.execute(
+                    "INSERT OR REPLACE INTO blobs (hash, size, ext) VALUES (?, ?, ?)",
+                    (blob_hash, size, ext)
+                )
+
+            previous = conn.execute(
+                "SELECT blob_hash FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+            if previous and previous[0] != blob_hash:
+                self._drop_entry(conn, namespace, key, previous[0])
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, blob_hash, created_at, accessed_at, meta) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, blob_hash, now, now, json.dumps(meta, default=str) if meta else None)
+            )
+            self._stats["puts"] += 1
+            self._evict(conn, self.max_bytes)
+            conn.commit()
+
+        return blob_hash
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Evict LRU entries until blobs fit in max_bytes. Returns entries evicted."""
+        with self._lock:
+            conn = self._db()
+            evicted = self._evict(conn, self.max_bytes if max_bytes is None else max_bytes)
+            conn.commit()
+            return evicted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for this process plus current index totals."""
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+            stats["max_bytes"] = self.max_bytes
+            if (self.root / INDEX_FILE).exists():
+                conn = self._db()
+                stats["entries"] = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+                stats["blobs"] = conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+                stats["total_bytes"] = self._total_bytes(conn)
+            else:
+                stats.update(entries=0, blobs=0, total_bytes=0)
+            return stats
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def default_cache_dir(namespace: str) -> Path:
+    """Per-user cache directory for a skill (outside any project or cwd)."""
+    return DEFAULT_CACHE_ROOT / namespace
+
+
+# === Process-wide instances ===
+
+_caches: Dict[str, MediaCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_media_cache(root: Union[str, Path], max_bytes: Optional[int] = None) -> MediaCache:
+    """
+    Get the shared MediaCache for a root directory.
+
+    Skills pointing at the same directory share one instance (and one size
+    budget). A max_bytes argument updates the budget of an existing instance.
+    """
+    resolved = str(Path(root).resolve())
+    with _caches_lock:
+        cache = _caches.get(resolved)
+        if cache is None:
+            cache = _caches[resolved] = MediaCache(resolved, max_bytes)
+        elif max_bytes is not None:
+            cache.max_bytes = max_bytes
+        return cache
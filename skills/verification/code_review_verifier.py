@@ -1,7 +1,7 @@
 """
 Skill: code_review_verifier
 Description: AST-based code review with configurable rules
-Version: 1.0.0
+Version: 1.1.0
 Tier: untested
 
 AST-based code review that goes beyond regex patterns:
@@ -9,6 +9,7 @@ AST-based code review that goes beyond regex patterns:
 - JavaScript/TypeScript: Uses tree-sitter (optional)
 - Configurable rule sets per project
 - Integration with code_quality_verifier for combined checks
+- Per-file findings cache (cache_dir) and parallel analysis of changed files
 
 Categories:
 - STRUCTURE: Function complexity, nesting depth, file length
@@ -31,14 +32,18 @@ Usage:
 """
 
 import ast
+import hashlib
+import json
 import os
 import sys
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 import re
+import time
 
 
 # Skill metadata
@@ -46,7 +51,7 @@ SKILL_META = {
     "name": "code_review_verifier",
     "description": "AST-based code review with configurable rules",
     "tier": "tested",
-    "version": "1.0.0",
+    "version": "1.1.0",
     "author": "duro",
     "phase": "3.1",
     "triggers": ["review code", "code review", "check code", "analyze code"],
@@ -113,6 +118,20 @@ DEFAULT_CONFIG = {
 }
 
 
+# Bump when a rule changes what it reports, so cached findings are dropped
+ANALYZER_VERSION = "2"
+
+CACHE_FILE = "review_cache.json"
+
+# Cache misses are analyzed in a process pool above this many files
+REVIEW_WORKERS = min(8, os.cpu_count() or 1)
+PARALLEL_MIN_FILES = 16
+
+# A file modified this close to when it was hashed may change again
+# without its size or mtime moving; don't trust its stat entry.
+RACY_MTIME_NS = 2_000_000_000
+
+
 # === AST ANALYZERS ===
 
 class ComplexityVisitor(ast.NodeVisitor):
@@ -213,6 +232,10 @@ class SecurityVisitor(ast.NodeVisitor):
         self.findings: List[Tuple[int, int, str, str]] = []  # line, col, issue, message
 
     def visit_Call(self, node):
+        self.check_call(node)
+        self.generic_visit(node)
+
+    def check_call(self, node: ast.Call):
         # Direct call: eval(...), exec(...), compile(...)
         # Only flag these for banned built-in functions
         if isinstance(node.func, ast.Name):
@@ -262,8 +285,6 @@ class SecurityVisitor(ast.NodeVisitor):
                             "subprocess with shell=True is vulnerable to injection"
                         ))
 
-        self.generic_visit(node)
-
 
 class NamingVisitor(ast.NodeVisitor):
     """Check naming conventions."""
@@ -297,19 +318,91 @@ class NamingVisitor(ast.NodeVisitor):
                 f"{kind} '{name}' doesn't follow {expected} convention"
             ))
 
+    def check_definition(self, node):
+        if isinstance(node, ast.ClassDef):
+            self._check_name(node.name, "PascalCase", node, "Class")
+        else:
+            self._check_name(node.name, self.convention, node, "Function")
+
     def visit_FunctionDef(self, node):
-        self._check_name(node.name, self.convention, node, "Function")
+        self.check_definition(node)
         self.generic_visit(node)
 
     def visit_AsyncFunctionDef(self, node):
-        self._check_name(node.name, self.convention, node, "Function")
+        self.check_definition(node)
         self.generic_visit(node)
 
     def visit_ClassDef(self, node):
-        self._check_name(node.name, "PascalCase", node, "Class")
+        self.check_definition(node)
         self.generic_visit(node)
 
 
+class ReviewVisitor:
+    """
+    All per-file analyses in one tree walk.
+
+    Collects what ComplexityVisitor (per function), NestingVisitor,
+    SecurityVisitor and NamingVisitor would, in the order they would
+    report it, without walking the tree four times plus once per function.
+    """
+
+    COMPLEXITY_NODES = (ast.If, ast.For, ast.While, ast.ExceptHandler, ast.With, ast.comprehension)
+    NESTING_NODES = (ast.If, ast.For, ast.While, ast.With, ast.Try)
+
+    def __init__(self, banned_functions: List[str], convention: str = "snake_case"):
+        self.security = SecurityVisitor(banned_functions)
+        self.naming = NamingVisitor(convention)
+        # (tree level, preorder index, node, complexity) per function
+        self.functions: List[List[Any]] = []
+        self.max_depth = 0
+        self.deepest_location = (0, 0)
+        self._depth = 0
+        self._open_functions: List[List[Any]] = []
+
+    def visit(self, tree: ast.AST):
+        self._walk(tree, 0)
+        # ast.walk order (breadth-first), as the per-function checks used
+        self.functions.sort(key=lambda f: (f[0], f[1]))
+
+    def _walk(self, node: ast.AST, level: int):
+        is_function = isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        if is_function:
+            entry = [level, len(self.functions), node, 1]
+            self.functions.append(entry)
+            self._open_functions.append(entry)
+
+        # A function's complexity counts every node beneath it, nested functions included
+        if isinstance(node, self.COMPLEXITY_NODES):
+            increment = 1
+        elif isinstance(node, ast.BoolOp):
+            increment = len(node.values) - 1
+        else:
+            increment = 0
+        if increment:
+            for entry in self._open_functions:
+                entry[3] += increment
+
+        if isinstance(node, ast.Call):
+            self.security.check_call(node)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            self.naming.check_definition(node)
+
+        nests = isinstance(node, self.NESTING_NODES)
+        if nests:
+            self._depth += 1
+            if self._depth > self.max_depth:
+                self.max_depth = self._depth
+                self.deepest_location = (getattr(node, 'lineno', 0), getattr(node, 'col_offset', 0))
+
+        for child in ast.iter_child_nodes(node):
+            self._walk(child, level + 1)
+
+        if nests:
+            self._depth -= 1
+        if is_function:
+            self._open_functions.pop()
+
+
 def analyze_python_file(
     file_path: str,
     content: str,
@@ -358,92 +451,90 @@ def analyze_python_file(
             suggestion="Consider splitting into multiple modules"
         ))
 
+    visitor = ReviewVisitor(
+        config.get("banned_functions", []),
+        config.get("naming_convention", "snake_case")
+    )
+    visitor.visit(tree)
+
     # Analyze functions
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            # Complexity
-            complexity_visitor = ComplexityVisitor()
-            complexity_visitor.visit(node)
-            max_complexity = config.get("max_function_complexity", 10)
-
-            if complexity_visitor.complexity > max_complexity:
+    for _, _, node, complexity in visitor.functions:
+        # Complexity
+        max_complexity = config.get("max_function_complexity", 10)
+
+        if complexity > max_complexity:
+            findings.append(Finding(
+                rule_id="high_complexity",
+                category=Category.STRUCTURE,
+                severity=Severity.WARN,
+                file_path=file_path,
+                line=node.lineno,
+                column=node.col_offset,
+                message=f"Function '{node.name}' has complexity {complexity} (max: {max_complexity})",
+                suggestion="Consider breaking into smaller functions"
+            ))
+
+        # Function length
+        if hasattr(node, 'end_lineno') and node.end_lineno:
+            func_lines = node.end_lineno - node.lineno
+            max_lines = config.get("max_function_lines", 50)
+            if func_lines > max_lines:
                 findings.append(Finding(
-                    rule_id="high_complexity",
+                    rule_id="function_too_long",
                     category=Category.STRUCTURE,
                     severity=Severity.WARN,
                     file_path=file_path,
                     line=node.lineno,
                     column=node.col_offset,
-                    message=f"Function '{node.name}' has complexity {complexity_visitor.complexity} (max: {max_complexity})",
-                    suggestion="Consider breaking into smaller functions"
+                    message=f"Function '{node.name}' has {func_lines} lines (max: {max_lines})",
+                    suggestion="Consider refactoring into smaller functions"
                 ))
 
-            # Function length
-            if hasattr(node, 'end_lineno') and node.end_lineno:
-                func_lines = node.end_lineno - node.lineno
-                max_lines = config.get("max_function_lines", 50)
-                if func_lines > max_lines:
-                    findings.append(Finding(
-                        rule_id="function_too_long",
-                        category=Category.STRUCTURE,
-                        severity=Severity.WARN,
-                        file_path=file_path,
-                        line=node.lineno,
-                        column=node.col_offset,
-                        message=f"Function '{node.name}' has {func_lines} lines (max: {max_lines})",
-                        suggestion="Consider refactoring into smaller functions"
-                    ))
+        # Too many arguments
+        max_args = config.get("max_arguments", 5)
+        arg_count = len(node.args.args) + len(node.args.kwonlyargs)
+        if arg_count > max_args:
+            findings.append(Finding(
+                rule_id="too_many_arguments",
+                category=Category.STRUCTURE,
+                severity=Severity.WARN,
+                file_path=file_path,
+                line=node.lineno,
+                column=node.col_offset,
+                message=f"Function '{node.name}' has {arg_count} arguments (max: {max_args})",
+                suggestion="Consider using a dataclass or config object"
+            ))
 
-            # Too many arguments
-            max_args = config.get("max_arguments", 5)
-            arg_count = len(node.args.args) + len(node.args.kwonlyargs)
-            if arg_count > max_args:
+        # Missing docstring
+        if config.get("required_docstrings", True):
+            if not ast.get_docstring(node):
                 findings.append(Finding(
-                    rule_id="too_many_arguments",
-                    category=Category.STRUCTURE,
-                    severity=Severity.WARN,
+                    rule_id="missing_docstring",
+                    category=Category.STYLE,
+                    severity=Severity.INFO,
                     file_path=file_path,
                     line=node.lineno,
                     column=node.col_offset,
-                    message=f"Function '{node.name}' has {arg_count} arguments (max: {max_args})",
-                    suggestion="Consider using a dataclass or config object"
+                    message=f"Function '{node.name}' is missing a docstring"
                 ))
 
-            # Missing docstring
-            if config.get("required_docstrings", True):
-                if not ast.get_docstring(node):
-                    findings.append(Finding(
-                        rule_id="missing_docstring",
-                        category=Category.STYLE,
-                        severity=Severity.INFO,
-                        file_path=file_path,
-                        line=node.lineno,
-                        column=node.col_offset,
-                        message=f"Function '{node.name}' is missing a docstring"
-                    ))
-
     # Nesting depth
-    nesting_visitor = NestingVisitor()
-    nesting_visitor.visit(tree)
     max_nesting = config.get("max_nesting_depth", 4)
 
-    if nesting_visitor.max_depth > max_nesting:
+    if visitor.max_depth > max_nesting:
         findings.append(Finding(
             rule_id="deep_nesting",
             category=Category.STRUCTURE,
             severity=Severity.WARN,
             file_path=file_path,
-            line=nesting_visitor.deepest_location[0],
-            column=nesting_visitor.deepest_location[1],
-            message=f"Nesting depth is {nesting_visitor.max_depth} (max: {max_nesting})",
+            line=visitor.deepest_location[0],
+            column=visitor.deepest_location[1],
+            message=f"Nesting depth is {visitor.max_depth} (max: {max_nesting})",
             suggestion="Consider early returns or extracting to functions"
         ))
 
     # Security checks
-    security_visitor = SecurityVisitor(config.get("banned_functions", []))
-    security_visitor.visit(tree)
-
-    for line, col, rule_id, message in security_visitor.findings:
+    for line, col, rule_id, message in visitor.security.findings:
         findings.append(Finding(
             rule_id=rule_id,
             category=Category.SECURITY,
@@ -456,10 +547,7 @@ def analyze_python_file(
         ))
 
     # Naming conventions
-    naming_visitor = NamingVisitor(config.get("naming_convention", "snake_case"))
-    naming_visitor.visit(tree)
-
-    for line, col, rule_id, message in naming_visitor.findings:
+    for line, col, rule_id, message in visitor.naming.findings:
         findings.append(Finding(
             rule_id=rule_id,
             category=Category.STYLE,
@@ -473,6 +561,173 @@ def analyze_python_file(
     return findings
 
 
+def finding_to_dict(f: Finding) -> Dict[str, Any]:
+    """Serialize a finding for results and the cache."""
+    return {
+        "rule_id": f.rule_id,
+        "category": f.category.value,
+        "severity": f.severity.value,
+        "file_path": f.file_path,
+        "line": f.line,
+        "column": f.column,
+        "message": f.message,
+        "snippet": f.snippet,
+        "suggestion": f.suggestion,
+        "confidence": f.confidence,
+    }
+
+
+def finding_from_dict(d: Dict[str, Any]) -> Finding:
+    return Finding(
+        rule_id=d["rule_id"],
+        category=Category(d["category"]),
+        severity=Severity(d["severity"]),
+        file_path=d["file_path"],
+        line=d["line"],
+        column=d["column"],
+        message=d["message"],
+        snippet=d.get("snippet"),
+        suggestion=d.get("suggestion"),
+        confidence=d.get("confidence", 0.9),
+    )
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """Stable hash of a review config (key order doesn't matter)."""
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class ReviewCache:
+    """
+    Persistent per-file findings, keyed by (content hash, config hash).
+
+    Stored as one JSON file in cache_dir:
+        files:   path -> [size, mtime_ns, content_hash, hashed_at_ns]
+        results: content_hash -> {config_hash: [finding dicts]}
+
+    The stat entry lets an unchanged file be looked up without reading it.
+    The whole cache is dropped when ANALYZER_VERSION changes. Findings are
+    stored with the path they were computed for and re-pathed on lookup, so
+    identical files share one entry.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.path = Path(cache_dir) / CACHE_FILE
+        self.files: Dict[str, List[Any]] = {}
+        self.results: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self.hits = 0
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("analyzer_version") != ANALYZER_VERSION:
+            return
+        self.files = data.get("files", {})
+        self.results = data.get("results", {})
+
+    def content_hash_from_stat(self, file_path: str) -> Optional[str]:
+        """Content hash recorded for file_path if its size and mtime are unchanged."""
+        entry = self.files.get(file_path)
+        if not entry:
+            return None
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        size, mtime_ns, content_hash, hashed_at_ns = entry
+        if st.st_size != size or st.st_mtime_ns != mtime_ns:
+            return None
+        if hashed_at_ns - mtime_ns < RACY_MTIME_NS:
+            return None
+        return content_hash
+
+    def record_stat(self, file_path: str, content_hash: str):
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return
+        self.files[file_path] = [st.st_size, st.st_mtime_ns, content_hash, time.time_ns()]
+        self._dirty = True
+
+    def get(self, file_path: str, content_hash: str, cfg_hash: str) -> Optional[List[Finding]]:
+        cached = self.results.get(content_hash, {}).get(cfg_hash)
+        if cached is None:
+            return None
+        self.hits += 1
+        return [finding_from_dict({**d, "file_path": file_path}) for d in cached]
+
+    def put(self, content_hash: str, cfg_hash: str, findings: List[Finding]):
+        self.results.setdefault(content_hash, {})[cfg_hash] = [finding_to_dict(f) for f in findings]
+        self._dirty = True
+
+    def save(self):
+        """Write the cache atomically, dropping results no tracked file points at."""
+        if not self._dirty:
+            return
+        live = {entry[2] for entry in self.files.values()}
+        results = {h: r for h, r in self.results.items() if h in live}
+        data = {"analyzer_version": ANALYZER_VERSION, "files": self.files, "results": results}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass  # A cache that can't be written just means a cold run next time
+        self._dirty = False
+
+
+def _analyze_job(file_path: str, content: str, config: Dict[str, Any]) -> List[Finding]:
+    """analyze_python_file, with failures reported as findings (pool-safe)."""
+    try:
+        return analyze_python_file(file_path, content, config)
+    except Exception as e:
+        return [_read_error(file_path, e)]
+
+
+def _read_error(file_path: str, error: Exception) -> Finding:
+    return Finding(
+        rule_id="read_error",
+        category=Category.STRUCTURE,
+        severity=Severity.ERROR,
+        file_path=file_path,
+        line=1,
+        column=0,
+        message=f"Could not read file: {str(error)}"
+    )
+
+
+def _analyze_many(
+    jobs: List[Tuple[str, str]],
+    config: Dict[str, Any],
+    workers: int
+) -> List[List[Finding]]:
+    """Analyze (path, content) jobs, across processes when there are enough."""
+    if workers > 1 and len(jobs) >= PARALLEL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+        from itertools import repeat
+
+        paths = [path for path, _ in jobs]
+        contents = [content for _, content in jobs]
+        chunksize = max(1, len(jobs) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(_analyze_job, paths, contents, repeat(config), chunksize=chunksize))
+        except Exception:
+            # No usable pool (e.g. the skill was loaded from a path a spawned
+            # worker can't import): analyze in this process instead.
+            pass
+
+    return [_analyze_job(path, content, config) for path, content in jobs]
+
+
 def run(args: Dict[str, Any], tools: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     """
     Main skill execution function.
@@ -482,6 +737,8 @@ def run(args: Dict[str, Any], tools: Dict[str, Any], context: Dict[str, Any]) ->
             files: List[str] - files to review (or glob pattern)
             config: Dict - review configuration overrides
             fail_on: str - severity level to fail on (error, warn, info)
+            cache_dir: str - persist per-file findings here (optional)
+            workers: int - processes for analyzing uncached files
         }
         tools: {
             read_file: callable
@@ -496,14 +753,17 @@ def run(args: Dict[str, Any], tools: Dict[str, Any], context: Dict[str, Any]) ->
             findings: List[dict] - all findings
             summary: dict - counts by severity
             files_reviewed: int
+            cache: dict - hits/misses (when cache_dir is set)
         }
     """
-    import time
     start_time = time.time()
 
     files = args.get("files", [])
     config = {**DEFAULT_CONFIG, **args.get("config", {})}
     fail_on = args.get("fail_on", "error")
+    workers = args.get("workers", REVIEW_WORKERS)
+    cache = ReviewCache(args["cache_dir"]) if args.get("cache_dir") else None
+    cfg_hash = config_hash(config)
 
     # Expand glob patterns
     if isinstance(files, str):
@@ -519,7 +779,9 @@ def run(args: Dict[str, Any], tools: Dict[str, Any], context: Dict[str, Any]) ->
         else:
             expanded_files.append(f)
 
-    all_findings: List[Finding] = []
+    # Findings per file, in input order; None until analyzed
+    per_file: List[Optional[List[Finding]]] = []
+    misses: List[Tuple[int, str, str, Optional[str]]] = []  # slot, path, content, content hash
     files_reviewed = 0
 
     for file_path in expanded_files:
@@ -527,27 +789,50 @@ def run(args: Dict[str, Any], tools: Dict[str, Any], context: Dict[str, Any]) ->
         if not file_path.endswith('.py'):
             continue
 
+        slot = len(per_file)
+        per_file.append(None)
+
+        if cache:
+            content_hash = cache.content_hash_from_stat(file_path)
+            cached = cache.get(file_path, content_hash, cfg_hash) if content_hash else None
+            if cached is not None:
+                per_file[slot] = cached
+                files_reviewed += 1
+                continue
+
         try:
             if tools.get("read_file"):
                 content = tools["read_file"](file_path)
             else:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
-
-            findings = analyze_python_file(file_path, content, config)
-            all_findings.extend(findings)
-            files_reviewed += 1
-
         except Exception as e:
-            all_findings.append(Finding(
-                rule_id="read_error",
-                category=Category.STRUCTURE,
-                severity=Severity.ERROR,
-                file_path=file_path,
-                line=1,
-                column=0,
-                message=f"Could not read file: {str(e)}"
-            ))
+            per_file[slot] = [_read_error(file_path, e)]
+            continue
+
+        files_reviewed += 1
+        content_hash = None
+        if cache:
+            content_hash = hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+            cache.record_stat(file_path, content_hash)
+            cached = cache.get(file_path, content_hash, cfg_hash)
+            if cached is not None:
+                per_file[slot] = cached
+                continue
+        misses.append((slot, file_path, content, content_hash))
+
+    analyzed = _analyze_many([(path, content) for _, path, content, _ in misses], config, workers)
+    for (slot, _, _, content_hash), findings in zip(misses, analyzed):
+        per_file[slot] = findings
+        if any(f.rule_id == "read_error" for f in findings):
+            files_reviewed -= 1
+        elif cache:
+            cache.put(content_hash, cfg_hash, findings)
+
+    if cache:
+        cache.save()
+
+    all_findings: List[Finding] = [f for findings in per_file for f in findings]
 
     # Calculate summary
     summary = {
@@ -569,29 +854,18 @@ def run(args: Dict[str, Any], tools: Dict[str, Any], context: Dict[str, Any]) ->
 
     duration_ms = int((time.time() - start_time) * 1000)
 
-    return {
+    result = {
         "success": True,
         "passed": passed,
-        "findings": [
-            {
-                "rule_id": f.rule_id,
-                "category": f.category.value,
-                "severity": f.severity.value,
-                "file_path": f.file_path,
-                "line": f.line,
-                "column": f.column,
-                "message": f.message,
-                "snippet": f.snippet,
-                "suggestion": f.suggestion,
-                "confidence": f.confidence,
-            }
-            for f in all_findings
-        ],
+        "findings": [finding_to_dict(f) for f in all_findings],
         "summary": summary,
         "files_reviewed": files_reviewed,
         "duration_ms": duration_ms,
         "config_used": config,
     }
+    if cache:
+        result["cache"] = {"hits": cache.hits, "misses": len(misses)}
+    return result
 
 
 # Export key components
@@ -600,6 +874,7 @@ __all__ = [
     "REQUIRES",
     "run",
     "analyze_python_file",
+    "ReviewCache",
     "Finding",
     "ReviewResult",
     "Severity",
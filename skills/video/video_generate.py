@@ -7,11 +7,13 @@ Capabilities:
 - Camera control instructions
 - Cost tracking per generation
 - Progress callbacks for long operations
+- Size-bounded media cache for repeated requests
 
 Phase 3.2.2
 """
 
 import os
+import sys
 import json
 import time
 import urllib.request
@@ -22,12 +24,21 @@ from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
+# Shared media cache (skills/production/media_cache.py)
+_PRODUCTION_SKILLS_DIR = str(Path(__file__).resolve().parent.parent / "production")
+if _PRODUCTION_SKILLS_DIR not in sys.path:
+    sys.path.append(_PRODUCTION_SKILLS_DIR)
+
+from media_cache import default_cache_dir, file_digest, get_media_cache, make_key
+
+CACHE_NAMESPACE = "video"
+
 
 SKILL_META = {
     "name": "video_generate",
     "description": "Generate AI videos with multi-backend fallback chain (Minimax, Kling)",
     "tier": "tested",
-    "version": "1.0.0",
+    "version": "1.1.0",
     "phase": "3.2",
     "keywords": [
         "video", "generate", "ai", "clip", "animation",
@@ -74,6 +85,7 @@ class VideoResult:
     height: int = 0
     file_size_bytes: int = 0
     estimated_cost: float = 0.0
+    cached: bool = False
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
@@ -101,6 +113,11 @@ class VideoRequest:
 
 
 DEFAULT_CONFIG = {
+    # Cache settings
+    "cache_enabled": True,
+    "cache_dir": None,  # None = per-user dir under DURO_AGENT_HOME (~/.agent/cache/media/video)
+    "cache_expiry_hours": 168,  # 1 week
+    "cache_max_mb": 8192,  # LRU eviction past this size
     # Minimax/Hailuo settings
     "minimax_api_key_env": "MINIMAX_API_KEY",
     "minimax_base_url": "https://api.minimax.io/v1/video_generation",
@@ -362,6 +379,30 @@ BACKEND_HANDLERS = {
 
 # === Main Generation Function ===
 
+def get_cache_key(request: VideoRequest) -> str:
+    """Cache key from request parameters (and the source image's bytes)."""
+    image_digest = None
+    if request.image_path and Path(request.image_path).exists():
+        image_digest = file_digest(request.image_path)
+    return make_key(
+        prompt=request.prompt,
+        mode=request.mode.value,
+        image=image_digest,
+        duration=request.duration,
+        width=request.width,
+        height=request.height,
+        camera_control=request.camera_control,
+    )
+
+
+def _media_cache(config: Dict[str, Any]):
+    cache_mb = config.get("cache_max_mb", DEFAULT_CONFIG["cache_max_mb"])
+    return get_media_cache(
+        config.get("cache_dir") or default_cache_dir(CACHE_NAMESPACE),
+        max_bytes=int(cache_mb * 1024 * 1024) if cache_mb is not None else None
+    )
+
+
 def generate_video(
     request: VideoRequest,
     config: Dict[str, Any],
@@ -372,6 +413,36 @@ def generate_video(
     """
     last_error = None
 
+    # Check cache first
+    cache_key = None
+    if config.get("cache_enabled", DEFAULT_CONFIG["cache_enabled"]):
+        expiry_hours = config.get("cache_expiry_hours", DEFAULT_CONFIG["cache_expiry_hours"])
+        try:
+            cache_key = get_cache_key(request)
+            cached_path = _media_cache(config).get(
+                cache_key,
+                namespace=CACHE_NAMESPACE,
+                dest_path=request.output_path,
+                max_age_seconds=expiry_hours * 3600 if expiry_hours is not None else None
+            )
+        except Exception:
+            cached_path = None
+        if cached_path:
+            return VideoResult(
+                success=True,
+                path=cached_path,
+                prompt=request.prompt,
+                duration_seconds=request.duration,
+                width=request.width,
+                height=request.height,
+                file_size_bytes=Path(cached_path).stat().st_size,
+                cached=True,
+                metadata={
+                    "mode": request.mode.value,
+                    "camera_control": request.camera_control,
+                }
+            )
+
     for i, backend in enumerate(request.backends):
         if progress_callback:
             progress_callback({
@@ -399,6 +470,16 @@ def generate_video(
                 except Exception:
                     file_size = 0
 
+                # Save to cache
+                if cache_key:
+                    try:
+                        _media_cache(config).put(
+                            cache_key, output_path, namespace=CACHE_NAMESPACE,
+                            meta={"prompt": request.prompt, "backend": backend.value}
+                        )
+                    except Exception:
+                        pass
+
                 # Calculate estimated cost
                 cost_per_second = BACKEND_COSTS_PER_SECOND.get(backend, 0)
                 estimated_cost = cost_per_second * request.duration
@@ -505,7 +586,11 @@ def run(
     return {
         "success": result.success,
         "result": result.to_dict(),
-        "summary": f"Generated {result.duration_seconds}s video via {result.backend_used.value}" if result.success else f"Failed: {result.error}",
+        "summary": (
+            f"Failed: {result.error}" if not result.success
+            else f"Reused cached {result.duration_seconds}s video" if result.cached
+            else f"Generated {result.duration_seconds}s video via {result.backend_used.value}"
+        ),
         "estimated_cost": result.estimated_cost,
     }
 
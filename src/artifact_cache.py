@@ -0,0 +1,159 @@
+"""
+Read cache for parsed, signature-verified artifacts.
+
+ArtifactStore.get_artifact() used to do an index lookup, read and parse
+the JSON file and verify its provenance HMAC on every call. Proactive
+recall, decision review and decay re-read the same hot artifacts many
+times, so the verified result is kept here, keyed by the file it came
+from:
+
+- An entry is valid while its file has the same (mtime_ns, size) and the
+  provenance key context it was verified under is unchanged; each hit
+  costs one stat() call.
+- ArtifactStore invalidates an entry on every write or delete it makes.
+  Writes from other processes change the file's mtime/size and miss.
+- A reader takes generation() before reading and hands it to put(); if
+  the artifact was invalidated in between, the put is dropped. Otherwise
+  a read racing a same-size rewrite within one mtime tick could cache the
+  old content under a signature that still matches.
+- Bounded LRU (DURO_ARTIFACT_CACHE_SIZE entries, 0 disables).
+- Copy-on-read: callers get a fresh copy and can mutate it freely.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = int(os.environ.get("DURO_ARTIFACT_CACHE_SIZE", "1024"))
+
+
+def clone_json(value: Any) -> Any:
+    """Deep copy of parsed JSON (dicts, lists, scalars); faster than copy.deepcopy."""
+    if isinstance(value, dict):
+        return {k: clone_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [clone_json(v) for v in value]
+    return value
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class ArtifactReadCache:
+    """
+    Bounded LRU of artifact_id -> (file_path, signature, key_context, artifact).
+
+    The stored artifact already carries its signature_status and is never
+    handed out directly.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, tuple, Any, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._invalidated: Dict[str, int] = {}  # artifact_id -> generation it was last invalidated at
+        self._floor = 0  # Puts from before this generation are dropped (_invalidated was reset)
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.dropped_puts = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, artifact_id: str, key_context: Any) -> Optional[Dict[str, Any]]:
+        """A copy of the cached artifact if its file is unchanged, else None."""
+        with self._lock:
+            entry = self._entries.get(artifact_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+        file_path, signature, context, artifact = entry
+        if context != key_context or file_signature(file_path) != signature:
+            with self._lock:
+                if self._entries.get(artifact_id) is entry:
+                    del self._entries[artifact_id]
+                self.stale += 1
+                self.misses += 1
+            return None
+
+        with self._lock:
+            if artifact_id in self._entries:
+                self._entries.move_to_end(artifact_id)
+            self.hits += 1
+        return clone_json(artifact)
+
+    def generation(self) -> int:
+        """Token to take before reading an artifact file and pass to put()."""
+        with self._lock:
+            return self._generation
+
+    def put(self, artifact_id: str, file_path: str, signature: Tuple[int, int], key_context: Any,
+            artifact: Dict[str, Any], generation: int):
+        """
+        Cache a copy of an artifact read from file_path.
+
+        Args:
+            signature: file_signature() taken before the file was read
+            key_context: Anything that changes when verification would give a different result
+            generation: generation() taken before the file was read; the put
+                is dropped if the artifact was invalidated since
+        """
+        if not self.enabled:
+            return
+        entry = (file_path, signature, key_context, clone_json(artifact))
+        with self._lock:
+            if generation < self._floor or self._invalidated.get(artifact_id, 0) > generation:
+                self.dropped_puts += 1
+                return
+            self._entries[artifact_id] = entry
+            self._entries.move_to_end(artifact_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, artifact_id: str):
+        with self._lock:
+            self._generation += 1
+            self._invalidated[artifact_id] = self._generation
+            if len(self._invalidated) > max(self.max_entries, 1024):
+                # Keep the map bounded: drop every put that started before now
+                self._invalidated.clear()
+                self._floor = self._generation
+            if self._entries.pop(artifact_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._invalidated.clear()
+            self._floor = self._generation
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "dropped_puts": self.dropped_puts,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
@@ -3,6 +3,7 @@ Artifact storage layer for Duro memory system.
 Handles creation, validation, storage, and retrieval of artifacts.
 """
 
+import atexit
 import hashlib
 import json
 import os
@@ -10,6 +11,8 @@ import random
 import string
 import sys
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
@@ -20,6 +23,8 @@ from typing import Any, Optional
 from schemas import validate_artifact, TYPE_DIRECTORIES, apply_backward_compat_defaults
 from index import ArtifactIndex
 from embedding_worker import EmbeddingQueue
+from write_behind import WriteBehindWorker
+from artifact_cache import ArtifactReadCache, clone_json, file_signature
 
 # Provenance signing
 from provenance_signing import (
@@ -33,6 +38,15 @@ from provenance_signing import (
 # Default to "1" for security - explicitly set to "0" only for migration/testing.
 PROVENANCE_REQUIRED = os.environ.get("DURO_PROVENANCE_REQUIRED", "1") == "1"
 
+# DURO_WRITE_BEHIND: When set to "1", saves return once the JSON file and index
+# row are written; FTS text and embeddings are group-committed in the background.
+WRITE_BEHIND_ENABLED = os.environ.get("DURO_WRITE_BEHIND", "0") == "1"
+
+# get_artifacts_many: batches of at least PARALLEL_READ_MIN uncached files are
+# read on a pool of DURO_ARTIFACT_READ_WORKERS threads
+READ_POOL_WORKERS = int(os.environ.get("DURO_ARTIFACT_READ_WORKERS", "4"))
+PARALLEL_READ_MIN = 16
+
 # Module-level lock for audit chain atomicity
 # Prevents concurrent prev_hash read + append races within a single process.
 #
@@ -47,6 +61,11 @@ PROVENANCE_REQUIRED = os.environ.get("DURO_PROVENANCE_REQUIRED", "1") == "1"
 # See KNOWN_LIMITATIONS.md for details.
 _AUDIT_CHAIN_LOCK = threading.Lock()
 
+
+def _provenance_key_context() -> str:
+    """Changes with the provenance key set, so cached verifications are redone on rotation."""
+    return os.environ.get("DURO_PROVENANCE_HMAC_KEYS", "")
+
 # Platform-specific file locking
 if sys.platform == "win32":
     import msvcrt
@@ -251,7 +270,12 @@ class ArtifactStore:
     Files are canonical, SQLite is the query index.
     """
 
-    def __init__(self, memory_dir: str | Path, db_path: str | Path):
+    def __init__(
+        self,
+        memory_dir: str | Path,
+        db_path: str | Path,
+        write_behind: Optional[bool] = None
+    ):
         self.memory_dir = Path(memory_dir)
         self.index = ArtifactIndex(db_path)
         # Ensure backup directory exists
@@ -260,6 +284,51 @@ class ArtifactStore:
         # Initialize embedding queue (Phase 1A)
         self.embedding_queue = EmbeddingQueue(self.memory_dir)
 
+        # Optional write-behind for FTS/embedding work (default: DURO_WRITE_BEHIND)
+        if write_behind is None:
+            write_behind = WRITE_BEHIND_ENABLED
+        self.write_behind: Optional[WriteBehindWorker] = None
+        if write_behind:
+            self.write_behind = WriteBehindWorker(self._write_behind_batch)
+            self.write_behind.start()
+            atexit.register(self.write_behind.stop)
+
+        # Parsed, signature-verified artifacts for get_artifact() (DURO_ARTIFACT_CACHE_SIZE)
+        self.read_cache = ArtifactReadCache()
+        # File loading pool for get_artifacts_many (created on first large batch)
+        self._read_pool: Optional[ThreadPoolExecutor] = None
+        self._read_pool_lock = threading.Lock()
+
+    def _write_behind_batch(self, artifacts: list[dict]):
+        """Group commit for queued saves: one FTS transaction, one embedding batch."""
+        self.index.populate_fts_text_many(artifacts)
+
+        from embeddings import is_embedding_available
+        if is_embedding_available():
+            by_id = {a["id"]: a for a in artifacts}
+            self.embed_artifacts(list(by_id), preloaded=by_id)
+
+    def flush_writes(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued write-behind work (FTS text, embeddings) to commit.
+        Returns True when drained (always True if write-behind is off).
+        """
+        if self.write_behind is None:
+            return True
+        return self.write_behind.flush(timeout)
+
+    def get_write_behind_stats(self) -> dict:
+        """Write-behind queue depth and counters for health reporting."""
+        if self.write_behind is None:
+            return {"enabled": False}
+        stats = self.write_behind.get_stats()
+        stats["enabled"] = True
+        return stats
+
+    def get_read_cache_stats(self) -> dict:
+        """get_artifact() cache size and hit rate for health reporting."""
+        return self.read_cache.get_stats()
+
     def _backup_artifact(
         self,
         artifact_id: str,
@@ -831,9 +900,9 @@ class ArtifactStore:
         )
 
         results = []
-        for entry in entries:
-            # Load full artifact to get data
-            artifact = self.get_artifact(entry["id"])
+        # Load full artifacts to get data
+        artifacts, _ = self.get_artifacts_many([entry["id"] for entry in entries])
+        for entry, artifact in zip(entries, artifacts):
             if not artifact:
                 continue
 
@@ -1171,8 +1240,8 @@ class ArtifactStore:
 
         # Query index for decision_validation artifacts
         all_validations = self.index.query(artifact_type="decision_validation")
-        for v in all_validations:
-            artifact = self.get_artifact(v["id"])
+        artifacts, _ = self.get_artifacts_many([v["id"] for v in all_validations])
+        for artifact in artifacts:
             if artifact and artifact.get("data", {}).get("decision_id") == decision_id:
                 validations.append(artifact)
 
@@ -1245,8 +1314,9 @@ class ArtifactStore:
         # Get linked episodes
         episodes_used = data.get("episodes_used", [])
         linked_episodes = []
-        for ep_id in episodes_used[-3:]:  # Last 3 most recent
-            ep = self.get_artifact(ep_id)
+        recent_episode_ids = episodes_used[-3:]  # Last 3 most recent
+        recent_episodes, _ = self.get_artifacts_many(recent_episode_ids)
+        for ep_id, ep in zip(recent_episode_ids, recent_episodes):
             if ep:
                 ep_data = ep.get("data", {})
                 linked_episodes.append({
@@ -1261,8 +1331,8 @@ class ArtifactStore:
         linked_incidents = []
         linked_incidents_count = 0
         all_incidents = self.index.query(artifact_type="incident_rca")
-        for inc in all_incidents:
-            inc_artifact = self.get_artifact(inc["id"])
+        inc_artifacts, _ = self.get_artifacts_many([inc["id"] for inc in all_incidents])
+        for inc, inc_artifact in zip(all_incidents, inc_artifacts):
             if inc_artifact:
                 inc_data = inc_artifact.get("data", {})
                 # Check if decision is mentioned in related_recent_changes or notes
@@ -1391,9 +1461,9 @@ class ArtifactStore:
         active = []
         now = utc_now()
 
-        for entry in entries:
-            # Load full artifact to check outcome.confidence
-            artifact = self.get_artifact(entry["id"])
+        # Load full artifacts to check outcome.confidence
+        artifacts, _ = self.get_artifacts_many([entry["id"] for entry in entries])
+        for entry, artifact in zip(entries, artifacts):
             if not artifact:
                 continue
 
@@ -1487,8 +1557,8 @@ class ArtifactStore:
         # Query all incidents for cross-referencing
         incident_entries = self.index.query(artifact_type="incident_rca", limit=200)
         incidents_by_decision = {}  # decision_id -> count
-        for inc_entry in incident_entries:
-            inc = self.get_artifact(inc_entry["id"])
+        incidents, _ = self.get_artifacts_many([inc_entry["id"] for inc_entry in incident_entries])
+        for inc in incidents:
             if inc:
                 related = inc.get("data", {}).get("related_recent_changes", [])
                 # Also check tags for decision references
@@ -1497,8 +1567,8 @@ class ArtifactStore:
                     if tag.startswith("decision_"):
                         incidents_by_decision[tag] = incidents_by_decision.get(tag, 0) + 1
 
-        unreviewed = []
-
+        # Filter on index fields first, then load the survivors in one batch
+        candidates = []
         for entry in entries:
             # Parse created_at to datetime (safe comparison)
             created_at = entry.get("created_at", "")
@@ -1524,8 +1594,11 @@ class ArtifactStore:
                 if not (entry_tags & set(include_tags)):
                     continue  # Doesn't have required tag
 
-            # Load full artifact
-            artifact = self.get_artifact(entry["id"])
+            candidates.append((entry, created_at, created_dt, entry_tags))
+
+        unreviewed = []
+        artifacts, _ = self.get_artifacts_many([c[0]["id"] for c in candidates])
+        for (entry, created_at, created_dt, entry_tags), artifact in zip(candidates, artifacts):
             if not artifact:
                 continue
 
@@ -1824,6 +1897,7 @@ class ArtifactStore:
         try:
             content = json.dumps(artifact, indent=2, ensure_ascii=False)
             file_path.write_text(content, encoding='utf-8')
+            self.read_cache.invalidate(artifact["id"])
             file_hash = compute_hash(content)
             self.index.upsert(artifact, str(file_path), file_hash)
             return True, "Updated successfully"
@@ -1851,33 +1925,16 @@ class ArtifactStore:
         Returns:
             (success, message)
         """
-        artifact_type = artifact["type"]
-        type_dir = TYPE_DIRECTORIES[artifact_type]
-        file_path = self.memory_dir / type_dir / f"{artifact['id']}.json"
-
-        # Ensure updated_at is set
-        if "updated_at" not in artifact or not artifact.get("updated_at"):
-            artifact["updated_at"] = utc_now_iso()
-
-        # Re-sign artifact (provenance)
-        if is_signing_available():
-            try:
-                artifact = sign_artifact(artifact)
-            except Exception as e:
-                if PROVENANCE_REQUIRED:
-                    return False, f"Provenance signing failed (DURO_PROVENANCE_REQUIRED=1): {e}"
-                else:
-                    print(f"[WARN] Provenance signing failed: {e}", file=sys.stderr)
-        elif PROVENANCE_REQUIRED:
-            return False, "Provenance signing required but DURO_PROVENANCE_HMAC_KEYS not set"
-
-        # Remove signature_status before storing (computed on load, not stored)
-        artifact.pop("signature_status", None)
+        file_path = self.memory_dir / TYPE_DIRECTORIES[artifact["type"]] / f"{artifact['id']}.json"
+        artifact, error = self._prepare_update(artifact)
+        if error:
+            return False, error
 
         # Serialize and write
         try:
             content = json.dumps(artifact, indent=2, ensure_ascii=False)
             file_path.write_text(content, encoding='utf-8')
+            self.read_cache.invalidate(artifact["id"])
             file_hash = compute_hash(content)
             self.index.upsert(artifact, str(file_path), file_hash)
         except Exception as e:
@@ -1908,6 +1965,62 @@ class ArtifactStore:
 
         return True, "Updated successfully"
 
+    def _prepare_update(self, artifact: dict[str, Any]) -> tuple[dict[str, Any], Optional[str]]:
+        """
+        Stamp updated_at and re-sign an artifact for rewriting.
+        Returns (artifact, error); error is set when it must not be written.
+        """
+        # Ensure updated_at is set
+        if "updated_at" not in artifact or not artifact.get("updated_at"):
+            artifact["updated_at"] = utc_now_iso()
+
+        # Re-sign artifact (provenance)
+        if is_signing_available():
+            try:
+                artifact = sign_artifact(artifact)
+            except Exception as e:
+                if PROVENANCE_REQUIRED:
+                    return artifact, f"Provenance signing failed (DURO_PROVENANCE_REQUIRED=1): {e}"
+                else:
+                    print(f"[WARN] Provenance signing failed: {e}", file=sys.stderr)
+        elif PROVENANCE_REQUIRED:
+            return artifact, "Provenance signing required but DURO_PROVENANCE_HMAC_KEYS not set"
+
+        # Remove signature_status before storing (computed on load, not stored)
+        artifact.pop("signature_status", None)
+        return artifact, None
+
+    def update_artifacts_many(self, artifacts: list[dict[str, Any]]) -> tuple[int, int]:
+        """
+        Batch update_artifact(re_embed=False): files are re-signed and
+        rewritten one by one, the index is updated in one transaction.
+
+        Only for metadata-only changes (e.g. confidence decay) that leave
+        the embedded text alone.
+
+        Returns (success_count, error_count).
+        """
+        entries = []
+        errors = 0
+        for artifact in artifacts:
+            file_path = self.memory_dir / TYPE_DIRECTORIES[artifact["type"]] / f"{artifact['id']}.json"
+            artifact, error = self._prepare_update(artifact)
+            if error:
+                print(f"[WARN] Update of {artifact['id']} skipped: {error}", file=sys.stderr)
+                errors += 1
+                continue
+            try:
+                content = json.dumps(artifact, indent=2, ensure_ascii=False)
+                file_path.write_text(content, encoding='utf-8')
+                self.read_cache.invalidate(artifact["id"])
+                entries.append((artifact, str(file_path), compute_hash(content)))
+            except Exception as e:
+                print(f"[WARN] Update of {artifact['id']} failed: {e}", file=sys.stderr)
+                errors += 1
+
+        success, index_errors = self.index.upsert_many(entries)
+        return success, errors + index_errors
+
     def store_evaluation(
         self,
         episode_id: str,
@@ -2571,12 +2684,19 @@ class ArtifactStore:
             file_path.write_text(content, encoding='utf-8')
         except Exception as e:
             return False, "", f"File write failed: {e}"
+        finally:
+            self.read_cache.invalidate(artifact["id"])  # After the write: drops puts of reads that raced it
 
         # Update index
         success = self.index.upsert(artifact, str(file_path), file_hash)
         if not success:
             return False, artifact["id"], str(file_path)  # File written but index failed
 
+        # Write-behind: file + index row are written, hand FTS/embedding to the
+        # background group commit. Falls through to inline work if the queue is full.
+        if self.write_behind is not None and self.write_behind.submit(artifact):
+            return True, artifact["id"], str(file_path)
+
         # Populate FTS text column (best effort, never block save)
         try:
             self.index.populate_fts_text(artifact["id"], artifact)
@@ -2612,18 +2732,58 @@ class ArtifactStore:
         """
         Retrieve full artifact by ID.
         Reads from file (canonical source).
+
+        Verified reads are cached (see artifact_cache.py) while the file is
+        unchanged; every call returns a fresh copy.
         """
+        key_context = _provenance_key_context()
+        generation = self.read_cache.generation()
+        cached = self.read_cache.get(artifact_id, key_context)
+        if cached is not None:
+            return cached
+
         # First check index for file path
         entry = self.index.get_by_id(artifact_id)
         if not entry:
             return None
 
-        file_path = Path(entry["file_path"])
-        if not file_path.exists():
+        path = entry["file_path"]
+        return self._verify_artifact_file(
+            artifact_id, path, self._read_artifact_file(path), key_context, generation
+        )
+
+    @staticmethod
+    def _read_artifact_file(path: str) -> Optional[tuple[tuple[int, int], str]]:
+        """(file_signature, content) of an artifact file, or None if unreadable. Thread-safe."""
+        # Stat before reading: a concurrent rewrite leaves a stale signature, not stale content
+        signature = file_signature(path)
+        if signature is None:
+            return None
+        try:
+            with open(path, encoding='utf-8') as f:
+                return signature, f.read()
+        except Exception as e:
+            print(f"Error reading artifact: {e}")
             return None
 
+    def _verify_artifact_file(
+        self,
+        artifact_id: str,
+        path: str,
+        read: Optional[tuple[tuple[int, int], str]],
+        key_context: str,
+        generation: int
+    ) -> Optional[dict[str, Any]]:
+        """
+        Parse and verify a _read_artifact_file() result, caching the artifact.
+
+        generation is read_cache.generation() from before the file was read.
+        """
+        if read is None:
+            return None
+        signature, content = read
+
         try:
-            content = file_path.read_text(encoding='utf-8')
             artifact = json.loads(content)
 
             # Verify provenance signature
@@ -2636,7 +2796,7 @@ class ArtifactStore:
                     if status == "invalid":
                         print(
                             f"[SECURITY] Artifact {artifact_id} has INVALID signature! "
-                            f"File may have been tampered with: {file_path}",
+                            f"File may have been tampered with: {path}",
                             file=sys.stderr
                         )
                 except Exception as e:
@@ -2647,11 +2807,160 @@ class ArtifactStore:
                 # Keys not configured - can't verify
                 artifact["signature_status"] = "unsigned"
 
+            # Tampered / unverifiable reads are not cached: they warn on every read
+            if artifact["signature_status"] not in ("invalid", "error"):
+                self.read_cache.put(artifact_id, path, signature, key_context, artifact, generation)
             return artifact
         except Exception as e:
             print(f"Error reading artifact: {e}")
             return None
 
+    def get_artifacts_many(
+        self,
+        artifact_ids: list[str]
+    ) -> tuple[list[Optional[dict[str, Any]]], list[str]]:
+        """
+        Bulk get_artifact().
+
+        Cache hits are served first; the rest are resolved with one index
+        query, their files are read on a small thread pool (I/O releases
+        the GIL) and parsed + verified on the calling thread.
+
+        Returns:
+            (artifacts, missing_ids): artifacts is in input order with None
+            where an ID was not found; missing_ids lists those IDs in order.
+            Repeated IDs get independent copies.
+        """
+        key_context = _provenance_key_context()
+        generation = self.read_cache.generation()
+        loaded: dict[str, Optional[dict[str, Any]]] = {}
+        to_load = []
+        for artifact_id in dict.fromkeys(artifact_ids):
+            cached = self.read_cache.get(artifact_id, key_context)
+            if cached is not None:
+                loaded[artifact_id] = cached
+            else:
+                to_load.append(artifact_id)
+
+        if to_load:
+            paths = self.index.get_file_paths(to_load)
+            jobs = [(artifact_id, paths[artifact_id]) for artifact_id in to_load if artifact_id in paths]
+            job_paths = [path for _, path in jobs]
+            if len(jobs) >= PARALLEL_READ_MIN:
+                # One task per worker (interleaved slices) keeps per-future overhead negligible
+                slices = [job_paths[i::READ_POOL_WORKERS] for i in range(READ_POOL_WORKERS)]
+                sliced = list(self._get_read_pool().map(
+                    lambda paths: [self._read_artifact_file(path) for path in paths], slices
+                ))
+                reads = [sliced[i % READ_POOL_WORKERS][i // READ_POOL_WORKERS] for i in range(len(job_paths))]
+            else:
+                reads = map(self._read_artifact_file, job_paths)
+            for (artifact_id, path), read in zip(jobs, reads):
+                loaded[artifact_id] = self._verify_artifact_file(artifact_id, path, read, key_context, generation)
+
+        artifacts = []
+        missing = []
+        seen = set()
+        for artifact_id in artifact_ids:
+            artifact = loaded.get(artifact_id)
+            if artifact is None:
+                missing.append(artifact_id)
+            elif artifact_id in seen:
+                artifact = clone_json(artifact)
+            seen.add(artifact_id)
+            artifacts.append(artifact)
+        return artifacts, missing
+
+    def _get_read_pool(self) -> ThreadPoolExecutor:
+        with self._read_pool_lock:
+            if self._read_pool is None:
+                self._read_pool = ThreadPoolExecutor(
+                    max_workers=READ_POOL_WORKERS, thread_name_prefix="duro_artifact_read"
+                )
+            return self._read_pool
+
+    def embed_artifacts(
+        self,
+        artifact_ids: list[str],
+        force: bool = False,
+        preloaded: Optional[dict[str, dict]] = None
+    ) -> dict:
+        """
+        Embed a chunk of artifacts with one model call and one write transaction.
+
+        Artifacts whose embedding already matches the current content hash
+        and model are skipped unless force=True. Callers are expected to pass
+        chunks of EMBEDDING_CONFIG["batch_size"] and handle timeouts and
+        cancellation between chunks. Artifacts the caller already holds can be
+        passed in `preloaded` (id -> artifact) to skip re-reading their files.
+
+        Returns:
+            {
+                "embedded", "unchanged", "no_text", "missing", "failed": counts,
+                "failed_ids": list
+            }
+        """
+        from embeddings import artifact_to_text, compute_content_hash, embed_batch, EMBEDDING_CONFIG
+
+        model_name = EMBEDDING_CONFIG["model_name"]
+        result = {
+            "embedded": 0,
+            "unchanged": 0,
+            "no_text": 0,
+            "missing": 0,
+            "failed": 0,
+            "failed_ids": []
+        }
+
+        states = {} if force else self.index.get_embedding_states(list(artifact_ids))
+
+        loaded = dict(preloaded or {})
+        to_load = [artifact_id for artifact_id in artifact_ids if not loaded.get(artifact_id)]
+        if to_load:
+            artifacts, _ = self.get_artifacts_many(to_load)
+            loaded.update(zip(to_load, artifacts))
+
+        pending = []  # (artifact_id, text, content_hash)
+        for artifact_id in artifact_ids:
+            artifact = loaded.get(artifact_id)
+            if not artifact:
+                result["missing"] += 1
+                continue
+
+            text = artifact_to_text(artifact)
+            if not text.strip():
+                result["no_text"] += 1
+                continue
+
+            content_hash = compute_content_hash(artifact)
+            state = states.get(artifact_id)
+            if state and state["content_hash"] == content_hash and state["model"] == model_name:
+                result["unchanged"] += 1
+                continue
+
+            pending.append((artifact_id, text, content_hash))
+
+        if not pending:
+            return result
+
+        vectors = embed_batch([text for _, text, _ in pending])
+
+        rows = []
+        for (artifact_id, _, content_hash), vector in zip(pending, vectors):
+            if vector:
+                rows.append((artifact_id, vector, content_hash))
+            else:
+                result["failed_ids"].append(artifact_id)
+
+        stored = self.index.upsert_embeddings(rows, model_name=model_name)
+        if stored == len(rows):
+            result["embedded"] = stored
+        else:
+            result["failed_ids"].extend(aid for aid, _, _ in rows)
+        result["failed"] = len(result["failed_ids"])
+
+        return result
+
     def query(self, **kwargs) -> list[dict]:
         """
         Query artifacts via index.
@@ -2704,6 +3013,118 @@ class ArtifactStore:
 
         return success, errors
 
+    def reconcile_index(self) -> dict:
+        """
+        Incrementally sync the index with files on disk.
+
+        Unlike reindex(), nothing is cleared. Every artifact directory is
+        stat'ed and compared against the file_manifest table; only files
+        that were added, or whose mtime/size changed, are read. A changed
+        file whose content hash still matches the manifest only gets its
+        stat refreshed. Index rows whose file is gone are removed.
+
+        Returns:
+            {
+                "scanned", "unchanged", "added", "changed", "touched",
+                "removed", "errors": int counts,
+                "added_ids", "changed_ids", "removed_ids": first 50 IDs each,
+                "error_paths": first 50 failing paths,
+                "scan_ms", "duration_ms": timing
+            }
+        """
+        started = time.perf_counter()
+        manifest = self.index.get_file_manifest()
+        indexed = self.index.get_indexed_paths()
+
+        # Stat pass - no file contents are read here
+        on_disk = {}  # path -> (mtime_ns, size)
+        for dir_name in TYPE_DIRECTORIES.values():
+            type_dir = self.memory_dir / dir_name
+            try:
+                entries = os.scandir(type_dir)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json") or entry.name.startswith("."):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    on_disk[entry.path] = (st.st_mtime_ns, st.st_size)
+        scan_ms = int((time.perf_counter() - started) * 1000)
+
+        result = {
+            "scanned": len(on_disk),
+            "unchanged": 0,
+            "added": 0,
+            "changed": 0,
+            "touched": 0,
+            "removed": 0,
+            "errors": 0,
+            "added_ids": [],
+            "changed_ids": [],
+            "removed_ids": [],
+            "error_paths": [],
+        }
+
+        # Removals first, so an artifact that moved directories is
+        # re-added by the upsert below rather than deleted after it
+        removed_ids = [aid for path, aid in indexed.items() if path not in on_disk]
+        if removed_ids:
+            result["removed"] = self.index.delete_many(removed_ids)
+            result["removed_ids"] = removed_ids[:50]
+        stale_ids = [m["artifact_id"] for p, m in manifest.items() if p not in on_disk]
+        if stale_ids:
+            self.index.delete_file_manifest(stale_ids)
+
+        to_upsert = []
+        touched = []
+        for path, (mtime_ns, size) in on_disk.items():
+            known = manifest.get(path)
+            is_indexed = path in indexed
+            if known and is_indexed and known["mtime_ns"] == mtime_ns and known["size"] == size:
+                result["unchanged"] += 1
+                continue
+
+            try:
+                content = Path(path).read_text(encoding='utf-8')
+                file_hash = compute_hash(content)
+                if known and is_indexed and known["hash"] == file_hash:
+                    # Touched but identical content - no re-parse needed
+                    touched.append((known["artifact_id"], mtime_ns, size))
+                    continue
+                artifact = json.loads(content)
+            except Exception as e:
+                print(f"Reconcile error for {path}: {e}")
+                result["errors"] += 1
+                if len(result["error_paths"]) < 50:
+                    result["error_paths"].append(path)
+                continue
+
+            bucket = "changed" if is_indexed else "added"
+            result[bucket] += 1
+            if len(result[f"{bucket}_ids"]) < 50:
+                result[f"{bucket}_ids"].append(artifact.get("id"))
+            to_upsert.append((artifact, path, file_hash))
+
+        if touched:
+            self.index.touch_file_manifest(touched)
+            result["touched"] = len(touched)
+
+        if to_upsert:
+            _, upsert_errors = self.index.upsert_many(to_upsert)
+            result["errors"] += upsert_errors
+            # Upsert triggers reset FTS text; refill only what we re-parsed
+            self.index.populate_fts_text_many([a for a, _, _ in to_upsert if "id" in a])
+
+        result["scan_ms"] = scan_ms
+        result["duration_ms"] = int((time.perf_counter() - started) * 1000)
+        return result
+
     def get_stats(self) -> dict:
         """Get statistics about the artifact store."""
         return self.index.get_stats()
@@ -2746,6 +3167,7 @@ class ArtifactStore:
         file_path = Path(entry["file_path"])
         if not file_path.exists():
             # File missing but index entry exists - clean up index
+            self.read_cache.invalidate(artifact_id)
             self.index.delete(artifact_id)
             return True, f"Artifact file already missing, cleaned up index entry"
 
@@ -2811,12 +3233,15 @@ class ArtifactStore:
             return False, f"Audit log write failed, deletion blocked: {audit_error}"
 
         # Delete the file
+        self.read_cache.invalidate(artifact_id)
         try:
             file_path.unlink()
         except Exception as e:
             return False, f"Failed to delete file: {e}"
 
-        # Remove from index
+        # Remove from index (and drop any queued write-behind work for it)
+        if self.write_behind is not None:
+            self.write_behind.discard(artifact_id)
         self.index.delete(artifact_id)
 
         msg = f"Artifact '{artifact_id}' deleted. Reason logged."
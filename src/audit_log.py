@@ -22,11 +22,13 @@ Events recorded:
 Schema version: 1
 """
 
+import atexit
 import hashlib
 import hmac
 import json
 import os
 import sys
+import time
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -124,6 +126,15 @@ GENESIS_HASH = "GENESIS"
 # Schema version
 SCHEMA_VERSION = 1
 
+# Storage backend: "jsonl" (default, security_audit.jsonl + audit_head.json)
+# or "sqlite" (audit_store.py - cross-process safe appends, indexed queries)
+AUDIT_BACKEND = os.environ.get("DURO_AUDIT_BACKEND", "jsonl").strip().lower()
+
+# Background writer (audit_sink.py): with DURO_AUDIT_ASYNC=1 events are queued
+# and group-committed in submission order by one thread; security-critical
+# events still wait for their commit
+AUDIT_ASYNC = os.environ.get("DURO_AUDIT_ASYNC", "0") == "1"
+
 # Thread lock for concurrent appends
 _append_lock = threading.Lock()
 
@@ -352,6 +363,22 @@ def compute_hmac_signature(chain_hash: str, hmac_key: bytes) -> str:
     return f"hmac-sha256:{sig}"
 
 
+def compute_record_hash(record: Dict[str, Any], prev_hash: str) -> str:
+    """
+    Recompute the chain hash of a stored record.
+
+    Rebuilds the payload without chain.hash and chain.sig, as it was hashed
+    by compute_chain() at append time.
+    """
+    event_dict = record.copy()
+    if "chain" in event_dict:
+        event_dict["chain"] = {"prev": record["chain"].get("prev", "")}
+
+    canonical = canonical_json(event_dict)
+    payload_hash = "sha256:" + hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    return compute_chain_hash(prev_hash, payload_hash)
+
+
 def compute_chain(event: AuditEvent, prev_hash: str) -> Tuple[str, Optional[str]]:
     """
     Compute chain hash and optional signature.
@@ -487,14 +514,20 @@ def _append_event_internal(event: AuditEvent, prev_hash: str) -> str:
     return event.event_id
 
 
-def append_event(event: AuditEvent) -> str:
+def _append_events_now(events: List[AuditEvent]) -> List[str]:
     """
-    Append an event to the unified audit log.
+    Append a batch in chain order on this thread.
 
-    Thread-safe with file locking.
-
-    Returns the event_id.
+    JSONL: one head read, one file append and one head rewrite per batch.
+    SQLite: one transaction.
     """
+    if _use_sqlite():
+        from audit_store import get_audit_store
+        return get_audit_store().append_many(events)
+
+    if not events:
+        return []
+
     with _append_lock:
         # Check rotation
         if should_rotate():
@@ -503,7 +536,121 @@ def append_event(event: AuditEvent) -> str:
         # Get current head
         prev_hash, _ = get_head()
 
-        return _append_event_internal(event, prev_hash)
+        lines = []
+        for event in events:
+            if not event.event_id:
+                event.event_id = generate_event_id()
+            event.chain.prev = prev_hash
+            chain_hash, sig = compute_chain(event, prev_hash)
+            event.chain.hash = chain_hash
+            event.chain.sig = sig
+            lines.append(json.dumps(event.to_dict(), sort_keys=True) + "\n")
+            prev_hash = chain_hash
+
+        with open(UNIFIED_AUDIT_FILE, "a", encoding="utf-8") as f:
+            f.write("".join(lines))
+
+        update_head(prev_hash, events[-1].event_id)
+
+    return [event.event_id for event in events]
+
+
+def is_security_critical(event: AuditEvent) -> bool:
+    """Events that must be on disk before the caller continues (see submit_event)."""
+    return (
+        event.decision in ("DENY", "NEED_APPROVAL")
+        or event.severity in (Severity.HIGH, Severity.CRITICAL)
+        or event.event_type == EventType.GATE_BREAKGLASS
+    )
+
+
+def append_event(event: AuditEvent) -> str:
+    """
+    Append an event to the unified audit log.
+
+    Thread-safe. Returns once the event is written (with the async writer
+    enabled it goes through the writer's queue to keep the chain in order).
+
+    Returns the event_id.
+    """
+    return append_events([event])[0]
+
+
+def append_events(events: List[AuditEvent]) -> List[str]:
+    """
+    Append a batch of events in chain order.
+
+    With the SQLite backend the whole batch is one transaction.
+
+    Returns the event_ids. Raises if the async writer failed to write any
+    of them (see AuditSink.submit_many).
+    """
+    sink = get_audit_sink()
+    if sink is None:
+        return _append_events_now(events)
+
+    for event in events:
+        if not event.event_id:
+            event.event_id = generate_event_id()
+    sink.submit_many(events)
+    return [event.event_id for event in events]
+
+
+def submit_event(event: AuditEvent, critical: Optional[bool] = None) -> str:
+    """
+    Queue an event for the background writer (DURO_AUDIT_ASYNC=1).
+
+    Returns immediately unless the event is security-critical (DENY,
+    approval needed, breakglass, high/critical severity; or critical=True),
+    which waits until it and everything before it are written. A critical
+    event is never dropped for a full queue, and raises AuditWriteError if
+    its batch fails to write. Without the async writer this is
+    append_event().
+
+    Returns the event_id, or "" if a non-critical event was dropped because
+    the queue stayed full.
+    """
+    sink = get_audit_sink()
+    if sink is None:
+        return _append_events_now([event])[0]
+
+    if not event.event_id:
+        event.event_id = generate_event_id()
+    if critical is None:
+        critical = is_security_critical(event)
+    if not sink.submit(event, wait=critical):
+        return ""
+    return event.event_id
+
+
+_sink = None
+_sink_lock = threading.Lock()
+
+
+def get_audit_sink():
+    """The process-wide AuditSink, or None unless DURO_AUDIT_ASYNC=1."""
+    global _sink
+    if not AUDIT_ASYNC:
+        return None
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                from audit_sink import AuditSink
+                sink = AuditSink(_append_events_now)
+                sink.start()
+                atexit.register(sink.stop)
+                _sink = sink
+    return _sink
+
+
+def flush_audit_sink(timeout: Optional[float] = None) -> bool:
+    """Wait for queued events to be written (no-op without the async writer)."""
+    sink = get_audit_sink()
+    return sink.flush(timeout) if sink is not None else True
+
+
+def _use_sqlite() -> bool:
+    return AUDIT_BACKEND == "sqlite"
 
 
 # ============================================================
@@ -523,8 +670,22 @@ def query_log(
     """
     Query the audit log with filters.
 
-    Returns events newest first.
+    Returns events newest first. include_archives only applies to the
+    JSONL backend (the SQLite store is not rotated).
     """
+    flush_audit_sink()
+    if _use_sqlite():
+        from audit_store import get_audit_store
+        return get_audit_store().query(
+            limit=limit,
+            event_type=event_type,
+            tool=tool,
+            decision=decision,
+            severity=severity,
+            since=since,
+            tags=tags,
+        )
+
     events = []
 
     # Collect log files to search
@@ -594,113 +755,461 @@ class VerifyResult:
     error: Optional[str] = None
     signed: bool = False
     signature_valid: bool = False
+    resumed_from: int = 0  # Events covered by a prior checkpoint (not re-hashed)
+    first_broken_file: Optional[str] = None
+    segments: int = 0  # Log files checked (whole-chain verification)
 
 
-def verify_log(path: Optional[Path] = None) -> VerifyResult:
+def _verify_segment(
+    path: str,
+    prev_hash: Optional[str],
+    start_offset: int = 0,
+    start_line: int = 0,
+    partial_tail_ok: bool = False,
+) -> Dict[str, Any]:
     """
-    Verify the hash chain integrity of the audit log.
+    Verify one JSONL log file, or its tail from start_offset.
 
-    Returns a VerifyResult with details.
-    """
-    log_path = path or UNIFIED_AUDIT_FILE
+    prev_hash is the hash the first record must chain from. With None the
+    first record's own prev is accepted and returned as first_prev, so the
+    caller can stitch independently verified segments together.
 
-    if not log_path.exists():
-        return VerifyResult(
-            valid=True,
-            total_events=0,
-            verified_events=0,
-        )
+    Every record must end with a newline. Only for the live log
+    (partial_tail_ok=True) is an unterminated final line taken as an append
+    in progress: it is left for the next run and flagged as partial_tail so
+    the caller can check the last verified hash against the chain head.
 
+    Module-level (and plain-dict result) so it can run in a process pool.
+    """
     hmac_key = get_hmac_key()
+    seg = {
+        "path": path,
+        "total": 0,
+        "verified": 0,
+        "first_prev": prev_hash,
+        "last_hash": prev_hash,
+        "offset": start_offset,
+        "line": start_line,
+        "last_line_offset": None,
+        "signed": False,
+        "sig_valid": True,
+        "error": None,
+        "broken_line": None,
+        "broken_event_id": None,
+        "partial_tail": False,
+    }
 
-    total = 0
-    verified = 0
-    prev_hash = GENESIS_HASH
-    signed = False
-    sig_valid = True
+    def broken(line_num, event_id, error):
+        seg.update(error=error, broken_line=line_num, broken_event_id=event_id)
+        return seg
 
     try:
-        with open(log_path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
+        with open(path, "rb") as f:
+            f.seek(start_offset)
+            offset = start_offset
+            line_num = start_line
+            for raw in f:
+                terminated = raw.endswith(b"\n")
+                if not terminated and partial_tail_ok:
+                    seg["partial_tail"] = True
+                    break  # Append in flight - checked against the head by the caller
+
+                line_offset = offset
+                offset += len(raw)
+                line_num += 1
+                line = raw.decode("utf-8").strip()
                 if not line:
+                    seg["offset"], seg["line"] = offset, line_num
                     continue
 
-                total += 1
+                seg["total"] += 1
 
                 try:
                     record = json.loads(line)
                 except json.JSONDecodeError:
-                    return VerifyResult(
-                        valid=False,
-                        total_events=total,
-                        verified_events=verified,
-                        first_broken_line=line_num,
-                        error=f"Invalid JSON at line {line_num}",
-                    )
+                    return broken(line_num, None, f"Invalid JSON at line {line_num}")
 
                 chain = record.get("chain", {})
                 stored_prev = chain.get("prev", "")
                 stored_hash = chain.get("hash", "")
                 stored_sig = chain.get("sig")
 
+                if seg["last_hash"] is None:
+                    # Unanchored segment: chain from whatever it claims, stitched later
+                    seg["first_prev"] = seg["last_hash"] = stored_prev
+
                 # Check prev hash continuity
-                if stored_prev != prev_hash:
-                    return VerifyResult(
-                        valid=False,
-                        total_events=total,
-                        verified_events=verified,
-                        first_broken_line=line_num,
-                        first_broken_event_id=record.get("event_id"),
-                        error=f"Chain break at line {line_num}: expected prev={prev_hash[:20]}..., got {stored_prev[:20]}...",
+                expected_prev = seg["last_hash"]
+                if stored_prev != expected_prev:
+                    return broken(
+                        line_num, record.get("event_id"),
+                        f"Chain break at line {line_num}: expected prev={expected_prev[:20]}..., got {stored_prev[:20]}...",
                     )
 
                 # Reconstruct event and compute expected hash
-                # We need to rebuild the event without chain.hash and chain.sig
-                event_dict = record.copy()
-                if "chain" in event_dict:
-                    event_dict["chain"] = {"prev": stored_prev}
-
-                canonical = canonical_json(event_dict)
-                payload_hash = "sha256:" + hashlib.sha256(canonical.encode('utf-8')).hexdigest()
-                expected_hash = compute_chain_hash(prev_hash, payload_hash)
-
-                if stored_hash != expected_hash:
-                    return VerifyResult(
-                        valid=False,
-                        total_events=total,
-                        verified_events=verified,
-                        first_broken_line=line_num,
-                        first_broken_event_id=record.get("event_id"),
-                        error=f"Hash mismatch at line {line_num}",
-                    )
+                if stored_hash != compute_record_hash(record, expected_prev):
+                    return broken(line_num, record.get("event_id"), f"Hash mismatch at line {line_num}")
 
                 # Verify signature if present and we have the key
                 if stored_sig:
-                    signed = True
+                    seg["signed"] = True
                     if hmac_key:
                         expected_sig = compute_hmac_signature(stored_hash, hmac_key)
                         if stored_sig != expected_sig:
-                            sig_valid = False
+                            seg["sig_valid"] = False
+
+                if not terminated:
+                    return broken(line_num, record.get("event_id"), f"Unterminated final line {line_num}")
+
+                seg["verified"] += 1
+                seg["last_hash"] = stored_hash
+                seg["offset"], seg["line"] = offset, line_num
+                seg["last_line_offset"] = line_offset
+
+    except Exception as e:
+        seg["error"] = str(e)
 
-                verified += 1
-                prev_hash = stored_hash
+    return seg
 
+
+def verify_log(
+    path: Optional[Path] = None,
+    full: bool = False,
+    parallel: bool = False,
+) -> VerifyResult:
+    """
+    Verify the hash chain integrity of the audit log.
+
+    With an explicit path, checks that one file from GENESIS. Without one,
+    checks the whole chain (rotated archives + current log) via
+    verify_chain(), or the SQLite store when DURO_AUDIT_BACKEND=sqlite.
+    Both resume from the last verified checkpoint unless full=True.
+
+    Returns a VerifyResult with details.
+    """
+    if path is None:
+        flush_audit_sink()
+        if _use_sqlite():
+            from audit_store import get_audit_store
+            return get_audit_store().verify(full=full)
+        return verify_chain(full=full, parallel=parallel)
+
+    if not path.exists():
         return VerifyResult(
             valid=True,
-            total_events=total,
-            verified_events=verified,
-            signed=signed,
-            signature_valid=sig_valid if signed else False,
+            total_events=0,
+            verified_events=0,
         )
 
-    except Exception as e:
-        return VerifyResult(
-            valid=False,
-            total_events=total,
-            verified_events=verified,
-            error=str(e),
+    seg = _verify_segment(str(path), GENESIS_HASH)
+    return VerifyResult(
+        valid=seg["error"] is None,
+        total_events=seg["total"],
+        verified_events=seg["verified"],
+        first_broken_line=seg["broken_line"],
+        first_broken_event_id=seg["broken_event_id"],
+        error=seg["error"],
+        signed=seg["signed"],
+        signature_valid=seg["sig_valid"] if seg["signed"] else False,
+    )
+
+
+# ============================================================
+# WHOLE-CHAIN VERIFICATION (CHECKPOINTED)
+# ============================================================
+
+VERIFY_CHECKPOINT_FILE = AUDIT_DIR / "verify_checkpoint.json"
+CHECKPOINT_VERSION = 3  # v3: archives carry a sha256 of their bytes, keyed by size + mtime
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return "sha256:" + digest.hexdigest()
+
+
+def _sign_checkpoint(checkpoint: Dict[str, Any], hmac_key: bytes) -> str:
+    payload = {k: v for k, v in checkpoint.items() if k != "sig"}
+    digest = "sha256:" + hashlib.sha256(canonical_json(payload).encode("utf-8")).hexdigest()
+    return compute_hmac_signature(digest, hmac_key)
+
+
+def load_verify_checkpoint() -> Optional[Dict[str, Any]]:
+    """
+    Load the verification checkpoint, or None if missing or not trusted.
+
+    With an HMAC key configured the checkpoint must carry a valid signature,
+    so an attacker can't forge one to skip verification of edited events.
+    Without a key it is accepted as-is (the chain itself is unsigned then).
+    """
+    if not VERIFY_CHECKPOINT_FILE.exists():
+        return None
+    try:
+        with open(VERIFY_CHECKPOINT_FILE, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except Exception:
+        return None
+
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        return None
+
+    hmac_key = get_hmac_key()
+    if hmac_key:
+        sig = checkpoint.get("sig")
+        if not sig or not hmac.compare_digest(sig, _sign_checkpoint(checkpoint, hmac_key)):
+            return None
+
+    return checkpoint
+
+
+def save_verify_checkpoint(archives: Dict[str, Dict[str, Any]], active: Optional[Dict[str, Any]]):
+    """Record a verified chain position (HMAC-signed when a key is set)."""
+    checkpoint = {
+        "version": CHECKPOINT_VERSION,
+        "archives": archives,
+        "active": active,
+        "verified_at": utc_now_iso(),
+    }
+    hmac_key = get_hmac_key()
+    checkpoint["sig"] = _sign_checkpoint(checkpoint, hmac_key) if hmac_key else None
+
+    tmp_path = VERIFY_CHECKPOINT_FILE.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, VERIFY_CHECKPOINT_FILE)
+
+
+def _active_resume_point(checkpoint: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Return the checkpointed position in the current log if still valid.
+
+    The file must be at least as long as the checkpoint offset and the last
+    verified line must still carry the checkpointed chain hash - otherwise
+    the log was rotated or rewritten and is verified from the start.
+    """
+    active = (checkpoint or {}).get("active")
+    if not active or active.get("last_line_offset") is None:
+        return None
+    if not UNIFIED_AUDIT_FILE.exists() or UNIFIED_AUDIT_FILE.stat().st_size < active["offset"]:
+        return None
+    try:
+        with open(UNIFIED_AUDIT_FILE, "rb") as f:
+            f.seek(active["last_line_offset"])
+            record = json.loads(f.readline().decode("utf-8"))
+    except Exception:
+        return None
+    if record.get("chain", {}).get("hash") != active["chain_hash"]:
+        return None
+    return active
+
+
+def _check_partial_tail(seg: Dict[str, Any], chained_from: str):
+    """
+    Check a live log segment whose last line was unterminated.
+
+    Writers append their lines before moving audit_head.json, so while an
+    append is in flight the head still names the last complete record. If
+    it doesn't, the tail is re-read once in case the append has finished
+    since; a line that is still unterminated and disagrees with the head is
+    a truncated or edited record, and seg is marked broken.
+    """
+    for attempt in range(2):
+        last_hash = seg["last_hash"] if seg["last_hash"] is not None else chained_from
+        if get_head()[0] == last_hash:
+            return
+        if attempt:
+            break
+
+        time.sleep(0.05)
+        tail = _verify_segment(
+            seg["path"], last_hash,
+            start_offset=seg["offset"], start_line=seg["line"], partial_tail_ok=True,
         )
+        seg["total"] += tail["total"]
+        seg["verified"] += tail["verified"]
+        for key in ("offset", "line", "partial_tail", "error", "broken_line", "broken_event_id"):
+            seg[key] = tail[key]
+        if tail["last_line_offset"] is not None:
+            seg["last_line_offset"] = tail["last_line_offset"]
+            seg["last_hash"] = tail["last_hash"]
+            if seg["first_prev"] is None:
+                seg["first_prev"] = chained_from
+        seg["signed"] = seg["signed"] or tail["signed"]
+        seg["sig_valid"] = seg["sig_valid"] and tail["sig_valid"]
+        if seg["error"] is not None or not seg["partial_tail"]:
+            return
+
+    seg["error"] = (
+        f"Unterminated final line {seg['line'] + 1}: last verified hash "
+        f"does not match {AUDIT_HEAD_FILE.name}"
+    )
+    seg["broken_line"] = seg["line"] + 1
+
+
+def verify_chain(
+    full: bool = False,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+) -> VerifyResult:
+    """
+    Verify the JSONL chain across rotated archives and the current log.
+
+    Incremental by default: archives whose bytes still match the checkpointed
+    sha256 are not re-verified (only their boundary hashes are re-stitched;
+    hashing a file is far cheaper than parsing and re-chaining it), and the
+    current log is checked from the checkpointed byte offset. An archive is
+    only re-digested when its size or mtime differs from the checkpoint, so
+    an unchanged history costs one stat() per archive. full=True ignores the
+    checkpoint.
+
+    parallel=True verifies the remaining archives concurrently in a process
+    pool, each from its own first prev, then stitches the segments by
+    checking every segment starts where the previous one ended.
+
+    A fully valid, correctly signed run advances the checkpoint.
+    """
+    archive_paths = sorted(AUDIT_DIR.glob("security_audit_*.jsonl"))
+    checkpoint = None if full else load_verify_checkpoint()
+    known_archives = (checkpoint or {}).get("archives", {})
+
+    # Archive segments: reuse checkpointed results for unchanged files
+    archive_results: Dict[str, Dict[str, Any]] = {}
+    to_verify = []
+    resumed = 0
+    # Digest before verifying: if an archive changes mid-run, the stored
+    # digest won't match it next time and it is verified again
+    archive_files: Dict[str, Dict[str, Any]] = {}
+    for archive in archive_paths:
+        stat = archive.stat()
+        known = known_archives.get(archive.name) or {}
+        current = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        if (known.get("sha256") and known.get("size") == current["size"]
+                and known.get("mtime_ns") == current["mtime_ns"]):
+            current["sha256"] = known["sha256"]
+        else:
+            current["sha256"] = _file_sha256(archive)
+        archive_files[archive.name] = current
+    for archive in archive_paths:
+        known = known_archives.get(archive.name)
+        current = archive_files[archive.name]
+        if known and known.get("size") == current["size"] and known.get("sha256") == current["sha256"]:
+            archive_results[archive.name] = {
+                "path": str(archive), "total": known["events"], "verified": known["events"],
+                "first_prev": known["first_prev"], "last_hash": known["last_hash"],
+                "signed": known.get("signed", False), "sig_valid": True, "error": None,
+            }
+            resumed += known["events"]
+        else:
+            to_verify.append(archive)
+
+    if parallel and len(to_verify) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = pool.map(_verify_segment, [str(p) for p in to_verify], [None] * len(to_verify))
+            for archive, seg in zip(to_verify, results):
+                archive_results[archive.name] = seg
+    else:
+        for archive in to_verify:
+            archive_results[archive.name] = _verify_segment(str(archive), None)
+
+    ordered = [archive_results[a.name] for a in archive_paths]
+
+    # Current log: resume from the checkpointed offset when possible
+    active_resume = _active_resume_point(checkpoint)
+    active_seg = None
+    if UNIFIED_AUDIT_FILE.exists():
+        if active_resume:
+            active_seg = _verify_segment(
+                str(UNIFIED_AUDIT_FILE), active_resume["chain_hash"],
+                start_offset=active_resume["offset"], start_line=active_resume["line"],
+                partial_tail_ok=True,
+            )
+            active_seg["first_prev"] = active_resume["first_prev"]
+            active_seg["resumed"] = active_resume["events"]
+            if active_seg["last_line_offset"] is None:
+                active_seg["last_line_offset"] = active_resume["last_line_offset"]
+            resumed += active_resume["events"]
+        else:
+            active_seg = _verify_segment(str(UNIFIED_AUDIT_FILE), None, partial_tail_ok=True)
+            active_seg["resumed"] = 0
+        if active_seg["error"] is None and active_seg["partial_tail"]:
+            chained_from = ordered[-1]["last_hash"] if ordered else GENESIS_HASH
+            _check_partial_tail(active_seg, chained_from or GENESIS_HASH)
+        ordered.append(active_seg)
+
+    # Stitch: every segment must start where the previous one ended
+    total = sum(seg["total"] + seg.get("resumed", 0) for seg in ordered)
+    verified = 0
+    signed = False
+    sig_valid = True
+    prev_hash = GENESIS_HASH
+
+    for seg in ordered:
+        name = Path(seg["path"]).name
+        if seg["error"] is None and seg["first_prev"] is not None and seg["first_prev"] != prev_hash:
+            seg["error"] = (
+                f"Chain break at start of {name}: expected prev={prev_hash[:20]}..., "
+                f"got {seg['first_prev'][:20]}..."
+            )
+            seg["broken_line"] = 1
+        if seg["error"] is not None:
+            return VerifyResult(
+                valid=False,
+                total_events=total,
+                verified_events=verified + seg["verified"] + seg.get("resumed", 0),
+                first_broken_line=seg.get("broken_line"),
+                first_broken_event_id=seg.get("broken_event_id"),
+                first_broken_file=name,
+                error=seg["error"],
+                resumed_from=resumed,
+                segments=len(ordered),
+            )
+
+        verified += seg["verified"] + seg.get("resumed", 0)
+        signed = signed or seg["signed"]
+        sig_valid = sig_valid and seg["sig_valid"]
+        if seg["last_hash"] is not None:
+            prev_hash = seg["last_hash"]
+
+    if sig_valid:
+        archives = {
+            Path(seg["path"]).name: {
+                **archive_files[Path(seg["path"]).name],
+                "events": seg["verified"],
+                "first_prev": seg["first_prev"],
+                "last_hash": seg["last_hash"],
+                "signed": seg["signed"],
+            }
+            for seg in ordered[:len(archive_paths)]
+            if seg["last_hash"] is not None
+        }
+        active = None
+        if active_seg is not None and active_seg["last_line_offset"] is not None:
+            active = {
+                "file": UNIFIED_AUDIT_FILE.name,
+                "offset": active_seg["offset"],
+                "line": active_seg["line"],
+                "last_line_offset": active_seg["last_line_offset"],
+                "events": active_seg["verified"] + active_seg["resumed"],
+                "first_prev": active_seg["first_prev"],
+                "chain_hash": active_seg["last_hash"],
+            }
+        try:
+            save_verify_checkpoint(archives, active)
+        except OSError:
+            pass  # Checkpoint is an optimization only
+
+    return VerifyResult(
+        valid=True,
+        total_events=total,
+        verified_events=verified,
+        signed=signed,
+        signature_valid=sig_valid if signed else False,
+        resumed_from=resumed,
+        segments=len(ordered),
+    )
 
 
 # ============================================================
@@ -709,6 +1218,24 @@ def verify_log(path: Optional[Path] = None) -> VerifyResult:
 
 def get_audit_stats() -> Dict[str, Any]:
     """Get audit log statistics."""
+    sink = get_audit_sink()
+    if sink is not None:
+        sink.flush()
+
+    if _use_sqlite():
+        from audit_store import get_audit_store
+        store = get_audit_store()
+        stats = {
+            "log_file": str(store.db_path),
+            "head_file": None,
+            "log_exists": store.db_path.exists(),
+            "log_size_bytes": store.db_path.stat().st_size if store.db_path.exists() else 0,
+            "hmac_key_available": get_hmac_key() is not None,
+            "async_writer": sink.get_stats() if sink is not None else None,
+        }
+        stats.update(store.get_stats())
+        return stats
+
     stats = {
         "log_file": str(UNIFIED_AUDIT_FILE),
         "head_file": str(AUDIT_HEAD_FILE),
@@ -720,6 +1247,7 @@ def get_audit_stats() -> Dict[str, Any]:
         "by_decision": {},
         "signed": False,
         "hmac_key_available": get_hmac_key() is not None,
+        "async_writer": sink.get_stats() if sink is not None else None,
     }
 
     if not UNIFIED_AUDIT_FILE.exists():
@@ -758,6 +1286,17 @@ def get_audit_stats() -> Dict[str, Any]:
     return stats
 
 
+def export_jsonl(path: Path) -> int:
+    """
+    Export the SQLite audit chain as JSONL (same format as the JSONL log).
+
+    The result can be checked with verify_log(path). Returns the event count.
+    """
+    flush_audit_sink()
+    from audit_store import get_audit_store
+    return get_audit_store().export_jsonl(path)
+
+
 # ============================================================
 # CONVENIENCE BUILDERS
 # ============================================================
@@ -0,0 +1,327 @@
+"""
+Audit Sink - background writer for the unified audit log.
+
+With DURO_AUDIT_ASYNC=1, audit_log hands events to one AuditSink instead
+of appending them on the caller's thread. policy_gate() logs a decision
+on every tool call, and a JSONL append is a head-file read, a hash, a
+file append and a head rewrite; with the sink the gate only builds the
+event and enqueues it.
+
+Ordering: events are written strictly in submission order by a single
+writer thread, which is the only place chain hashes are computed.
+Synchronous audit_log.append_event() callers go through the same queue
+and wait for their event, so the whole process produces one ordered chain.
+
+Group commit: the writer lingers briefly so bursts share one write
+(one head read/rewrite and one file append for JSONL, one transaction
+for SQLite).
+
+Durability: submit(wait=True) returns once the event (and everything
+queued before it) is committed. audit_log uses it for security-critical
+events (DENY, approval needed, breakglass, high/critical severity). If
+the batch holding a waited-for event fails, the waiter gets
+AuditWriteError instead of returning as if it were written. stop() drains
+the queue and is registered atexit.
+
+Backpressure: the queue is bounded. A full queue blocks the submitter for
+up to block_timeout_s; after that a non-critical event is dropped and
+counted in "dropped" (and reported on stderr) rather than growing memory
+unbounded. Waited-for events are never dropped: they block until there
+is room.
+"""
+
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+
+class AuditWriteError(RuntimeError):
+    """A waited-for event was not written because its batch failed."""
+
+
+class AuditSink:
+    """
+    Bounded FIFO queue of audit events with one group-committing writer.
+
+    Unlike WriteBehindWorker nothing is coalesced: every event is written,
+    in order.
+    """
+
+    DEFAULT_MAX_QUEUE = 10000
+    DEFAULT_BATCH_SIZE = 256
+    DEFAULT_LINGER_MS = 20
+    DEFAULT_BLOCK_TIMEOUT_S = 5.0
+
+    def __init__(
+        self,
+        write_batch: Callable[[List[Any]], Any],
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        linger_ms: int = DEFAULT_LINGER_MS,
+        block_timeout_s: float = DEFAULT_BLOCK_TIMEOUT_S
+    ):
+        """
+        Args:
+            write_batch: Appends a list of events to the chain, in order
+            max_queue: Max events waiting (backpressure bound)
+            batch_size: Max events per group commit
+            linger_ms: How long to wait for a batch to fill before committing
+            block_timeout_s: How long a submitter waits on a full queue before dropping
+        """
+        self._write_batch = write_batch
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.linger_ms = linger_ms
+        self.block_timeout_s = block_timeout_s
+
+        self._queue: Deque[Tuple[int, Any, float]] = deque()  # (seq, event, enqueued_at)
+        self._next_seq = 1
+        self._done_seq = 0  # Every seq <= this has been attempted (failures in _failed)
+        self._waiting: Set[int] = set()  # Seqs a submitter is waiting on
+        self._failed: Dict[int, str] = {}  # Waited-for seq -> batch error
+        self._flush_waiters = 0
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()  # Held while taking + writing a batch
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._stats = {
+            "submitted": 0,
+            "written": 0,
+            "batches": 0,
+            "dropped": 0,
+            "backpressure_waits": 0,
+            "critical_waits": 0,
+            "errors": 0,
+            "failed_events": 0,
+            "max_depth_seen": 0,
+            "last_batch_size": 0,
+            "last_batch_ms": 0.0,
+            "last_commit_lag_ms": 0.0,
+            "max_commit_lag_ms": 0.0,
+            "last_error": None,
+        }
+
+    def start(self):
+        """Start the writer thread (idempotent)."""
+        with self._cond:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="duro_audit_sink", daemon=True)
+            self._thread.start()
+
+    def submit(self, event: Any, wait: bool = False, timeout: Optional[float] = None) -> bool:
+        """
+        Queue an event.
+
+        Args:
+            wait: Block until the event is committed (security-critical events).
+                A waited-for event is never dropped on a full queue.
+            timeout: Max seconds to wait for the commit
+
+        Returns:
+            False if the event was dropped because the queue stayed full
+
+        Raises:
+            AuditWriteError: wait=True and the event's batch failed to write
+        """
+        with self._cond:
+            if self._stopping:
+                # Shut down: still queued (keeps order), then drained on this thread
+                wait = True
+            elif not self._wait_for_room_locked(block=wait):
+                self._stats["dropped"] += 1
+                print(f"[WARN] Audit queue full, dropped event "
+                      f"{getattr(event, 'event_id', '')}", file=sys.stderr)
+                return False
+
+            seq = self._enqueue_locked(event, wait)
+            if wait:
+                self._stats["critical_waits"] += 1
+                self._wait_written_locked([seq], timeout)
+        return True
+
+    def submit_many(self, events: List[Any], timeout: Optional[float] = None):
+        """
+        Queue events in order and wait until all of them are committed.
+
+        Used for synchronous appends; never drops.
+
+        Raises:
+            AuditWriteError: A batch holding any of the events failed to write
+        """
+        if not events:
+            return
+        with self._cond:
+            seqs = []
+            for event in events:
+                if not self._stopping:
+                    self._wait_for_room_locked(block=True)
+                seqs.append(self._enqueue_locked(event, True))
+            self._stats["critical_waits"] += 1
+            self._wait_written_locked(seqs, timeout)
+
+    def _wait_for_room_locked(self, block: bool) -> bool:
+        """
+        Wait until the queue has room: without limit when block=True,
+        otherwise for up to block_timeout_s. Returns False on timeout.
+        """
+        if len(self._queue) < self.max_queue:
+            return True
+        self._stats["backpressure_waits"] += 1
+        deadline = None if block else time.monotonic() + self.block_timeout_s
+        while len(self._queue) >= self.max_queue and not self._stopping:
+            if block and (self._thread is None or not self._thread.is_alive()):
+                # No writer to make room - drain on this thread
+                self._cond.release()
+                try:
+                    self._drain_one()
+                finally:
+                    self._cond.acquire()
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._cond.wait(remaining)
+        return True
+
+    def _enqueue_locked(self, event: Any, waited: bool) -> int:
+        seq = self._next_seq
+        self._next_seq += 1
+        if waited:
+            self._waiting.add(seq)
+        self._queue.append((seq, event, time.monotonic()))
+        self._stats["submitted"] += 1
+        self._stats["max_depth_seen"] = max(self._stats["max_depth_seen"], len(self._queue))
+        self._cond.notify_all()
+        return seq
+
+    def _wait_written_locked(self, seqs: List[int], timeout: Optional[float]):
+        """Wait for seqs to be attempted; raise if any of their batches failed."""
+        try:
+            self._wait_done_locked(max(seqs), timeout)
+            errors = [self._failed.pop(seq) for seq in seqs if seq in self._failed]
+        finally:
+            self._waiting.difference_update(seqs)
+        if errors:
+            raise AuditWriteError(f"{len(errors)} audit event(s) not written: {errors[0]}")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far is committed. Returns False on timeout."""
+        with self._cond:
+            return self._wait_done_locked(self._next_seq - 1, timeout)
+
+    def _wait_done_locked(self, seq: int, timeout: Optional[float]) -> bool:
+        if self._done_seq >= seq:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._flush_waiters += 1
+        self._cond.notify_all()  # Wake the writer so it skips the linger wait
+        try:
+            while self._done_seq < seq:
+                if self._stopping or self._thread is None or not self._thread.is_alive():
+                    # No writer (stopped / never started / died) - drain on this thread
+                    self._cond.release()
+                    try:
+                        self._drain_one()
+                    finally:
+                        self._cond.acquire()
+                    continue
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+        finally:
+            self._flush_waiters -= 1
+
+    def stop(self, flush: bool = True, timeout: Optional[float] = 10.0):
+        """Stop the writer, draining the queue first if flush=True."""
+        if flush:
+            self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread:
+            thread.join(timeout)
+
+    def get_stats(self) -> dict:
+        """Queue depth, lag and drop/backpressure counters."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats["queue_depth"] = len(self._queue)
+            stats["lag_ms"] = round((time.monotonic() - self._queue[0][2]) * 1000, 2) if self._queue else 0.0
+            stats["max_queue"] = self.max_queue
+            stats["batch_size"] = self.batch_size
+            stats["running"] = bool(self._thread and self._thread.is_alive() and not self._stopping)
+        return stats
+
+    def _take_batch_locked(self) -> List[Tuple[int, Any, float]]:
+        batch = []
+        while self._queue and len(batch) < self.batch_size:
+            batch.append(self._queue.popleft())
+        return batch
+
+    def _drain_one(self) -> bool:
+        """
+        Take the next batch and write it. Never raises: a failed batch is
+        counted, and reported to whoever is waiting on its events.
+
+        Taking and writing both happen under the write lock, so batches hit
+        the chain in queue order whichever thread drains them.
+        """
+        with self._write_lock:
+            with self._cond:
+                batch = self._take_batch_locked()
+            if not batch:
+                return False
+            start = time.perf_counter()
+            try:
+                self._write_batch([event for _, event, _ in batch])
+                error = None
+            except Exception as e:
+                error = str(e)
+                print(f"[WARN] Audit sink batch failed: {e}", file=sys.stderr)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        lag_ms = (time.monotonic() - batch[0][2]) * 1000
+
+        with self._cond:
+            self._done_seq = max(self._done_seq, batch[-1][0])
+            self._stats["batches"] += 1
+            self._stats["last_batch_size"] = len(batch)
+            self._stats["last_batch_ms"] = round(elapsed_ms, 2)
+            self._stats["last_commit_lag_ms"] = round(lag_ms, 2)
+            self._stats["max_commit_lag_ms"] = max(self._stats["max_commit_lag_ms"], round(lag_ms, 2))
+            if error:
+                for seq, _, _ in batch:
+                    if seq in self._waiting:
+                        self._failed[seq] = error
+                self._stats["errors"] += 1
+                self._stats["failed_events"] += len(batch)
+                self._stats["last_error"] = error
+            else:
+                self._stats["written"] += len(batch)
+            self._cond.notify_all()
+        return True
+
+    def _run(self):
+        """Writer loop: wait for events, linger briefly to fill a batch, commit."""
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopping:
+                    self._cond.wait()
+                if self._stopping and not self._queue:
+                    return
+                # Linger so bursts of gate decisions share one commit
+                linger_until = time.monotonic() + self.linger_ms / 1000
+                while (len(self._queue) < self.batch_size
+                       and not self._stopping and not self._flush_waiters):
+                    remaining = linger_until - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            self._drain_one()
@@ -0,0 +1,467 @@
+"""
+SQLite Audit Store - Layer 5 Security
+======================================
+
+SQLite backend for the unified audit log (DURO_AUDIT_BACKEND=sqlite).
+
+The JSONL backend takes a thread lock, reads audit_head.json, stats the
+log for rotation, appends a line and rewrites the head file on every
+event, and query_log() re-parses every line. It is also only safe within
+one process (see KNOWN_LIMITATIONS.md). This store keeps the same event
+records and the same hash chain, but:
+
+- Appends run in a BEGIN IMMEDIATE transaction: read head row, compute
+  chain, insert. SQLite's write lock makes this atomic across processes.
+- The head is the last row (O(1) via the rowid), no head file.
+- event_type, tool, decision, severity and ts are indexed columns, so
+  queries are SQL lookups instead of full scans.
+- append_many() chains a whole batch in one transaction.
+- verify() resumes from the last verified checkpoint.
+- export_jsonl() writes the chain in the JSONL format, which verify_log()
+  accepts unchanged.
+
+The stored record is exactly the JSONL line, so hashes are computed by
+the same functions in audit_log.py.
+"""
+
+import hmac
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from audit_log import (
+    AUDIT_DIR, GENESIS_HASH, AuditEvent, VerifyResult,
+    compute_chain, compute_hmac_signature, compute_record_hash,
+    generate_event_id, get_hmac_key,
+)
+from time_utils import utc_now_iso
+
+
+AUDIT_DB_FILE = AUDIT_DIR / "security_audit.db"
+
+# Columns copied out of each record (for indexed queries), in insert order
+RECORD_COLUMNS = (
+    "event_id", "ts", "event_type", "severity", "tool", "decision",
+    "chain_prev", "chain_hash", "chain_sig",
+)
+
+
+def _record_columns(record: Dict[str, Any]) -> tuple:
+    """Values for RECORD_COLUMNS as derived from a stored record."""
+    chain = record.get("chain", {})
+    return (
+        record.get("event_id"), record.get("ts"), record.get("event_type"),
+        record.get("severity"), record.get("tool"), record.get("decision"),
+        chain.get("prev"), chain.get("hash"), chain.get("sig"),
+    )
+
+
+class AuditStore:
+    """
+    Hash-chained audit events in SQLite.
+
+    One connection per thread; all chain writes go through BEGIN IMMEDIATE,
+    so concurrent writers (threads or processes) serialize on SQLite's lock.
+    """
+
+    BUSY_TIMEOUT_MS = 10000
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path or AUDIT_DB_FILE)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=self.BUSY_TIMEOUT_MS / 1000,
+                isolation_level=None,  # Explicit BEGIN/COMMIT
+                check_same_thread=False,
+            )
+            conn.execute(f"PRAGMA busy_timeout = {self.BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        conn = self._connect()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS audit_events (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_id TEXT NOT NULL,
+                ts TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                severity TEXT,
+                tool TEXT,
+                decision TEXT,
+                chain_prev TEXT NOT NULL,
+                chain_hash TEXT NOT NULL,
+                chain_sig TEXT,
+                record TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_audit_event_type ON audit_events(event_type, ts);
+            CREATE INDEX IF NOT EXISTS idx_audit_tool ON audit_events(tool, ts);
+            CREATE INDEX IF NOT EXISTS idx_audit_decision ON audit_events(decision, ts);
+            CREATE INDEX IF NOT EXISTS idx_audit_severity ON audit_events(severity, ts);
+            CREATE INDEX IF NOT EXISTS idx_audit_ts ON audit_events(ts);
+
+            CREATE TABLE IF NOT EXISTS audit_checkpoints (
+                name TEXT PRIMARY KEY,
+                seq INTEGER NOT NULL,
+                chain_hash TEXT NOT NULL,
+                verified_at TEXT NOT NULL,
+                sig TEXT
+            );
+        """)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(audit_checkpoints)")}
+        if "sig" not in columns:
+            conn.execute("ALTER TABLE audit_checkpoints ADD COLUMN sig TEXT")
+
+    def close(self):
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------
+    # Append
+    # ------------------------------------------------------------
+
+    def get_head(self) -> tuple:
+        """Return (chain_hash, event_id) of the last event."""
+        row = self._connect().execute(
+            "SELECT chain_hash, event_id FROM audit_events ORDER BY seq DESC LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return GENESIS_HASH, ""
+        return row[0], row[1]
+
+    def append(self, event: AuditEvent) -> str:
+        """Append one event to the chain. Returns the event_id."""
+        return self.append_many([event])[0]
+
+    def append_many(self, events: List[AuditEvent]) -> List[str]:
+        """
+        Chain and insert a batch of events in one transaction.
+
+        Returns the event_ids in order.
+        """
+        if not events:
+            return []
+
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT chain_hash FROM audit_events ORDER BY seq DESC LIMIT 1"
+            ).fetchone()
+            prev_hash = row[0] if row else GENESIS_HASH
+
+            rows = []
+            for event in events:
+                if not event.event_id:
+                    event.event_id = generate_event_id()
+                event.chain.prev = prev_hash
+                chain_hash, sig = compute_chain(event, prev_hash)
+                event.chain.hash = chain_hash
+                event.chain.sig = sig
+
+                record = event.to_dict()
+                rows.append((*_record_columns(record), json.dumps(record, sort_keys=True)))
+                prev_hash = chain_hash
+
+            conn.executemany(f"""
+                INSERT INTO audit_events ({', '.join(RECORD_COLUMNS)}, record)
+                VALUES ({', '.join('?' for _ in RECORD_COLUMNS)}, ?)
+            """, rows)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        return [event.event_id for event in events]
+
+    # ------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------
+
+    def query(
+        self,
+        limit: int = 100,
+        event_type: Optional[str] = None,
+        tool: Optional[str] = None,
+        decision: Optional[str] = None,
+        severity: Optional[str] = None,
+        since: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Query events with indexed filters. Returns events newest first."""
+        conditions = []
+        params: List[Any] = []
+
+        for column, value in (
+            ("event_type", event_type),
+            ("tool", tool),
+            ("decision", decision),
+            ("severity", severity),
+        ):
+            if value:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            conditions.append("ts >= ?")
+            params.append(since)
+        if tags:
+            placeholders = ",".join("?" for _ in tags)
+            conditions.append(
+                f"EXISTS (SELECT 1 FROM json_each(record, '$.tags') WHERE value IN ({placeholders}))"
+            )
+            params.extend(tags)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(limit)
+
+        rows = self._connect().execute(
+            f"SELECT record FROM audit_events {where} ORDER BY ts DESC, seq DESC LIMIT ?",
+            params
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self) -> int:
+        row = self._connect().execute("SELECT COUNT(*) FROM audit_events").fetchone()
+        return row[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Event counts by type, severity and decision."""
+        conn = self._connect()
+
+        def grouped(column: str) -> Dict[str, int]:
+            return {
+                key: count for key, count in conn.execute(
+                    f"SELECT {column}, COUNT(*) FROM audit_events "
+                    f"WHERE {column} IS NOT NULL GROUP BY {column}"
+                )
+            }
+
+        signed = conn.execute(
+            "SELECT 1 FROM audit_events WHERE chain_sig IS NOT NULL LIMIT 1"
+        ).fetchone() is not None
+
+        return {
+            "total_events": self.count(),
+            "by_event_type": grouped("event_type"),
+            "by_severity": grouped("severity"),
+            "by_decision": grouped("decision"),
+            "signed": signed,
+        }
+
+    # ------------------------------------------------------------
+    # Verify
+    # ------------------------------------------------------------
+
+    @staticmethod
+    def _sign_checkpoint(name: str, seq: int, chain_hash: str, verified_at: str, hmac_key: bytes) -> str:
+        payload = json.dumps([name, seq, chain_hash, verified_at], separators=(",", ":"))
+        return compute_hmac_signature(payload, hmac_key)
+
+    def get_checkpoint(self, name: str = "verify") -> Optional[Dict[str, Any]]:
+        """
+        Load a verify checkpoint, or None if missing or not trusted.
+
+        With an HMAC key configured the row must carry a valid signature (as
+        load_verify_checkpoint requires for the JSONL backend), so a row
+        written directly into the database can't skip verification.
+        """
+        row = self._connect().execute(
+            "SELECT seq, chain_hash, verified_at, sig FROM audit_checkpoints WHERE name = ?",
+            (name,)
+        ).fetchone()
+        if row is None:
+            return None
+        seq, chain_hash, verified_at, sig = row
+
+        hmac_key = get_hmac_key()
+        if hmac_key:
+            expected = self._sign_checkpoint(name, seq, chain_hash, verified_at, hmac_key)
+            if not sig or not hmac.compare_digest(sig, expected):
+                return None
+
+        return {"seq": seq, "chain_hash": chain_hash, "verified_at": verified_at}
+
+    def _save_checkpoint(self, seq: int, chain_hash: str, name: str = "verify"):
+        verified_at = utc_now_iso()
+        hmac_key = get_hmac_key()
+        sig = self._sign_checkpoint(name, seq, chain_hash, verified_at, hmac_key) if hmac_key else None
+        self._connect().execute("""
+            INSERT INTO audit_checkpoints (name, seq, chain_hash, verified_at, sig)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                seq = excluded.seq,
+                chain_hash = excluded.chain_hash,
+                verified_at = excluded.verified_at,
+                sig = excluded.sig
+        """, (name, seq, chain_hash, verified_at, sig))
+
+    def verify(self, full: bool = False) -> VerifyResult:
+        """
+        Verify the hash chain.
+
+        Resumes after the last verified checkpoint unless full=True. The
+        checkpointed row must still carry the checkpointed hash, otherwise
+        verification restarts from GENESIS. first_broken_line is the row seq.
+
+        The indexed columns query() filters on are re-derived from each
+        hashed record, so editing a column (say decision 'DENY' -> 'ALLOW'
+        to hide an event from queries) fails verification too.
+        """
+        conn = self._connect()
+        hmac_key = get_hmac_key()
+        total = self.count()
+
+        start_seq = 0
+        prev_hash = GENESIS_HASH
+        resumed = 0
+
+        checkpoint = None if full else self.get_checkpoint()
+        if checkpoint:
+            row = conn.execute(
+                "SELECT chain_hash, (SELECT COUNT(*) FROM audit_events WHERE seq <= ?) "
+                "FROM audit_events WHERE seq = ?",
+                (checkpoint["seq"], checkpoint["seq"])
+            ).fetchone()
+            if row and row[0] == checkpoint["chain_hash"]:
+                start_seq = checkpoint["seq"]
+                prev_hash = checkpoint["chain_hash"]
+                resumed = row[1]
+
+        verified = resumed
+        signed = False
+        sig_valid = True
+        last_seq = start_seq
+
+        cursor = conn.execute(
+            f"SELECT seq, record, {', '.join(RECORD_COLUMNS)} FROM audit_events "
+            "WHERE seq > ? ORDER BY seq",
+            (start_seq,)
+        )
+        for seq, record_json, *columns in cursor:
+            event_id = columns[0]
+            try:
+                record = json.loads(record_json)
+            except json.JSONDecodeError:
+                return VerifyResult(
+                    valid=False,
+                    total_events=total,
+                    verified_events=verified,
+                    first_broken_line=seq,
+                    first_broken_event_id=event_id,
+                    error=f"Invalid JSON at seq {seq}",
+                    resumed_from=resumed,
+                )
+
+            chain = record.get("chain", {})
+            stored_prev = chain.get("prev", "")
+            stored_hash = chain.get("hash", "")
+            stored_sig = chain.get("sig")
+
+            if stored_prev != prev_hash:
+                return VerifyResult(
+                    valid=False,
+                    total_events=total,
+                    verified_events=verified,
+                    first_broken_line=seq,
+                    first_broken_event_id=event_id,
+                    error=f"Chain break at seq {seq}: expected prev={prev_hash[:20]}..., got {stored_prev[:20]}...",
+                    resumed_from=resumed,
+                )
+
+            if stored_hash != compute_record_hash(record, prev_hash):
+                return VerifyResult(
+                    valid=False,
+                    total_events=total,
+                    verified_events=verified,
+                    first_broken_line=seq,
+                    first_broken_event_id=event_id,
+                    error=f"Hash mismatch at seq {seq}",
+                    resumed_from=resumed,
+                )
+
+            derived = dict(zip(RECORD_COLUMNS, _record_columns(record)))
+            mismatched = [
+                column for column, value in zip(RECORD_COLUMNS, columns)
+                if derived[column] != value
+            ]
+            if mismatched:
+                return VerifyResult(
+                    valid=False,
+                    total_events=total,
+                    verified_events=verified,
+                    first_broken_line=seq,
+                    first_broken_event_id=record.get("event_id"),
+                    error=f"Column mismatch at seq {seq}: {', '.join(mismatched)} differs from the hashed record",
+                    resumed_from=resumed,
+                )
+
+            if stored_sig:
+                signed = True
+                if hmac_key and stored_sig != compute_hmac_signature(stored_hash, hmac_key):
+                    sig_valid = False
+
+            verified += 1
+            prev_hash = stored_hash
+            last_seq = seq
+
+        # Only advance the checkpoint over a clean, correctly signed stretch
+        if last_seq > start_seq and sig_valid:
+            self._save_checkpoint(last_seq, prev_hash)
+
+        return VerifyResult(
+            valid=True,
+            total_events=total,
+            verified_events=verified,
+            signed=signed,
+            signature_valid=sig_valid if signed else False,
+            resumed_from=resumed,
+        )
+
+    # ------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------
+
+    def export_jsonl(self, path: Path) -> int:
+        """
+        Write the chain to a JSONL file in seq order.
+
+        The output has the same line format as security_audit.jsonl, so
+        audit_log.verify_log(path) can check it. Returns the event count.
+        """
+        count = 0
+        with open(path, "w", encoding="utf-8") as f:
+            for (record_json,) in self._connect().execute(
+                "SELECT record FROM audit_events ORDER BY seq"
+            ):
+                f.write(record_json + "\n")
+                count += 1
+        return count
+
+
+# Singleton store (created on first use)
+_store: Optional[AuditStore] = None
+_store_lock = threading.Lock()
+
+
+def get_audit_store() -> AuditStore:
+    """Get the process-wide SQLite audit store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = AuditStore()
+    return _store
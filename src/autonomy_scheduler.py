@@ -19,7 +19,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Dict, List, Optional, Set
 
-from autonomy_state import AutonomyStateStore
+from autonomy_state import AutonomyStateStore, BufferEventTable
 from surfacing import QuietModeCalculator, ResultBuffer, FeedbackTracker
 
 logger = logging.getLogger(__name__)
@@ -243,11 +243,13 @@ class AutonomyScheduler:
     Design:
     - ensure_session_started() is idempotent with cache + TTL
     - Cheap checks only in session start (heavy work deferred to maintenance)
-    - track_retrieval() with top-3 limit and cooldown
+    - track_retrieval() with top-3 limit and cooldown (batched, TTL cooldown keys)
     - Integrates with surfacing layer
     """
 
     SESSION_CACHE_TTL_SECONDS = 180  # 3 minutes
+    REINFORCE_COOLDOWN_MINUTES = 60
+    REINFORCE_COOLDOWN_PREFIX = "reinforcement.recent."
 
     def __init__(
         self,
@@ -277,6 +279,7 @@ class AutonomyScheduler:
         self.buffer = ResultBuffer(
             load_state_cb=self.state.get,
             save_state_cb=self.state.set,
+            event_table=BufferEventTable(self.state),
         )
         self.quiet_mode = QuietModeCalculator(
             load_state_cb=self.state.get,
@@ -290,6 +293,9 @@ class AutonomyScheduler:
             buffer=self.buffer,
         )
 
+        # Cooldown keys written before they had a TTL expire like new ones
+        self.state.expire_prefix(self.REINFORCE_COOLDOWN_PREFIX, self.REINFORCE_COOLDOWN_MINUTES * 60)
+
         # Idempotency guards
         self._session_lock = asyncio.Lock()
         self._session_lock_sync = threading.Lock()  # For sync version
@@ -452,6 +458,9 @@ class AutonomyScheduler:
         """
         Auto-reinforce top N facts only, with cooldown.
 
+        Cooldowns are read in one query, all due facts are bumped in one
+        index transaction, and the cooldown keys carry a TTL so they expire.
+
         Args:
             results: List of result objects with at least {id, type}
             source: Source of retrieval (e.g., "semantic_search", "proactive_recall")
@@ -464,40 +473,54 @@ class AutonomyScheduler:
         if source == "proactive_recall":
             return 0
 
-        COOLDOWN_MINUTES = 60
         now = utc_now()
-        reinforced = 0
 
         # Filter to facts only using the type from results (no extra lookup)
-        facts = [r for r in results if r.get("type") == "fact"]
-
-        for result in facts[:max_reinforce]:
+        candidates = []
+        for result in [r for r in results if r.get("type") == "fact"][:max_reinforce]:
             artifact_id = result.get("id")
-            if not artifact_id:
-                continue
+            if artifact_id and artifact_id not in candidates:
+                candidates.append(artifact_id)
+        if not candidates:
+            return 0
 
-            # Check cooldown
-            key = f"reinforcement.recent.{artifact_id}"
-            last_str = self.state.get(key)
+        # Check cooldowns in one query (cooldown keys expire on their own)
+        keys = {artifact_id: f"{self.REINFORCE_COOLDOWN_PREFIX}{artifact_id}" for artifact_id in candidates}
+        recent = self.state.get_values(list(keys.values()))
+        due = []
+        for artifact_id in candidates:
+            last_str = recent.get(keys[artifact_id])
             if last_str:
                 try:
                     last = datetime.fromisoformat(str(last_str))
                     elapsed_minutes = (now - last).total_seconds() / 60
-                    if elapsed_minutes < COOLDOWN_MINUTES:
+                    if elapsed_minutes < self.REINFORCE_COOLDOWN_MINUTES:
                         continue
                 except (ValueError, TypeError):
                     pass  # Invalid timestamp, proceed
+            due.append(artifact_id)
+        if not due:
+            return 0
 
-            # Reinforce
-            try:
-                if hasattr(self.index, 'increment_reinforcement'):
+        # Reinforce all due facts in one index transaction
+        try:
+            if hasattr(self.index, 'increment_reinforcement_many'):
+                if self.index.increment_reinforcement_many(due) < 0:
+                    return 0
+            elif hasattr(self.index, 'increment_reinforcement'):
+                for artifact_id in due:
                     self.index.increment_reinforcement(artifact_id)
-                    self.state.set(key, utc_now_iso())
-                    reinforced += 1
-            except Exception as e:
-                logger.error(f"Failed to reinforce {artifact_id}: {e}")
+            else:
+                return 0
+            self.state.set_many(
+                {keys[artifact_id]: utc_now_iso() for artifact_id in due},
+                ttl_seconds=self.REINFORCE_COOLDOWN_MINUTES * 60,
+            )
+        except Exception as e:
+            logger.error(f"Failed to reinforce {due}: {e}")
+            return 0
 
-        return reinforced
+        return len(due)
 
     def get_surfacing_events(
         self,
@@ -4,6 +4,9 @@ Persistent key-value store for autonomy state.
 
 SQLite-backed with JSON serialization for complex values.
 This is the foundation - without it, autonomy is a goldfish with opinions.
+
+Keys can carry a TTL (expires_at_unix). Expired keys read as missing and
+are swept by writes at most every SWEEP_INTERVAL_SECONDS.
 """
 from __future__ import annotations
 
@@ -21,18 +24,24 @@ class AutonomyStateStore:
     Thread-safe SQLite key-value store for autonomy state.
 
     Schema:
-        autonomy_state(key TEXT PRIMARY KEY, value_json TEXT, updated_at_unix INTEGER)
+        autonomy_state(key TEXT PRIMARY KEY, value_json TEXT, updated_at_unix INTEGER,
+                       expires_at_unix INTEGER NULL)
 
     Usage:
         state = AutonomyStateStore("/path/to/db.sqlite")
         state.ensure_schema()
         state.set("maintenance.last_run.decay", 1708531200)
         val = state.get("maintenance.last_run.decay", default=0)
+        state.set_many({"cooldown.a": 1, "cooldown.b": 1}, ttl_seconds=3600)
     """
 
+    SWEEP_INTERVAL_SECONDS = 300
+    _LIVE = "(expires_at_unix IS NULL OR expires_at_unix > ?)"
+
     def __init__(self, db_path: str):
         self.db_path = str(db_path)
         self._local = threading.local()
+        self._last_sweep = 0.0
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get thread-local connection."""
@@ -70,17 +79,43 @@ class AutonomyStateStore:
                 CREATE INDEX IF NOT EXISTS idx_autonomy_state_key_prefix
                 ON autonomy_state(key)
             """)
+            # TTL column (added after the original schema)
+            cur.execute("PRAGMA table_info(autonomy_state)")
+            if "expires_at_unix" not in {row["name"] for row in cur.fetchall()}:
+                cur.execute("ALTER TABLE autonomy_state ADD COLUMN expires_at_unix INTEGER")
+            cur.execute("""
+                CREATE INDEX IF NOT EXISTS idx_autonomy_state_expires
+                ON autonomy_state(expires_at_unix)
+                WHERE expires_at_unix IS NOT NULL
+            """)
+            # Surfacing buffer: one row per event (see BufferEventTable)
+            cur.execute("""
+                CREATE TABLE IF NOT EXISTS autonomy_buffer (
+                    id TEXT PRIMARY KEY,
+                    type TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    payload_json TEXT NOT NULL,
+                    created_at_unix INTEGER NOT NULL,
+                    updated_at_unix INTEGER NOT NULL,
+                    dedupe_key TEXT UNIQUE,
+                    seq INTEGER NOT NULL
+                )
+            """)
+            cur.execute("""
+                CREATE INDEX IF NOT EXISTS idx_autonomy_buffer_order
+                ON autonomy_buffer(priority DESC, updated_at_unix DESC, seq)
+            """)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
-        Get value by key. Returns default if not found.
+        Get value by key. Returns default if not found (or expired).
 
         Values are JSON-deserialized automatically.
         """
         with self._cursor() as cur:
             cur.execute(
-                "SELECT value_json FROM autonomy_state WHERE key = ?",
-                (str(key),)
+                f"SELECT value_json FROM autonomy_state WHERE key = ? AND {self._LIVE}",
+                (str(key), int(time.time()))
             )
             row = cur.fetchone()
             if row is None:
@@ -90,23 +125,88 @@ class AutonomyStateStore:
             except (json.JSONDecodeError, TypeError):
                 return default
 
-    def set(self, key: str, value: Any) -> None:
+    def get_values(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Get several keys in one query. Missing / expired keys are omitted.
+        """
+        keys = [str(k) for k in keys]
+        result = {}
+        now = int(time.time())
+        with self._cursor() as cur:
+            # Stay under SQLite's host parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                cur.execute(
+                    f"SELECT key, value_json FROM autonomy_state "
+                    f"WHERE key IN ({','.join('?' * len(chunk))}) AND {self._LIVE}",
+                    (*chunk, now)
+                )
+                for row in cur.fetchall():
+                    try:
+                        result[row["key"]] = json.loads(row["value_json"])
+                    except (json.JSONDecodeError, TypeError):
+                        result[row["key"]] = None
+        return result
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
         """
         Set value by key. Value is JSON-serialized.
 
-        Upserts: creates if not exists, updates if exists.
+        Upserts: creates if not exists, updates if exists. With ttl_seconds
+        the key expires (reads as missing, then is swept); without, any
+        earlier TTL is cleared.
         """
+        self.set_many({key: value}, ttl_seconds=ttl_seconds)
+
+    def set_many(self, items: dict[str, Any], ttl_seconds: Optional[float] = None) -> None:
+        """Set several keys in one transaction (same TTL rules as set)."""
+        if not items:
+            return
         now = int(time.time())
-        value_json = json.dumps(value, separators=(",", ":"), default=str)
+        expires = int(now + ttl_seconds) if ttl_seconds is not None else None
+        rows = [
+            (str(k), json.dumps(v, separators=(",", ":"), default=str), now, expires)
+            for k, v in items.items()
+        ]
 
         with self._cursor() as cur:
-            cur.execute("""
-                INSERT INTO autonomy_state (key, value_json, updated_at_unix)
-                VALUES (?, ?, ?)
+            cur.executemany("""
+                INSERT INTO autonomy_state (key, value_json, updated_at_unix, expires_at_unix)
+                VALUES (?, ?, ?, ?)
                 ON CONFLICT(key) DO UPDATE SET
                     value_json = excluded.value_json,
-                    updated_at_unix = excluded.updated_at_unix
-            """, (str(key), value_json, now))
+                    updated_at_unix = excluded.updated_at_unix,
+                    expires_at_unix = excluded.expires_at_unix
+            """, rows)
+            if now - self._last_sweep >= self.SWEEP_INTERVAL_SECONDS:
+                self._last_sweep = now
+                cur.execute(
+                    "DELETE FROM autonomy_state WHERE expires_at_unix IS NOT NULL AND expires_at_unix <= ?",
+                    (now,)
+                )
+
+    def sweep_expired(self) -> int:
+        """Delete expired keys now. Returns count deleted."""
+        now = int(time.time())
+        with self._cursor() as cur:
+            cur.execute(
+                "DELETE FROM autonomy_state WHERE expires_at_unix IS NOT NULL AND expires_at_unix <= ?",
+                (now,)
+            )
+            self._last_sweep = now
+            return cur.rowcount
+
+    def expire_prefix(self, prefix: str, ttl_seconds: float) -> int:
+        """
+        Give keys under prefix that have no TTL one, counted from their last
+        update. For moving permanent keys to TTL keys. Returns count updated.
+        """
+        with self._cursor() as cur:
+            cur.execute("""
+                UPDATE autonomy_state SET expires_at_unix = updated_at_unix + ?
+                WHERE key LIKE ? AND expires_at_unix IS NULL
+            """, (int(ttl_seconds), str(prefix) + "%"))
+            return cur.rowcount
 
     def delete(self, key: str) -> bool:
         """Delete key. Returns True if key existed."""
@@ -123,8 +223,8 @@ class AutonomyStateStore:
         """
         with self._cursor() as cur:
             cur.execute(
-                "SELECT key, value_json FROM autonomy_state WHERE key LIKE ?",
-                (str(prefix) + "%",)
+                f"SELECT key, value_json FROM autonomy_state WHERE key LIKE ? AND {self._LIVE}",
+                (str(prefix) + "%", int(time.time()))
             )
             result = {}
             for row in cur.fetchall():
@@ -146,25 +246,27 @@ class AutonomyStateStore:
     def keys(self, prefix: Optional[str] = None) -> list[str]:
         """List all keys, optionally filtered by prefix."""
         with self._cursor() as cur:
+            now = int(time.time())
             if prefix:
                 cur.execute(
-                    "SELECT key FROM autonomy_state WHERE key LIKE ? ORDER BY key",
-                    (str(prefix) + "%",)
+                    f"SELECT key FROM autonomy_state WHERE key LIKE ? AND {self._LIVE} ORDER BY key",
+                    (str(prefix) + "%", now)
                 )
             else:
-                cur.execute("SELECT key FROM autonomy_state ORDER BY key")
+                cur.execute(f"SELECT key FROM autonomy_state WHERE {self._LIVE} ORDER BY key", (now,))
             return [row["key"] for row in cur.fetchall()]
 
     def count(self, prefix: Optional[str] = None) -> int:
         """Count keys, optionally filtered by prefix."""
         with self._cursor() as cur:
+            now = int(time.time())
             if prefix:
                 cur.execute(
-                    "SELECT COUNT(*) as cnt FROM autonomy_state WHERE key LIKE ?",
-                    (str(prefix) + "%",)
+                    f"SELECT COUNT(*) as cnt FROM autonomy_state WHERE key LIKE ? AND {self._LIVE}",
+                    (str(prefix) + "%", now)
                 )
             else:
-                cur.execute("SELECT COUNT(*) as cnt FROM autonomy_state")
+                cur.execute(f"SELECT COUNT(*) as cnt FROM autonomy_state WHERE {self._LIVE}", (now,))
             return cur.fetchone()["cnt"]
 
     def clear(self) -> int:
@@ -178,3 +280,94 @@ class AutonomyStateStore:
         if hasattr(self._local, "conn") and self._local.conn:
             self._local.conn.close()
             self._local.conn = None
+
+
+class BufferEventTable:
+    """
+    Row-per-event storage for surfacing.ResultBuffer.
+
+    Lives in the same database as AutonomyStateStore (table created by
+    ensure_schema). Enqueue, dedupe update and pop each touch only their
+    own rows instead of rewriting the whole queue as one JSON value.
+    """
+
+    def __init__(self, state: AutonomyStateStore):
+        self._state = state
+
+    def load(self) -> list[tuple[dict, int]]:
+        """All events as (event, seq), best first."""
+        with self._state._cursor() as cur:
+            cur.execute("""
+                SELECT id, type, priority, payload_json, created_at_unix,
+                       updated_at_unix, dedupe_key, seq
+                FROM autonomy_buffer
+                ORDER BY priority DESC, updated_at_unix DESC, seq
+            """)
+            rows = cur.fetchall()
+        events = []
+        for row in rows:
+            try:
+                payload = json.loads(row["payload_json"])
+            except (json.JSONDecodeError, TypeError):
+                payload = {}
+            events.append(({
+                "id": row["id"],
+                "type": row["type"],
+                "priority": row["priority"],
+                "payload": payload,
+                "created_at_unix": row["created_at_unix"],
+                "updated_at_unix": row["updated_at_unix"],
+                "dedupe_key": row["dedupe_key"],
+            }, row["seq"]))
+        return events
+
+    def upsert(self, event: dict, seq: int) -> None:
+        """Insert or update one event row."""
+        with self._state._cursor() as cur:
+            cur.execute("""
+                INSERT INTO autonomy_buffer
+                    (id, type, priority, payload_json, created_at_unix, updated_at_unix, dedupe_key, seq)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    type = excluded.type,
+                    priority = excluded.priority,
+                    payload_json = excluded.payload_json,
+                    updated_at_unix = excluded.updated_at_unix,
+                    dedupe_key = excluded.dedupe_key
+            """, (
+                event["id"], event["type"], int(event["priority"]),
+                json.dumps(event.get("payload") or {}, separators=(",", ":"), default=str),
+                int(event["created_at_unix"]), int(event["updated_at_unix"]),
+                event.get("dedupe_key"), int(seq),
+            ))
+
+    def upsert_many(self, events: list[tuple[dict, int]]) -> None:
+        """Insert a batch of (event, seq) rows in one transaction (migration)."""
+        with self._state._cursor() as cur:
+            cur.executemany("""
+                INSERT OR REPLACE INTO autonomy_buffer
+                    (id, type, priority, payload_json, created_at_unix, updated_at_unix, dedupe_key, seq)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
+                    ev["id"], ev["type"], int(ev["priority"]),
+                    json.dumps(ev.get("payload") or {}, separators=(",", ":"), default=str),
+                    int(ev["created_at_unix"]), int(ev["updated_at_unix"]),
+                    ev.get("dedupe_key"), int(seq),
+                )
+                for ev, seq in events
+            ])
+
+    def delete(self, event_ids: list[str]) -> int:
+        """Delete events by id. Returns count deleted."""
+        if not event_ids:
+            return 0
+        with self._state._cursor() as cur:
+            cur.executemany("DELETE FROM autonomy_buffer WHERE id = ?", [(i,) for i in event_ids])
+            return cur.rowcount
+
+    def clear(self) -> int:
+        """Delete all events. Returns count deleted."""
+        with self._state._cursor() as cur:
+            cur.execute("DELETE FROM autonomy_buffer")
+            return cur.rowcount
@@ -12,8 +12,11 @@ Key principles:
 - Confidence has a floor (never goes to 0)
 """
 
+import json
+import os
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import Callable, Optional
 
 from time_utils import utc_now_iso, days_since, parse_iso_datetime
 
@@ -339,42 +342,213 @@ def apply_batch_decay(
 # Store Integration
 # =============================================================================
 
-def apply_decay_to_store(artifact_store, dry_run: bool = True) -> dict:
+# Facts per keyset page; each page is one batch of loads and one index write
+DECAY_CHUNK_SIZE = 500
+
+# Resume point of an interrupted apply_decay_to_store() pass (in memory_dir)
+DECAY_CHECKPOINT_FILE = "decay_checkpoint.json"
+DECAY_CHECKPOINT_VERSION = 1
+
+
+def index_decay_stub(row: dict, config: DecayConfig = DEFAULT_DECAY_CONFIG) -> dict:
+    """
+    Fact-shaped dict built from an index row, enough for calculate_decay().
+
+    Confidence isn't indexed, so the ceiling stands in: a stub that doesn't
+    decay (pinned, grace period, reinforcement protection) rules out the
+    real fact too, without reading its file.
+    """
+    return {
+        "id": row["id"],
+        "created_at": row.get("created_at"),
+        "data": {
+            "confidence": config.max_confidence,
+            "importance": row.get("importance") if row.get("importance") is not None else 0.5,
+            "pinned": bool(row.get("pinned")),
+            "last_reinforced_at": row.get("last_reinforced_at"),
+            "reinforcement_count": row.get("reinforcement_count") or 0,
+        }
+    }
+
+
+def _merge_index_reinforcement(fact: dict, row: dict):
+    """
+    Carry index-only reinforcement (autonomy scheduler) into the fact, so
+    decay uses it and the rewrite doesn't roll the index back.
+    """
+    data = fact.setdefault("data", {})
+    if (row.get("reinforcement_count") or 0) > (data.get("reinforcement_count") or 0):
+        data["reinforcement_count"] = row["reinforcement_count"]
+        data["last_reinforced_at"] = row.get("last_reinforced_at")
+
+
+def load_decay_checkpoint(checkpoint_path: Path) -> Optional[dict]:
+    """The saved pass position and counters, or None if missing/unreadable."""
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except Exception:
+        return None
+    if checkpoint.get("version") != DECAY_CHECKPOINT_VERSION:
+        return None
+    return checkpoint
+
+
+def _save_decay_checkpoint(checkpoint_path: Path, after_id: str, min_importance: float, counts: dict,
+                           started_at: str):
+    checkpoint = {
+        "version": DECAY_CHECKPOINT_VERSION,
+        "after_id": after_id,
+        "min_importance": min_importance,
+        "counts": counts,
+        "started_at": started_at,
+        "saved_at": utc_now_iso(),
+    }
+    tmp_path = checkpoint_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def apply_decay_to_store(
+    artifact_store,
+    dry_run: bool = True,
+    config: DecayConfig = DEFAULT_DECAY_CONFIG,
+    chunk_size: int = DECAY_CHUNK_SIZE,
+    resume: bool = True,
+    max_chunks: Optional[int] = None,
+    min_importance: float = 0,
+    stale_samples: int = 10,
+    should_stop: Optional[Callable[[], bool]] = None
+) -> dict:
     """
-    Apply decay to all facts in the artifact store.
+    Apply decay to all facts in the artifact store, streaming.
+
+    Pages through every fact by id (keyset cursor). Each page is screened
+    on the indexed decay inputs (pinned, importance, last_reinforced_at,
+    reinforcement_count); only facts that can still decay have their
+    files loaded, and the ones whose confidence drops are rewritten in
+    one batch per page. Memory stays O(chunk_size) whatever the corpus size.
+
+    When not a dry run, progress is checkpointed after every page, so an
+    interrupted pass (or one cut short by max_chunks / should_stop)
+    continues where it stopped on the next call with resume=True. A
+    finished pass clears the checkpoint; a failed page read raises and
+    leaves it in place.
 
     Args:
         artifact_store: The artifact store instance
         dry_run: If True, calculate but don't save changes
+        config: Decay configuration
+        chunk_size: Facts per page
+        resume: Continue from a saved checkpoint (same min_importance) if there is one
+        max_chunks: Stop after this many pages (checkpointed; None = all)
+        min_importance: Only decay facts with indexed importance >= this
+        stale_samples: Keep up to this many stale facts (this call only)
+        should_stop: Checked before each page; True ends the call early
 
     Returns:
-        Dict with decayed count and details
+        Dict with counts for the whole pass (including resumed pages):
+        total (facts considered), loaded, decayed, skipped_pinned,
+        skipped_grace_period, skipped_reinforcement, skipped_other,
+        stale (loaded facts below the stale threshold after decay),
+        write_errors; plus complete, chunks, resumed_from and
+        stale_facts ([{id, old_confidence, new_confidence}])
+
+    Raises:
+        sqlite3.Error: If a page can't be read from the index
     """
-    # Get all facts from store
-    fact_entries = artifact_store.index.query(artifact_type="fact", limit=1000)
-    facts = []
-    for entry in fact_entries:
-        artifact = artifact_store.get_artifact(entry.get("id"))
-        if artifact:
-            facts.append(artifact)
-
-    if not facts:
-        return {"decayed": 0, "total": 0, "dry_run": dry_run}
-
-    # Apply batch decay
-    result = apply_batch_decay(facts, DEFAULT_DECAY_CONFIG, dry_run=dry_run)
-
-    # If not dry run, save updated facts
-    if not dry_run:
-        for i, fact in enumerate(facts):
-            if result.results[i].get("decayed"):
-                artifact_store.update_artifact(fact)
+    checkpoint_path = Path(artifact_store.memory_dir) / DECAY_CHECKPOINT_FILE
+    counts = {
+        "total": 0, "loaded": 0, "decayed": 0,
+        "skipped_pinned": 0, "skipped_grace_period": 0, "skipped_reinforcement": 0, "skipped_other": 0,
+        "stale": 0, "write_errors": 0,
+    }
+    stale_facts = []
+    after_id = None
+    started_at = utc_now_iso()
+    resumed_from = None
+
+    checkpoint = load_decay_checkpoint(checkpoint_path) if resume and not dry_run else None
+    # A pass over a different subset starts over (its counts wouldn't add up)
+    if checkpoint and checkpoint.get("min_importance", 0) == min_importance:
+        after_id = resumed_from = checkpoint["after_id"]
+        counts.update(checkpoint.get("counts", {}))
+        started_at = checkpoint.get("started_at", started_at)
+
+    chunks = 0
+    complete = False
+    while True:
+        if max_chunks is not None and chunks >= max_chunks:
+            break
+        if should_stop is not None and should_stop():
+            break
+        rows = artifact_store.index.get_fact_decay_page(after_id, chunk_size)
+        if not rows:
+            complete = True
+            break
+        chunks += 1
+        after_id = rows[-1]["id"]
+
+        # Screen on indexed columns; only possible decays load their files
+        candidates = []
+        for row in rows:
+            stub = index_decay_stub(row, config)
+            if min_importance > 0 and stub["data"]["importance"] < min_importance:
+                continue
+            counts["total"] += 1
+            skip_reason = calculate_decay(stub, config).skip_reason
+            if skip_reason is None:
+                candidates.append(row)
+            elif skip_reason == "pinned":
+                counts["skipped_pinned"] += 1
+            elif skip_reason == "grace_period":
+                counts["skipped_grace_period"] += 1
+            elif skip_reason in ["reinforcement_protection", "no_decay_days"]:
+                counts["skipped_reinforcement"] += 1
+            else:
+                counts["skipped_other"] += 1
+        facts, _ = artifact_store.get_artifacts_many([row["id"] for row in candidates])
+
+        changed = []
+        for row, fact in zip(candidates, facts):
+            if not fact:
+                continue
+            counts["loaded"] += 1
+            _merge_index_reinforcement(fact, row)
+            decay_result = calculate_decay(fact, config)
+            if decay_result.decayed:
+                counts["decayed"] += 1
+                fact["data"]["confidence"] = decay_result.new_confidence
+                changed.append(fact)
+            if is_stale(fact, config):
+                counts["stale"] += 1
+                if len(stale_facts) < stale_samples:
+                    stale_facts.append({
+                        "id": fact["id"],
+                        "old_confidence": decay_result.old_confidence,
+                        "new_confidence": decay_result.new_confidence,
+                    })
+
+        if not dry_run:
+            if changed:
+                _, errors = artifact_store.update_artifacts_many(changed)
+                counts["write_errors"] += errors
+            _save_decay_checkpoint(checkpoint_path, after_id, min_importance, counts, started_at)
+
+    if complete and not dry_run:
+        try:
+            os.remove(checkpoint_path)
+        except FileNotFoundError:
+            pass
 
     return {
-        "decayed": result.decayed_count,
-        "total": result.total_facts,
-        "stale": result.stale_count,
-        "dry_run": dry_run
+        **counts,
+        "dry_run": dry_run,
+        "complete": complete,
+        "chunks": chunks,
+        "resumed_from": resumed_from,
+        "stale_facts": stale_facts,
     }
 
 
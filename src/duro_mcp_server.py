@@ -333,16 +333,23 @@ def _startup_ensure_consistency():
         if created:
             log_info(f"Seeded skill_stats: {skill_id}")
 
-    # Reindex to ensure SQLite matches files on disk
-    success_count, error_count = artifact_store.reindex()
-    if error_count > 0:
-        log_warn(f"Startup reindex: {success_count} indexed, {error_count} errors")
+    # Incrementally reconcile SQLite with files on disk (manifest-driven).
+    # Only added/changed/removed files are re-parsed; their FTS text is
+    # refreshed as part of the reconcile.
+    diff = artifact_store.reconcile_index()
+    log_info(
+        f"Startup reconcile: {diff['scanned']} scanned, +{diff['added']} "
+        f"~{diff['changed']} -{diff['removed']} ({diff['touched']} touched) "
+        f"in {diff['duration_ms']}ms"
+    )
+    if diff["errors"] > 0:
+        log_warn(f"Startup reconcile: {diff['errors']} errors, e.g. {diff['error_paths'][:5]}")
 
-    # Rebuild FTS to populate semantic text column
-    # (Triggers can't call Python, so text column is empty after reindex)
-    fts_result = artifact_store.index.rebuild_fts()
-    if not fts_result.get("success"):
-        log_warn(f"FTS rebuild failed: {fts_result}")
+    # FTS table missing entirely (migration never ran) - build it from scratch
+    if not artifact_store.index.get_fts_completeness().get("fts_exists"):
+        fts_result = artifact_store.index.rebuild_fts()
+        if not fts_result.get("success"):
+            log_warn(f"FTS rebuild failed: {fts_result}")
 
     # Cleanup any repairs that were stuck in_progress (server crash recovery)
     cleaned = artifact_store.index.cleanup_stuck_repairs(max_age_minutes=10)
@@ -431,11 +438,8 @@ def _run_apply_decay_callable() -> dict:
         # Get fact IDs from index, then load full artifacts
         # (index.query returns index entries, but generate_maintenance_report needs full artifacts)
         fact_entries = artifact_store.index.query(artifact_type="fact", limit=500)
-        facts = []
-        for entry in fact_entries:
-            artifact = artifact_store.get_artifact(entry.get("id"))
-            if artifact:
-                facts.append(artifact)
+        artifacts, _ = artifact_store.get_artifacts_many([entry.get("id") for entry in fact_entries])
+        facts = [artifact for artifact in artifacts if artifact]
 
         # Generate maintenance report with full artifacts
         report = generate_maintenance_report(facts, top_n_stale=10)
@@ -491,7 +495,8 @@ def _run_orphan_cleanup_callable() -> dict:
 
 def _build_skill_tools(_running_skills=None) -> dict:
     """Build the tools dict that reflective skills need."""
-    from embeddings import embed_text, is_embedding_available
+    from embeddings import is_embedding_available
+    from embedding_service import embed_query
 
     # Shared call stack for recursion detection across nested skill calls
     _running_skills = _running_skills or set()
@@ -499,11 +504,17 @@ def _build_skill_tools(_running_skills=None) -> dict:
     def _query_memory_wrapper(**kwargs):
         return artifact_store.query(**kwargs)
 
+    def _tag_census_wrapper(**kwargs):
+        return artifact_store.index.get_tag_census(
+            artifact_types=kwargs.get("artifact_types"),
+            since=kwargs.get("since"),
+        )
+
     def _semantic_search_wrapper(query, **kwargs):
         try:
             query_embedding = None
             if is_embedding_available():
-                query_embedding = embed_text(query)
+                query_embedding = embed_query(query)
             return artifact_store.index.hybrid_search(
                 query=query,
                 query_embedding=query_embedding,
@@ -589,6 +600,7 @@ def _build_skill_tools(_running_skills=None) -> dict:
     return {
         "query_memory": _query_memory_wrapper,
         "semantic_search": _semantic_search_wrapper,
+        "tag_census": _tag_census_wrapper,
         "store_fact": _store_fact_wrapper,
         "store_decision": _store_decision_wrapper,
         "run_skill": _run_skill_wrapper,
@@ -756,7 +768,10 @@ def _embed_artifact_sync(artifact_id: str) -> bool:
     Synchronously embed an artifact immediately after storage.
 
     This ensures embeddings are generated inline rather than queued,
-    providing immediate vector search capability.
+    providing immediate vector search capability. With write-behind
+    enabled the store has already queued the embedding for its group
+    commit (or embedded inline when the queue was full), so this is a no-op
+    and the model call stays off the tool thread.
 
     Args:
         artifact_id: The artifact ID to embed
@@ -764,6 +779,9 @@ def _embed_artifact_sync(artifact_id: str) -> bool:
     Returns:
         True if embedding succeeded, False otherwise
     """
+    if artifact_store.write_behind is not None:
+        return True
+
     try:
         # Load the artifact
         artifact = artifact_store.get_artifact(artifact_id)
@@ -1028,6 +1046,100 @@ def _startup_health_check() -> dict:
         checks["embedding_queue"] = {"status": "error", "message": str(e)}
         issues.append(f"Embedding queue check error: {e}")
 
+    # 8. Write-behind queue (FTS/embedding group commits)
+    try:
+        wb = artifact_store.get_write_behind_stats()
+        if not wb.get("enabled"):
+            checks["write_behind"] = {"status": "ok", "enabled": False}
+        else:
+            depth = wb["queue_depth"]
+            max_queue = wb["max_queue"]
+            if not wb["running"] or depth >= max_queue:
+                status = "error"
+            elif depth > max_queue * 0.8 or wb["errors"] > 0:
+                status = "warning"
+            else:
+                status = "ok"
+
+            checks["write_behind"] = {
+                "status": status,
+                "enabled": True,
+                "queue_depth": depth,
+                "max_queue": max_queue,
+                "in_flight": wb["in_flight"],
+                "batches": wb["batches"],
+                "processed": wb["processed"],
+                "coalesced": wb["coalesced"],
+                "rejected_full": wb["rejected_full"],
+                "errors": wb["errors"],
+                "last_batch_ms": wb["last_batch_ms"]
+            }
+
+            if not wb["running"]:
+                issues.append("Write-behind worker is not running")
+            if depth > max_queue * 0.8:
+                issues.append(f"Write-behind queue near capacity: {depth}/{max_queue}")
+            if wb["errors"] > 0:
+                issues.append(f"Write-behind had {wb['errors']} failed batch(es): {wb['last_error']}")
+
+    except Exception as e:
+        checks["write_behind"] = {"status": "error", "message": str(e)}
+        issues.append(f"Write-behind check error: {e}")
+
+    # 9. Query embedding service (micro-batched search embeddings)
+    try:
+        from embedding_service import get_query_embedding_service
+        qe = get_query_embedding_service().get_stats()
+        checks["query_embeddings"] = {
+            "status": "warning" if qe["timeouts"] > 0 or qe["errors"] > 0 else "ok",
+            "queue_depth": qe["queue_depth"],
+            "requests": qe["requests"],
+            "cache_hits": qe["cache_hits"],
+            "coalesced": qe["coalesced"],
+            "batches": qe["batches"],
+            "batch_size_histogram": qe["batch_size_histogram"],
+            "cache_size": qe["cache_size"],
+            "last_batch_ms": qe["last_batch_ms"]
+        }
+        if qe["timeouts"] > 0:
+            issues.append(f"Query embedding timed out {qe['timeouts']} time(s)")
+        if qe["errors"] > 0:
+            issues.append(f"Query embedding had {qe['errors']} failed batch(es)")
+
+    except Exception as e:
+        checks["query_embeddings"] = {"status": "error", "message": str(e)}
+        issues.append(f"Query embedding check error: {e}")
+
+    # 10. Skill host (warm worker pool for duro_run_skill)
+    try:
+        host_stats = skills.get_skill_host_stats()
+        if host_stats is None:
+            checks["skill_host"] = {"status": "ok", "started": False, "enabled": skills.use_skill_host}
+        else:
+            checks["skill_host"] = {
+                "status": "warning" if host_stats["crashes"] > 0 else "ok",
+                "started": True,
+                "workers": host_stats["workers"],
+                "calls": host_stats["calls"],
+                "timeouts": host_stats["timeouts"],
+                "crashes": host_stats["crashes"],
+                "recycled": host_stats["recycled"],
+                "latency_ms": host_stats["latency_ms"]
+            }
+            if host_stats["crashes"] > 0:
+                issues.append(f"Skill host workers crashed {host_stats['crashes']} time(s)")
+
+    except Exception as e:
+        checks["skill_host"] = {"status": "error", "message": str(e)}
+        issues.append(f"Skill host check error: {e}")
+
+    # 11. Artifact read cache (verified get_artifact results)
+    try:
+        checks["artifact_read_cache"] = {"status": "ok", **artifact_store.get_read_cache_stats()}
+    except Exception as e:
+        checks["artifact_read_cache"] = {"status": "error", "message": str(e)}
+        issues.append(f"Artifact read cache check error: {e}")
+
     # Overall status
     has_errors = any(c.get("status") == "error" for c in checks.values())
     has_warnings = any(c.get("status") == "warning" for c in checks.values())
@@ -1596,7 +1708,18 @@ async def list_tools() -> list[Tool]:
             description="Verify the integrity of the security audit log. Checks hash chain continuity and optional HMAC signatures. Use this to detect tampering.",
             inputSchema={
                 "type": "object",
-                "properties": {}
+                "properties": {
+                    "full": {
+                        "type": "boolean",
+                        "description": "Re-verify the whole chain from GENESIS instead of resuming from the last verified checkpoint",
+                        "default": False
+                    },
+                    "parallel": {
+                        "type": "boolean",
+                        "description": "Verify rotated archives concurrently in a process pool, then stitch their boundary hashes (JSONL backend)",
+                        "default": False
+                    }
+                }
             }
         ),
         Tool(
@@ -1824,6 +1947,11 @@ async def list_tools() -> list[Tool]:
                         "type": "integer",
                         "description": "Max seconds before stopping with partial result",
                         "default": 120
+                    },
+                    "skip_unchanged": {
+                        "type": "boolean",
+                        "description": "Skip artifacts whose stored embedding already matches their content hash and the current model (default re-embeds everything selected)",
+                        "default": False
                     }
                 }
             }
@@ -2534,7 +2662,13 @@ Use override=true with override_reason to bypass gate (creates waiver trail)."""
                     "tags": {
                         "type": "array",
                         "items": {"type": "string"},
-                        "description": "Filter by tags (any match)"
+                        "description": "Filter by tags (any match, or all with tag_mode=all)"
+                    },
+                    "tag_mode": {
+                        "type": "string",
+                        "enum": ["any", "all"],
+                        "description": "any = match at least one tag, all = require every tag",
+                        "default": "any"
                     },
                     "sensitivity": {
                         "type": "string",
@@ -2633,7 +2767,14 @@ Use override=true with override_reason to bypass gate (creates waiver trail)."""
             description="Rebuild SQLite index from artifact files. Use if index gets out of sync.",
             inputSchema={
                 "type": "object",
-                "properties": {}
+                "properties": {
+                    "mode": {
+                        "type": "string",
+                        "enum": ["full", "incremental"],
+                        "description": "full: clear and rebuild everything. incremental: only re-parse files added/changed/removed since the last index (manifest-driven)",
+                        "default": "full"
+                    }
+                }
             }
         ),
         Tool(
@@ -2843,10 +2984,24 @@ Use override=true with override_reason to bypass gate (creates waiver trail)."""
                         "description": "Max runs to return",
                         "default": 20
                     },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Skip this many runs (for paging)",
+                        "default": 0
+                    },
                     "outcome": {
                         "type": "string",
                         "enum": ["success", "failed", "denied", "dry_run"],
                         "description": "Filter by outcome"
+                    },
+                    "intent": {
+                        "type": "string",
+                        "description": "Filter by normalized intent (e.g. store_fact)"
+                    },
+                    "include_stats": {
+                        "type": "boolean",
+                        "description": "Append per-intent counts and p50/p95 duration",
+                        "default": False
                     }
                 }
             }
@@ -4034,6 +4189,8 @@ Contact the system administrator or check duro-mcp installation.""")]
                     result += f"- Constitution: {d.constitution_reason}\n"
                     result += f"- Domain Hints: {d.domain_hints or 'none'}\n"
                     result += f"- Skills: {d.skills_scanned} scanned, {d.skills_matched} matched, {d.skills_selected} selected\n"
+                    if d.timings_ms:
+                        result += f"- Timings (ms): {', '.join(f'{k}={v:.1f}' for k, v in d.timings_ms.items())}\n"
 
                     if d.skill_candidates:
                         result += "\n**Top Skill Candidates:**\n"
@@ -4502,7 +4659,10 @@ Contact the system administrator or check duro-mcp installation.""")]
             if not UNIFIED_AUDIT_AVAILABLE:
                 return [TextContent(type="text", text=f"❌ Unified audit not available: {UNIFIED_AUDIT_ERROR}")]
 
-            result = verify_log()
+            result = verify_log(
+                full=arguments.get("full", False),
+                parallel=arguments.get("parallel", False),
+            )
 
             status_icon = "✅" if result.valid else "❌"
 
@@ -4510,6 +4670,10 @@ Contact the system administrator or check duro-mcp installation.""")]
             lines.append(f"**Valid:** {'Yes' if result.valid else 'No'}")
             lines.append(f"**Total Events:** {result.total_events}")
             lines.append(f"**Verified Events:** {result.verified_events}")
+            if result.segments > 1:
+                lines.append(f"**Log Segments:** {result.segments}")
+            if result.resumed_from:
+                lines.append(f"**Resumed From Checkpoint:** {result.resumed_from} events already verified")
 
             if result.signed:
                 sig_icon = "✅" if result.signature_valid else "⚠️"
@@ -4518,6 +4682,8 @@ Contact the system administrator or check duro-mcp installation.""")]
                 lines.append("**HMAC Signed:** No (hash chain only)")
 
             if not result.valid:
+                if result.first_broken_file:
+                    lines.append(f"\n**Broken File:** {result.first_broken_file}")
                 lines.append(f"\n**First Broken Line:** {result.first_broken_line}")
                 if result.first_broken_event_id:
                     lines.append(f"**Broken Event ID:** {result.first_broken_event_id}")
@@ -4555,6 +4721,20 @@ Contact the system administrator or check duro-mcp installation.""")]
                 for dec, count in stats['by_decision'].items():
                     lines.append(f"  - {dec}: {count}")
 
+            writer = stats.get('async_writer')
+            if writer:
+                lines.append("\n**Async Writer:**")
+                lines.append(f"  - Written: {writer['written']} in {writer['batches']} batches "
+                             f"(last {writer['last_batch_size']} events, {writer['last_batch_ms']}ms)")
+                lines.append(f"  - Queue: {writer['queue_depth']}/{writer['max_queue']} "
+                             f"(max seen {writer['max_depth_seen']}, lag {writer['lag_ms']}ms, "
+                             f"max commit lag {writer['max_commit_lag_ms']}ms)")
+                lines.append(f"  - Critical waits: {writer['critical_waits']}, "
+                             f"backpressure waits: {writer['backpressure_waits']}, dropped: {writer['dropped']}")
+                if writer['errors']:
+                    lines.append(f"  - Errors: {writer['errors']} ({writer['failed_events']} events), "
+                                 f"last: {writer['last_error']}")
+
             return [TextContent(type="text", text="\n".join(lines))]
 
         # Layer 6: Intent Guard & Prompt Firewall tools
@@ -4813,7 +4993,7 @@ Contact the system administrator or check duro-mcp installation.""")]
 
             # Load all non-pinned facts
             facts = artifact_store.query(artifact_type="fact", limit=10000)
-            full_facts = [artifact_store.get_artifact(f["id"]) for f in facts]
+            full_facts, _ = artifact_store.get_artifacts_many([f["id"] for f in facts])
             full_facts = [f for f in full_facts if f is not None]
 
             # Calculate decay priority score for each fact
@@ -4904,42 +5084,41 @@ Contact the system administrator or check duro-mcp installation.""")]
             return [TextContent(type="text", text=text)]
 
         elif name == "duro_apply_decay":
-            from decay import apply_batch_decay, DecayConfig, DEFAULT_DECAY_CONFIG
+            from decay import apply_decay_to_store
 
             dry_run = arguments.get("dry_run", True)
             min_importance = arguments.get("min_importance", 0)
             include_stale_report = arguments.get("include_stale_report", True)
 
-            # Load all facts
-            facts = artifact_store.query(artifact_type="fact", limit=10000)
-            full_facts = [artifact_store.get_artifact(f["id"]) for f in facts]
-            full_facts = [f for f in full_facts if f is not None]
-
-            # Filter by importance if specified
-            if min_importance > 0:
-                full_facts = [f for f in full_facts if f.get("data", {}).get("importance", 0.5) >= min_importance]
-
-            # Apply decay
-            result = apply_batch_decay(full_facts, DEFAULT_DECAY_CONFIG, dry_run=dry_run)
-
-            # Save changes if not dry run (no re-embed since only confidence changed)
-            if not dry_run:
-                for fact in full_facts:
-                    artifact_store.update_artifact(fact, re_embed=False)
+            # Streams every fact in pages; only decaying facts are loaded and rewritten.
+            # A timeout cancels between pages and the next applied run resumes there.
+            try:
+                result = apply_decay_to_store(
+                    artifact_store, dry_run=dry_run, min_importance=min_importance,
+                    should_stop=lambda: is_cancelled("decay")
+                )
+            finally:
+                clear_cancel("decay")
 
             lines = ["## Decay Results\n"]
             lines.append(f"**Mode:** {'DRY RUN' if dry_run else 'APPLIED'}")
-            lines.append(f"**Total facts:** {result.total_facts}")
-            lines.append(f"**Decayed:** {result.decayed_count}")
-            lines.append(f"**Skipped (pinned):** {result.skipped_pinned}")
-            lines.append(f"**Skipped (grace period):** {result.skipped_grace_period}")
-            lines.append(f"**Skipped (reinforcement):** {result.skipped_reinforcement}")
-            lines.append(f"**Now stale:** {result.stale_count}\n")
-
-            if include_stale_report and result.stale_count > 0:
+            if result["resumed_from"]:
+                lines.append(f"**Resumed after:** `{result['resumed_from']}`")
+            lines.append(f"**Total facts:** {result['total']}")
+            lines.append(f"**Loaded (could decay):** {result['loaded']}")
+            lines.append(f"**Decayed:** {result['decayed']}")
+            lines.append(f"**Skipped (pinned):** {result['skipped_pinned']}")
+            lines.append(f"**Skipped (grace period):** {result['skipped_grace_period']}")
+            lines.append(f"**Skipped (reinforcement):** {result['skipped_reinforcement']}")
+            if result["write_errors"]:
+                lines.append(f"**Write errors:** {result['write_errors']}")
+            if not result["complete"]:
+                lines.append("**Incomplete:** stopped early; run again to continue")
+            lines.append(f"**Now stale:** {result['stale']}\n")
+
+            if include_stale_report and result["stale_facts"]:
                 lines.append("### Stale Facts (top 10)\n")
-                stale = [r for r in result.results if r.get("stale")][:10]
-                for s in stale:
+                for s in result["stale_facts"]:
                     lines.append(f"- `{s['id']}` conf: {s['new_confidence']:.3f} (was {s['old_confidence']:.3f})")
 
             text = "\n".join(lines)
@@ -4957,6 +5136,8 @@ Contact the system administrator or check duro-mcp installation.""")]
             missing_only = arguments.get("missing_only", False)
             limit = arguments.get("limit", 100)
             timeout_seconds = arguments.get("timeout_seconds", 120)
+            # Off by default: a re-embed is often asked for to fix vectors whose content didn't change
+            skip_unchanged = arguments.get("skip_unchanged", False)
 
             # Get before metrics
             caps = artifact_store.index.get_search_capabilities()
@@ -5026,6 +5207,8 @@ Contact the system administrator or check duro-mcp installation.""")]
             embedded = 0
             failed = 0
             skipped = 0
+            unchanged = 0
+            no_text = 0
             cleared = 0
             timed_out = False
             error_blob = None
@@ -5034,8 +5217,9 @@ Contact the system administrator or check duro-mcp installation.""")]
 
             try:
                 total = len(to_process)
-                for i, aid in enumerate(to_process):
-                    # Check timeout
+                batch_size = EMBEDDING_CONFIG["batch_size"]
+                for i in range(0, total, batch_size):
+                    # Check timeout (between chunks - a chunk is one model call)
                     elapsed = time.time() - start_time
                     if elapsed > timeout_seconds:
                         timed_out = True
@@ -5043,30 +5227,27 @@ Contact the system administrator or check duro-mcp installation.""")]
                         repair_result = "partial"
                         break
 
-                    # Cooperative cancellation check (every 25 items)
-                    if i > 0 and i % 25 == 0:
+                    # Cooperative cancellation check (every chunk)
+                    if i > 0:
                         if is_cancelled("reembed"):
                             error_blob = f"Cancelled by user at {i}/{total}"
                             repair_result = "cancelled"
                             log_info(f"[duro_reembed] Cancellation requested at {i}/{total}")
                             break
                         # Progress output
-                        log_info(f"[duro_reembed] Progress: {i}/{total} ({embedded} embedded, {failed} failed, {elapsed:.1f}s)")
+                        log_info(f"[duro_reembed] Progress: {i}/{total} ({embedded} embedded, {unchanged} unchanged, {failed} failed, {elapsed:.1f}s)")
 
+                    chunk = to_process[i:i + batch_size]
                     try:
-                        result = _embed_artifact_sync(aid)
-                        if result:
-                            embedded += 1
-                        else:
-                            # Check if artifact exists - if not, skip; if yes, mark as failed
-                            artifact = artifact_store.get_artifact(aid)
-                            if artifact:
-                                failed += 1
-                            else:
-                                skipped += 1
-                    except Exception as item_err:
-                        failed += 1
-                        log_warn(f"[duro_reembed] Error on {aid}: {item_err}")
+                        batch = artifact_store.embed_artifacts(chunk, force=not skip_unchanged)
+                        embedded += batch["embedded"]
+                        unchanged += batch["unchanged"]
+                        no_text += batch["no_text"]
+                        skipped += batch["missing"]
+                        failed += batch["failed"]
+                    except Exception as chunk_err:
+                        failed += len(chunk)
+                        log_warn(f"[duro_reembed] Error on chunk {i}-{i + len(chunk)}: {chunk_err}")
 
                 # Clear any pending items from queue (they're now processed)
                 cleared = embedding_queue.clear_queue()
@@ -5102,10 +5283,12 @@ Contact the system administrator or check duro-mcp installation.""")]
 
             elapsed = time.time() - start_time
             lines = [f"## Re-embed {'Partial' if timed_out else 'Complete'}"]
-            lines.append(f"\n**Processed:** {embedded + failed + skipped}/{len(to_process)} artifacts")
+            lines.append(f"\n**Processed:** {embedded + unchanged + no_text + failed + skipped}/{len(to_process)} artifacts")
             if original_count > len(to_process):
                 lines.append(f"**Note:** Limited from {original_count} to {len(to_process)}")
             lines.append(f"- Embedded: {embedded}")
+            lines.append(f"- Unchanged (same content + model): {unchanged}")
+            lines.append(f"- No embeddable text: {no_text}")
             lines.append(f"- Failed: {failed}")
             lines.append(f"- Skipped (not found): {skipped}")
             lines.append(f"- Time: {elapsed:.1f}s")
@@ -5202,7 +5385,7 @@ Contact the system administrator or check duro-mcp installation.""")]
 
             # Load all facts
             facts = artifact_store.query(artifact_type="fact", limit=10000)
-            full_facts = [artifact_store.get_artifact(f["id"]) for f in facts]
+            full_facts, _ = artifact_store.get_artifacts_many([f["id"] for f in facts])
             full_facts = [f for f in full_facts if f is not None]
 
             # Generate report
@@ -6113,6 +6296,7 @@ When ready, call `duro_store_incident` with all fields."""
             results = artifact_store.query(
                 artifact_type=arguments.get("artifact_type"),
                 tags=arguments.get("tags"),
+                tag_mode=arguments.get("tag_mode", "any"),
                 sensitivity=arguments.get("sensitivity"),
                 workflow=arguments.get("workflow"),
                 search_text=arguments.get("search_text"),
@@ -6142,10 +6326,11 @@ When ready, call `duro_store_incident` with all fields."""
             explain = arguments.get("explain", False)
 
             # Get query embedding if available
-            from embeddings import embed_text, is_embedding_available
+            from embeddings import is_embedding_available
+            from embedding_service import embed_query
             query_embedding = None
             if is_embedding_available():
-                query_embedding = embed_text(query)
+                query_embedding = embed_query(query)
 
             # Run hybrid search
             search_result = artifact_store.index.hybrid_search(
@@ -6210,6 +6395,8 @@ When ready, call `duro_store_incident` with all fields."""
         elif name == "duro_reindex":
             import subprocess
 
+            mode = arguments.get("mode", "full")
+
             # Get before metrics
             before_count = artifact_store.index.count()
             before_metrics = {"indexed_count": before_count}
@@ -6226,7 +6413,7 @@ When ready, call `duro_store_incident` with all fields."""
 
             # Start repair log
             repair_id = artifact_store.index.start_repair(
-                repair_type="full_reindex",
+                repair_type="incremental_reindex" if mode == "incremental" else "full_reindex",
                 trigger="manual",
                 before_metrics=before_metrics,
                 code_version=code_version
@@ -6237,9 +6424,15 @@ When ready, call `duro_store_incident` with all fields."""
             error_count = 0
             error_blob = None
             repair_result = "success"
+            diff = None
 
             try:
-                success_count, error_count = artifact_store.reindex()
+                if mode == "incremental":
+                    diff = artifact_store.reconcile_index()
+                    success_count = diff["added"] + diff["changed"] + diff["removed"]
+                    error_count = diff["errors"]
+                else:
+                    success_count, error_count = artifact_store.reindex()
                 if error_count > 0:
                     repair_result = "partial"
             except Exception as e:
@@ -6260,7 +6453,23 @@ When ready, call `duro_store_incident` with all fields."""
                     error_blob=error_blob
                 )
 
-            text = f"Reindex complete.\n- Indexed: {success_count}\n- Errors: {error_count}\n- Repair logged: #{repair_id}"
+            if diff is not None:
+                text = (
+                    f"Incremental reindex complete ({diff['duration_ms']}ms, stat pass {diff['scan_ms']}ms).\n"
+                    f"- Scanned: {diff['scanned']}\n"
+                    f"- Unchanged: {diff['unchanged']}\n"
+                    f"- Added: {diff['added']}\n"
+                    f"- Changed: {diff['changed']}\n"
+                    f"- Touched (same content): {diff['touched']}\n"
+                    f"- Removed: {diff['removed']}\n"
+                    f"- Errors: {error_count}\n"
+                    f"- Repair logged: #{repair_id}"
+                )
+                for label, key in (("Added", "added_ids"), ("Changed", "changed_ids"), ("Removed", "removed_ids")):
+                    if diff[key]:
+                        text += f"\n\n**{label}:** {', '.join(str(i) for i in diff[key][:20])}"
+            else:
+                text = f"Reindex complete.\n- Indexed: {success_count}\n- Errors: {error_count}\n- Repair logged: #{repair_id}"
             return [TextContent(type="text", text=text)]
 
         elif name == "duro_list_repairs":
@@ -6583,11 +6792,13 @@ When ready, call `duro_store_incident` with all fields."""
 
         elif name == "duro_list_runs":
             limit = arguments.get("limit", 20)
+            offset = arguments.get("offset", 0)
             outcome = arguments.get("outcome")
+            intent = arguments.get("intent")
 
-            runs = orchestrator.list_runs(limit=limit, outcome=outcome)
+            runs = orchestrator.list_runs(limit=limit, outcome=outcome, offset=offset, intent=intent)
 
-            if not runs:
+            if not runs and not arguments.get("include_stats"):
                 return [TextContent(type="text", text="No runs found.")]
 
             lines = [f"## Recent Runs ({len(runs)} shown)\n"]
@@ -6603,6 +6814,17 @@ When ready, call `duro_store_incident` with all fields."""
                 outcome_icon = {"success": "✅", "failed": "❌", "denied": "🚫", "dry_run": "👁️"}.get(outcome, "❓")
                 lines.append(f"| `{run_id}` | {intent} | {outcome_icon} | {duration}ms |")
 
+            if arguments.get("include_stats"):
+                stats = orchestrator.run_stats()
+                lines.append(f"\n### Run Stats ({stats['total_runs']} runs)\n")
+                lines.append("| Intent | Runs | Outcomes | p50 | p95 |")
+                lines.append("|--------|------|----------|-----|-----|")
+                for stat_intent, entry in sorted(stats["by_intent"].items(), key=lambda kv: -kv[1]["runs"]):
+                    outcomes = ", ".join(f"{k}:{v}" for k, v in entry["outcomes"].items())
+                    lines.append(
+                        f"| {stat_intent} | {entry['runs']} | {outcomes} | {entry['p50_ms']}ms | {entry['p95_ms']}ms |"
+                    )
+
             return [TextContent(type="text", text="\n".join(lines))]
 
         elif name == "duro_get_run":
@@ -7071,6 +7293,11 @@ When ready, call `duro_store_incident` with all fields."""
                 lines.append(f"- Breakglass uses: {gate_stats['breakglass_uses']}")
                 if gate_stats['errors']:
                     lines.append(f"- Errors: {gate_stats['errors']}")
+                if gate_stats['timings_ms']:
+                    lines.append("\n| Gate stage | Calls | Avg ms | Max ms |")
+                    lines.append("|---|---|---|---|")
+                    for stage, t in gate_stats['timings_ms'].items():
+                        lines.append(f"| {stage} | {t['count']} | {t['avg_ms']:.3f} | {t['max_ms']:.3f} |")
 
             return [TextContent(type="text", text="\n".join(lines))]
 
@@ -7435,6 +7662,14 @@ async def _run_deferred_startup():
     except Exception as e:
         log_warn(f"Deferred startup: embedding preload error (non-fatal): {e}")
 
+    # Pre-start skill host workers so the first run_skill doesn't pay process startup
+    try:
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(_fast_executor, skills.start_skill_host):
+            log_info("Deferred startup: skill host workers started")
+    except Exception as e:
+        log_warn(f"Deferred startup: skill host start error (non-fatal): {e}")
+
     log_info("Deferred startup complete")
 
 
@@ -7449,8 +7684,12 @@ async def main():
     # Start deferred startup in background
     asyncio.create_task(_run_deferred_startup())
 
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        # Stop skill host workers so they don't outlive the server
+        skills.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,260 @@
+"""
+Query embedding service for Duro semantic search.
+
+Search paths (duro_semantic_search, proactive recall, skill tools) used to
+call embed_text() inline on the tool thread, so N concurrent searches paid
+N separate model forward passes. This service moves query inference onto
+one background thread:
+
+- Requests are queued and micro-batched: the worker waits a few ms after
+  the first request so concurrent ones share a single embed_batch() call
+- Identical in-flight queries are coalesced onto one pending slot
+- A bounded LRU keeps recent query vectors keyed by normalized text, so
+  repeated queries cost no inference at all. Vectors are stored as tuples
+  and every caller gets its own list, so no caller can corrupt the cache
+
+Only query text goes through here. Artifact embedding keeps using the
+batch paths in artifacts.py / embedding_worker.py.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from embeddings import embed_batch, is_embedding_available, EMBEDDING_CONFIG
+
+
+# Service Config
+# ==============
+
+QUERY_EMBEDDING_CONFIG = {
+    "batch_window_ms": 5,       # Wait this long after the first request for others to join
+    "max_batch_size": EMBEDDING_CONFIG["batch_size"],
+    "cache_size": 512,          # Query vectors kept in the LRU
+    "request_timeout_s": 30.0,  # Callers give up (and fall back to keyword search) after this
+}
+
+# Batch-size histogram buckets (upper bounds, inclusive)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """
+    Normalize query text for cache keys and coalescing.
+
+    Collapses whitespace and lowercases. The default model (bge-small-en)
+    uses an uncased tokenizer, so case doesn't change the vector.
+    """
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+class _PendingQuery:
+    """One queued query; every caller asking for the same text waits on it."""
+
+    __slots__ = ("text", "event", "vector", "waiters")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.event = threading.Event()
+        self.vector: Optional[tuple[float, ...]] = None
+        self.waiters = 1
+
+
+class QueryEmbeddingService:
+    """
+    Micro-batching, caching front end for query embeddings.
+
+    Thread-safe. embed() blocks the calling thread until its batch is done
+    (or the timeout passes) but never runs inference itself.
+    """
+
+    def __init__(
+        self,
+        batch_window_ms: float = QUERY_EMBEDDING_CONFIG["batch_window_ms"],
+        max_batch_size: int = QUERY_EMBEDDING_CONFIG["max_batch_size"],
+        cache_size: int = QUERY_EMBEDDING_CONFIG["cache_size"]
+    ):
+        self.batch_window_ms = batch_window_ms
+        self.max_batch_size = max_batch_size
+        self.cache_size = cache_size
+
+        self._cache: OrderedDict[str, tuple[float, ...]] = OrderedDict()
+        self._queue: OrderedDict[str, _PendingQuery] = OrderedDict()  # key -> pending, FIFO
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+        self._stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "coalesced": 0,
+            "batches": 0,
+            "inferences": 0,
+            "timeouts": 0,
+            "errors": 0,  # Queries a batch returned no vector for
+            "last_batch_ms": 0.0
+        }
+        self._histogram = {bucket: 0 for bucket in BATCH_SIZE_BUCKETS}
+        self._histogram_overflow = 0
+
+    def embed(self, text: str, timeout: Optional[float] = None) -> Optional[list[float]]:
+        """
+        Get the embedding for a query string.
+
+        Returns None if the text is empty, embeddings are unavailable, or the
+        request times out - callers should degrade to keyword search.
+        """
+        if not text or not text.strip():
+            return None
+        if not is_embedding_available():
+            return None
+
+        key = normalize_query(text)
+        if timeout is None:
+            timeout = QUERY_EMBEDDING_CONFIG["request_timeout_s"]
+
+        with self._cond:
+            self._stats["requests"] += 1
+
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._stats["cache_hits"] += 1
+                return list(cached)
+
+            pending = self._queue.get(key)
+            if pending is not None:
+                pending.waiters += 1
+                self._stats["coalesced"] += 1
+            else:
+                pending = _PendingQuery(text.strip())
+                self._queue[key] = pending
+                self._ensure_worker_locked()
+                self._cond.notify_all()
+
+        if not pending.event.wait(timeout):
+            with self._cond:
+                self._stats["timeouts"] += 1
+            return None
+        return list(pending.vector) if pending.vector is not None else None
+
+    def get_stats(self) -> dict:
+        """Queue depth, cache and batch-size histogram for health reporting."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats["queue_depth"] = len(self._queue)
+            stats["cache_size"] = len(self._cache)
+            stats["cache_capacity"] = self.cache_size
+            stats["batch_window_ms"] = self.batch_window_ms
+            stats["batch_size_histogram"] = {
+                **{f"<={bucket}": count for bucket, count in self._histogram.items()},
+                f">{BATCH_SIZE_BUCKETS[-1]}": self._histogram_overflow
+            }
+            stats["running"] = bool(self._thread and self._thread.is_alive())
+        return stats
+
+    def clear_cache(self):
+        """Drop cached query vectors (e.g. after an embedding model change)."""
+        with self._cond:
+            self._cache.clear()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the worker thread. Queued requests are still answered first."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread:
+            thread.join(timeout)
+
+    def _ensure_worker_locked(self):
+        """Start the worker on first use. Caller holds the lock."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="duro_query_embedder", daemon=True
+        )
+        self._thread.start()
+
+    def _record_batch_locked(self, size: int, elapsed_ms: float):
+        self._stats["batches"] += 1
+        self._stats["inferences"] += size
+        self._stats["last_batch_ms"] = round(elapsed_ms, 2)
+        for bucket in BATCH_SIZE_BUCKETS:
+            if size <= bucket:
+                self._histogram[bucket] += 1
+                return
+        self._histogram_overflow += 1
+
+    def _run(self):
+        """Worker loop: collect a micro-batch, run one inference, fan results out."""
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopping:
+                    self._cond.wait()
+                if not self._queue:
+                    return  # Stopping and drained
+
+                # Batch window: give concurrent callers a moment to join
+                window_end = time.monotonic() + self.batch_window_ms / 1000
+                while len(self._queue) < self.max_batch_size and not self._stopping:
+                    remaining = window_end - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                keys = list(self._queue)[:self.max_batch_size]
+                batch = [(key, self._queue[key]) for key in keys]
+
+            start = time.perf_counter()
+            try:
+                vectors = embed_batch([pending.text for _, pending in batch])
+            except Exception:
+                vectors = [None] * len(batch)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            with self._cond:
+                self._record_batch_locked(len(batch), elapsed_ms)
+                # embed_batch logs and returns None per text rather than raising
+                self._stats["errors"] += sum(1 for vector in vectors if vector is None)
+                for (key, pending), vector in zip(batch, vectors):
+                    # Remove from queue only now, so late arrivals kept coalescing
+                    self._queue.pop(key, None)
+                    if vector is not None:
+                        vector = tuple(vector)
+                    pending.vector = vector
+                    if vector is not None:
+                        self._cache[key] = vector
+                        self._cache.move_to_end(key)
+                    pending.event.set()
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+
+# Singleton service (created on first use)
+_service: Optional[QueryEmbeddingService] = None
+_service_lock = threading.Lock()
+
+
+def get_query_embedding_service() -> QueryEmbeddingService:
+    """Get the process-wide query embedding service."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = QueryEmbeddingService()
+    return _service
+
+
+def embed_query(text: str, timeout: Optional[float] = None) -> Optional[list[float]]:
+    """
+    Embed a search query via the shared micro-batching service.
+
+    Drop-in replacement for embed_text() on search paths.
+    """
+    return get_query_embedding_service().embed(text, timeout=timeout)
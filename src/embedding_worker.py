@@ -20,7 +20,10 @@ from pathlib import Path
 from time_utils import utc_now, utc_now_iso
 from typing import Optional, Callable
 
-from embeddings import artifact_to_text, should_embed, compute_content_hash, embed_text, is_embedding_available
+from embeddings import (
+    artifact_to_text, should_embed, compute_content_hash, embed_text, embed_batch,
+    is_embedding_available, EMBEDDING_CONFIG
+)
 
 
 class EmbeddingQueue:
@@ -192,19 +195,36 @@ class EmbeddingWorker:
         # Fallback to zeros if embedding fails
         return [0.0] * 384
 
-    def process_queue(self, batch_size: int = 10) -> dict:
+    def _generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Batch version of _generate_embedding - one model call for all texts.
+        Falls back to zeros per item if embedding unavailable or failed.
+        """
+        vectors = [None] * len(texts)
+        if is_embedding_available():
+            vectors = embed_batch(texts)
+        return [v if v else [0.0] * 384 for v in vectors]
+
+    def process_queue(self, batch_size: Optional[int] = None) -> dict:
         """
         Process pending embeddings in batches.
 
+        The whole batch is loaded first, then embedded with a single
+        model call, then handed to the callback item by item.
+
         Args:
             batch_size: Number of items to process per call
+                        (defaults to EMBEDDING_CONFIG["batch_size"])
 
         Returns:
             {processed: int, failed: int, skipped: int, remaining: int}
         """
+        batch_size = batch_size or EMBEDDING_CONFIG["batch_size"]
         pending_items = self.queue.get_pending_items(limit=batch_size)
         results = {"processed": 0, "failed": 0, "skipped": 0}
 
+        # Phase 1: load artifacts and build texts
+        to_embed = []  # (artifact_id, pending_path, text)
         for item in pending_items:
             artifact_id = item["artifact_id"]
             pending_path = item["path"]
@@ -231,10 +251,28 @@ class EmbeddingWorker:
                     results["skipped"] += 1
                     continue
 
-                # Generate embedding (placeholder in Phase 1A)
-                vector = self._generate_embedding(text)
+                to_embed.append((artifact_id, pending_path, text))
 
-                # Store embedding via callback
+            except Exception as e:
+                self.queue.mark_failed(pending_path, str(e))
+                results["failed"] += 1
+                self.stats["failed"] += 1
+
+        # Phase 2: one model call for the whole batch
+        vectors = []
+        if to_embed:
+            try:
+                vectors = self._generate_embeddings([text for _, _, text in to_embed])
+            except Exception as e:
+                for _, pending_path, _ in to_embed:
+                    self.queue.mark_failed(pending_path, str(e))
+                results["failed"] += len(to_embed)
+                self.stats["failed"] += len(to_embed)
+                to_embed = []
+
+        # Phase 3: store embeddings via callback
+        for (artifact_id, pending_path, text), vector in zip(to_embed, vectors):
+            try:
                 success = self.embedding_callback(artifact_id, text, vector)
                 if success:
                     self.queue.mark_complete(pending_path)
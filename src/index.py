@@ -7,7 +7,11 @@ If sqlite-vec is not available, falls back to FTS-only search.
 """
 
 import json
+import os
 import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
@@ -23,29 +27,123 @@ except ImportError:
     pass
 
 
+class _PooledConnection(sqlite3.Connection):
+    """sqlite3 connection that remembers per-connection setup state."""
+
+    # None = not attempted yet, True/False = sqlite-vec load result
+    vec_loaded: Optional[bool] = None
+
+
 class ArtifactIndex:
-    """SQLite-backed index for artifact discovery and querying."""
+    """
+    SQLite-backed index for artifact discovery and querying.
+
+    Connections are pooled: each thread gets one long-lived connection for
+    reads (via _connect), and all writes go through a single dedicated
+    writer connection serialized by a lock (via _connect_writer). PRAGMAs
+    and the sqlite-vec extension are set up once per connection, and each
+    connection keeps its own prepared statement cache.
+    """
 
     # Default timeout for SQLite busy lock (ms)
     BUSY_TIMEOUT_MS = 5000
 
+    # Prepared statements cached per pooled connection
+    STATEMENT_CACHE_SIZE = 256
+
     def __init__(self, db_path: str | Path):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
+        self._writer_lock = threading.RLock()
+        self._writer_conn: Optional[_PooledConnection] = None
+        self._open_conns = weakref.WeakSet()
+        self._generation = 0  # Bumped by close() to invalidate thread-local connections
+        self._connection_opens = 0
+        self._tag_table_ready = False  # artifact_tags exists (migration 005)
+
         self._init_db()
 
-    def _connect(self) -> sqlite3.Connection:
-        """Create a connection with busy_timeout and WAL mode for better concurrency."""
-        conn = sqlite3.connect(self.db_path)
+    def _open_connection(self) -> _PooledConnection:
+        """Open a new connection with busy_timeout and WAL mode for better concurrency."""
+        # check_same_thread=False so close() can tear down other threads'
+        # connections; each reader connection is still only used by its owner.
+        conn = sqlite3.connect(
+            self.db_path,
+            factory=_PooledConnection,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+            check_same_thread=False
+        )
         conn.execute(f"PRAGMA busy_timeout = {self.BUSY_TIMEOUT_MS}")
         conn.execute("PRAGMA journal_mode = WAL")
         conn.execute("PRAGMA synchronous = NORMAL")  # Safe with WAL, better perf
         conn.execute("PRAGMA temp_store = MEMORY")   # Temp tables in RAM
+        with self._pool_lock:
+            self._connection_opens += 1
+            self._open_conns.add(conn)
         return conn
 
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get this thread's pooled connection, opening it on first use.
+
+        Use for reads. Writes should go through _connect_writer() so they
+        are serialized on one connection instead of contending for the lock.
+        """
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None or getattr(local, "generation", None) != self._generation:
+            conn = self._open_connection()
+            local.conn = conn
+            local.generation = self._generation
+        # Methods set row_factory ad hoc; don't let it leak between calls
+        conn.row_factory = None
+        return conn
+
+    @contextmanager
+    def _connect_writer(self):
+        """
+        Hold the dedicated writer connection for one unit of work.
+
+        Commits on success and rolls back on error, like `with conn:`.
+        Re-entrant within the same thread.
+        """
+        with self._writer_lock:
+            if self._writer_conn is None:
+                self._writer_conn = self._open_connection()
+            conn = self._writer_conn
+            conn.row_factory = None
+            with conn:
+                yield conn
+
+    def close(self):
+        """Close all pooled connections. The index reopens them lazily if used again."""
+        with self._writer_lock:
+            with self._pool_lock:
+                self._generation += 1
+                conns = list(self._open_conns)
+                self._open_conns.clear()
+            self._writer_conn = None
+            for conn in conns:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+    def get_pool_stats(self) -> dict:
+        """Connection pool counters (exposed via get_stats)."""
+        with self._pool_lock:
+            return {
+                "connection_opens": self._connection_opens,
+                "open_connections": len(self._open_conns),
+                "statement_cache_size": self.STATEMENT_CACHE_SIZE
+            }
+
     def _init_db(self):
         """Initialize the database schema."""
-        with self._connect() as conn:
+        with self._connect_writer() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS artifacts (
                     id TEXT PRIMARY KEY,
@@ -90,83 +188,191 @@ class ArtifactIndex:
             """)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_repairs_type ON repairs(repair_type)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_repairs_started ON repairs(started_at)")
+
+            # File manifest - last-seen stat + hash per artifact file.
+            # Lets startup reconcile only re-parse files that actually changed.
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS file_manifest (
+                    artifact_id TEXT PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    hash TEXT NOT NULL
+                ) WITHOUT ROWID
+            """)
             conn.commit()
 
+    _UPSERT_SQL = """
+        INSERT INTO artifacts (id, type, created_at, updated_at, sensitivity,
+                              title, tags, source_workflow, source_urls, file_path, hash,
+                              valid_from, valid_until, superseded_by, importance, pinned,
+                              last_reinforced_at, reinforcement_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            updated_at = excluded.updated_at,
+            sensitivity = excluded.sensitivity,
+            title = excluded.title,
+            tags = excluded.tags,
+            source_urls = excluded.source_urls,
+            file_path = excluded.file_path,
+            hash = excluded.hash,
+            valid_from = excluded.valid_from,
+            valid_until = excluded.valid_until,
+            superseded_by = excluded.superseded_by,
+            importance = excluded.importance,
+            pinned = excluded.pinned,
+            last_reinforced_at = excluded.last_reinforced_at,
+            reinforcement_count = excluded.reinforcement_count
+    """
+
+    def _upsert_params(self, artifact: dict[str, Any], file_path: str, file_hash: str) -> tuple:
+        """Build the parameter tuple for _UPSERT_SQL from an artifact."""
+        # Extract title based on type
+        data = artifact.get("data", {})
+        title = self._extract_title(artifact["type"], data)
+
+        # Convert lists to JSON strings for storage
+        tags_json = json.dumps(artifact.get("tags", []))
+        source = artifact.get("source", {})
+        source_urls = data.get("source_urls", [])
+        source_urls_json = json.dumps(source_urls) if source_urls else None
+
+        # Extract temporal fields (for facts, but columns exist for all)
+        valid_from = data.get("valid_from")
+        valid_until = data.get("valid_until")
+        superseded_by = data.get("superseded_by")
+        importance = data.get("importance", 0.5)
+        pinned = 1 if data.get("pinned", False) else 0
+
+        # Extract reinforcement fields (Phase 4)
+        last_reinforced_at = data.get("last_reinforced_at")
+        reinforcement_count = data.get("reinforcement_count", 0)
+
+        return (
+            artifact["id"],
+            artifact["type"],
+            artifact["created_at"],
+            artifact.get("updated_at"),
+            artifact["sensitivity"],
+            title,
+            tags_json,
+            source.get("workflow"),
+            source_urls_json,
+            file_path,
+            file_hash,
+            valid_from,
+            valid_until,
+            superseded_by,
+            importance,
+            pinned,
+            last_reinforced_at,
+            reinforcement_count
+        )
+
+    def _record_manifest(self, conn, artifact_id: str, file_path: str, file_hash: str):
+        """
+        Record the file's current stat + hash in file_manifest.
+        Skipped silently when the file doesn't exist (e.g. index-only callers).
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return
+        conn.execute("""
+            INSERT INTO file_manifest (artifact_id, path, mtime_ns, size, hash)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(artifact_id) DO UPDATE SET
+                path = excluded.path,
+                mtime_ns = excluded.mtime_ns,
+                size = excluded.size,
+                hash = excluded.hash
+        """, (artifact_id, file_path, st.st_mtime_ns, st.st_size, file_hash))
+
+    def _has_tag_table(self, conn) -> bool:
+        """
+        Check if the normalized artifact_tags table exists (migration 005).
+        Only a positive result is cached, so a migration run mid-process is picked up.
+        """
+        if self._tag_table_ready:
+            return True
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='artifact_tags'"
+        )
+        self._tag_table_ready = cursor.fetchone() is not None
+        return self._tag_table_ready
+
+    def _sync_tags(self, conn, artifact_id: str, tags: Any):
+        """Replace an artifact's rows in artifact_tags (no-op before migration 005)."""
+        if not self._has_tag_table(conn):
+            return
+        conn.execute("DELETE FROM artifact_tags WHERE artifact_id = ?", (artifact_id,))
+        if not isinstance(tags, list):
+            return
+        rows = [(artifact_id, tag) for tag in dict.fromkeys(tags) if isinstance(tag, str) and tag]
+        if rows:
+            conn.executemany(
+                "INSERT OR IGNORE INTO artifact_tags (artifact_id, tag) VALUES (?, ?)", rows
+            )
+
     def upsert(self, artifact: dict[str, Any], file_path: str, file_hash: str) -> bool:
         """
         Insert or update an artifact in the index.
         Returns True on success.
         """
         try:
-            # Extract title based on type
-            data = artifact.get("data", {})
-            title = self._extract_title(artifact["type"], data)
-
-            # Convert lists to JSON strings for storage
-            tags_json = json.dumps(artifact.get("tags", []))
-            source = artifact.get("source", {})
-            source_urls = data.get("source_urls", [])
-            source_urls_json = json.dumps(source_urls) if source_urls else None
-
-            # Extract temporal fields (for facts, but columns exist for all)
-            valid_from = data.get("valid_from")
-            valid_until = data.get("valid_until")
-            superseded_by = data.get("superseded_by")
-            importance = data.get("importance", 0.5)
-            pinned = 1 if data.get("pinned", False) else 0
-
-            # Extract reinforcement fields (Phase 4)
-            last_reinforced_at = data.get("last_reinforced_at")
-            reinforcement_count = data.get("reinforcement_count", 0)
-
-            with self._connect() as conn:
-                conn.execute("""
-                    INSERT INTO artifacts (id, type, created_at, updated_at, sensitivity,
-                                          title, tags, source_workflow, source_urls, file_path, hash,
-                                          valid_from, valid_until, superseded_by, importance, pinned,
-                                          last_reinforced_at, reinforcement_count)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        updated_at = excluded.updated_at,
-                        sensitivity = excluded.sensitivity,
-                        title = excluded.title,
-                        tags = excluded.tags,
-                        source_urls = excluded.source_urls,
-                        file_path = excluded.file_path,
-                        hash = excluded.hash,
-                        valid_from = excluded.valid_from,
-                        valid_until = excluded.valid_until,
-                        superseded_by = excluded.superseded_by,
-                        importance = excluded.importance,
-                        pinned = excluded.pinned,
-                        last_reinforced_at = excluded.last_reinforced_at,
-                        reinforcement_count = excluded.reinforcement_count
-                """, (
-                    artifact["id"],
-                    artifact["type"],
-                    artifact["created_at"],
-                    artifact.get("updated_at"),
-                    artifact["sensitivity"],
-                    title,
-                    tags_json,
-                    source.get("workflow"),
-                    source_urls_json,
-                    file_path,
-                    file_hash,
-                    valid_from,
-                    valid_until,
-                    superseded_by,
-                    importance,
-                    pinned,
-                    last_reinforced_at,
-                    reinforcement_count
-                ))
+            params = self._upsert_params(artifact, file_path, file_hash)
+            with self._connect_writer() as conn:
+                conn.execute(self._UPSERT_SQL, params)
+                self._sync_tags(conn, artifact["id"], artifact.get("tags", []))
+                self._record_manifest(conn, artifact["id"], file_path, file_hash)
                 conn.commit()
             return True
         except Exception as e:
             print(f"Index upsert error: {e}")
             return False
 
+    def upsert_many(self, entries: list[tuple[dict[str, Any], str, str]]) -> tuple[int, int]:
+        """
+        Insert or update many artifacts in a single transaction.
+
+        Args:
+            entries: List of (artifact, file_path, file_hash) tuples
+
+        Returns (success_count, error_count). Falls back to per-item upsert
+        if the batch transaction fails, so one bad row can't sink the rest.
+        """
+        rows = []
+        errors = 0
+        for artifact, file_path, file_hash in entries:
+            try:
+                rows.append((artifact, file_path, file_hash,
+                             self._upsert_params(artifact, file_path, file_hash)))
+            except Exception as e:
+                print(f"Index upsert error for {file_path}: {e}")
+                errors += 1
+
+        if not rows:
+            return 0, errors
+
+        try:
+            with self._connect_writer() as conn:
+                for artifact, file_path, file_hash, params in rows:
+                    conn.execute(self._UPSERT_SQL, params)
+                    self._sync_tags(conn, artifact["id"], artifact.get("tags", []))
+                    self._record_manifest(conn, artifact["id"], file_path, file_hash)
+                conn.commit()
+            return len(rows), errors
+        except Exception as e:
+            print(f"Index batch upsert error, retrying per item: {e}")
+
+        success = 0
+        for artifact, file_path, file_hash, _ in rows:
+            if self.upsert(artifact, file_path, file_hash):
+                success += 1
+            else:
+                errors += 1
+        return success, errors
+
     def _extract_title(self, artifact_type: str, data: dict) -> str:
         """Extract a title/summary from artifact data."""
         if artifact_type == "fact":
@@ -216,14 +422,117 @@ class ArtifactIndex:
     def delete(self, artifact_id: str) -> bool:
         """Remove an artifact from the index."""
         try:
-            with self._connect() as conn:
+            with self._connect_writer() as conn:
                 conn.execute("DELETE FROM artifacts WHERE id = ?", (artifact_id,))
+                conn.execute("DELETE FROM file_manifest WHERE artifact_id = ?", (artifact_id,))
+                if self._has_tag_table(conn):
+                    conn.execute("DELETE FROM artifact_tags WHERE artifact_id = ?", (artifact_id,))
                 conn.commit()
             return True
         except Exception as e:
             print(f"Index delete error: {e}")
             return False
 
+    def delete_many(self, artifact_ids: list[str]) -> int:
+        """
+        Remove many artifacts from the index in one transaction.
+        Deletes in chunks of 200 to avoid SQLite parameter limits.
+
+        Returns number of index rows deleted.
+        """
+        CHUNK_SIZE = 200
+        deleted = 0
+        try:
+            with self._connect_writer() as conn:
+                has_tags = self._has_tag_table(conn)
+                for i in range(0, len(artifact_ids), CHUNK_SIZE):
+                    chunk = artifact_ids[i:i + CHUNK_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor = conn.execute(
+                        f"DELETE FROM artifacts WHERE id IN ({placeholders})", chunk
+                    )
+                    deleted += cursor.rowcount
+                    conn.execute(
+                        f"DELETE FROM file_manifest WHERE artifact_id IN ({placeholders})", chunk
+                    )
+                    if has_tags:
+                        conn.execute(
+                            f"DELETE FROM artifact_tags WHERE artifact_id IN ({placeholders})", chunk
+                        )
+                conn.commit()
+            return deleted
+        except Exception as e:
+            print(f"Index batch delete error: {e}")
+            return deleted
+
+    def get_file_manifest(self) -> dict[str, dict]:
+        """
+        Get the file manifest, keyed by file path.
+
+        Returns:
+            {path: {"artifact_id", "mtime_ns", "size", "hash"}}
+        """
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    "SELECT path, artifact_id, mtime_ns, size, hash FROM file_manifest"
+                )
+                return {
+                    row[0]: {
+                        "artifact_id": row[1],
+                        "mtime_ns": row[2],
+                        "size": row[3],
+                        "hash": row[4]
+                    }
+                    for row in cursor
+                }
+        except Exception as e:
+            print(f"Manifest read error: {e}")
+            return {}
+
+    def touch_file_manifest(self, entries: list[tuple[str, int, int]]) -> bool:
+        """
+        Refresh stat info for files whose content hash did not change.
+
+        Args:
+            entries: List of (artifact_id, mtime_ns, size)
+        """
+        try:
+            with self._connect_writer() as conn:
+                conn.executemany(
+                    "UPDATE file_manifest SET mtime_ns = ?, size = ? WHERE artifact_id = ?",
+                    [(mtime_ns, size, aid) for aid, mtime_ns, size in entries]
+                )
+                conn.commit()
+            return True
+        except Exception as e:
+            print(f"Manifest touch error: {e}")
+            return False
+
+    def delete_file_manifest(self, artifact_ids: list[str]) -> bool:
+        """Drop manifest entries for files that no longer exist."""
+        try:
+            with self._connect_writer() as conn:
+                conn.executemany(
+                    "DELETE FROM file_manifest WHERE artifact_id = ?",
+                    [(aid,) for aid in artifact_ids]
+                )
+                conn.commit()
+            return True
+        except Exception as e:
+            print(f"Manifest delete error: {e}")
+            return False
+
+    def get_indexed_paths(self) -> dict[str, str]:
+        """Get {file_path: artifact_id} for every indexed artifact."""
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute("SELECT file_path, id FROM artifacts")
+                return {row[0]: row[1] for row in cursor}
+        except Exception as e:
+            print(f"Index path read error: {e}")
+            return {}
+
     def increment_reinforcement(self, artifact_id: str) -> bool:
         """
         Increment reinforcement count and update timestamp.
@@ -237,7 +546,7 @@ class ArtifactIndex:
             True if artifact was found and updated, False otherwise.
         """
         try:
-            with self._connect() as conn:
+            with self._connect_writer() as conn:
                 cursor = conn.execute("""
                     UPDATE artifacts
                     SET reinforcement_count = COALESCE(reinforcement_count, 0) + 1,
@@ -250,6 +559,29 @@ class ArtifactIndex:
             print(f"Increment reinforcement error: {e}")
             return False
 
+    def increment_reinforcement_many(self, artifact_ids: list[str]) -> int:
+        """
+        Batch increment_reinforcement: one transaction for all ids.
+
+        Returns:
+            Number of artifacts found and updated (-1 on error).
+        """
+        if not artifact_ids:
+            return 0
+        now = utc_now_iso()
+        try:
+            with self._connect_writer() as conn:
+                cursor = conn.executemany("""
+                    UPDATE artifacts
+                    SET reinforcement_count = COALESCE(reinforcement_count, 0) + 1,
+                        last_reinforced_at = ?
+                    WHERE id = ?
+                """, [(now, artifact_id) for artifact_id in artifact_ids])
+                return cursor.rowcount
+        except Exception as e:
+            print(f"Increment reinforcement error: {e}")
+            return -1
+
     def add_relation(
         self,
         source_id: str,
@@ -271,7 +603,7 @@ class ArtifactIndex:
         Returns True on success.
         """
         try:
-            with self._connect() as conn:
+            with self._connect_writer() as conn:
                 # Check if relations table exists
                 cursor = conn.execute(
                     "SELECT name FROM sqlite_master WHERE type='table' AND name='artifact_relations'"
@@ -368,6 +700,103 @@ class ArtifactIndex:
             print(f"Get relations error: {e}")
             return []
 
+    def _tag_condition(
+        self,
+        conn,
+        tags: list[str],
+        prefix: str = "",
+        match_all: bool = False
+    ) -> tuple[str, list]:
+        """
+        SQL condition matching rows that carry any (or all) of the given tags.
+
+        Uses the artifact_tags table (indexed on tag) when migration 005 has
+        run. Otherwise falls back to LIKE over the JSON tags column, matching
+        each tag with its quotes to avoid prefix hits ("api" vs "api-design").
+
+        Args:
+            conn: Connection used to detect artifact_tags
+            tags: Tags to match
+            prefix: Table alias prefix for the artifacts columns (e.g. "a.")
+            match_all: Require every tag instead of any
+        """
+        tags = list(dict.fromkeys(tags))
+
+        if self._has_tag_table(conn):
+            placeholders = ",".join("?" * len(tags))
+            subquery = f"SELECT artifact_id FROM artifact_tags WHERE tag IN ({placeholders})"
+            params = list(tags)
+            if match_all and len(tags) > 1:
+                subquery += " GROUP BY artifact_id HAVING COUNT(*) = ?"
+                params.append(len(tags))
+            return f"{prefix}id IN ({subquery})", params
+
+        conditions = [f"{prefix}tags LIKE ?" for _ in tags]
+        params = [f'%"{tag}"%' for tag in tags]
+        joiner = " AND " if match_all else " OR "
+        return f"({joiner.join(conditions)})", params
+
+    def get_tag_census(
+        self,
+        artifact_types: Optional[list[str]] = None,
+        since: Optional[str] = None
+    ) -> dict:
+        """
+        Tag frequency census, aggregated in SQL.
+
+        Args:
+            artifact_types: Restrict to these types (default: all)
+            since: Only artifacts created at or after this ISO date
+
+        Returns:
+            {
+                "tags": {tag: {artifact_type: count}},
+                "type_counts": {artifact_type: artifacts_in_scope},
+                "source": "artifact_tags" | "json"
+            }
+        """
+        conditions = []
+        params = []
+        if artifact_types:
+            conditions.append(f"a.type IN ({','.join('?' * len(artifact_types))})")
+            params.extend(artifact_types)
+        if since:
+            conditions.append("a.created_at >= ?")
+            params.append(since)
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+
+        census = {"tags": {}, "type_counts": {}, "source": "json"}
+        try:
+            with self._connect() as conn:
+                if self._has_tag_table(conn):
+                    census["source"] = "artifact_tags"
+                    tag_sql = f"""
+                        SELECT t.tag, a.type, COUNT(*)
+                        FROM artifact_tags t
+                        JOIN artifacts a ON a.id = t.artifact_id
+                        WHERE {where_clause}
+                        GROUP BY t.tag, a.type
+                    """
+                else:
+                    tag_sql = f"""
+                        SELECT j.value, a.type, COUNT(DISTINCT a.id)
+                        FROM artifacts a,
+                             json_each(CASE WHEN json_valid(a.tags) THEN a.tags ELSE '[]' END) j
+                        WHERE j.type = 'text' AND {where_clause}
+                        GROUP BY j.value, a.type
+                    """
+                for tag, artifact_type, count in conn.execute(tag_sql, params):
+                    census["tags"].setdefault(tag, {})[artifact_type] = count
+
+                cursor = conn.execute(
+                    f"SELECT a.type, COUNT(*) FROM artifacts a WHERE {where_clause} GROUP BY a.type",
+                    params
+                )
+                census["type_counts"] = dict(cursor.fetchall())
+        except Exception as e:
+            print(f"Tag census error: {e}")
+        return census
+
     def query(
         self,
         artifact_type: Optional[str] = None,
@@ -377,11 +806,15 @@ class ArtifactIndex:
         search_text: Optional[str] = None,
         since: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        tag_mode: str = "any"
     ) -> list[dict]:
         """
         Query artifacts with filters.
         Returns list of index entries (not full artifacts).
+
+        tag_mode: "any" matches artifacts with at least one of `tags`,
+        "all" requires every tag.
         """
         conditions = []
         params = []
@@ -403,12 +836,11 @@ class ArtifactIndex:
             params.append(since)
 
         if tags:
-            # Search for any matching tag
-            tag_conditions = []
-            for tag in tags:
-                tag_conditions.append("tags LIKE ?")
-                params.append(f'%"{tag}"%')
-            conditions.append(f"({' OR '.join(tag_conditions)})")
+            tag_sql, tag_params = self._tag_condition(
+                self._connect(), tags, match_all=(tag_mode == "all")
+            )
+            conditions.append(tag_sql)
+            params.extend(tag_params)
 
         if search_text:
             conditions.append("title LIKE ?")
@@ -489,11 +921,9 @@ class ArtifactIndex:
         params = [now, now]
 
         if tags:
-            tag_conditions = []
-            for tag in tags:
-                tag_conditions.append("tags LIKE ?")
-                params.append(f'%"{tag}"%')
-            conditions.append(f"({' OR '.join(tag_conditions)})")
+            tag_sql, tag_params = self._tag_condition(self._connect(), tags)
+            conditions.append(tag_sql)
+            params.extend(tag_params)
 
         if search_text:
             conditions.append("title LIKE ?")
@@ -568,6 +998,58 @@ class ArtifactIndex:
             print(f"Index get error: {e}")
             return None
 
+    def get_file_paths(self, artifact_ids: list[str]) -> dict[str, str]:
+        """
+        Batch file path lookup for get_artifacts_many.
+        Queries in chunks of 200 to avoid SQLite parameter limits.
+
+        Returns:
+            {artifact_id: file_path} for indexed IDs only
+        """
+        CHUNK_SIZE = 200
+        paths = {}
+        try:
+            with self._connect() as conn:
+                for i in range(0, len(artifact_ids), CHUNK_SIZE):
+                    chunk = artifact_ids[i:i + CHUNK_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor = conn.execute(
+                        f"SELECT id, file_path FROM artifacts WHERE id IN ({placeholders})", chunk
+                    )
+                    paths.update(cursor.fetchall())
+        except Exception as e:
+            print(f"Index get_file_paths error: {e}")
+        return paths
+
+    def get_fact_decay_page(self, after_id: Optional[str] = None, limit: int = 500) -> list[dict]:
+        """
+        One keyset page of facts with the indexed decay inputs, ordered by id.
+
+        Pass the last id of the previous page as after_id; unlike OFFSET
+        paging this stays O(page) deep into the corpus and is stable while
+        pages are being rewritten.
+
+        Returns:
+            [{id, created_at, file_path, importance, pinned,
+              last_reinforced_at, reinforcement_count}, ...]
+
+        Raises:
+            sqlite3.Error: Query errors propagate - an empty page means the
+                end of the facts, so the decay pass must not mistake a
+                failed read for completion.
+        """
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute("""
+                SELECT id, created_at, file_path, importance, pinned,
+                       last_reinforced_at, reinforcement_count
+                FROM artifacts
+                WHERE type = 'fact' AND id > ?
+                ORDER BY id
+                LIMIT ?
+            """, (after_id or "", limit))
+            return [dict(row) for row in cursor.fetchall()]
+
     def count(self, artifact_type: Optional[str] = None) -> int:
         """Get count of artifacts, optionally filtered by type."""
         try:
@@ -601,16 +1083,25 @@ class ArtifactIndex:
                 return {
                     "total_artifacts": total,
                     "by_type": type_counts,
-                    "by_sensitivity": sensitivity_counts
+                    "by_sensitivity": sensitivity_counts,
+                    "connection_pool": self.get_pool_stats()
                 }
         except Exception as e:
             print(f"Index stats error: {e}")
-            return {"total_artifacts": 0, "by_type": {}, "by_sensitivity": {}}
+            return {
+                "total_artifacts": 0,
+                "by_type": {},
+                "by_sensitivity": {},
+                "connection_pool": self.get_pool_stats()
+            }
 
     def clear(self):
         """Clear all entries from the index. Use with caution."""
-        with self._connect() as conn:
+        with self._connect_writer() as conn:
             conn.execute("DELETE FROM artifacts")
+            conn.execute("DELETE FROM file_manifest")
+            if self._has_tag_table(conn):
+                conn.execute("DELETE FROM artifact_tags")
             conn.commit()
 
     def get_fts_completeness(self) -> dict:
@@ -728,18 +1219,25 @@ class ArtifactIndex:
     # ========================================
 
     def _load_vec_extension(self, conn) -> bool:
-        """Load sqlite-vec extension if available."""
+        """Load sqlite-vec extension if available (once per pooled connection)."""
         if not _VEC_AVAILABLE:
             return False
+        loaded = getattr(conn, "vec_loaded", None)
+        if loaded is not None:
+            return loaded
         try:
             import sqlite_vec
             # Must enable extension loading before loading
             conn.enable_load_extension(True)
             sqlite_vec.load(conn)
-            return True
+            conn.enable_load_extension(False)
+            loaded = True
         except Exception as e:
             print(f"[WARN] Failed to load sqlite-vec: {e}")
-            return False
+            loaded = False
+        if isinstance(conn, _PooledConnection):
+            conn.vec_loaded = loaded
+        return loaded
 
     def _has_fts(self, conn) -> bool:
         """Check if FTS5 table exists."""
@@ -834,7 +1332,7 @@ class ArtifactIndex:
             True on success, False if vectors not available
         """
         try:
-            with self._connect() as conn:
+            with self._connect_writer() as conn:
                 if not self._has_vectors(conn):
                     return False
 
@@ -871,10 +1369,92 @@ class ArtifactIndex:
             print(f"Embedding upsert error: {e}")
             return False
 
+    def get_embedding_states(self, artifact_ids: list[str]) -> dict[str, dict]:
+        """
+        Batch version of get_embedding_state.
+        Queries in chunks of 200 to avoid SQLite parameter limits.
+
+        Returns:
+            {artifact_id: {content_hash, embedded_at, model}} for embedded IDs only
+        """
+        CHUNK_SIZE = 200
+        states = {}
+        try:
+            with self._connect() as conn:
+                for i in range(0, len(artifact_ids), CHUNK_SIZE):
+                    chunk = artifact_ids[i:i + CHUNK_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor = conn.execute(f"""
+                        SELECT artifact_id, content_hash, embedded_at, model
+                        FROM embedding_state
+                        WHERE artifact_id IN ({placeholders})
+                    """, chunk)
+                    for row in cursor:
+                        states[row[0]] = {
+                            "content_hash": row[1],
+                            "embedded_at": row[2],
+                            "model": row[3]
+                        }
+        except Exception:
+            pass
+        return states
+
+    def upsert_embeddings(
+        self,
+        items: list[tuple[str, list[float], str]],
+        model_name: str = "bge-small-en-v1.5"
+    ) -> int:
+        """
+        Batch version of upsert_embedding - all vectors in one transaction.
+
+        Args:
+            items: List of (artifact_id, embedding, content_hash)
+            model_name: Name of the embedding model used
+
+        Returns:
+            Number of embeddings stored (0 if vectors not available or on error)
+        """
+        if not items:
+            return 0
+
+        try:
+            with self._connect_writer() as conn:
+                if not self._has_vectors(conn):
+                    return 0
+
+                import sqlite_vec
+                now = utc_now_iso()
+
+                conn.executemany("""
+                    INSERT INTO embedding_state (artifact_id, content_hash, embedded_at, model)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(artifact_id) DO UPDATE SET
+                        content_hash = excluded.content_hash,
+                        embedded_at = excluded.embedded_at,
+                        model = excluded.model
+                """, [(aid, content_hash, now, model_name) for aid, _, content_hash in items])
+
+                # vec0 virtual tables don't support UPSERT, so delete first
+                conn.executemany(
+                    "DELETE FROM artifact_vectors WHERE artifact_id = ?",
+                    [(aid,) for aid, _, _ in items]
+                )
+                conn.executemany(
+                    "INSERT INTO artifact_vectors (artifact_id, embedding) VALUES (?, ?)",
+                    [(aid, sqlite_vec.serialize_float32(emb)) for aid, emb, _ in items]
+                )
+
+                conn.commit()
+                return len(items)
+
+        except Exception as e:
+            print(f"Batch embedding upsert error: {e}")
+            return 0
+
     def delete_embedding(self, artifact_id: str) -> bool:
         """Delete embedding for an artifact."""
         try:
-            with self._connect() as conn:
+            with self._connect_writer() as conn:
                 conn.execute("DELETE FROM embedding_state WHERE artifact_id = ?", (artifact_id,))
                 if self._has_vectors(conn):
                     conn.execute("DELETE FROM artifact_vectors WHERE artifact_id = ?", (artifact_id,))
@@ -924,7 +1504,7 @@ class ArtifactIndex:
         CHUNK_SIZE = 200
 
         try:
-            with self._connect() as conn:
+            with self._connect_writer() as conn:
                 # Get orphan IDs (with optional limit)
                 query = """
                     SELECT e.artifact_id FROM embedding_state e
@@ -1006,7 +1586,8 @@ class ArtifactIndex:
         self,
         query: str,
         artifact_type: Optional[str] = None,
-        limit: int = 50
+        limit: int = 50,
+        tags: Optional[list[str]] = None
     ) -> list[dict]:
         """
         Full-text search using FTS5.
@@ -1015,6 +1596,7 @@ class ArtifactIndex:
             query: Search query (will be escaped for safety)
             artifact_type: Optional type filter
             limit: Max results
+            tags: Optional tag filter (any match), applied before the limit
 
         Returns:
             List of {id, score, title} dicts sorted by relevance
@@ -1023,7 +1605,7 @@ class ArtifactIndex:
             with self._connect() as conn:
                 if not self._has_fts(conn):
                     # Fall back to LIKE search
-                    return self._like_search(conn, query, artifact_type, limit)
+                    return self._like_search(conn, query, artifact_type, limit, tags)
 
                 # Escape user query for FTS5 safety
                 safe_query = self._escape_fts_query(query)
@@ -1040,9 +1622,16 @@ class ArtifactIndex:
                 """
                 params = [safe_query]
 
+                conditions = []
                 if artifact_type:
-                    sql += " WHERE a.type = ?"
+                    conditions.append("a.type = ?")
                     params.append(artifact_type)
+                if tags:
+                    tag_sql, tag_params = self._tag_condition(conn, tags, prefix="a.")
+                    conditions.append(tag_sql)
+                    params.extend(tag_params)
+                if conditions:
+                    sql += " WHERE " + " AND ".join(conditions)
 
                 sql += " ORDER BY fts_matches.score LIMIT ?"
                 params.append(limit)
@@ -1070,7 +1659,8 @@ class ArtifactIndex:
         conn,
         query: str,
         artifact_type: Optional[str],
-        limit: int
+        limit: int,
+        tags: Optional[list[str]] = None
     ) -> list[dict]:
         """Fallback LIKE search when FTS not available."""
         sql = """
@@ -1084,6 +1674,11 @@ class ArtifactIndex:
             sql += " AND type = ?"
             params.append(artifact_type)
 
+        if tags:
+            tag_sql, tag_params = self._tag_condition(conn, tags)
+            sql += f" AND {tag_sql}"
+            params.extend(tag_params)
+
         sql += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
 
@@ -1105,7 +1700,8 @@ class ArtifactIndex:
         self,
         query_embedding: list[float],
         artifact_type: Optional[str] = None,
-        limit: int = 50
+        limit: int = 50,
+        tags: Optional[list[str]] = None
     ) -> list[dict]:
         """
         Vector similarity search using vec0 KNN queries.
@@ -1117,6 +1713,7 @@ class ArtifactIndex:
             query_embedding: Query vector
             artifact_type: Optional type filter
             limit: Max results
+            tags: Optional tag filter (any match)
 
         Returns:
             List of {id, score, title} dicts sorted by similarity
@@ -1140,7 +1737,9 @@ class ArtifactIndex:
                       AND k = ?
                     ORDER BY v.distance
                 """
-                params = [query_vec, limit * 2]  # Get extra for type filter
+                # Get extra neighbours so type/tag filters don't starve the result
+                k = limit * (4 if tags else 2)
+                params = [query_vec, k]
 
                 conn.row_factory = sqlite3.Row
                 cursor = conn.execute(sql, params)
@@ -1151,15 +1750,22 @@ class ArtifactIndex:
                 if not knn_results:
                     return []
 
-                # Get artifact metadata
+                # Get artifact metadata, applying type/tag filters in SQL
                 artifact_ids = [r["artifact_id"] for r in knn_results]
-                placeholders = ",".join("?" * len(artifact_ids))
-                meta_sql = f"""
+                meta_sql = """
                     SELECT id, title, type
                     FROM artifacts
-                    WHERE id IN ({placeholders})
+                    WHERE id IN (SELECT value FROM json_each(?))
                 """
-                cursor = conn.execute(meta_sql, artifact_ids)
+                meta_params = [json.dumps(artifact_ids)]
+                if artifact_type:
+                    meta_sql += " AND type = ?"
+                    meta_params.append(artifact_type)
+                if tags:
+                    tag_sql, tag_params = self._tag_condition(conn, tags)
+                    meta_sql += f" AND {tag_sql}"
+                    meta_params.extend(tag_params)
+                cursor = conn.execute(meta_sql, meta_params)
                 metadata = {row["id"]: dict(row) for row in cursor}
 
                 results = []
@@ -1172,10 +1778,6 @@ class ArtifactIndex:
 
                     meta = metadata[aid]
 
-                    # Apply type filter if specified
-                    if artifact_type and meta["type"] != artifact_type:
-                        continue
-
                     # Convert distance to similarity score
                     # For cosine distance: similarity = 1 - distance
                     similarity = max(0, 1.0 - distance)
@@ -1216,7 +1818,7 @@ class ArtifactIndex:
             query: Text query for FTS
             query_embedding: Optional vector for semantic search
             artifact_type: Filter by type
-            tags: Filter by tags (any match)
+            tags: Filter by tags (any match), applied to candidates in SQL
             limit: Max results
             explain: Include score breakdown in results
 
@@ -1236,13 +1838,14 @@ class ArtifactIndex:
             explain_score
         )
 
-        # Get FTS results
-        fts_results = self.fts_search(query, artifact_type, limit * 2)
+        # Get FTS results (type/tag filters are applied inside the candidate SQL
+        # so filtered searches still get a full candidate pool)
+        fts_results = self.fts_search(query, artifact_type, limit * 2, tags=tags)
 
         # Get vector results if embedding provided
         vector_results = []
         if query_embedding:
-            vector_results = self.vector_search(query_embedding, artifact_type, limit * 2)
+            vector_results = self.vector_search(query_embedding, artifact_type, limit * 2, tags=tags)
 
         # Determine search mode
         if vector_results and fts_results:
@@ -1278,67 +1881,69 @@ class ArtifactIndex:
             scores[aid]["vec_rank"] = rank + 1
             scores[aid]["vec_score"] = result["score"]
 
-        # Get full artifact info for boosting
+        # Hydrate all candidates with one query
+        hydrated = {}
+        if scores:
+            try:
+                with self._connect() as conn:
+                    conn.row_factory = sqlite3.Row
+                    cursor = conn.execute("""
+                        SELECT id, type, title, created_at, tags, file_path
+                        FROM artifacts
+                        WHERE id IN (SELECT value FROM json_each(?))
+                    """, (json.dumps(list(scores)),))
+                    hydrated = {row["id"]: row for row in cursor}
+            except Exception as e:
+                print(f"Hybrid search hydration error: {e}")
+
+        # Apply boosts in one pass (shared clock, no per-row lookups)
+        now = utc_now()
+        min_score = RANKING["min_score_threshold"]
         results = []
-        with self._connect() as conn:
-            conn.row_factory = sqlite3.Row
-
-            for aid, data in scores.items():
-                # Get artifact details
-                cursor = conn.execute(
-                    "SELECT * FROM artifacts WHERE id = ?", (aid,)
-                )
-                row = cursor.fetchone()
-                if not row:
-                    continue
+        for aid, data in scores.items():
+            row = hydrated.get(aid)
+            if row is None:
+                continue
+            created_at = row["created_at"] or ""
+            artifact_type = row["type"]
+
+            recency_boost = calculate_recency_boost(created_at, now)
+            type_weight = calculate_type_weight(artifact_type)
+
+            # Calculate final score
+            base_score = data["rrf"]
+            final_score = base_score * type_weight + recency_boost
+
+            # Filter by min score threshold
+            if final_score < min_score:
+                continue
+
+            result = {
+                "id": aid,
+                "type": artifact_type,
+                "title": row["title"],
+                "created_at": created_at,
+                "tags": json.loads(row["tags"]) if row["tags"] else [],
+                "file_path": row["file_path"],
+                "search_score": round(final_score, 4)
+            }
 
-                # Apply boosts
-                created_at = row["created_at"] or ""
-                artifact_type = row["type"]
-
-                recency_boost = calculate_recency_boost(created_at)
-                type_weight = calculate_type_weight(artifact_type)
-
-                # Calculate final score
-                base_score = data["rrf"]
-                final_score = base_score * type_weight + recency_boost
-
-                result = {
-                    "id": aid,
-                    "type": artifact_type,
-                    "title": row["title"],
-                    "created_at": created_at,
-                    "tags": json.loads(row["tags"]) if row["tags"] else [],
-                    "file_path": row["file_path"],
-                    "search_score": round(final_score, 4)
+            if explain:
+                result["score_components"] = {
+                    "rrf_base": round(base_score, 4),
+                    "type_weight": round(type_weight, 4),
+                    "recency_boost": round(recency_boost, 4),
+                    "fts_rank": data.get("fts_rank"),
+                    "vec_rank": data.get("vec_rank"),
+                    "fts_score": round(data.get("fts_score", 0), 4),
+                    "vec_score": round(data.get("vec_score", 0), 4)
                 }
+                result["explain"] = explain_score(result["score_components"])
 
-                if explain:
-                    result["score_components"] = {
-                        "rrf_base": round(base_score, 4),
-                        "type_weight": round(type_weight, 4),
-                        "recency_boost": round(recency_boost, 4),
-                        "fts_rank": data.get("fts_rank"),
-                        "vec_rank": data.get("vec_rank"),
-                        "fts_score": round(data.get("fts_score", 0), 4),
-                        "vec_score": round(data.get("vec_score", 0), 4)
-                    }
-                    result["explain"] = explain_score(result["score_components"])
-
-                results.append(result)
+            results.append(result)
 
         # Sort by score and apply limit
         results.sort(key=lambda x: x["search_score"], reverse=True)
-
-        # Filter by min score threshold
-        min_score = RANKING["min_score_threshold"]
-        results = [r for r in results if r["search_score"] >= min_score]
-
-        # Apply tag filter if provided
-        if tags:
-            tag_set = set(tags)
-            results = [r for r in results if tag_set & set(r.get("tags", []))]
-
         results = results[:limit]
 
         return {
@@ -1366,7 +1971,7 @@ class ArtifactIndex:
             # Truncate very long text (FTS performance)
             text = text[:2000]
 
-            with self._connect() as conn:
+            with self._connect_writer() as conn:
                 conn.execute(
                     "UPDATE artifact_fts SET text = ? WHERE id = ?",
                     (text, artifact_id)
@@ -1377,6 +1982,34 @@ class ArtifactIndex:
             print(f"FTS text update error for {artifact_id}: {e}")
             return False
 
+    def populate_fts_text_many(self, artifacts: list[dict]) -> int:
+        """
+        Batch version of populate_fts_text - one connection, one commit.
+
+        Returns number of artifacts whose text was written.
+        """
+        try:
+            from embeddings import artifact_to_text
+
+            rows = []
+            for artifact in artifacts:
+                try:
+                    text = (artifact_to_text(artifact) or "")[:2000]
+                except Exception as e:
+                    print(f"FTS text build error for {artifact.get('id')}: {e}")
+                    continue
+                rows.append((text, artifact["id"]))
+
+            with self._connect_writer() as conn:
+                if not self._has_fts(conn):
+                    return 0
+                conn.executemany("UPDATE artifact_fts SET text = ? WHERE id = ?", rows)
+                conn.commit()
+            return len(rows)
+        except Exception as e:
+            print(f"FTS batch text update error: {e}")
+            return 0
+
     def rebuild_fts(self) -> dict:
         """
         Rebuild FTS index with proper content.
@@ -1393,7 +2026,7 @@ class ArtifactIndex:
         result = {"success": False, "indexed_count": 0, "errors": []}
 
         try:
-            with self._connect() as conn:
+            with self._connect_writer() as conn:
                 # Drop and recreate FTS table
                 conn.execute("DROP TABLE IF EXISTS artifact_fts")
                 conn.execute("""
@@ -1548,7 +2181,7 @@ class ArtifactIndex:
             repair_id for completing the log later
         """
         try:
-            with self._connect() as conn:
+            with self._connect_writer() as conn:
                 cursor = conn.execute("""
                     INSERT INTO repairs (
                         repair_type, trigger, started_at, before_metrics,
@@ -1598,7 +2231,7 @@ class ArtifactIndex:
             return False
 
         try:
-            with self._connect() as conn:
+            with self._connect_writer() as conn:
                 # Get start time for duration calc
                 cursor = conn.execute(
                     "SELECT started_at FROM repairs WHERE id = ?",
@@ -1667,7 +2300,7 @@ class ArtifactIndex:
             Number of repairs marked as failed
         """
         try:
-            with self._connect() as conn:
+            with self._connect_writer() as conn:
                 cutoff = utc_now() - timedelta(minutes=max_age_minutes)
                 cutoff_iso = cutoff.isoformat().replace('+00:00', 'Z')
 
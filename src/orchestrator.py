@@ -13,6 +13,7 @@ One new concept: a "run" - the auditable trace of an orchestrated action.
 """
 
 import json
+import os
 import random
 import re
 import string
@@ -22,6 +23,7 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 
 from time_utils import utc_now, utc_now_iso
+from run_store import RUN_DB_NAME, RunStore
 from pathlib import Path
 from typing import Any, Optional
 
@@ -52,6 +54,9 @@ MAX_RETRIES = 3
 MAX_SECONDS = 60
 SKILL_TIMEOUT_SECONDS = 60
 
+# Runs go to runs/runs.db; set to also write the legacy runs/run_*.json files
+WRITE_RUN_JSON = os.environ.get("DURO_RUN_LOG_JSON", "").strip().lower() in ("1", "true", "yes")
+
 # External tool mapping: capability -> (server, tool_name)
 # This is a tiny mapping, not a full registry
 EXTERNAL_TOOL_MAP = {
@@ -199,6 +204,14 @@ class Orchestrator:
         self.memory_dir = Path(memory_dir)
         self.runs_dir = self.memory_dir / "runs"
         self.runs_dir.mkdir(parents=True, exist_ok=True)
+        self.run_store = RunStore(self.runs_dir / RUN_DB_NAME)
+        self._json_fallback_pending = False  # A run went to JSON because the store write failed
+        try:
+            imported = self.run_store.import_json_dir(self.runs_dir)
+            if imported["imported"]:
+                print(f"[Orchestrator] Imported {imported['imported']} run logs into {RUN_DB_NAME}")
+        except Exception as e:
+            print(f"[Orchestrator] Run log import failed: {e}")
 
         self.rules = rules_module
         self.skills = skills_module
@@ -396,7 +409,10 @@ class Orchestrator:
         """
         Main entry point. Route intent through rules to skill, execute, log.
 
-        Returns dict with run_id, outcome, artifacts, etc.
+        Returns dict with run_id, outcome, artifacts, etc. run_path locates
+        the run log: the runs/<run_id>.json file when one was written
+        (DURO_RUN_LOG_JSON, or the store write failed), otherwise
+        "<runs.db path>#<run_id>" - read it back with get_run(run_id).
         """
         start_time = time.time()
         run_id = generate_run_id()
@@ -953,14 +969,29 @@ class Orchestrator:
                 pass  # Don't fail the run for maturation errors
 
         # Write run log
-        run_path = self.runs_dir / f"{run.run_id}.json"
+        run_path = f"{self.run_store.db_path}#{run.run_id}"
         run_dict = self._run_to_dict(run)
 
+        write_json = WRITE_RUN_JSON
         try:
-            with open(run_path, "w", encoding="utf-8") as f:
-                json.dump(run_dict, f, indent=2, ensure_ascii=False)
+            self.run_store.record(run_dict)
         except Exception as e:
             run.notes.append(f"Failed to write run log: {e}")
+            write_json = True  # Keep the run as a JSON file instead
+            # ...and have list_runs() fold it into the store once it's writable again
+            self._json_fallback_pending = True
+            try:
+                self.run_store.request_json_import()
+            except Exception:
+                pass
+
+        if write_json:
+            run_path = self.runs_dir / f"{run.run_id}.json"
+            try:
+                with open(run_path, "w", encoding="utf-8") as f:
+                    json.dump(self._run_to_dict(run), f, indent=2, ensure_ascii=False)
+            except Exception as e:
+                run.notes.append(f"Failed to write run log: {e}")
 
         # Return summary
         return {
@@ -1025,6 +1056,13 @@ class Orchestrator:
 
     def get_run(self, run_id: str) -> Optional[dict]:
         """Retrieve a run log by ID."""
+        try:
+            run = self.run_store.get(run_id)
+            if run is not None:
+                return run
+        except Exception:
+            pass
+        # Runs written as JSON files only (store write failed)
         run_path = self.runs_dir / f"{run_id}.json"
         if not run_path.exists():
             return None
@@ -1034,24 +1072,33 @@ class Orchestrator:
         except Exception:
             return None
 
-    def list_runs(self, limit: int = 20, outcome: Optional[str] = None) -> list:
-        """List recent runs."""
-        runs = []
-        for run_file in sorted(self.runs_dir.glob("run_*.json"), reverse=True):
-            if len(runs) >= limit:
-                break
-            try:
-                with open(run_file, "r", encoding="utf-8") as f:
-                    run = json.load(f)
-                    if outcome and run.get("execution", {}).get("outcome") != outcome:
-                        continue
-                    runs.append({
-                        "run_id": run.get("run_id"),
-                        "intent": run.get("intent_normalized"),
-                        "outcome": run.get("execution", {}).get("outcome"),
-                        "started_at": run.get("started_at"),
-                        "duration_ms": run.get("execution", {}).get("duration_ms")
-                    })
-            except Exception:
-                continue
-        return runs
+    def list_runs(
+        self,
+        limit: int = 20,
+        outcome: Optional[str] = None,
+        offset: int = 0,
+        intent: Optional[str] = None
+    ) -> list:
+        """List recent runs, newest first (paged with offset)."""
+        self._import_fallback_runs()
+        return self.run_store.list_runs(limit=limit, offset=offset, outcome=outcome, intent=intent)
+
+    def run_stats(self, since: Optional[str] = None) -> dict:
+        """Per-intent run counts, outcomes and avg/p50/p95 duration."""
+        self._import_fallback_runs()
+        return self.run_store.get_stats(since=since)
+
+    def _import_fallback_runs(self):
+        """
+        Import runs that were written as JSON files because the store write failed.
+
+        Pending when this process fell back, or when any process cleared the
+        store's import marker; retried on the next read if the import fails.
+        """
+        try:
+            if not self._json_fallback_pending and self.run_store.get_meta("json_imported_at"):
+                return
+            self.run_store.import_json_dir(self.runs_dir, force=True)
+            self._json_fallback_pending = False
+        except Exception as e:
+            print(f"[Orchestrator] Run log import failed: {e}")
@@ -25,6 +25,8 @@ import json
 import os
 import re
 import sys
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -78,7 +80,7 @@ UNIFIED_AUDIT_AVAILABLE = False
 UNIFIED_AUDIT_ERROR = None
 try:
     from audit_log import (
-        append_event, build_gate_event, build_secrets_event, build_browser_event,
+        submit_event, build_gate_event, build_secrets_event, build_browser_event,
         build_workspace_event, build_intent_event, build_injection_event,
         build_rules_event,
         EventType, Severity
@@ -433,6 +435,65 @@ class GateDecision:
         return "\n".join(lines)
 
 
+# === GATE TIMINGS ===
+# Per-stage latency of policy_gate(), reported by get_gate_stats().
+# classify covers args hashing, the safe summary and risk/domain
+# classification; audit is the gate-decision audit write; total is the
+# whole call. A stage skipped by an early return is not counted.
+
+GATE_STAGES = ("classify", "permission", "workspace", "secrets", "browser",
+               "intent", "rules", "audit", "total")
+
+_gate_timings: Dict[str, Dict[str, float]] = {}
+_gate_timings_lock = threading.Lock()
+
+
+def _record_stage(stage: str, elapsed_s: float):
+    elapsed_ms = elapsed_s * 1000
+    with _gate_timings_lock:
+        entry = _gate_timings.get(stage)
+        if entry is None:
+            entry = _gate_timings[stage] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+        entry["count"] += 1
+        entry["total_ms"] += elapsed_ms
+        if elapsed_ms > entry["max_ms"]:
+            entry["max_ms"] = elapsed_ms
+
+
+class _StageTimer:
+    """Records the time since the previous lap under each stage name."""
+
+    def __init__(self):
+        self.started = self._mark = time.perf_counter()
+
+    def lap(self, stage: str):
+        now = time.perf_counter()
+        _record_stage(stage, now - self._mark)
+        self._mark = now
+
+
+def get_gate_timings() -> Dict[str, Dict[str, float]]:
+    """Per-stage gate latency: count, avg_ms, max_ms, total_ms (in GATE_STAGES order)."""
+    with _gate_timings_lock:
+        snapshot = {stage: dict(entry) for stage, entry in _gate_timings.items()}
+    timings = {}
+    for stage in GATE_STAGES:
+        entry = snapshot.get(stage)
+        if entry:
+            timings[stage] = {
+                "count": entry["count"],
+                "avg_ms": round(entry["total_ms"] / entry["count"], 4),
+                "max_ms": round(entry["max_ms"], 4),
+                "total_ms": round(entry["total_ms"], 2),
+            }
+    return timings
+
+
+def reset_gate_timings():
+    with _gate_timings_lock:
+        _gate_timings.clear()
+
+
 # === AUDIT LOGGING ===
 
 def _log_gate_decision(decision: GateDecision, arguments: Dict[str, Any] = None):
@@ -442,6 +503,7 @@ def _log_gate_decision(decision: GateDecision, arguments: Dict[str, Any] = None)
     Uses Layer 5 unified audit with hash chain if available,
     falls back to legacy file-based logging otherwise.
     """
+    start = time.perf_counter()
     try:
         # Prepare redacted args preview
         args_preview = None
@@ -467,7 +529,7 @@ def _log_gate_decision(decision: GateDecision, arguments: Dict[str, Any] = None)
                 breakglass=decision.breakglass,
                 error=decision.error,
             )
-            append_event(event)
+            submit_event(event)
         else:
             # Fallback to legacy logging
             with open(GATE_AUDIT_FILE, "a", encoding="utf-8") as f:
@@ -486,6 +548,8 @@ def _log_gate_decision(decision: GateDecision, arguments: Dict[str, Any] = None)
     except Exception as e:
         # Logging should never break the gate
         print(f"[WARN] Gate audit log failed: {e}", file=sys.stderr)
+    finally:
+        _record_stage("audit", time.perf_counter() - start)
 
 
 def _log_secret_detection(tool_name: str, scan_result: Any, action: str, reason: str):
@@ -522,7 +586,7 @@ def _log_secret_detection(tool_name: str, scan_result: Any, action: str, reason:
                 match_count=match_count,
                 patterns=patterns,
             )
-            append_event(event)
+            submit_event(event)
         else:
             # Fallback to legacy logging
             audit_entry = create_secret_audit_entry(tool_name, scan_result, action, reason)
@@ -550,7 +614,7 @@ def _log_browser_violation(tool_name: str, url: str, reason: str):
         )
         # Add tool context
         event.tool = tool_name
-        append_event(event)
+        submit_event(event)
     except Exception as e:
         print(f"[WARN] Browser audit log failed: {e}", file=sys.stderr)
 
@@ -571,7 +635,7 @@ def _log_workspace_violation(tool_name: str, path: str, reason: str, event_type:
             tool_name=tool_name,
             severity=Severity.WARN,
         )
-        append_event(event)
+        submit_event(event)
     except Exception as e:
         print(f"[WARN] Workspace audit log failed: {e}", file=sys.stderr)
 
@@ -605,6 +669,27 @@ def policy_gate(
     Returns:
         GateDecision with allowed=True/False
     """
+    timer = _StageTimer()
+    try:
+        return _policy_gate(
+            tool_name, arguments, autonomy_available, check_action_fn,
+            classify_domain_fn, classify_risk_fn, get_enforcer_fn, timer,
+        )
+    finally:
+        _record_stage("total", time.perf_counter() - timer.started)
+
+
+def _policy_gate(
+    tool_name: str,
+    arguments: Dict[str, Any],
+    autonomy_available: bool,
+    check_action_fn,
+    classify_domain_fn,
+    classify_risk_fn,
+    get_enforcer_fn,
+    timer: "_StageTimer",
+) -> GateDecision:
+    """policy_gate() body. timer.lap() records each layer's latency."""
     # Defensive: normalize arguments to dict
     if not isinstance(arguments, dict):
         print(f"[WARN] policy_gate received non-dict arguments: {type(arguments).__name__}", file=sys.stderr)
@@ -720,6 +805,8 @@ def policy_gate(
         _log_gate_decision(decision, arguments)
         return decision
 
+    timer.lap("classify")
+
     # === CHECK PERMISSION ===
     try:
         # Build scoped action_id for approval token lookup
@@ -808,6 +895,8 @@ def policy_gate(
                 logged_at=timestamp,
             )
 
+        timer.lap("permission")
+
         # === WORKSPACE CONSTRAINTS (Layer 2) ===
         # If action is allowed, check if paths are within workspace
         if decision.allowed and WORKSPACE_GUARD_AVAILABLE:
@@ -866,6 +955,8 @@ def policy_gate(
                     error=f"workspace_error: {e}",
                 )
 
+        timer.lap("workspace")
+
         # === SECRETS CONSTRAINTS (Layer 3) ===
         # For SENSITIVE_TOOLS: redact secrets FIRST, then allow (redact-and-persist strategy)
         # For other tools: block if secrets detected (block-and-deny strategy)
@@ -980,6 +1071,8 @@ def policy_gate(
                     error=f"secrets_error: {e}",
                 )
 
+        timer.lap("secrets")
+
         # === BROWSER SANDBOX CONSTRAINTS (Layer 4) ===
         # Check if browser tools are accessing allowed domains
         if decision.allowed and BROWSER_GUARD_AVAILABLE and tool_name in BROWSER_TOOLS:
@@ -1031,6 +1124,8 @@ def policy_gate(
                     error=f"browser_error: {e}",
                 )
 
+        timer.lap("browser")
+
         # === INTENT GUARD (Layer 6) ===
         # Tools that require intent tokens must have valid, unexpired intent
         # This enforces that untrusted content cannot trigger risky tool calls
@@ -1065,7 +1160,7 @@ def policy_gate(
                             reason=intent_reason,
                             severity=Severity.WARN,
                         )
-                        append_event(intent_event)
+                        submit_event(intent_event)
                 else:
                     # Intent verified successfully - log consumption
                     if UNIFIED_AUDIT_AVAILABLE and tool_name in INTENT_REQUIRED_TOOLS:
@@ -1078,7 +1173,7 @@ def policy_gate(
                             reason=intent_reason,
                             severity=Severity.INFO,
                         )
-                        append_event(intent_event)
+                        submit_event(intent_event)
 
             except Exception as e:
                 # Intent check error = DENY (fail-closed)
@@ -1095,6 +1190,8 @@ def policy_gate(
                     error=f"intent_error: {e}",
                 )
 
+        timer.lap("intent")
+
         # === RULES GUARD (Layer 7) ===
         # Check if any active rules apply to this tool call
         # Hard rules with PreToolUse enforcement can block execution
@@ -1122,6 +1219,7 @@ def policy_gate(
                         logged_at=timestamp,
                         error="rule_violation",
                     )
+                    timer.lap("rules")
                     _log_gate_decision(decision, arguments)
 
                     # Emit dedicated rules.violation event for ops queryability
@@ -1136,7 +1234,7 @@ def policy_gate(
                                 message=rules_message,
                                 severity=Severity.WARN,
                             )
-                            append_event(rule_event)
+                            submit_event(rule_event)
                         except Exception as e:
                             print(f"[WARN] Failed to log rules.violation event: {e}", file=sys.stderr)
                     return decision
@@ -1155,7 +1253,7 @@ def policy_gate(
                                 message=rules_message,
                                 severity=Severity.INFO,
                             )
-                            append_event(guidance_event)
+                            submit_event(guidance_event)
                         except Exception as e:
                             print(f"[WARN] Failed to log rules.guidance event: {e}", file=sys.stderr)
             except Exception as e:
@@ -1172,9 +1270,12 @@ def policy_gate(
                     logged_at=timestamp,
                     error="rules_check_failed",
                 )
+                timer.lap("rules")
                 _log_gate_decision(decision, arguments)
                 return decision
 
+        timer.lap("rules")
+
         # === CONSUME APPROVAL TOKEN (only after ALL checks pass) ===
         # This is the fix for the bug where token was consumed before subsequent
         # checks (workspace/secrets/browser/intent) could block the operation.
@@ -1355,9 +1456,13 @@ def get_layer6_status() -> Dict[str, Any]:
 
 
 def get_gate_stats() -> Dict[str, Any]:
-    """Get summary statistics from gate audit log."""
+    """
+    Get summary statistics from gate audit log, plus per-stage gate
+    latency (timings_ms) and the action classification cache.
+    """
     if not GATE_AUDIT_FILE.exists():
-        return {"total": 0, "by_decision": {}, "by_tool": {}}
+        return {"total": 0, "by_decision": {}, "by_tool": {}, "bypasses": 0, "breakglass_uses": 0,
+                "errors": 0, "timings_ms": get_gate_timings(), "classification_cache": _classification_cache_stats()}
 
     total = 0
     by_decision = {}
@@ -1398,4 +1503,14 @@ def get_gate_stats() -> Dict[str, Any]:
         "bypasses": bypasses,
         "breakglass_uses": breakglass,
         "errors": errors,
+        "timings_ms": get_gate_timings(),
+        "classification_cache": _classification_cache_stats(),
     }
+
+
+def _classification_cache_stats() -> Optional[Dict[str, Any]]:
+    try:
+        from autonomy_ladder import get_action_policy
+        return get_action_policy().get_stats()
+    except ImportError:
+        return None
@@ -127,8 +127,9 @@ class ProactiveRecall:
 
         # Step 5: Load full artifacts and format results
         results = []
-        for memory in memories[:limit]:
-            artifact = self.artifact_store.get_artifact(memory["id"])
+        top_memories = memories[:limit]
+        artifacts, _ = self.artifact_store.get_artifacts_many([memory["id"] for memory in top_memories])
+        for memory, artifact in zip(top_memories, artifacts):
             if artifact:
                 results.append(self._format_memory(artifact, memory))
 
@@ -164,13 +165,14 @@ class ProactiveRecall:
 
         # Try hybrid search first
         try:
-            from embeddings import embed_text, is_embedding_available
+            from embeddings import is_embedding_available
+            from embedding_service import embed_query
 
             query_embedding = None
             emb_available = is_embedding_available()
             debug(f"Embedding available: {emb_available}")
             if emb_available:
-                query_embedding = embed_text(context)
+                query_embedding = embed_query(context)
                 debug(f"Got query embedding, shape: {len(query_embedding) if query_embedding else 'None'}")
 
             # Use hybrid search
@@ -346,10 +348,10 @@ class ProactiveRecall:
         related = []
 
         # Get explicit relations
-        relations = self.index.get_relations(artifact_id, direction="both")
-        for rel in relations[:limit]:
-            related_id = rel["target_id"] if rel["source_id"] == artifact_id else rel["source_id"]
-            artifact = self.artifact_store.get_artifact(related_id)
+        relations = self.index.get_relations(artifact_id, direction="both")[:limit]
+        related_ids = [rel["target_id"] if rel["source_id"] == artifact_id else rel["source_id"] for rel in relations]
+        artifacts, _ = self.artifact_store.get_artifacts_many(related_ids)
+        for rel, related_id, artifact in zip(relations, related_ids, artifacts):
             if artifact:
                 related.append({
                     "id": related_id,
@@ -40,7 +40,6 @@ import hashlib
 import hmac
 import json
 import os
-from copy import deepcopy
 from enum import Enum
 from functools import lru_cache
 from typing import Any
@@ -167,10 +166,12 @@ def _signing_payload(artifact: dict) -> dict:
     - provenance.signature (can't sign a value that includes itself)
     - signature_status (computed on load, not stored)
     """
-    payload = deepcopy(artifact)
+    # Shallow copies suffice: only these two keys are dropped, nothing is mutated
+    payload = dict(artifact)
 
     # Remove signature from provenance block
     if "provenance" in payload and isinstance(payload["provenance"], dict):
+        payload["provenance"] = dict(payload["provenance"])
         payload["provenance"].pop("signature", None)
 
     # Remove computed status
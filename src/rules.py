@@ -4,9 +4,21 @@ Handles rule matching, application, and tracking.
 """
 
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# Keyword automaton shared with lib/rule_retriever
+PROJECT_LIB_PATH = str(Path(__file__).resolve().parent.parent / "lib")
+if PROJECT_LIB_PATH not in sys.path:
+    sys.path.append(PROJECT_LIB_PATH)
+
+try:
+    from rule_retriever import KeywordAutomaton
+    KEYWORD_AUTOMATON_AVAILABLE = True
+except ImportError:
+    KEYWORD_AUTOMATON_AVAILABLE = False
 
 
 class DuroRules:
@@ -14,22 +26,50 @@ class DuroRules:
         self.rules_dir = Path(config["paths"]["rules_dir"])
         self.index_file = self.rules_dir / config["files"]["rules_index"]
         self._index_cache = None
+        self._index_signature = None
+        self._matcher = None
+        self._matcher_index = None
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.index_file.stat()
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
 
     def _load_index(self, force_reload: bool = False) -> dict:
-        """Load the rules index."""
-        if self._index_cache is None or force_reload:
-            if self.index_file.exists():
+        """Load the rules index (reloaded when the file's mtime/size change)."""
+        signature = self._file_signature()
+        if self._index_cache is None or force_reload or signature != self._index_signature:
+            if signature is not None:
                 self._index_cache = json.loads(self.index_file.read_text(encoding="utf-8"))
             else:
                 self._index_cache = {"rules": [], "version": "1.0"}
+            self._index_signature = signature
         return self._index_cache
 
     def _save_index(self, index: dict) -> bool:
         """Save the rules index."""
         self.index_file.write_text(json.dumps(index, indent=2), encoding="utf-8")
         self._index_cache = index
+        self._index_signature = self._file_signature()
         return True
 
+    def _keyword_matcher(self):
+        """
+        (automaton, keyword -> [(rule_idx, kw_idx)]) for the current rules,
+        compiled once per loaded index.
+        """
+        index = self._load_index()
+        if self._matcher is None or self._matcher_index is not index:
+            by_keyword: Dict[str, List[Tuple[int, int]]] = {}
+            for rule_idx, rule in enumerate(self.list_rules()):
+                for kw_idx, kw in enumerate(rule.get("trigger_keywords", [])):
+                    by_keyword.setdefault(kw.lower(), []).append((rule_idx, kw_idx))
+            self._matcher = (KeywordAutomaton(by_keyword), by_keyword)
+            self._matcher_index = index
+        return self._matcher
+
     def list_rules(self) -> List[Dict]:
         """List all rules (active + soft)."""
         index = self._load_index()
@@ -64,18 +104,32 @@ class DuroRules:
         applicable = []
         task_lower = task_description.lower()
 
-        for rule in rules:
-            keywords = rule.get("trigger_keywords", [])
-            for kw in keywords:
-                if kw.lower() in task_lower:
-                    # Load full rule content
-                    content = self.load_rule_content(rule)
-                    applicable.append({
-                        "rule": rule,
-                        "content": content,
-                        "matched_keyword": kw
-                    })
-                    break
+        if KEYWORD_AUTOMATON_AVAILABLE:
+            # One pass over the task finds every keyword; each rule reports
+            # its first keyword (in list order) that occurs
+            automaton, by_keyword = self._keyword_matcher()
+            first_hit: Dict[int, int] = {}
+            for kw in automaton.find(task_lower):
+                for rule_idx, kw_idx in by_keyword[kw]:
+                    if kw_idx < first_hit.get(rule_idx, kw_idx + 1):
+                        first_hit[rule_idx] = kw_idx
+            matched = [(rules[i], rules[i]["trigger_keywords"][k]) for i, k in sorted(first_hit.items())]
+        else:
+            matched = []
+            for rule in rules:
+                for kw in rule.get("trigger_keywords", []):
+                    if kw.lower() in task_lower:
+                        matched.append((rule, kw))
+                        break
+
+        for rule, kw in matched:
+            # Load full rule content
+            content = self.load_rule_content(rule)
+            applicable.append({
+                "rule": rule,
+                "content": content,
+                "matched_keyword": kw
+            })
 
         # Sort by priority (1 = highest) and type (hard before soft)
         type_priority = {"hard": 0, "soft": 1}
@@ -0,0 +1,283 @@
+"""
+Run Store - SQLite store for orchestrator run logs.
+
+The orchestrator used to write every run as a pretty-printed
+runs/run_*.json file, and list_runs() globbed, sorted and parsed those
+files until it had enough matches (the whole history for a rare outcome
+filter). This store keeps one row per run:
+
+- run_id, started_at, intent, outcome, duration_ms, dry_run are indexed
+  columns, so listing / filtering / paging is an SQL lookup.
+- The full run dict is stored as zlib-compressed compact JSON.
+- get_stats() aggregates per intent (count, outcomes, avg / p50 / p95
+  duration) without loading run bodies.
+- import_json_dir() imports existing run_*.json files once; the files are
+  left in place.
+"""
+
+import json
+import math
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from time_utils import utc_now_iso
+
+
+RUN_DB_NAME = "runs.db"
+IMPORT_BATCH_SIZE = 500
+
+
+def compress_run(run: Dict[str, Any]) -> bytes:
+    """Compact JSON, zlib-compressed."""
+    return zlib.compress(json.dumps(run, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+def decompress_run(body: bytes) -> Dict[str, Any]:
+    return json.loads(zlib.decompress(body).decode("utf-8"))
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list (None if empty)."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class RunStore:
+    """
+    Orchestrator run logs in SQLite.
+
+    One connection per thread (WAL), so the MCP server and tests can read
+    while a run is being recorded.
+    """
+
+    BUSY_TIMEOUT_MS = 10000
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=self.BUSY_TIMEOUT_MS / 1000,
+                check_same_thread=False,
+            )
+            conn.execute(f"PRAGMA busy_timeout = {self.BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        conn = self._connect()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                started_at TEXT NOT NULL DEFAULT '',
+                intent TEXT,
+                outcome TEXT,
+                duration_ms INTEGER,
+                dry_run INTEGER NOT NULL DEFAULT 0,
+                body BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_at, run_id);
+            CREATE INDEX IF NOT EXISTS idx_runs_outcome ON runs(outcome, started_at, run_id);
+            CREATE INDEX IF NOT EXISTS idx_runs_intent ON runs(intent, started_at, run_id);
+            CREATE INDEX IF NOT EXISTS idx_runs_intent_duration ON runs(intent, duration_ms);
+
+            CREATE TABLE IF NOT EXISTS run_store_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        conn.commit()
+
+    def close(self):
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------
+
+    @staticmethod
+    def _row(run: Dict[str, Any]) -> tuple:
+        execution = run.get("execution", {}) or {}
+        return (
+            run["run_id"],
+            run.get("started_at") or "",
+            run.get("intent_normalized"),
+            execution.get("outcome"),
+            execution.get("duration_ms"),
+            1 if run.get("dry_run") else 0,
+            compress_run(run),
+        )
+
+    def record(self, run: Dict[str, Any]):
+        """Insert or replace one run (the orchestrator's _run_to_dict shape)."""
+        self.record_many([run])
+
+    def record_many(self, runs: Iterable[Dict[str, Any]], replace: bool = True) -> int:
+        """Insert runs in one transaction. Returns rows written."""
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        conn = self._connect()
+        with conn:
+            cursor = conn.executemany(
+                f"{verb} INTO runs (run_id, started_at, intent, outcome, duration_ms, dry_run, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [self._row(run) for run in runs]
+            )
+        return cursor.rowcount
+
+    # ------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Full run dict by ID."""
+        row = self._connect().execute("SELECT body FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return decompress_run(row[0]) if row else None
+
+    def list_runs(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        outcome: Optional[str] = None,
+        intent: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run summaries, newest first.
+
+        Args:
+            limit / offset: Page size and start
+            outcome: Only runs with this outcome
+            intent: Only runs with this normalized intent
+            since / until: started_at bounds (ISO, inclusive / exclusive)
+        """
+        where, params = self._filters(outcome=outcome, intent=intent, since=since, until=until)
+        rows = self._connect().execute(
+            "SELECT run_id, intent, outcome, started_at, duration_ms FROM runs"
+            f"{where} ORDER BY started_at DESC, run_id DESC LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        ).fetchall()
+        return [
+            {"run_id": r[0], "intent": r[1], "outcome": r[2], "started_at": r[3], "duration_ms": r[4]}
+            for r in rows
+        ]
+
+    def count(self, outcome: Optional[str] = None, intent: Optional[str] = None) -> int:
+        where, params = self._filters(outcome=outcome, intent=intent)
+        return self._connect().execute(f"SELECT COUNT(*) FROM runs{where}", params).fetchone()[0]
+
+    @staticmethod
+    def _filters(**filters) -> tuple:
+        clauses, params = [], []
+        ops = {"outcome": "outcome = ?", "intent": "intent = ?", "since": "started_at >= ?", "until": "started_at < ?"}
+        for name, value in filters.items():
+            if value is not None:
+                clauses.append(ops[name])
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def get_stats(self, since: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Per-intent aggregates: runs, outcome counts, avg / p50 / p95 duration_ms.
+        """
+        conn = self._connect()
+        where, params = self._filters(since=since)
+
+        by_intent: Dict[str, Dict[str, Any]] = {}
+        for intent, outcome, n in conn.execute(
+            f"SELECT intent, outcome, COUNT(*) FROM runs{where} GROUP BY intent, outcome", params
+        ):
+            entry = by_intent.setdefault(intent, {"runs": 0, "outcomes": {}})
+            entry["runs"] += n
+            entry["outcomes"][outcome] = n
+
+        for intent, entry in by_intent.items():
+            # "IS" also matches runs without an intent; served by idx_runs_intent_duration
+            sql = "SELECT duration_ms FROM runs WHERE intent IS ? AND duration_ms IS NOT NULL"
+            duration_params: List[Any] = [intent]
+            if since is not None:
+                sql += " AND started_at >= ?"
+                duration_params.append(since)
+            durations = [r[0] for r in conn.execute(sql + " ORDER BY duration_ms", duration_params)]
+            entry["avg_ms"] = round(sum(durations) / len(durations), 1) if durations else None
+            entry["p50_ms"] = percentile(durations, 50)
+            entry["p95_ms"] = percentile(durations, 95)
+
+        return {
+            "total_runs": sum(e["runs"] for e in by_intent.values()),
+            "by_intent": by_intent,
+        }
+
+    # ------------------------------------------------------------
+    # Import
+    # ------------------------------------------------------------
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._connect().execute("SELECT value FROM run_store_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        conn = self._connect()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO run_store_meta (key, value) VALUES (?, ?)", (key, value))
+
+    def request_json_import(self):
+        """Make the next import_json_dir() re-scan (a run was written as JSON only)."""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM run_store_meta WHERE key = 'json_imported_at'")
+
+    def import_json_dir(self, runs_dir: Path, force: bool = False) -> Dict[str, int]:
+        """
+        Import runs/run_*.json files (once; force=True re-scans).
+
+        Runs already in the store are kept. Unreadable files are skipped.
+
+        Returns:
+            {"imported": n, "skipped": n, "failed": n}
+        """
+        result = {"imported": 0, "skipped": 0, "failed": 0}
+        if not force and self.get_meta("json_imported_at"):
+            return result
+
+        batch: List[Dict[str, Any]] = []
+
+        def flush():
+            if batch:
+                written = self.record_many(batch, replace=False)
+                result["imported"] += written
+                result["skipped"] += len(batch) - written
+                batch.clear()
+
+        for run_file in sorted(Path(runs_dir).glob("run_*.json")):
+            try:
+                with open(run_file, "r", encoding="utf-8") as f:
+                    run = json.load(f)
+                run.setdefault("run_id", run_file.stem)
+            except Exception:
+                result["failed"] += 1
+                continue
+            batch.append(run)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                flush()
+        flush()
+
+        self._set_meta("json_imported_at", utc_now_iso())
+        return result
@@ -30,11 +30,20 @@ import json
 
 @dataclass
 class SecretPattern:
-    """Definition of a secret pattern to detect."""
+    """
+    Definition of a secret pattern to detect.
+
+    anchors are lowercase literals the scanner's prefilter looks for
+    (case-insensitively). With anchor_mode "start" every match begins at an
+    anchor; with "line" every match lies on a line containing one. Patterns
+    without anchors are always run over the full text.
+    """
     name: str
     pattern: re.Pattern
     severity: str  # 'critical', 'high', 'medium'
     description: str
+    anchors: Tuple[str, ...] = ()
+    anchor_mode: str = "start"  # start, line
 
 
 # Compiled patterns for performance
@@ -44,7 +53,8 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="generic_api_key",
         pattern=re.compile(r'(?i)(api[_-]?key|apikey)["\s:=]+["\']?([a-zA-Z0-9_\-]{20,})["\']?'),
         severity="critical",
-        description="Generic API key pattern"
+        description="Generic API key pattern",
+        anchors=("api",)
     ),
 
     # AWS
@@ -52,13 +62,15 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="aws_access_key",
         pattern=re.compile(r'(?<![A-Z0-9])AKIA[0-9A-Z]{16}(?![A-Z0-9])'),
         severity="critical",
-        description="AWS Access Key ID"
+        description="AWS Access Key ID",
+        anchors=("akia",)
     ),
     SecretPattern(
         name="aws_secret_key",
         pattern=re.compile(r'(?i)(aws[_-]?secret|secret[_-]?access[_-]?key)["\s:=]+["\']?([a-zA-Z0-9/+=]{40})["\']?'),
         severity="critical",
-        description="AWS Secret Access Key"
+        description="AWS Secret Access Key",
+        anchors=("aws", "secret")
     ),
 
     # OpenAI / Anthropic
@@ -66,19 +78,22 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="openai_api_key",
         pattern=re.compile(r'sk-(?:proj-)?[a-zA-Z0-9]{20,}'),
         severity="critical",
-        description="OpenAI API Key (legacy and project format)"
+        description="OpenAI API Key (legacy and project format)",
+        anchors=("sk-",)
     ),
     SecretPattern(
         name="openai_api_key_new",
         pattern=re.compile(r'sk-(?:proj|org|svcacct)-[a-zA-Z0-9_\-]{20,}'),
         severity="critical",
-        description="OpenAI API Key (new prefixed format)"
+        description="OpenAI API Key (new prefixed format)",
+        anchors=("sk-",)
     ),
     SecretPattern(
         name="anthropic_api_key",
         pattern=re.compile(r'sk-ant-[a-zA-Z0-9\-]{20,}'),
         severity="critical",
-        description="Anthropic API Key"
+        description="Anthropic API Key",
+        anchors=("sk-",)
     ),
 
     # GitHub
@@ -86,31 +101,36 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="github_pat",
         pattern=re.compile(r'ghp_[a-zA-Z0-9]{36}'),
         severity="critical",
-        description="GitHub Personal Access Token (classic)"
+        description="GitHub Personal Access Token (classic)",
+        anchors=("ghp_",)
     ),
     SecretPattern(
         name="github_pat_fine_grained",
         pattern=re.compile(r'github_pat_[a-zA-Z0-9_]{22,}'),
         severity="critical",
-        description="GitHub Personal Access Token (fine-grained)"
+        description="GitHub Personal Access Token (fine-grained)",
+        anchors=("github_pat_",)
     ),
     SecretPattern(
         name="github_oauth",
         pattern=re.compile(r'gho_[a-zA-Z0-9]{36}'),
         severity="critical",
-        description="GitHub OAuth Token"
+        description="GitHub OAuth Token",
+        anchors=("gho_",)
     ),
     SecretPattern(
         name="github_app_token",
         pattern=re.compile(r'ghs_[a-zA-Z0-9]{36}'),
         severity="critical",
-        description="GitHub App Installation Token"
+        description="GitHub App Installation Token",
+        anchors=("ghs_",)
     ),
     SecretPattern(
         name="github_refresh_token",
         pattern=re.compile(r'ghr_[a-zA-Z0-9]{36,}'),
         severity="critical",
-        description="GitHub Refresh Token"
+        description="GitHub Refresh Token",
+        anchors=("ghr_",)
     ),
 
     # Stripe
@@ -118,13 +138,15 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="stripe_secret_key",
         pattern=re.compile(r'sk_(live|test)_[a-zA-Z0-9]{24,}'),
         severity="critical",
-        description="Stripe Secret Key"
+        description="Stripe Secret Key",
+        anchors=("sk_",)
     ),
     SecretPattern(
         name="stripe_publishable_key",
         pattern=re.compile(r'pk_(live|test)_[a-zA-Z0-9]{24,}'),
         severity="high",
-        description="Stripe Publishable Key"
+        description="Stripe Publishable Key",
+        anchors=("pk_",)
     ),
 
     # Database URLs
@@ -132,7 +154,8 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="database_url",
         pattern=re.compile(r'(?i)(postgres|mysql|mongodb|redis)://[^:]+:[^@]+@[^\s"\']+'),
         severity="critical",
-        description="Database connection string with credentials"
+        description="Database connection string with credentials",
+        anchors=("postgres", "mysql", "mongodb", "redis")
     ),
 
     # JWT
@@ -140,7 +163,8 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="jwt_token",
         pattern=re.compile(r'eyJ[a-zA-Z0-9_-]{10,}\.eyJ[a-zA-Z0-9_-]{10,}\.[a-zA-Z0-9_-]{10,}'),
         severity="high",
-        description="JWT Token"
+        description="JWT Token",
+        anchors=("eyj",)
     ),
 
     # Private Keys
@@ -148,7 +172,8 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="private_key",
         pattern=re.compile(r'-----BEGIN (?:RSA |EC |DSA |OPENSSH )?PRIVATE KEY-----'),
         severity="critical",
-        description="Private Key Header"
+        description="Private Key Header",
+        anchors=("-----begin ",)
     ),
 
     # Passwords in common formats - requires actual assignment syntax (= or :)
@@ -157,14 +182,16 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="password_assignment",
         pattern=re.compile(r'(?i)(?<![a-z])(password|passwd|pwd)\s*["\']?\s*[:=]\s*["\']?([^\s"\']{8,})["\']?'),
         severity="high",
-        description="Password assignment (password=, password:, etc.)"
+        description="Password assignment (password=, password:, etc.)",
+        anchors=("passw", "pwd")
     ),
     # Secret assignment - more strict to avoid "secrets policy" false positives
     SecretPattern(
         name="secret_assignment",
         pattern=re.compile(r'(?i)(?<![a-z])secret\s*["\']?\s*[:=]\s*["\']?([^\s"\']{8,})["\']?'),
         severity="high",
-        description="Secret assignment (secret=, secret:, etc.)"
+        description="Secret assignment (secret=, secret:, etc.)",
+        anchors=("secret",)
     ),
 
     # Bearer tokens
@@ -172,7 +199,8 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="bearer_token",
         pattern=re.compile(r'(?i)bearer\s+[a-zA-Z0-9_\-\.]{20,}'),
         severity="high",
-        description="Bearer token"
+        description="Bearer token",
+        anchors=("bearer",)
     ),
 
     # Basic auth
@@ -180,7 +208,8 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="basic_auth",
         pattern=re.compile(r'(?i)basic\s+[a-zA-Z0-9+/=]{20,}'),
         severity="high",
-        description="Basic auth header"
+        description="Basic auth header",
+        anchors=("basic",)
     ),
 
     # Slack tokens
@@ -188,7 +217,8 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="slack_token",
         pattern=re.compile(r'xox[baprs]-[a-zA-Z0-9\-]{10,}'),
         severity="critical",
-        description="Slack token"
+        description="Slack token",
+        anchors=("xox",)
     ),
 
     # Discord tokens
@@ -204,7 +234,8 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="ssh_key",
         pattern=re.compile(r'ssh-(?:rsa|ed25519|dss)\s+[A-Za-z0-9+/=]{50,}'),
         severity="high",
-        description="SSH public key (may indicate private key nearby)"
+        description="SSH public key (may indicate private key nearby)",
+        anchors=("ssh-",)
     ),
 
     # Google Cloud
@@ -212,7 +243,8 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="gcp_api_key",
         pattern=re.compile(r'AIza[0-9A-Za-z\-_]{35}'),
         severity="critical",
-        description="Google Cloud API Key"
+        description="Google Cloud API Key",
+        anchors=("aiza",)
     ),
 
     # Azure
@@ -220,7 +252,8 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="azure_connection_string",
         pattern=re.compile(r'(?i)DefaultEndpointsProtocol=https?;AccountName=[^;]+;AccountKey=[^;]+'),
         severity="critical",
-        description="Azure Storage connection string"
+        description="Azure Storage connection string",
+        anchors=("defaultendpointsprotocol=",)
     ),
 
     # Generic secrets in env format
@@ -228,7 +261,9 @@ SECRET_PATTERNS: List[SecretPattern] = [
         name="env_secret",
         pattern=re.compile(r'(?i)^([A-Z_]+(?:KEY|SECRET|TOKEN|PASSWORD|PASSWD|CREDENTIALS|AUTH))[=:]\s*(.{8,})$', re.MULTILINE),
         severity="medium",
-        description="Environment variable with secret-like name"
+        description="Environment variable with secret-like name",
+        anchors=("key", "secret", "token", "passw", "credentials", "auth"),
+        anchor_mode="line"
     ),
 ]
 
@@ -300,6 +335,177 @@ def redact_secret(secret: str, prefix_len: int = 4, suffix_len: int = 2) -> str:
     return f"{secret[:prefix_len]}***{secret[-suffix_len:]}"
 
 
+# ============================================================
+# COMPILED SCANNER
+# ============================================================
+
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters but
+# str.lower() leaves alone. ("İ" lowers to two chars and forces a fallback.)
+_CASE_FOLD_EXTRA = str.maketrans({"\u017f": "s", "\u0131": "i"})
+
+
+def _fold_case(content: str) -> Optional[str]:
+    """
+    Lowercase content for anchor lookup, keeping character positions.
+
+    Returns None if folding would shift positions; callers then run
+    every pattern over the full text.
+    """
+    folded = content.lower()
+    if len(folded) != len(content):
+        return None
+    if not folded.isascii():
+        folded = folded.translate(_CASE_FOLD_EXTRA)
+    return folded
+
+
+class CompiledSecretScanner:
+    """
+    Anchor prefilter in front of the secret patterns.
+
+    Running finditer for every pattern over a multi-MB tool output costs one
+    full regex pass per pattern. Instead the text is case-folded once and
+    each anchor literal is located with str.find (a C substring search; an
+    alternation of all anchors in re is slower than the patterns it would
+    skip). Then per pattern:
+
+    - no anchor present: the pattern is skipped
+    - a few hits: the pattern is only tried at the hits ("start") or at the
+      start of their lines ("line")
+    - many hits: one finditer over the text is cheaper than per-hit calls
+
+    Patterns without anchors always get a full finditer. Results equal
+    finditer per pattern: pattern order, then non-overlapping left to right.
+    """
+
+    MIN_WINDOW_BUDGET = 32
+    BYTES_PER_WINDOW = 128  # Allow one windowed match per this many chars
+
+    def __init__(self, patterns: List[SecretPattern]):
+        self.patterns = patterns
+
+    def _anchor_hits(self, folded: str, literal: str, budget: int) -> Optional[List[int]]:
+        """Positions of literal in folded, or None if there are more than budget."""
+        hits = []
+        pos = folded.find(literal)
+        while pos != -1:
+            if len(hits) >= budget:
+                return None
+            hits.append(pos)
+            pos = folded.find(literal, pos + 1)
+        return hits
+
+    def scan(self, content: str) -> List[Tuple[SecretPattern, re.Match]]:
+        """Return (pattern, match) pairs in pattern order."""
+        found = []
+        folded = _fold_case(content)
+        budget = max(self.MIN_WINDOW_BUDGET, len(content) // self.BYTES_PER_WINDOW)
+        hits_by_anchor: Dict[str, Optional[List[int]]] = {}
+
+        for sp in self.patterns:
+            starts: Optional[Set[int]] = set()
+            if not sp.anchors or folded is None:
+                starts = None
+            else:
+                for anchor in sp.anchors:
+                    if anchor not in hits_by_anchor:
+                        hits_by_anchor[anchor] = self._anchor_hits(folded, anchor, budget)
+                    hits = hits_by_anchor[anchor]
+                    if hits is None:
+                        starts = None
+                        break
+                    if sp.anchor_mode == "line":
+                        starts.update(content.rfind("\n", 0, pos) + 1 for pos in hits)
+                    else:
+                        starts.update(hits)
+                if starts is not None and len(starts) > budget:
+                    starts = None
+
+            if starts is None:
+                found.extend((sp, match) for match in sp.pattern.finditer(content))
+                continue
+
+            last_end = 0
+            for pos in sorted(starts):
+                if pos < last_end:
+                    continue  # Inside the previous match, as finditer would skip it
+                match = sp.pattern.match(content, pos)
+                if match:
+                    found.append((sp, match))
+                    last_end = match.end()
+
+        return found
+
+
+_SCANNERS: Dict[bool, CompiledSecretScanner] = {}
+
+
+def get_scanner(include_pii: bool = False) -> CompiledSecretScanner:
+    """Get the compiled scanner for SECRET_PATTERNS (+ PII_PATTERNS)."""
+    scanner = _SCANNERS.get(include_pii)
+    if scanner is None:
+        scanner = CompiledSecretScanner(SECRET_PATTERNS + (PII_PATTERNS if include_pii else []))
+        _SCANNERS[include_pii] = scanner
+    return scanner
+
+
+def _secret_value(match: re.Match) -> str:
+    """Get the actual secret value (might be in a group)."""
+    if match.groups():
+        # Use last non-None group (usually the actual secret)
+        return next((g for g in reversed(match.groups()) if g), match.group(0))
+    return match.group(0)
+
+
+def _scan_spans(content: str, include_pii: bool = False) -> Tuple[List[SecretMatch], List[Tuple[int, int]]]:
+    """Scan content, returning SecretMatches and their (start, end) spans."""
+    matches = []
+    spans = []
+    for sp, match in get_scanner(include_pii).scan(content):
+        secret_value = _secret_value(match)
+        matches.append(SecretMatch(
+            pattern_name=sp.name,
+            severity=sp.severity,
+            location=f"char {match.start()}-{match.end()}",
+            redacted_preview=redact_secret(secret_value),
+            hash=compute_secret_hash(secret_value)
+        ))
+        spans.append(match.span())
+    return matches, spans
+
+
+def _redact_spans(
+    content: str,
+    matches: List[SecretMatch],
+    spans: List[Tuple[int, int]],
+    marker,
+) -> Tuple[str, int]:
+    """
+    Replace matched spans in one pass.
+
+    Overlapping matches (e.g. two OpenAI key formats on the same token)
+    collapse into one region, labelled by its earliest match. Returns
+    (redacted_content, regions_redacted).
+    """
+    order = sorted(range(len(spans)), key=lambda i: (spans[i][0], -spans[i][1], i))
+    parts = []
+    cursor = 0  # End of the last redacted region
+    regions = 0
+    for i in order:
+        start, end = spans[i]
+        if start < cursor:
+            cursor = max(cursor, end)  # Overlaps the current region: extend it
+            continue
+        parts.append(content[cursor:start])
+        parts.append(marker(matches[i]))
+        cursor = end
+        regions += 1
+    if not regions:
+        return content, 0
+    parts.append(content[cursor:])
+    return "".join(parts), regions
+
+
 def scan_string(content: str, include_pii: bool = False) -> SecretScanResult:
     """
     Scan a string for secrets.
@@ -311,29 +517,8 @@ def scan_string(content: str, include_pii: bool = False) -> SecretScanResult:
     Returns:
         SecretScanResult with matches and blocking recommendation
     """
-    matches = []
-    patterns = SECRET_PATTERNS + (PII_PATTERNS if include_pii else [])
-    has_critical = False
-
-    for sp in patterns:
-        for match in sp.pattern.finditer(content):
-            # Get the actual secret value (might be in a group)
-            if match.groups():
-                # Use last non-None group (usually the actual secret)
-                secret_value = next((g for g in reversed(match.groups()) if g), match.group(0))
-            else:
-                secret_value = match.group(0)
-
-            matches.append(SecretMatch(
-                pattern_name=sp.name,
-                severity=sp.severity,
-                location=f"char {match.start()}-{match.end()}",
-                redacted_preview=redact_secret(secret_value),
-                hash=compute_secret_hash(secret_value)
-            ))
-
-            if sp.severity == "critical":
-                has_critical = True
+    matches, _ = _scan_spans(content, include_pii)
+    has_critical = any(m.severity == "critical" for m in matches)
 
     return SecretScanResult(
         has_secrets=len(matches) > 0,
@@ -392,14 +577,9 @@ def redact_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """
     def redact_value(value: Any) -> Any:
         if isinstance(value, str):
-            result = scan_string(value)
-            if result.matches:
-                # Replace each match with redacted version
-                redacted = value
-                for match in sorted(result.matches, key=lambda m: int(m.location.split()[1].split('-')[0]), reverse=True):
-                    # Extract original position
-                    start, end = map(int, match.location.replace('char ', '').split('-'))
-                    redacted = redacted[:start] + f"[REDACTED:{match.hash}]" + redacted[end:]
+            matches, spans = _scan_spans(value)
+            if matches:
+                redacted, _ = _redact_spans(value, matches, spans, lambda m: f"[REDACTED:{m.hash}]")
                 return redacted
             return value
 
@@ -619,37 +799,20 @@ def scan_and_redact_output(output: str, tool_name: str = "") -> OutputScanResult
         return OutputScanResult(had_secrets=False, redacted_output=output or "")
 
     # Scan for secrets
-    scan_result = scan_string(output, include_pii=False)
+    matches, spans = _scan_spans(output, include_pii=False)
 
-    if not scan_result.has_secrets:
+    if not matches:
         return OutputScanResult(had_secrets=False, redacted_output=output)
 
-    # Redact each match (process in reverse order to preserve positions)
-    redacted = output
-    sorted_matches = sorted(
-        scan_result.matches,
-        key=lambda m: int(m.location.split()[1].split('-')[0]) if 'char' in m.location else 0,
-        reverse=True
+    # Redact with hash for correlation (one pass, overlapping matches merged)
+    redacted, redaction_count = _redact_spans(
+        output, matches, spans, lambda m: f"[REDACTED:{m.hash}]"
     )
 
-    redaction_count = 0
-    for match in sorted_matches:
-        try:
-            # Extract position from location string "char X-Y"
-            if 'char' in match.location:
-                pos_str = match.location.replace('char ', '')
-                start, end = map(int, pos_str.split('-'))
-                # Redact with hash for correlation
-                redacted = redacted[:start] + f"[REDACTED:{match.hash}]" + redacted[end:]
-                redaction_count += 1
-        except (ValueError, IndexError):
-            # If we can't parse position, skip (shouldn't happen)
-            continue
-
     return OutputScanResult(
         had_secrets=True,
         redacted_output=redacted,
-        matches=scan_result.matches,
+        matches=matches,
         redaction_count=redaction_count
     )
 
@@ -762,9 +925,9 @@ def redact_incoming_content(
         )
 
     # Scan for secrets
-    scan_result = scan_string(content, include_pii=include_pii)
+    matches, spans = _scan_spans(content, include_pii=include_pii)
 
-    if not scan_result.has_secrets:
+    if not matches:
         return IncomingRedactionResult(
             original_had_secrets=False,
             redacted_content=content,
@@ -774,30 +937,13 @@ def redact_incoming_content(
         )
 
     # Collect metadata before redaction
-    secret_hashes = [m.hash for m in scan_result.matches]
-    pattern_names = list(set(m.pattern_name for m in scan_result.matches))
-
-    # Redact each match (process in reverse order to preserve positions)
-    redacted = content
-    sorted_matches = sorted(
-        scan_result.matches,
-        key=lambda m: int(m.location.split()[1].split('-')[0]) if 'char' in m.location else 0,
-        reverse=True
-    )
+    secret_hashes = [m.hash for m in matches]
+    pattern_names = list(set(m.pattern_name for m in matches))
 
-    redaction_count = 0
-    for match in sorted_matches:
-        try:
-            # Extract position from location string "char X-Y"
-            if 'char' in match.location:
-                pos_str = match.location.replace('char ', '')
-                start, end = map(int, pos_str.split('-'))
-                # Redact with type and hash for debugging
-                redacted = redacted[:start] + f"[REDACTED:{match.pattern_name}:{match.hash}]" + redacted[end:]
-                redaction_count += 1
-        except (ValueError, IndexError):
-            # If we can't parse position, skip
-            continue
+    # Redact with type and hash for debugging (one pass, overlapping matches merged)
+    redacted, redaction_count = _redact_spans(
+        content, matches, spans, lambda m: f"[REDACTED:{m.pattern_name}:{m.hash}]"
+    )
 
     return IncomingRedactionResult(
         original_had_secrets=True,
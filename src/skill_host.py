@@ -0,0 +1,498 @@
+"""
+Warm skill host for Duro skill execution.
+
+DuroSkills.run_skill() used to start a fresh interpreter per call
+(`python <skill>.py --key value`), paying interpreter startup and every
+import again for skills that run dozens of times a session. The host keeps
+a small pool of pre-started worker processes instead:
+
+- Workers are `python skill_host.py` processes; requests are JSON-RPC 2.0
+  style lines on their stdin ({"method": "run", "params": {path, args,
+  context}}) and responses come back as lines on their stdout
+- Skills exposing run(args, tools, context) with no required capabilities
+  are imported once per worker (re-imported when the file changes) and
+  called directly with the JSON args
+- Script-style skills run their __main__ inside the warm worker with the
+  same argv, cwd and stdout/stderr contract as the old subprocess call;
+  their dependencies stay imported between calls
+- Process state a skill can change (cwd, sys.argv, sys.path, os.environ,
+  stdout/stderr, modules imported from the skills dir, and the run()
+  module's globals) is snapshotted and restored around every call
+- Per-call timeouts kill the worker (a runaway skill can't be interrupted
+  any other way); crashed workers are replaced; a worker is recycled after
+  max_calls_per_worker calls so leaked state doesn't accumulate
+- SkillHostUnavailable is raised only when no worker could take the call;
+  once a request is dispatched, every failure is reported as a failed run
+  (the skill may already have run, so callers must not retry it elsewhere)
+
+Workers are plain subprocesses rather than multiprocessing children, so
+nothing is forked out of the threaded server and nothing re-imports its
+__main__. Skill output is captured and returned in the response; stray
+writes to a worker's stdout are sent to its stderr so they can't corrupt
+the protocol.
+"""
+
+import ast
+import contextlib
+import io
+import itertools
+import json
+import os
+import queue
+import runpy
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Host Config
+# ===========
+
+SKILL_HOST_CONFIG = {
+    "workers": 2,                 # Pre-started worker processes
+    "max_calls_per_worker": 50,   # Recycle a worker after this many calls
+    "timeout_s": 300,             # Per-call limit (matches the old subprocess timeout)
+}
+
+# JSON-RPC error codes
+ERROR_SKILL_FAILED = -32000
+ERROR_INVALID_REQUEST = -32600
+
+
+class SkillHostUnavailable(RuntimeError):
+    """No worker could be started (or the host is closed); nothing was dispatched."""
+
+
+# Worker side
+# ===========
+
+def _skill_interface(path: Path) -> Tuple[bool, List[str]]:
+    """
+    (has_run, requires) from a skill's source, without executing it.
+
+    Importing a script-style skill would run it, so the interface is read
+    from the AST: a top-level def run and a literal REQUIRES list.
+    """
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    has_run = False
+    requires: List[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "run":
+            has_run = True
+        elif isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "REQUIRES" for t in node.targets
+        ):
+            try:
+                requires = list(ast.literal_eval(node.value))
+            except ValueError:
+                requires = ["<dynamic>"]
+    return has_run, requires
+
+
+@contextlib.contextmanager
+def _skill_dir_on_path(path: Path):
+    """Put the skill's directory first on sys.path, as `python skill.py` does."""
+    skill_dir = str(path.parent)
+    sys.path.insert(0, skill_dir)
+    try:
+        yield
+    finally:
+        try:
+            sys.path.remove(skill_dir)
+        except ValueError:
+            pass
+
+
+def _is_under(file: str, root: str) -> bool:
+    try:
+        return os.path.commonpath([os.path.abspath(file), root]) == root
+    except ValueError:  # Different drives
+        return False
+
+
+@contextlib.contextmanager
+def _restored_process_state(skills_root: str):
+    """
+    Undo process-wide changes a skill makes during one call.
+
+    Modules newly imported from the skills dir are dropped (two skills may
+    ship same-named helpers); other new imports stay warm. Modules that
+    existed before the call are put back if a skill rebound or removed them.
+    """
+    cwd = os.getcwd()
+    argv = list(sys.argv)
+    path = list(sys.path)
+    environ = dict(os.environ)
+    stdout, stderr = sys.stdout, sys.stderr
+    modules = dict(sys.modules)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+        sys.argv = argv
+        sys.path[:] = path
+        if dict(os.environ) != environ:
+            os.environ.clear()
+            os.environ.update(environ)
+        sys.stdout, sys.stderr = stdout, stderr
+        for name in [n for n in sys.modules if n not in modules]:
+            module_file = getattr(sys.modules[name], "__file__", None)
+            if module_file and _is_under(module_file, skills_root):
+                del sys.modules[name]
+        for name, module in modules.items():
+            if sys.modules.get(name) is not module:
+                sys.modules[name] = module
+
+
+class _WorkerState:
+    """Per-worker caches of skill interfaces and imported modules, by mtime."""
+
+    def __init__(self):
+        self.interfaces: Dict[str, Tuple[int, bool, List[str]]] = {}
+        self.modules: Dict[str, Tuple[int, Any]] = {}
+
+    def interface(self, path: Path) -> Tuple[bool, List[str]]:
+        mtime = path.stat().st_mtime_ns
+        cached = self.interfaces.get(str(path))
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, *_skill_interface(path))
+            self.interfaces[str(path)] = cached
+        return cached[1], cached[2]
+
+    def module(self, path: Path):
+        import importlib.util
+
+        mtime = path.stat().st_mtime_ns
+        cached = self.modules.get(str(path))
+        if cached is None or cached[0] != mtime:
+            spec = importlib.util.spec_from_file_location(path.stem, path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot load skill module: {path}")
+            module = importlib.util.module_from_spec(spec)
+            with _skill_dir_on_path(path):
+                spec.loader.exec_module(module)
+            cached = (mtime, module)
+            self.modules[str(path)] = cached
+        return cached[1]
+
+
+def _run_module(module, path: Path, args: Dict, context: Dict) -> Dict[str, Any]:
+    """Call run(args, {}, context) on an imported skill; its globals are restored afterwards."""
+    captured = io.StringIO()
+    module_globals = dict(module.__dict__)
+    try:
+        with _skill_dir_on_path(path), contextlib.redirect_stdout(captured):
+            result = module.run(args, {}, context)
+    finally:
+        module.__dict__.clear()
+        module.__dict__.update(module_globals)
+
+    if isinstance(result, dict):
+        success = bool(result.get("success", True))
+    else:
+        success = result is not None
+    return {"success": success, "output": json.dumps(result, indent=2, default=str)}
+
+
+def _run_script(path: Path, args: Dict) -> Dict[str, Any]:
+    """Run a skill's __main__ with `--key value` argv, like the old subprocess."""
+    argv = [str(path)]
+    for key, value in (args or {}).items():
+        argv.extend([f"--{key}", str(value)])
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = argv
+    exit_code = 0
+    try:
+        with _skill_dir_on_path(path), contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                runpy.run_path(str(path), run_name="__main__")
+            except SystemExit as e:
+                if e.code is None:
+                    exit_code = 0
+                elif isinstance(e.code, int):
+                    exit_code = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        sys.argv = saved_argv
+
+    if exit_code == 0:
+        return {"success": True, "output": stdout.getvalue()}
+    return {"success": False, "output": f"Error: {stderr.getvalue()}"}
+
+
+def _handle_request(request: Dict[str, Any], state: _WorkerState, skills_root: str) -> Dict[str, Any]:
+    response: Dict[str, Any] = {"jsonrpc": "2.0", "id": request.get("id")}
+    params = request.get("params") or {}
+    if request.get("method") != "run" or "path" not in params:
+        response["error"] = {"code": ERROR_INVALID_REQUEST, "message": "Expected method 'run' with a skill path"}
+        return response
+
+    path = Path(params["path"])
+    args = params.get("args") or {}
+    try:
+        with _restored_process_state(skills_root):
+            has_run, requires = state.interface(path)
+            # Tools can't cross the process boundary; skills that need them run as scripts
+            if has_run and not requires:
+                response["result"] = _run_module(state.module(path), path, args, params.get("context") or {})
+            else:
+                response["result"] = _run_script(path, args)
+    except BaseException as e:
+        response["error"] = {"code": ERROR_SKILL_FAILED, "message": f"{type(e).__name__}: {e}"}
+    return response
+
+
+def _worker_main():
+    """Worker loop: one JSON request line in, one JSON response line out, until EOF."""
+    # Keep the real stdout for responses; everything else written there goes to stderr
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    state = _WorkerState()
+    skills_root = os.path.abspath(os.getcwd())
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError:
+            request = {}
+        response = _handle_request(request, state, skills_root)
+        protocol.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+        protocol.flush()
+
+
+# Host side
+# =========
+
+class _Worker:
+    """A worker process; a reader thread queues its response lines."""
+
+    def __init__(self, cwd: str):
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", str(Path(__file__).resolve())],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=cwd,
+        )
+        self.calls = 0
+        self._responses: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in self.process.stdout:
+            self._responses.put(line)
+        self._responses.put(None)  # EOF: the worker exited
+
+    def request(self, payload: bytes, timeout: float) -> bytes:
+        """
+        Send one request line and wait for its response line.
+
+        Raises TimeoutError if none arrives in time, EOFError if the worker died.
+        """
+        try:
+            self.process.stdin.write(payload + b"\n")
+            self.process.stdin.flush()
+        except OSError:
+            raise EOFError("worker stdin closed")
+        try:
+            line = self._responses.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError
+        if line is None:
+            raise EOFError("worker exited")
+        return line
+
+    def stop(self):
+        """Close stdin so the worker exits; kill it if it doesn't."""
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        self.kill()
+
+    def kill(self):
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.wait(timeout=5)
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class SkillHost:
+    """
+    Pool of warm skill workers.
+
+    Usage:
+        host = SkillHost(cwd=skills_dir)
+        success, output = host.run(skill_path, {"query": "..."}, timeout=60)
+    """
+
+    def __init__(
+        self,
+        cwd: str,
+        workers: int = SKILL_HOST_CONFIG["workers"],
+        max_calls_per_worker: int = SKILL_HOST_CONFIG["max_calls_per_worker"],
+    ):
+        self.cwd = str(cwd)
+        self.size = max(1, workers)
+        self.max_calls_per_worker = max(1, max_calls_per_worker)
+        self._idle: List[_Worker] = []
+        self._started = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._ids = itertools.count(1)
+
+        self._stats = {"calls": 0, "timeouts": 0, "crashes": 0, "recycled": 0}
+        self._latency: Dict[str, Dict[str, float]] = {}
+
+    def start(self):
+        """Pre-start the pool so the first calls don't pay process startup."""
+        with self._cond:
+            while self._started < self.size:
+                self._idle.append(_Worker(self.cwd))
+                self._started += 1
+
+    def _acquire(self) -> _Worker:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise SkillHostUnavailable("Skill host is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._started < self.size:
+                    self._started += 1
+                    break
+                self._cond.wait()
+        try:
+            return _Worker(self.cwd)
+        except Exception as e:
+            with self._cond:
+                self._started -= 1
+                self._cond.notify()
+            raise SkillHostUnavailable(f"Cannot start skill worker: {e}") from e
+
+    def _release(self, worker: _Worker, healthy: bool):
+        recycle = not healthy or worker.calls >= self.max_calls_per_worker
+        with self._cond:
+            retire = recycle or self._closed
+            if retire:
+                self._started -= 1
+                self._stats["recycled"] += recycle
+            else:
+                self._idle.append(worker)
+            self._cond.notify()
+
+        if not healthy:
+            worker.kill()
+        elif retire:
+            worker.stop()
+
+    def run(
+        self,
+        skill_path: Path,
+        args: Optional[Dict] = None,
+        context: Optional[Dict] = None,
+        timeout: float = SKILL_HOST_CONFIG["timeout_s"],
+    ) -> Tuple[bool, str]:
+        """
+        Run a skill in a warm worker. Returns (success, output).
+
+        Raises SkillHostUnavailable only if no worker can be started, before
+        anything is sent. Once the request is dispatched, skill failures,
+        timeouts, worker crashes and unreadable responses are returned as
+        (False, message).
+        """
+        request = {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": "run",
+            "params": {"path": str(skill_path), "args": args or {}, "context": context or {}},
+        }
+        worker = self._acquire()
+        start = time.perf_counter()
+        healthy = False
+        try:
+            worker.calls += 1
+            response = json.loads(worker.request(json.dumps(request, default=str).encode("utf-8"), timeout))
+            healthy = True
+        except TimeoutError:
+            self._count("timeouts")
+            return False, f"Skill execution timed out ({timeout:g}s limit)"
+        except EOFError:
+            try:
+                exit_code = worker.process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                exit_code = None
+            self._count("crashes")
+            return False, f"Skill worker crashed (exit code {exit_code})"
+        except Exception as e:
+            return False, f"Skill host error: {type(e).__name__}: {e}"
+        finally:
+            self._record(Path(skill_path).stem, (time.perf_counter() - start) * 1000)
+            self._release(worker, healthy)
+
+        if "error" in response:
+            return False, f"Execution error: {response['error']['message']}"
+        result = response.get("result") or {}
+        return bool(result.get("success")), result.get("output", "")
+
+    def _count(self, key: str):
+        with self._cond:
+            self._stats[key] += 1
+
+    def _record(self, skill: str, latency_ms: float):
+        with self._cond:
+            self._stats["calls"] += 1
+            entry = self._latency.setdefault(skill, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["calls"] += 1
+            entry["total_ms"] += latency_ms
+            entry["max_ms"] = max(entry["max_ms"], latency_ms)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool counters and per-skill call latency."""
+        with self._cond:
+            return {
+                **self._stats,
+                "workers": self._started,
+                "idle": len(self._idle),
+                "max_calls_per_worker": self.max_calls_per_worker,
+                "latency_ms": {
+                    name: {
+                        "calls": e["calls"],
+                        "avg": round(e["total_ms"] / e["calls"], 2),
+                        "max": round(e["max_ms"], 2),
+                    }
+                    for name, e in self._latency.items()
+                },
+            }
+
+    def close(self):
+        """Stop idle workers; busy ones are stopped when their call returns."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._started -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.stop()
+
+
+if __name__ == "__main__":
+    _worker_main()
@@ -9,6 +9,10 @@ Skill Interface Convention:
 
 The orchestrator builds the tools dict with capability wrappers.
 Skills never see server names - they just call tools["search"], tools["read"], etc.
+
+run_skill() executes in a pool of warm worker processes (see skill_host.py)
+unless settings.skill_host is false, in which case each call starts a new
+interpreter as before.
 """
 
 import os
@@ -17,6 +21,7 @@ import importlib.util
 import subprocess
 import sys
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Callable, Any
@@ -29,6 +34,12 @@ class DuroSkills:
         self.log_usage = config["settings"].get("log_skill_usage", True)
         self._index_cache = None
 
+        self.use_skill_host = config["settings"].get("skill_host", True)
+        self.skill_host_workers = config["settings"].get("skill_host_workers")
+        self.skill_host_max_calls = config["settings"].get("skill_host_max_calls")
+        self._host = None
+        self._host_lock = threading.Lock()
+
     def _load_index(self, force_reload: bool = False) -> dict:
         """Load the skills index."""
         if self._index_cache is None or force_reload:
@@ -93,10 +104,52 @@ class DuroSkills:
         """Get the full path to a skill's Python file."""
         return self.skills_dir / skill["path"]
 
+    def _get_skill_host(self):
+        """The warm skill host, started on first use (None when disabled)."""
+        if not self.use_skill_host:
+            return None
+        with self._host_lock:
+            if self._host is None:
+                from skill_host import SkillHost, SKILL_HOST_CONFIG
+
+                self._host = SkillHost(
+                    cwd=str(self.skills_dir),
+                    workers=self.skill_host_workers or SKILL_HOST_CONFIG["workers"],
+                    max_calls_per_worker=self.skill_host_max_calls or SKILL_HOST_CONFIG["max_calls_per_worker"],
+                )
+            return self._host
+
+    def get_skill_host_stats(self) -> Optional[Dict]:
+        """Worker pool counters and per-skill latency, if the host has started."""
+        return self._host.get_stats() if self._host else None
+
+    def start_skill_host(self) -> bool:
+        """Pre-start the skill host's workers. Returns False when the host is disabled."""
+        host = self._get_skill_host()
+        if host is None:
+            return False
+        host.start()
+        return True
+
+    def close(self) -> None:
+        """Stop skill host workers."""
+        with self._host_lock:
+            host, self._host = self._host, None
+            self.use_skill_host = False
+        if host:
+            host.close()
+
     def run_skill(self, skill_name: str, args: Dict = None) -> Tuple[bool, str]:
         """
         Execute a skill by name.
         Returns (success, output).
+
+        Runs in a warm skill host worker: skills exposing run() without
+        required capabilities get args as-is; script-style skills get them
+        as `--key value` argv. Falls back to a fresh interpreter only if the
+        host can't start a worker; once a call reaches a worker, its outcome
+        (including a lost or unreadable response) is final, so a skill never
+        runs twice.
         """
         skill = self.get_skill(skill_name)
         if not skill:
@@ -106,6 +159,29 @@ class DuroSkills:
         if not skill_path.exists():
             return False, f"Skill file not found: {skill_path}"
 
+        start = time.perf_counter()
+        host = self._get_skill_host()
+        if host is not None:
+            from skill_host import SkillHostUnavailable
+
+            try:
+                success, output = host.run(skill_path, args, context={"skill": skill_name})
+            except SkillHostUnavailable:
+                pass  # Nothing was dispatched; run it the old way
+            else:
+                self._update_skill_stats(skill_name, success, (time.perf_counter() - start) * 1000)
+                return success, output
+
+        return self._run_skill_subprocess(skill_name, skill_path, args, start)
+
+    def _run_skill_subprocess(
+        self,
+        skill_name: str,
+        skill_path: Path,
+        args: Optional[Dict],
+        start: float
+    ) -> Tuple[bool, str]:
+        """Run a skill in a new interpreter (one process per call)."""
         try:
             # Build command
             cmd = [sys.executable, str(skill_path)]
@@ -125,7 +201,10 @@ class DuroSkills:
             )
 
             # Update usage stats
-            self._update_skill_stats(skill_name, success=(result.returncode == 0))
+            self._update_skill_stats(
+                skill_name, success=(result.returncode == 0),
+                duration_ms=(time.perf_counter() - start) * 1000
+            )
 
             if result.returncode == 0:
                 return True, result.stdout
@@ -133,10 +212,10 @@ class DuroSkills:
                 return False, f"Error: {result.stderr}"
 
         except subprocess.TimeoutExpired:
-            self._update_skill_stats(skill_name, success=False)
+            self._update_skill_stats(skill_name, success=False, duration_ms=(time.perf_counter() - start) * 1000)
             return False, "Skill execution timed out (5 min limit)"
         except Exception as e:
-            self._update_skill_stats(skill_name, success=False)
+            self._update_skill_stats(skill_name, success=False, duration_ms=(time.perf_counter() - start) * 1000)
             return False, f"Execution error: {str(e)}"
 
     def run_skill_with_tools(
@@ -198,22 +277,24 @@ class DuroSkills:
                 except Exception as e:
                     exception_holder[0] = e
 
+            start = time.perf_counter()
             thread = threading.Thread(target=execute)
             thread.start()
             thread.join(timeout=timeout_seconds)
+            duration_ms = (time.perf_counter() - start) * 1000
 
             if thread.is_alive():
                 # Timeout - thread still running
-                self._update_skill_stats(skill_name, success=False)
+                self._update_skill_stats(skill_name, success=False, duration_ms=duration_ms)
                 return False, {"error": f"Skill timed out after {timeout_seconds}s", "timeout": True}
 
             if exception_holder[0]:
-                self._update_skill_stats(skill_name, success=False)
+                self._update_skill_stats(skill_name, success=False, duration_ms=duration_ms)
                 return False, {"error": str(exception_holder[0])}
 
             # Check result
             success = result.get("success", False) if isinstance(result, dict) else False
-            self._update_skill_stats(skill_name, success=success)
+            self._update_skill_stats(skill_name, success=success, duration_ms=duration_ms)
 
             return success, result
 
@@ -243,8 +324,8 @@ class DuroSkills:
         except Exception:
             return None
 
-    def _update_skill_stats(self, skill_name: str, success: bool) -> None:
-        """Update usage statistics for a skill."""
+    def _update_skill_stats(self, skill_name: str, success: bool, duration_ms: Optional[float] = None) -> None:
+        """Update usage statistics (and call latency, when measured) for a skill."""
         if not self.log_usage:
             return
 
@@ -259,6 +340,13 @@ class DuroSkills:
                     skill["success_rate"] = ((current_rate * (total - 1)) + 1) / total
                 else:
                     skill["success_rate"] = (current_rate * (total - 1)) / total
+                if duration_ms is not None:
+                    # Running mean over calls that measured latency
+                    timed = skill.get("timed_calls", 0) + 1
+                    avg = skill.get("avg_latency_ms", 0.0)
+                    skill["timed_calls"] = timed
+                    skill["avg_latency_ms"] = round(avg + (duration_ms - avg) / timed, 2)
+                    skill["last_latency_ms"] = round(duration_ms, 2)
                 skill["last_used"] = datetime.now().isoformat()
                 break
 
@@ -9,10 +9,12 @@ Handles:
 """
 from __future__ import annotations
 
+import heapq
+import threading
 import time
 import uuid
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -34,6 +36,13 @@ class ResultBuffer:
     Buffers autonomy results for later surfacing.
 
     Storage model: persisted "events" with dedupe_key to prevent repeat spam.
+    With an event_table (autonomy_state.BufferEventTable) each event is its
+    own row and only changed rows are written. Without one, the queue is
+    saved as a single JSON value under "autonomy.buffer" (legacy).
+
+    In memory the events are indexed by id and dedupe_key, with two heaps
+    (best-first for peek/pop, worst-first for trimming to MAX_EVENTS) using
+    lazy deletion, so enqueue, dedupe updates and pops are O(log n).
 
     Expected event schema:
       {
@@ -48,35 +57,96 @@ class ResultBuffer:
     """
 
     MAX_EVENTS = 200
+    STATE_KEY = "autonomy.buffer"
 
-    def __init__(self, load_state_cb: Callable, save_state_cb: Callable):
+    def __init__(self, load_state_cb: Callable, save_state_cb: Callable, event_table: Any = None):
         self._load_state = load_state_cb
         self._save_state = save_state_cb
+        self._table = event_table
 
-        self._queue: List[Dict[str, Any]] = []
+        self._events: Dict[str, Dict[str, Any]] = {}
+        # event_id -> (priority, updated_at_unix, seq); seq keeps FIFO order among ties
+        self._order: Dict[str, Tuple[int, int, int]] = {}
+        self._best: List[Tuple[int, int, int, str]] = []   # (-priority, -updated, seq, id)
+        self._worst: List[Tuple[int, int, int, str]] = []  # (priority, updated, -seq, id)
         self._by_dedupe: Dict[str, str] = {}  # dedupe_key -> event_id
+        self._next_seq = 0
+        self._lock = threading.RLock()
         self._hydrate()
 
     def _hydrate(self) -> None:
-        data = self._load_state("autonomy.buffer", default={"queue": []}) or {"queue": []}
-        self._queue = list(data.get("queue", []))
-        self._rebuild_dedupe_index()
-
-    def _persist(self) -> None:
-        self._save_state("autonomy.buffer", {"queue": self._queue})
-
-    def _rebuild_dedupe_index(self) -> None:
-        self._by_dedupe = {}
-        for ev in self._queue:
-            dk = ev.get("dedupe_key")
-            if dk:
-                self._by_dedupe[str(dk)] = ev["id"]
-
-    def _sort_trim(self) -> None:
-        # Higher priority first; newer first
-        self._queue.sort(key=lambda x: (-int(x.get("priority", 0)), -int(x.get("updated_at_unix", 0))))
-        if len(self._queue) > self.MAX_EVENTS:
-            self._queue = self._queue[: self.MAX_EVENTS]
+        rows: List[Tuple[Dict[str, Any], int]] = []
+        if self._table is not None:
+            rows = self._table.load()
+        if not rows:
+            data = self._load_state(self.STATE_KEY, default={"queue": []}) or {"queue": []}
+            rows = [(ev, seq) for seq, ev in enumerate(data.get("queue", []))]
+            if rows and self._table is not None:
+                # One-time move from the JSON blob to the event table
+                self._table.upsert_many(rows)
+                self._save_state(self.STATE_KEY, {"queue": []})
+
+        for ev, seq in rows:
+            self._index(ev, seq)
+            self._next_seq = max(self._next_seq, seq + 1)
+        removed = self._trim()
+        if removed and self._table is not None:
+            self._table.delete(removed)
+
+    def _index(self, ev: Dict[str, Any], seq: int) -> None:
+        key = (int(ev.get("priority", 0)), int(ev.get("updated_at_unix", 0)), seq)
+        ev_id = ev["id"]
+        self._events[ev_id] = ev
+        self._order[ev_id] = key
+        heapq.heappush(self._best, (-key[0], -key[1], seq, ev_id))
+        heapq.heappush(self._worst, (key[0], key[1], -seq, ev_id))
+        dk = ev.get("dedupe_key")
+        if dk:
+            self._by_dedupe[str(dk)] = ev_id
+
+    def _remove(self, ev_id: str) -> None:
+        ev = self._events.pop(ev_id)
+        self._order.pop(ev_id, None)
+        dk = ev.get("dedupe_key")
+        if dk and self._by_dedupe.get(str(dk)) == ev_id:
+            del self._by_dedupe[str(dk)]
+
+    def _is_live(self, ev_id: str, priority: int, updated: int, seq: int) -> bool:
+        return self._order.get(ev_id) == (priority, updated, seq)
+
+    def _trim(self) -> List[str]:
+        """Drop the lowest-ranked events past MAX_EVENTS. Returns dropped ids."""
+        removed = []
+        while len(self._events) > self.MAX_EVENTS and self._worst:
+            priority, updated, neg_seq, ev_id = heapq.heappop(self._worst)
+            if self._is_live(ev_id, priority, updated, -neg_seq):
+                self._remove(ev_id)
+                removed.append(ev_id)
+        return removed
+
+    def _compact(self) -> None:
+        """Rebuild the heaps once stale entries outnumber live ones."""
+        if len(self._best) + len(self._worst) <= 4 * len(self._order) + 64:
+            return
+        self._best = [(-p, -u, seq, ev_id) for ev_id, (p, u, seq) in self._order.items()]
+        self._worst = [(p, u, -seq, ev_id) for ev_id, (p, u, seq) in self._order.items()]
+        heapq.heapify(self._best)
+        heapq.heapify(self._worst)
+
+    def _ranked(self) -> List[Dict[str, Any]]:
+        """All events, higher priority first, newer first."""
+        ids = sorted(self._order, key=lambda i: (-self._order[i][0], -self._order[i][1], self._order[i][2]))
+        return [self._events[i] for i in ids]
+
+    def _persist(self, changed: Optional[List[str]] = None, removed: Optional[List[str]] = None) -> None:
+        if self._table is None:
+            self._save_state(self.STATE_KEY, {"queue": self._ranked()})
+            return
+        for ev_id in changed or []:
+            if ev_id in self._events:
+                self._table.upsert(self._events[ev_id], self._order[ev_id][2])
+        if removed:
+            self._table.delete(removed)
 
     def enqueue(
         self,
@@ -88,39 +158,41 @@ class ResultBuffer:
         now = int(time.time())
         dedupe_key = str(dedupe_key) if dedupe_key else None
 
-        # Dedupe: update existing event instead of adding new
-        if dedupe_key and dedupe_key in self._by_dedupe:
-            ev_id = self._by_dedupe[dedupe_key]
-            for ev in self._queue:
-                if ev["id"] == ev_id:
-                    ev["payload"] = payload
-                    ev["priority"] = int(priority)
-                    ev["updated_at_unix"] = now
-                    self._sort_trim()
-                    self._persist()
-                    return ev_id
-
-        ev_id = str(uuid.uuid4())
-        ev = {
-            "id": ev_id,
-            "type": str(event_type),
-            "priority": int(priority),
-            "payload": payload or {},
-            "created_at_unix": now,
-            "updated_at_unix": now,
-            "dedupe_key": dedupe_key,
-        }
-        self._queue.append(ev)
-        if dedupe_key:
-            self._by_dedupe[dedupe_key] = ev_id
-
-        self._sort_trim()
-        self._persist()
-        return ev_id
+        with self._lock:
+            # Dedupe: update existing event instead of adding new
+            if dedupe_key and dedupe_key in self._by_dedupe:
+                ev_id = self._by_dedupe[dedupe_key]
+                ev = self._events[ev_id]
+                ev["payload"] = payload
+                ev["priority"] = int(priority)
+                ev["updated_at_unix"] = now
+                self._index(ev, self._order[ev_id][2])
+            else:
+                ev_id = str(uuid.uuid4())
+                ev = {
+                    "id": ev_id,
+                    "type": str(event_type),
+                    "priority": int(priority),
+                    "payload": payload or {},
+                    "created_at_unix": now,
+                    "updated_at_unix": now,
+                    "dedupe_key": dedupe_key,
+                }
+                self._index(ev, self._next_seq)
+                self._next_seq += 1
+
+            removed = self._trim()
+            self._persist(changed=[ev_id], removed=removed)
+            self._compact()
+            return ev_id
 
     def peek(self, max_items: int = 3) -> List[Dict[str, Any]]:
-        self._sort_trim()
-        return list(self._queue[: max(0, int(max_items))])
+        with self._lock:
+            top = heapq.nsmallest(
+                max(0, int(max_items)), self._order.items(),
+                key=lambda item: (-item[1][0], -item[1][1], item[1][2])
+            )
+            return [self._events[ev_id] for ev_id, _ in top]
 
     def pop_for_surfacing(
         self,
@@ -132,37 +204,57 @@ class ResultBuffer:
         """
         Pop the top items, optionally filtering by type and/or min priority.
         """
-        self._sort_trim()
-
-        filtered = self._queue
-        if type_filter:
-            allowed = set(type_filter)
-            filtered = [ev for ev in filtered if ev.get("type") in allowed]
-        if min_priority is not None:
-            mp = int(min_priority)
-            filtered = [ev for ev in filtered if int(ev.get("priority", 0)) >= mp]
-
-        picked = filtered[: max(0, int(max_items))]
-        if not picked:
-            return []
-
-        picked_ids = {ev["id"] for ev in picked}
-        self._queue = [ev for ev in self._queue if ev["id"] not in picked_ids]
-        self._rebuild_dedupe_index()
-        self._persist()
-        return picked
+        limit = max(0, int(max_items))
+        allowed = set(type_filter) if type_filter else None
+        mp = int(min_priority) if min_priority is not None else None
+
+        with self._lock:
+            picked: List[Dict[str, Any]] = []
+            skipped = []
+            while self._best and len(picked) < limit:
+                entry = heapq.heappop(self._best)
+                neg_priority, neg_updated, seq, ev_id = entry
+                if not self._is_live(ev_id, -neg_priority, -neg_updated, seq):
+                    continue
+                skipped.append(entry)
+                if mp is not None and -neg_priority < mp:
+                    break  # Everything after this ranks lower
+                ev = self._events[ev_id]
+                if allowed is not None and ev.get("type") not in allowed:
+                    continue
+                skipped.pop()
+                picked.append(ev)
+
+            for entry in skipped:
+                heapq.heappush(self._best, entry)
+            if not picked:
+                return []
+
+            picked_ids = [ev["id"] for ev in picked]
+            for ev_id in picked_ids:
+                self._remove(ev_id)
+            self._persist(removed=picked_ids)
+            self._compact()
+            return picked
 
     def size(self) -> int:
         """Return current queue size."""
-        return len(self._queue)
+        return len(self._events)
 
     def clear(self) -> int:
         """Clear all events. Returns count cleared."""
-        count = len(self._queue)
-        self._queue = []
-        self._by_dedupe = {}
-        self._persist()
-        return count
+        with self._lock:
+            count = len(self._events)
+            self._events = {}
+            self._order = {}
+            self._best = []
+            self._worst = []
+            self._by_dedupe = {}
+            if self._table is not None:
+                self._table.clear()
+            else:
+                self._persist()
+            return count
 
 
 class FeedbackTracker:
@@ -0,0 +1,221 @@
+"""
+Write-behind worker for derived artifact index data.
+
+With write-behind enabled, ArtifactStore._store_artifact() acknowledges a
+save once the JSON file and the artifacts index row are durable. The
+derived work (FTS text, embeddings) is queued here. A background thread
+coalesces it into group commits: one FTS transaction and one batched
+embedding call per batch instead of several connections per save.
+
+Crash safety: only derived data is ever in memory. Anything lost on a
+crash shows up as missing FTS text / embeddings and is repaired by the
+existing health check, duro_reembed and rebuild_fts paths.
+"""
+
+import sys
+import threading
+import time
+from typing import Callable, Optional
+
+
+class WriteBehindWorker:
+    """
+    Bounded, coalescing queue for post-save index work.
+
+    Repeated saves of the same artifact before a batch runs collapse into
+    one entry (latest wins). When the queue is full, submit() returns False
+    and the caller does the work inline, so memory stays bounded and saves
+    are never dropped.
+    """
+
+    DEFAULT_MAX_QUEUE = 1000
+    DEFAULT_BATCH_SIZE = 64
+    DEFAULT_LINGER_MS = 50  # Wait this long for more saves to join a batch
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[dict]], None],
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        linger_ms: int = DEFAULT_LINGER_MS
+    ):
+        """
+        Args:
+            process_batch: Called on the worker thread with a list of artifacts
+            max_queue: Max distinct artifacts waiting (backpressure bound)
+            batch_size: Max artifacts per group commit
+            linger_ms: How long to wait for a batch to fill before committing
+        """
+        self._process_batch = process_batch
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.linger_ms = linger_ms
+
+        self._pending: dict[str, dict] = {}  # artifact_id -> latest artifact (insertion ordered)
+        self._in_flight = 0
+        self._flush_waiters = 0
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._stats = {
+            "submitted": 0,
+            "coalesced": 0,
+            "rejected_full": 0,
+            "batches": 0,
+            "processed": 0,
+            "errors": 0,
+            "max_depth_seen": 0,
+            "last_batch_size": 0,
+            "last_batch_ms": 0.0,
+            "last_error": None
+        }
+
+    def start(self):
+        """Start the background thread (idempotent)."""
+        with self._cond:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name="duro_write_behind", daemon=True
+            )
+            self._thread.start()
+
+    def submit(self, artifact: dict) -> bool:
+        """
+        Queue derived index work for an artifact. Non-blocking.
+
+        Returns False if the queue is full or the worker is stopped;
+        the caller should then process the artifact inline.
+        """
+        artifact_id = artifact["id"]
+        with self._cond:
+            if self._stopping:
+                return False
+            if artifact_id in self._pending:
+                # Coalesce: newer content replaces the queued one
+                self._pending[artifact_id] = artifact
+                self._stats["coalesced"] += 1
+                self._stats["submitted"] += 1
+                return True
+            if len(self._pending) >= self.max_queue:
+                self._stats["rejected_full"] += 1
+                return False
+            self._pending[artifact_id] = artifact
+            self._stats["submitted"] += 1
+            self._stats["max_depth_seen"] = max(self._stats["max_depth_seen"], len(self._pending))
+            self._cond.notify_all()
+        return True
+
+    def discard(self, artifact_id: str) -> bool:
+        """Drop queued work for an artifact (e.g. it was deleted). Returns True if dropped."""
+        with self._cond:
+            return self._pending.pop(artifact_id, None) is not None
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until everything queued so far has been committed.
+
+        Returns True if drained, False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flush_waiters += 1
+            self._cond.notify_all()  # Wake the worker so it skips the linger wait
+            try:
+                return self._wait_drained_locked(deadline)
+            finally:
+                self._flush_waiters -= 1
+
+    def _wait_drained_locked(self, deadline: Optional[float]) -> bool:
+        """Wait until nothing is pending or in flight. Caller holds the lock."""
+        while self._pending or self._in_flight:
+            if self._pending and (self._thread is None or not self._thread.is_alive()):
+                # No worker (never started / died) - drain on this thread
+                batch = self._take_batch_locked()
+                self._cond.release()
+                try:
+                    self._run_batch(batch)
+                finally:
+                    self._cond.acquire()
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._cond.wait(remaining)
+        return True
+
+    def stop(self, flush: bool = True, timeout: Optional[float] = 10.0):
+        """Stop the worker, draining the queue first if flush=True."""
+        if flush:
+            self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread:
+            thread.join(timeout)
+
+    def get_stats(self) -> dict:
+        """Queue depth and throughput counters for health reporting."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats["queue_depth"] = len(self._pending)
+            stats["in_flight"] = self._in_flight
+            stats["max_queue"] = self.max_queue
+            stats["batch_size"] = self.batch_size
+            stats["running"] = bool(self._thread and self._thread.is_alive() and not self._stopping)
+        return stats
+
+    def _take_batch_locked(self) -> list[dict]:
+        """Pop up to batch_size artifacts (FIFO). Caller holds the lock."""
+        batch = []
+        for artifact_id in list(self._pending)[:self.batch_size]:
+            batch.append(self._pending.pop(artifact_id))
+        self._in_flight += len(batch)
+        return batch
+
+    def _run_batch(self, batch: list[dict]):
+        """Process one batch and update counters. Never raises."""
+        if not batch:
+            return
+        start = time.perf_counter()
+        try:
+            self._process_batch(batch)
+            error = None
+        except Exception as e:
+            error = str(e)
+            print(f"[WARN] Write-behind batch failed: {e}", file=sys.stderr)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        with self._cond:
+            self._in_flight -= len(batch)
+            self._stats["batches"] += 1
+            self._stats["last_batch_size"] = len(batch)
+            self._stats["last_batch_ms"] = round(elapsed_ms, 2)
+            if error:
+                self._stats["errors"] += 1
+                self._stats["last_error"] = error
+            else:
+                self._stats["processed"] += len(batch)
+            self._cond.notify_all()
+
+    def _run(self):
+        """Worker loop: wait for work, linger briefly to fill a batch, commit."""
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopping:
+                    self._cond.wait()
+                if self._stopping and not self._pending:
+                    return
+                # Linger so bursts of saves share one group commit
+                linger_until = time.monotonic() + self.linger_ms / 1000
+                while (len(self._pending) < self.batch_size
+                       and not self._stopping and not self._flush_waiters):
+                    remaining = linger_until - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._take_batch_locked()
+            self._run_batch(batch)
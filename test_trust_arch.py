@@ -4,6 +4,7 @@ Tests the verification_state, blast_radius, and verified field fixes.
 """
 import sys
 import os
+from pathlib import Path
 
 # Set HMAC key
 os.environ["DURO_PROVENANCE_HMAC_KEYS"] = "v1:d2cfb01f37385f2f935f4d2ac36b0b867af52038f0d3b49552d116cb51111a11"
@@ -11,8 +12,9 @@ os.environ["DURO_PROVENANCE_HMAC_KEYS"] = "v1:d2cfb01f37385f2f935f4d2ac36b0b867a
 sys.path.insert(0, "src")
 from artifacts import ArtifactStore
 
-MEMORY_DIR = "C:/Users/sibag/.agent/memory"
-DB_PATH = "C:/Users/sibag/.agent/duro_index.db"
+AGENT_HOME = Path(os.environ.get("DURO_AGENT_HOME", str(Path.home() / ".agent")))
+MEMORY_DIR = AGENT_HOME / "memory"
+DB_PATH = AGENT_HOME / "duro_index.db"
 
 store = ArtifactStore(MEMORY_DIR, DB_PATH)
 test_facts = []
@@ -0,0 +1,204 @@
+"""
+Tests for the compiled action policy and gate stage timings.
+
+Tests cover:
+- ActionPolicy classifies exactly like the uncompiled from_action() chain
+- Results are memoized per action, bounded, and rebuilt by reload_action_policy()
+- policy_gate() records per-stage latency, reported by get_gate_stats()
+"""
+
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import autonomy_ladder
+import policy_gate
+from autonomy_ladder import (
+    ActionPolicy,
+    ActionRisk,
+    classify_action_domain,
+    get_action_policy,
+    reload_action_policy,
+)
+
+
+def reference_from_action(action: str, context=None) -> ActionRisk:
+    """The pre-compiled from_action(): tables rebuilt on every call."""
+    context = context if isinstance(context, dict) else {}
+    DESTRUCTIVE_ACTIONS = set(autonomy_ladder.DESTRUCTIVE_ACTIONS)
+    SAFE_WRITE_ACTIONS = set(autonomy_ladder.SAFE_WRITE_ACTIONS)
+    PLAN_ACTIONS = set(autonomy_ladder.PLAN_ACTIONS)
+    READ_ACTIONS = set(autonomy_ladder.READ_ACTIONS)
+    action_lower = action.lower().strip()
+
+    if action_lower in DESTRUCTIVE_ACTIONS:
+        return ActionRisk.DESTRUCTIVE
+    if action_lower in SAFE_WRITE_ACTIONS:
+        return ActionRisk.SAFE_WRITE
+    if action_lower in PLAN_ACTIONS:
+        return ActionRisk.PLAN
+    if action_lower in READ_ACTIONS:
+        return ActionRisk.READ
+
+    for risk, prefixes, suffixes in [
+        (ActionRisk.DESTRUCTIVE, ("delete_", "remove_", "drop_", "destroy_", "force_"),
+         ("_delete", "_remove", "_drop", "_destroy", "_force")),
+        (ActionRisk.SAFE_WRITE, ("edit_", "write_", "update_", "store_", "save_", "create_"),
+         ("_edit", "_write", "_update", "_store", "_save", "_create")),
+        (ActionRisk.PLAN, ("plan_", "propose_", "draft_", "design_"), ("_plan", "_proposal", "_draft")),
+        (ActionRisk.READ, ("read_", "get_", "fetch_", "query_", "list_", "search_"),
+         ("_read", "_get", "_fetch", "_query", "_list", "_search")),
+    ]:
+        if any(action_lower.startswith(p) for p in prefixes):
+            return risk
+        if any(action_lower.endswith(s) for s in suffixes):
+            return risk
+
+    if ":" in action_lower:
+        _, args_part = action_lower.split(":", 1)
+        if any(k in args_part for k in ("rm -rf", "rm -r", "rmdir", "del /s", "rd /s", "drop ", "truncate ",
+                                        "delete from", "git push -f", "git push --force",
+                                        "git reset --hard", "--force", "-f ")):
+            return ActionRisk.DESTRUCTIVE
+
+    if context.get("is_destructive"):
+        return ActionRisk.DESTRUCTIVE
+    if context.get("affects_production") and not context.get("is_reversible", True):
+        return ActionRisk.CRITICAL
+    if context.get("affects_production"):
+        return ActionRisk.DESTRUCTIVE
+    return ActionRisk.SAFE_WRITE
+
+
+def reference_domain(action: str) -> str:
+    normalized = action[5:] if action.startswith("duro_") else action
+    return autonomy_ladder.ACTION_DOMAINS.get(normalized, "general")
+
+
+PARTS = ["delete", "store", "get", "plan", "draft", "read", "fact", "file", "duro", "force", "bash",
+         "command", "query", "memory", "design", "proposal", "artifact", "git", "push", "Deploy", "prod"]
+
+
+def random_action(rng: random.Random) -> str:
+    action = "_".join(rng.sample(PARTS, rng.randint(1, 3)))
+    roll = rng.random()
+    if roll < 0.15:
+        action += ":" + rng.choice(["rm -rf /tmp", "ls -la", "git push --force", "echo hi", "cat -f x"])
+    elif roll < 0.25:
+        action = rng.choice([" ", ""]) + action.upper() + rng.choice([" ", ""])
+    return action
+
+
+def random_context(rng: random.Random):
+    return rng.choice([
+        None, {}, "not a dict", {"is_destructive": True}, {"affects_production": True},
+        {"affects_production": True, "is_reversible": False}, {"affects_production": 1, "is_reversible": 0},
+    ])
+
+
+class TestActionPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = ActionPolicy()
+
+    def test_matches_reference_classification(self):
+        rng = random.Random(1)
+        actions = [random_action(rng) for _ in range(2000)]
+        actions += list(autonomy_ladder.DESTRUCTIVE_ACTIONS | autonomy_ladder.SAFE_WRITE_ACTIONS
+                        | autonomy_ladder.PLAN_ACTIONS | autonomy_ladder.READ_ACTIONS)
+        actions += [f"duro_{a}" for a in autonomy_ladder.ACTION_DOMAINS]
+        for action in actions:
+            context = random_context(rng)
+            self.assertEqual(self.policy.classify_risk(action, context), reference_from_action(action, context), action)
+            self.assertEqual(self.policy.classify_domain(action), reference_domain(action), action)
+
+    def test_context_not_cached_with_name(self):
+        self.assertEqual(self.policy.classify_risk("frobnicate"), ActionRisk.SAFE_WRITE)
+        self.assertEqual(self.policy.classify_risk("frobnicate", {"is_destructive": True}), ActionRisk.DESTRUCTIVE)
+        self.assertEqual(self.policy.classify_risk("frobnicate"), ActionRisk.SAFE_WRITE)
+
+    def test_memoized_and_bounded(self):
+        for _ in range(5):
+            self.policy.classify_risk("duro_store_fact")
+            self.policy.classify_domain("duro_store_fact")
+        self.assertEqual(self.policy.get_stats(), {"cached_actions": 1, "hits": 9, "misses": 1})
+
+        with patch.object(ActionPolicy, "MAX_CACHED_ACTIONS", 10):
+            for i in range(25):
+                self.policy.classify_risk(f"bash_command:echo {i}")
+        self.assertLessEqual(self.policy.get_stats()["cached_actions"], 10)
+
+    def test_reload_picks_up_table_changes(self):
+        self.assertEqual(classify_action_domain("duro_frobnicate"), "general")
+        with patch.dict(autonomy_ladder.ACTION_DOMAINS, {"frobnicate": "knowledge"}):
+            self.assertEqual(classify_action_domain("duro_frobnicate"), "general")  # Cached tables
+            reload_action_policy()
+            self.assertEqual(classify_action_domain("duro_frobnicate"), "knowledge")
+        reload_action_policy()
+        self.assertIsNot(get_action_policy(), self.policy)
+
+
+class TestGateTimings(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.patches = [
+            patch.object(policy_gate, "GATE_AUDIT_FILE", self.tmp / "gate_decisions.jsonl"),
+            patch.object(policy_gate, "DEBUG_ARGS_FILE", self.tmp / "gate_debug_args.jsonl"),
+            patch.object(policy_gate, "UNIFIED_AUDIT_AVAILABLE", False),
+            patch.object(policy_gate, "INTENT_GUARD_AVAILABLE", False),
+            patch.object(policy_gate, "RULES_GUARD_AVAILABLE", False),
+        ]
+        for p in self.patches:
+            p.start()
+        policy_gate.reset_gate_timings()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        policy_gate.reset_gate_timings()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def gate(self, tool_name: str, allowed: bool = True):
+        permission = SimpleNamespace(allowed=allowed, requires_approval=False, reason="test")
+        return policy_gate.policy_gate(
+            tool_name, {"query": "x"},
+            check_action_fn=lambda *args: permission,
+            classify_domain_fn=classify_action_domain,
+            classify_risk_fn=lambda t, a: ActionRisk.from_action(t, a),
+        )
+
+    def test_stages_recorded(self):
+        for _ in range(3):
+            self.assertTrue(self.gate("duro_query_memory").allowed)
+
+        stats = policy_gate.get_gate_stats()
+        timings = stats["timings_ms"]
+        self.assertEqual(
+            list(timings),
+            ["classify", "permission", "workspace", "secrets", "browser", "intent", "rules", "audit", "total"]
+        )
+        self.assertTrue(all(t["count"] == 3 for t in timings.values()))
+        self.assertGreaterEqual(timings["total"]["total_ms"], timings["audit"]["total_ms"])
+        self.assertEqual(stats["total"], 3)
+        self.assertIn("hits", stats["classification_cache"])
+
+    def test_early_return_skips_later_stages(self):
+        self.gate(next(iter(policy_gate.GATE_BYPASS_TOOLS)))
+        self.assertEqual(set(policy_gate.get_gate_timings()), {"audit", "total"})
+
+    def test_stats_without_audit_file(self):
+        stats = policy_gate.get_gate_stats()
+        self.assertEqual((stats["total"], stats["bypasses"], stats["timings_ms"]), (0, 0, {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
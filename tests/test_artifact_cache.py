@@ -0,0 +1,238 @@
+"""
+Tests for the verified-artifact read cache behind ArtifactStore.get_artifact.
+
+Tests cover:
+- Cached reads return the same artifact (and signature_status) as uncached reads
+- Copy-on-read: mutating a returned artifact never reaches the cache
+- update_artifact / store / delete invalidate; external file edits miss
+- Tampered artifacts are re-verified (and warned about) on every read
+- LRU bound, hit-rate counters, and key rotation re-verifying
+- A read that races a same-size rewrite within one mtime tick is not cached
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from artifact_cache import ArtifactReadCache, clone_json, file_signature
+from artifacts import ArtifactStore
+from migrations import run_all_pending
+from provenance_signing import clear_key_cache, sign_artifact
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+TEST_KEYS = "v1:" + "cd" * 32
+
+
+class ArtifactCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.memory_dir = Path(self.temp_dir) / "memory"
+        self.memory_dir.mkdir(parents=True)
+        self.db_path = self.memory_dir / "index.db"
+
+        self.patches = [
+            patch.dict(os.environ, {"DURO_PROVENANCE_HMAC_KEYS": TEST_KEYS}),
+            patch("embeddings.embed_artifact", return_value=None),
+        ]
+        for p in self.patches:
+            p.start()
+        clear_key_cache()
+
+        self.store = ArtifactStore(self.memory_dir, self.db_path, write_behind=False)
+        run_all_pending(MIGRATIONS_DIR, str(self.db_path))
+
+    def tearDown(self):
+        self.store.index.close()
+        for p in reversed(self.patches):
+            p.stop()
+        clear_key_cache()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def store_facts(self, n: int) -> list:
+        ids = []
+        for i in range(n):
+            ok, artifact_id, _ = self.store.store_fact(
+                claim=f"cached claim number {i}", tags=["cache", f"t{i % 3}"], confidence=0.6
+            )
+            self.assertTrue(ok, artifact_id)
+            ids.append(artifact_id)
+        return ids
+
+    def uncached_store(self) -> ArtifactStore:
+        store = ArtifactStore(self.memory_dir, self.db_path, write_behind=False)
+        store.read_cache = ArtifactReadCache(max_entries=0)
+        return store
+
+    def rewrite_file(self, artifact_id: str, mutate):
+        path = Path(self.store.index.get_by_id(artifact_id)["file_path"])
+        artifact = json.loads(path.read_text(encoding="utf-8"))
+        mutate(artifact)
+        path.write_text(json.dumps(artifact, indent=2), encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestReadCache(ArtifactCacheTestCase):
+
+    def test_cached_reads_match_uncached(self):
+        ids = self.store_facts(5)
+        reference = self.uncached_store()
+        for _ in range(3):
+            for artifact_id in ids:
+                got = self.store.get_artifact(artifact_id)
+                self.assertEqual(got, reference.get_artifact(artifact_id))
+                self.assertEqual(got["signature_status"], "valid")
+
+        stats = self.store.get_read_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (10, 5, 5))
+        self.assertAlmostEqual(stats["hit_rate"], 10 / 15, places=3)
+        self.assertIsNone(self.store.get_artifact("fact_missing"))
+
+    def test_copy_on_read(self):
+        artifact_id = self.store_facts(1)[0]
+        first = self.store.get_artifact(artifact_id)
+        first["data"]["claim"] = "corrupted"
+        first["tags"].append("corrupted")
+
+        second = self.store.get_artifact(artifact_id)
+        self.assertEqual(second["data"]["claim"], "cached claim number 0")
+        self.assertNotIn("corrupted", second["tags"])
+
+    def test_invalidated_by_writes_and_delete(self):
+        artifact_id = self.store_facts(1)[0]
+        artifact = self.store.get_artifact(artifact_id)
+
+        artifact["data"]["confidence"] = 0.9
+        ok, _ = self.store.update_artifact(artifact, re_embed=False)
+        self.assertTrue(ok)
+        self.assertEqual(self.store.get_artifact(artifact_id)["data"]["confidence"], 0.9)
+
+        artifact = self.store.get_artifact(artifact_id)
+        artifact["tags"] = ["restored"]
+        self.store._store_artifact(artifact)
+        self.assertEqual(self.store.get_artifact(artifact_id)["tags"], ["restored"])
+
+        ok, _ = self.store.delete_artifact(artifact_id, reason="test", skip_backup=True)
+        self.assertTrue(ok)
+        self.assertIsNone(self.store.get_artifact(artifact_id))
+        self.assertGreaterEqual(self.store.get_read_cache_stats()["invalidations"], 3)
+
+    def test_external_edit_misses_and_tamper_is_not_cached(self):
+        artifact_id = self.store_facts(1)[0]
+        self.assertEqual(self.store.get_artifact(artifact_id)["signature_status"], "valid")
+
+        self.rewrite_file(artifact_id, lambda a: a["data"].update(claim="edited behind our back"))
+        with patch("sys.stderr") as stderr:
+            for _ in range(2):
+                got = self.store.get_artifact(artifact_id)
+                self.assertEqual(got["data"]["claim"], "edited behind our back")
+                self.assertEqual(got["signature_status"], "invalid")
+        warnings = [c for c in stderr.write.call_args_list if "INVALID signature" in str(c)]
+        self.assertEqual(len(warnings), 2)
+        self.assertEqual(self.store.get_read_cache_stats()["entries"], 0)
+
+    def test_read_racing_same_tick_rewrite_is_not_cached(self):
+        artifact_id = self.store_facts(1)[0]
+        path = Path(self.store.index.get_by_id(artifact_id)["file_path"])
+        read_file = self.store._read_artifact_file
+
+        def read_then_rewrite(file_path):
+            read = read_file(file_path)
+            # A same-size, validly signed rewrite lands in the same mtime tick,
+            # then the writer invalidates (as update_artifact does)
+            on_disk = json.loads(path.read_text(encoding="utf-8"))
+            had_status = "signature_status" in on_disk
+            on_disk["data"]["confidence"] = 0.5
+            sign_artifact(on_disk)
+            if not had_status:
+                on_disk.pop("signature_status")
+            path.write_text(json.dumps(on_disk, indent=2, ensure_ascii=False), encoding="utf-8")
+            mtime_ns, size = read[0]
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+            self.assertEqual(file_signature(str(path)), read[0])
+            self.store.read_cache.invalidate(artifact_id)
+            return read
+
+        with patch.object(self.store, "_read_artifact_file", side_effect=read_then_rewrite):
+            stale = self.store.get_artifact(artifact_id)
+        self.assertEqual(stale["data"]["confidence"], 0.6)  # The racing read itself saw the old file
+
+        got = self.store.get_artifact(artifact_id)
+        self.assertEqual(got["data"]["confidence"], 0.5)
+        self.assertEqual(got["signature_status"], "valid")
+        self.assertEqual(self.store.get_read_cache_stats()["dropped_puts"], 1)
+
+    def test_key_rotation_reverifies(self):
+        artifact_id = self.store_facts(1)[0]
+        self.assertEqual(self.store.get_artifact(artifact_id)["signature_status"], "valid")
+
+        with patch.dict(os.environ, {"DURO_PROVENANCE_HMAC_KEYS": "v2:" + "ef" * 32}):
+            clear_key_cache()
+            self.assertEqual(self.store.get_artifact(artifact_id)["signature_status"], "unknown_key")
+        clear_key_cache()
+        self.assertEqual(self.store.get_artifact(artifact_id)["signature_status"], "valid")
+
+
+class TestArtifactReadCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_lru_bound(self):
+        cache = ArtifactReadCache(max_entries=3)
+        path = self.tmp / "a.json"
+        path.write_text("{}", encoding="utf-8")
+        sig = (path.stat().st_mtime_ns, path.stat().st_size)
+        for i in range(5):
+            cache.put(f"a{i}", str(path), sig, "k", {"id": f"a{i}"}, cache.generation())
+            if i >= 1:
+                cache.get("a0", "k")  # Keep a0 hot
+
+        self.assertEqual(cache.get_stats()["entries"], 3)
+        self.assertEqual(cache.get_stats()["evictions"], 2)
+        self.assertIsNotNone(cache.get("a0", "k"))
+        self.assertIsNone(cache.get("a1", "k"))
+
+    def test_put_after_invalidate_is_dropped(self):
+        cache = ArtifactReadCache(max_entries=3)
+        path = self.tmp / "a.json"
+        path.write_text("{}", encoding="utf-8")
+        sig = (path.stat().st_mtime_ns, path.stat().st_size)
+
+        generation = cache.generation()
+        cache.invalidate("a")
+        cache.put("a", str(path), sig, "k", {"v": "old"}, generation)
+        self.assertIsNone(cache.get("a", "k"))
+        self.assertEqual(cache.get_stats()["dropped_puts"], 1)
+
+        cache.put("a", str(path), sig, "k", {"v": "new"}, cache.generation())
+        self.assertEqual(cache.get("a", "k"), {"v": "new"})
+
+    def test_disabled(self):
+        cache = ArtifactReadCache(max_entries=0)
+        cache.put("a", str(self.tmp), (0, 0), "k", {}, cache.generation())
+        self.assertIsNone(cache.get("a", "k"))
+        self.assertFalse(cache.get_stats()["enabled"])
+
+    def test_clone_json(self):
+        value = {"a": [1, {"b": [2, 3]}], "c": "d", "e": None}
+        copy = clone_json(value)
+        self.assertEqual(copy, value)
+        copy["a"][1]["b"].append(4)
+        self.assertEqual(value["a"][1]["b"], [2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Tests for the normalized artifact_tags table (migration 005).
+
+Covers:
+1. Migration backfills tags from the JSON column
+2. upsert/delete keep artifact_tags in sync
+3. Any-of / all-of tag queries (with and without the table)
+4. Tag census aggregate, and the emerge skill using it
+"""
+
+import importlib.util
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from index import ArtifactIndex
+from migrations import run_all_pending, run_migration
+
+REPO_ROOT = Path(__file__).parent.parent
+MIGRATIONS_DIR = REPO_ROOT / "migrations"
+M005_PATH = MIGRATIONS_DIR / "m005_add_artifact_tags.py"
+
+
+def _load_module(path: Path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _artifact(artifact_id: str, tags: list, artifact_type: str = "fact") -> dict:
+    return {
+        "id": artifact_id,
+        "type": artifact_type,
+        "created_at": "2026-02-01T00:00:00Z",
+        "sensitivity": "public",
+        "tags": tags,
+        "source": {"workflow": "test"},
+        "data": {"claim": f"claim {artifact_id}", "message": f"log {artifact_id}"},
+    }
+
+
+SEED = [
+    _artifact("fact_a", ["api", "performance"]),
+    _artifact("fact_b", ["api"]),
+    _artifact("fact_c", ["api-design"]),
+    _artifact("log_d", ["performance", "api"], "log"),
+]
+
+
+class TestArtifactTags(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = Path(self.temp_dir) / "index.db"
+        self.index = ArtifactIndex(self.db_path)
+        run_all_pending(MIGRATIONS_DIR, str(self.db_path))
+        for artifact in SEED:
+            self.index.upsert(artifact, f"{artifact['id']}.json", "hash")
+
+    def tearDown(self):
+        self.index.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _tag_rows(self, artifact_id: str) -> list:
+        with self.index._connect() as conn:
+            rows = conn.execute(
+                "SELECT tag FROM artifact_tags WHERE artifact_id = ? ORDER BY tag", (artifact_id,)
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def _ids(self, **kwargs) -> list:
+        return sorted(r["id"] for r in self.index.query(**kwargs))
+
+    def test_upsert_and_delete_sync_tags(self):
+        self.assertEqual(self._tag_rows("fact_a"), ["api", "performance"])
+
+        self.index.upsert(_artifact("fact_a", ["security", "security"]), "fact_a.json", "hash")
+        self.assertEqual(self._tag_rows("fact_a"), ["security"])
+
+        self.index.delete("fact_a")
+        self.assertEqual(self._tag_rows("fact_a"), [])
+
+        self.index.delete_many(["fact_b", "log_d"])
+        self.assertEqual(self._tag_rows("fact_b"), [])
+        self.assertEqual(self._tag_rows("log_d"), [])
+
+    def test_any_and_all_tag_queries(self):
+        self.assertEqual(self._ids(tags=["api"]), ["fact_a", "fact_b", "log_d"])
+        self.assertEqual(self._ids(tags=["api", "performance"]), ["fact_a", "fact_b", "log_d"])
+        self.assertEqual(self._ids(tags=["api", "performance"], tag_mode="all"), ["fact_a", "log_d"])
+        self.assertEqual(self._ids(tags=["api", "performance"], tag_mode="all", artifact_type="fact"), ["fact_a"])
+
+    def test_tag_query_uses_tag_index(self):
+        tag_sql, params = self.index._tag_condition(self.index._connect(), ["api"])
+        with self.index._connect() as conn:
+            plan = conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT id FROM artifacts WHERE {tag_sql}", params
+            ).fetchall()
+        self.assertIn("idx_artifact_tags_tag", " ".join(str(row[-1]) for row in plan))
+
+    def test_tag_census(self):
+        census = self.index.get_tag_census()
+
+        self.assertEqual(census["source"], "artifact_tags")
+        self.assertEqual(census["tags"]["api"], {"fact": 2, "log": 1})
+        self.assertEqual(census["tags"]["performance"], {"fact": 1, "log": 1})
+        self.assertEqual(census["type_counts"], {"fact": 3, "log": 1})
+
+        logs_only = self.index.get_tag_census(artifact_types=["log"])
+        self.assertEqual(logs_only["tags"]["api"], {"log": 1})
+        self.assertNotIn("api-design", logs_only["tags"])
+
+    def test_fallback_without_table_matches(self):
+        with_table = self.index.get_tag_census()
+        all_ids = self._ids(tags=["api", "performance"], tag_mode="all")
+
+        _load_module(M005_PATH).down(str(self.db_path))
+        legacy = ArtifactIndex(self.db_path)
+        try:
+            census = legacy.get_tag_census()
+            self.assertEqual(census["source"], "json")
+            self.assertEqual(census["tags"], with_table["tags"])
+            self.assertEqual(
+                sorted(r["id"] for r in legacy.query(tags=["api", "performance"], tag_mode="all")),
+                all_ids
+            )
+            self.assertEqual(sorted(r["id"] for r in legacy.query(tags=["api"])),
+                             ["fact_a", "fact_b", "log_d"])
+        finally:
+            legacy.close()
+
+    def test_migration_backfills_existing_tags(self):
+        _load_module(M005_PATH).down(str(self.db_path))
+        result = run_migration(str(self.db_path), M005_PATH)
+
+        self.assertTrue(result["success"], result)
+        self.assertEqual(result["details"]["tags_backfilled"], 6)
+        self.assertEqual(self._tag_rows("log_d"), ["api", "performance"])
+
+
+class TestEmergeTagCensus(unittest.TestCase):
+
+    def test_emerge_loads_only_logs_with_census_tool(self):
+        emerge = _load_module(REPO_ROOT / "skills-shared" / "memory" / "emerge.py")
+        queried_types = []
+
+        def query_memory(artifact_type=None, **kwargs):
+            queried_types.append(artifact_type)
+            return [{"id": "log_1", "type": "log", "tags": ["Deploy"], "message": "deploy failed"}]
+
+        def tag_census(artifact_types=None, since=None):
+            return {
+                "tags": {"Deploy": {"log": 4}, "deploy": {"log": 1, "fact": 1}},
+                "type_counts": {"log": 5, "fact": 1},
+            }
+
+        tools = {
+            "query_memory": query_memory,
+            "semantic_search": lambda query, **kwargs: {"results": []},
+            "tag_census": tag_census,
+        }
+        result = emerge.run({}, tools, {"timeout": 30})
+
+        self.assertTrue(result["success"])
+        self.assertEqual(queried_types, ["log"])
+        self.assertEqual(result["total_artifacts"], 6)
+        self.assertEqual(
+            emerge.normalize_tag_census(tag_census()["tags"]),
+            {"deploy": {"log": 5, "fact": 1}}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
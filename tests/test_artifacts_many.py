@@ -0,0 +1,152 @@
+"""
+Tests for bulk artifact loading (ArtifactStore.get_artifacts_many).
+
+Tests cover:
+- Results match get_artifact() per ID, in input order, with missing IDs reported
+- Duplicate IDs get independent copies; cache hits skip the index and files
+- Parallel path (large batches) matches the serial path and populates the cache
+- ArtifactIndex.get_file_paths resolves indexed IDs only
+- Migrated callers (active decisions, validation history) still see every artifact
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from artifact_cache import ArtifactReadCache
+from artifacts import PARALLEL_READ_MIN, ArtifactStore
+from migrations import run_all_pending
+from provenance_signing import clear_key_cache
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+TEST_KEYS = "v1:" + "ab" * 32
+
+
+class ArtifactsManyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.memory_dir = Path(self.temp_dir) / "memory"
+        self.memory_dir.mkdir(parents=True)
+        self.db_path = self.memory_dir / "index.db"
+
+        self.patches = [
+            patch.dict(os.environ, {"DURO_PROVENANCE_HMAC_KEYS": TEST_KEYS}),
+            patch("embeddings.embed_artifact", return_value=None),
+        ]
+        for p in self.patches:
+            p.start()
+        clear_key_cache()
+
+        self.store = ArtifactStore(self.memory_dir, self.db_path, write_behind=False)
+        run_all_pending(MIGRATIONS_DIR, str(self.db_path))
+
+    def tearDown(self):
+        self.store.index.close()
+        for p in reversed(self.patches):
+            p.stop()
+        clear_key_cache()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def store_facts(self, n: int) -> list:
+        ids = []
+        for i in range(n):
+            ok, artifact_id, _ = self.store.store_fact(
+                claim=f"bulk claim number {i}", tags=["bulk", f"t{i % 4}"], confidence=0.5
+            )
+            self.assertTrue(ok, artifact_id)
+            ids.append(artifact_id)
+        return ids
+
+    def uncached_store(self) -> ArtifactStore:
+        store = ArtifactStore(self.memory_dir, self.db_path, write_behind=False)
+        store.read_cache = ArtifactReadCache(max_entries=0)
+        return store
+
+
+class TestGetArtifactsMany(ArtifactsManyTestCase):
+
+    def test_matches_get_artifact_in_order(self):
+        ids = self.store_facts(6)
+        reference = self.uncached_store()
+        wanted = [ids[3], "fact_missing_1", ids[0], ids[5], "fact_missing_2", ids[1]]
+
+        artifacts, missing = self.uncached_store().get_artifacts_many(wanted)
+
+        self.assertEqual(missing, ["fact_missing_1", "fact_missing_2"])
+        self.assertEqual(len(artifacts), len(wanted))
+        for artifact_id, artifact in zip(wanted, artifacts):
+            self.assertEqual(artifact, reference.get_artifact(artifact_id))
+        self.assertEqual(artifacts[0]["signature_status"], "valid")
+        self.assertEqual(self.store.get_artifacts_many([]), ([], []))
+
+    def test_duplicates_are_independent_copies(self):
+        artifact_id = self.store_facts(1)[0]
+        artifacts, missing = self.store.get_artifacts_many([artifact_id, artifact_id])
+
+        self.assertEqual(missing, [])
+        self.assertEqual(artifacts[0], artifacts[1])
+        artifacts[0]["tags"].append("mutated")
+        self.assertNotIn("mutated", artifacts[1]["tags"])
+
+    def test_cache_hits_skip_index(self):
+        ids = self.store_facts(3)
+        self.store.get_artifacts_many(ids)
+
+        with patch.object(self.store.index, "get_file_paths") as get_file_paths:
+            artifacts, missing = self.store.get_artifacts_many(ids)
+        get_file_paths.assert_not_called()
+        self.assertEqual([a["id"] for a in artifacts], ids)
+        self.assertEqual(self.store.get_read_cache_stats()["hits"], 3)
+
+    def test_parallel_matches_serial(self):
+        ids = self.store_facts(PARALLEL_READ_MIN + 4)
+        reference = self.uncached_store()
+        serial = [reference.get_artifact(artifact_id) for artifact_id in ids]
+
+        artifacts, missing = self.store.get_artifacts_many(ids)
+        self.assertEqual(missing, [])
+        self.assertEqual(artifacts, serial)
+        self.assertIsNotNone(self.store._read_pool)
+        self.assertEqual(self.store.get_read_cache_stats()["entries"], len(ids))
+
+    def test_get_file_paths(self):
+        ids = self.store_facts(3)
+        paths = self.store.index.get_file_paths(ids + ["fact_missing"])
+        self.assertEqual(set(paths), set(ids))
+        for artifact_id in ids:
+            self.assertEqual(paths[artifact_id], self.store.index.get_by_id(artifact_id)["file_path"])
+        self.assertEqual(self.store.index.get_file_paths([]), {})
+
+
+class TestMigratedCallers(ArtifactsManyTestCase):
+
+    def test_active_decisions_and_validation_history(self):
+        decision_ids = []
+        for i in range(3):
+            ok, decision_id, _ = self.store.store_decision(
+                decision=f"use approach {i}", rationale="because", tags=["bulk"]
+            )
+            self.assertTrue(ok, decision_id)
+            decision_ids.append(decision_id)
+
+        ok, _, _ = self.store.validate_decision(decision_ids[0], status="validated", result="worked")
+        self.assertTrue(ok)
+
+        history = self.store.get_validation_history(decision_ids[0])
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0]["data"]["decision_id"], decision_ids[0])
+
+        active = self.store.get_active_decisions(min_confidence=0.0)
+        self.assertIn(decision_ids[0], [d["id"] for d in active])
+
+
+if __name__ == "__main__":
+    unittest.main()
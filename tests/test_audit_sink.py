@@ -0,0 +1,294 @@
+"""
+Tests for the background audit writer (DURO_AUDIT_ASYNC=1).
+
+Tests cover:
+- AuditSink writes events in submission order, grouping bursts into batches
+- submit(wait=True) returns only after the event is committed
+- A full queue blocks, then drops and counts the event; waited-for
+  events block until there is room instead
+- A failed batch raises AuditWriteError for its waiters
+- stop() / flush() drain the queue, inline if no writer thread is running
+- With the sink enabled, concurrent submitters still produce one valid chain
+- DENY / breakglass gate events are on disk when submit_event returns
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import audit_log
+import policy_gate
+from audit_log import AuditEvent, EventType, build_gate_event, submit_event, verify_log
+from audit_sink import AuditSink, AuditWriteError
+from policy_gate import GateDecision, _log_gate_decision
+
+
+class RecordingWriter:
+    """write_batch stand-in that records batches (optionally blocking)."""
+
+    def __init__(self):
+        self.batches = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, events):
+        self.release.wait()
+        self.batches.append(list(events))
+
+    @property
+    def events(self):
+        return [e for batch in self.batches for e in batch]
+
+
+class TestAuditSink(unittest.TestCase):
+
+    def setUp(self):
+        self.writer = RecordingWriter()
+
+    def make_sink(self, **kwargs) -> AuditSink:
+        sink = AuditSink(self.writer, **kwargs)
+        self.addCleanup(sink.stop)
+        return sink
+
+    def test_order_and_group_commit(self):
+        sink = self.make_sink(linger_ms=50, batch_size=64)
+        sink.start()
+
+        def producer(p):
+            for i in range(100):
+                sink.submit((p, i))
+
+        threads = [threading.Thread(target=producer, args=(p,)) for p in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertTrue(sink.flush(timeout=10))
+
+        events = self.writer.events
+        self.assertEqual(len(events), 400)
+        for p in range(4):
+            self.assertEqual([i for q, i in events if q == p], list(range(100)))
+        self.assertLess(len(self.writer.batches), 100)
+        self.assertTrue(all(len(b) <= 64 for b in self.writer.batches))
+
+        stats = sink.get_stats()
+        self.assertEqual((stats["submitted"], stats["written"], stats["queue_depth"]), (400, 400, 0))
+        self.assertEqual(stats["batches"], len(self.writer.batches))
+
+    def test_wait_returns_after_commit(self):
+        sink = self.make_sink(linger_ms=2000)
+        sink.start()
+        sink.submit("info")
+
+        start = time.perf_counter()
+        sink.submit("deny", wait=True)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(self.writer.events, ["info", "deny"])
+        self.assertLess(elapsed, 1.0)  # A waiter cuts the linger short
+        self.assertEqual(sink.get_stats()["critical_waits"], 1)
+
+    def test_backpressure_drops_when_full(self):
+        sink = self.make_sink(max_queue=2, block_timeout_s=0.05)  # Not started: nothing drains
+        self.assertTrue(sink.submit(1))
+        self.assertTrue(sink.submit(2))
+        self.assertFalse(sink.submit(3))
+
+        stats = sink.get_stats()
+        self.assertEqual((stats["dropped"], stats["backpressure_waits"], stats["queue_depth"]), (1, 1, 2))
+        self.assertGreater(stats["lag_ms"], 0)
+
+        self.assertTrue(sink.flush())  # No writer thread: drained inline
+        self.assertEqual(self.writer.events, [1, 2])
+
+    def test_blocked_submitter_resumes_when_space_frees(self):
+        self.writer.release.clear()
+        sink = self.make_sink(max_queue=1, linger_ms=0, block_timeout_s=5.0)
+        sink.start()
+        sink.submit(1)
+        while sink.get_stats()["queue_depth"]:
+            time.sleep(0.001)  # Writer has taken 1 and is blocked writing it
+        sink.submit(2)
+
+        threading.Timer(0.05, self.writer.release.set).start()
+        self.assertTrue(sink.submit(3))
+        sink.flush()
+        self.assertEqual(self.writer.events, [1, 2, 3])
+        self.assertEqual(sink.get_stats()["dropped"], 0)
+
+    def test_waited_event_is_never_dropped(self):
+        self.writer.release.clear()
+        sink = self.make_sink(max_queue=1, linger_ms=0, block_timeout_s=0.01)
+        sink.start()
+        sink.submit(1)
+        while sink.get_stats()["queue_depth"]:
+            time.sleep(0.001)  # Writer has taken 1 and is blocked writing it
+        sink.submit(2)
+
+        # Well past block_timeout_s: a plain submit would have been dropped
+        threading.Timer(0.2, self.writer.release.set).start()
+        self.assertTrue(sink.submit("deny", wait=True))
+        self.assertEqual(self.writer.events, [1, 2, "deny"])
+        self.assertEqual(sink.get_stats()["dropped"], 0)
+
+    def test_waited_event_without_writer_drains_inline(self):
+        sink = self.make_sink(max_queue=1, block_timeout_s=0.01)  # Not started
+        sink.submit(1)
+        self.assertTrue(sink.submit("deny", wait=True))
+        self.assertEqual(self.writer.events, [1, "deny"])
+
+    def test_stop_flushes(self):
+        sink = self.make_sink(linger_ms=5000)
+        sink.start()
+        for i in range(10):
+            sink.submit(i)
+        sink.stop()
+
+        self.assertEqual(self.writer.events, list(range(10)))
+        self.assertFalse(sink.get_stats()["running"])
+        sink.submit(10)  # After stop: written on the caller's thread, still in order
+        self.assertEqual(self.writer.events, list(range(11)))
+
+    def test_failed_batch_counted(self):
+        def failing(events):
+            raise OSError("disk full")
+
+        sink = AuditSink(failing)
+        self.assertTrue(sink.submit("x"))
+        with self.assertRaisesRegex(AuditWriteError, "disk full"):
+            sink.submit("y", wait=True)
+        with self.assertRaises(AuditWriteError):
+            sink.submit_many(["z1", "z2"])
+
+        stats = sink.get_stats()
+        self.assertEqual((stats["errors"], stats["failed_events"], stats["written"]), (2, 4, 0))
+        self.assertEqual(stats["last_error"], "disk full")
+
+    def test_failed_batch_only_raises_for_its_waiters(self):
+        fail = threading.Event()
+
+        def flaky(events):
+            if fail.is_set():
+                raise OSError("disk full")
+            self.writer(events)
+
+        sink = AuditSink(flaky)
+        fail.set()
+        sink.submit("lost")
+        sink.flush()
+        fail.clear()
+        self.assertTrue(sink.submit("deny", wait=True))
+        self.assertEqual(self.writer.events, ["deny"])
+
+
+class AsyncAuditTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.patches = [
+            patch.object(audit_log, "AUDIT_DIR", self.temp_dir),
+            patch.object(audit_log, "UNIFIED_AUDIT_FILE", self.temp_dir / "security_audit.jsonl"),
+            patch.object(audit_log, "AUDIT_HEAD_FILE", self.temp_dir / "audit_head.json"),
+            patch.object(audit_log, "VERIFY_CHECKPOINT_FILE", self.temp_dir / "verify_checkpoint.json"),
+            patch.object(audit_log, "AUDIT_BACKEND", "jsonl"),
+            patch.object(audit_log, "AUDIT_ASYNC", True),
+            patch.object(audit_log, "_sink", None),
+            patch.object(audit_log, "should_rotate", return_value=False),
+            patch.dict(os.environ, {audit_log.HMAC_KEY_ENV: "sink-test-key"}),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        if audit_log._sink is not None:
+            audit_log._sink.stop()
+        for p in reversed(self.patches):
+            p.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def logged_ids(self) -> list:
+        return [e["event_id"] for e in reversed(audit_log.query_log(limit=100000))]
+
+
+class TestAsyncAuditLog(AsyncAuditTestCase):
+
+    def test_concurrent_submitters_one_valid_chain(self):
+        submitted = []
+        lock = threading.Lock()
+
+        def producer(p):
+            for i in range(50):
+                event = AuditEvent(event_type=EventType.GATE_DECISION, tool=f"t{p}", reason=str(i), decision="ALLOW")
+                with lock:
+                    submitted.append(submit_event(event))
+
+        threads = [threading.Thread(target=producer, args=(p,)) for p in range(4)]
+        for t in threads:
+            t.start()
+        audit_log.append_event(AuditEvent(event_type=EventType.GATE_DECISION, tool="sync", reason="sync"))
+        for t in threads:
+            t.join()
+
+        result = verify_log()
+        self.assertTrue(result.valid, result.error)
+        self.assertEqual(result.total_events, 201)
+        self.assertEqual(len(self.logged_ids()), 201)
+        self.assertTrue(set(submitted) <= set(self.logged_ids()))
+
+        stats = audit_log.get_audit_stats()["async_writer"]
+        self.assertEqual(stats["written"], 201)
+        self.assertLess(stats["batches"], 201)
+
+    def test_critical_events_written_before_return(self):
+        with patch.object(audit_log._sink or audit_log.get_audit_sink(), "linger_ms", 5000):
+            submit_event(AuditEvent(event_type=EventType.GATE_DECISION, tool="t", decision="ALLOW"))
+
+            for kwargs in [{"decision": "DENY"}, {"decision": "NEED_APPROVAL"}, {"decision": "ALLOW", "breakglass": True}]:
+                event = build_gate_event(
+                    tool_name="t", reason="r", risk_level="destructive", domain="d",
+                    action_id="a", args_hash="h", **kwargs
+                )
+                event_id = submit_event(event)
+                on_disk = audit_log.UNIFIED_AUDIT_FILE.read_text(encoding="utf-8")
+                self.assertIn(event_id, on_disk, kwargs)
+
+    def test_critical_event_write_failure_is_raised(self):
+        event = build_gate_event(
+            tool_name="t", reason="r", risk_level="destructive", domain="d",
+            action_id="a", args_hash="h", decision="DENY",
+        )
+        with patch.object(audit_log, "update_head", side_effect=OSError("read-only")):
+            with self.assertRaises(AuditWriteError):
+                submit_event(event)
+
+    def test_dropped_event_has_no_id(self):
+        sink = audit_log.get_audit_sink()
+        with patch.object(sink, "submit", return_value=False):
+            event = AuditEvent(event_type=EventType.GATE_DECISION, tool="t", decision="ALLOW")
+            self.assertEqual(submit_event(event), "")
+
+    def test_gate_decisions_go_through_sink(self):
+        with patch.object(policy_gate, "UNIFIED_AUDIT_AVAILABLE", True):
+            for allowed in [True, True, False]:
+                _log_gate_decision(GateDecision(
+                    allowed=allowed, action_needed="none" if allowed else "deny", reason="r",
+                    tool_name="duro_store_fact", risk_level="write", domain="memory", args_hash="h", safe_summary="s",
+                ), {"claim": "x"})
+
+        events = list(reversed(audit_log.query_log(limit=10)))
+        self.assertEqual([e["decision"] for e in events], ["ALLOW", "ALLOW", "DENY"])
+        self.assertTrue(verify_log().valid)
+        self.assertEqual(audit_log.get_audit_stats()["async_writer"]["critical_waits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,234 @@
+"""
+Tests for the SQLite audit store (DURO_AUDIT_BACKEND=sqlite).
+
+Covers:
+1. Appends chain from GENESIS and the head is the last row
+2. Batched appends chain in order within one transaction
+3. Indexed filters (event_type, tool, decision, severity, since, tags)
+4. Concurrent appends from many threads keep a linear chain
+5. Verification detects tampering (of the record or of an indexed column)
+   and resumes from its checkpoint; with an HMAC key, an unsigned or forged
+   checkpoint row is ignored
+6. JSONL export verifies with the existing verify_log()
+7. audit_log dispatches to the store when the backend is sqlite
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import audit_log
+import audit_store
+from audit_log import AuditEvent, GENESIS_HASH, build_gate_event, verify_log
+from audit_store import AuditStore
+
+
+def _gate_event(tool: str = "duro_store_fact", decision: str = "ALLOW") -> AuditEvent:
+    return build_gate_event(
+        tool_name=tool,
+        decision=decision,
+        reason="test",
+        risk_level="low",
+        domain="memory",
+        action_id="act_1",
+        args_hash="abc",
+    )
+
+
+class TestAuditStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.store = AuditStore(self.temp_dir / "audit.db")
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _tamper(self, seq: int, reason: str):
+        conn = sqlite3.connect(str(self.store.db_path))
+        record = json.loads(conn.execute(
+            "SELECT record FROM audit_events WHERE seq = ?", (seq,)
+        ).fetchone()[0])
+        record["reason"] = reason
+        conn.execute(
+            "UPDATE audit_events SET record = ? WHERE seq = ?",
+            (json.dumps(record, sort_keys=True), seq)
+        )
+        conn.commit()
+        conn.close()
+
+    def test_append_chains_from_genesis(self):
+        first = _gate_event()
+        second = _gate_event(decision="DENY")
+        self.store.append(first)
+        self.store.append(second)
+
+        self.assertEqual(first.chain.prev, GENESIS_HASH)
+        self.assertEqual(second.chain.prev, first.chain.hash)
+        self.assertEqual(self.store.get_head(), (second.chain.hash, second.event_id))
+
+    def test_append_many_is_one_ordered_chain(self):
+        events = [_gate_event(tool=f"tool_{i}") for i in range(5)]
+        ids = self.store.append_many(events)
+
+        self.assertEqual(ids, [e.event_id for e in events])
+        for prev, event in zip(events, events[1:]):
+            self.assertEqual(event.chain.prev, prev.chain.hash)
+        self.assertTrue(self.store.verify().valid)
+
+    def test_query_filters(self):
+        self.store.append_many([
+            _gate_event(tool="a", decision="ALLOW"),
+            _gate_event(tool="b", decision="DENY"),
+            _gate_event(tool="b", decision="ALLOW"),
+        ])
+
+        self.assertEqual(len(self.store.query(tool="b")), 2)
+        self.assertEqual(len(self.store.query(decision="DENY")), 1)
+        self.assertEqual(len(self.store.query(severity="warn")), 1)
+        self.assertEqual(len(self.store.query(event_type="gate.decision", limit=2)), 2)
+        self.assertEqual(len(self.store.query(tags=["policy-gate"])), 3)
+        self.assertEqual(self.store.query(tags=["browser"]), [])
+        self.assertEqual(self.store.query(since="9999"), [])
+
+        stats = self.store.get_stats()
+        self.assertEqual(stats["total_events"], 3)
+        self.assertEqual(stats["by_decision"], {"ALLOW": 2, "DENY": 1})
+
+    def test_concurrent_appends_keep_linear_chain(self):
+        def worker():
+            for _ in range(10):
+                self.store.append(_gate_event())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        result = self.store.verify(full=True)
+        self.assertTrue(result.valid, result.error)
+        self.assertEqual(result.verified_events, 80)
+
+    def test_verify_detects_tampering(self):
+        self.store.append_many([_gate_event() for _ in range(3)])
+        self._tamper(2, "edited")
+
+        result = self.store.verify()
+        self.assertFalse(result.valid)
+        self.assertEqual(result.first_broken_line, 2)
+        self.assertIn("Hash mismatch", result.error)
+
+    def test_verify_detects_column_tampering(self):
+        self.store.append_many([_gate_event(), _gate_event(decision="DENY"), _gate_event()])
+        conn = sqlite3.connect(str(self.store.db_path))
+        conn.execute("UPDATE audit_events SET decision = 'ALLOW' WHERE seq = 2")
+        conn.commit()
+        conn.close()
+        self.assertEqual(self.store.query(decision="DENY"), [])
+
+        result = self.store.verify()
+        self.assertFalse(result.valid)
+        self.assertEqual(result.first_broken_line, 2)
+        self.assertIn("decision", result.error)
+
+    def test_verify_resumes_from_checkpoint(self):
+        self.store.append_many([_gate_event() for _ in range(4)])
+        first = self.store.verify()
+        self.assertEqual((first.verified_events, first.resumed_from), (4, 0))
+
+        self.store.append_many([_gate_event() for _ in range(2)])
+        second = self.store.verify()
+        self.assertTrue(second.valid)
+        self.assertEqual((second.verified_events, second.resumed_from), (6, 4))
+
+        # Tampering behind the checkpoint is only caught by a full verify
+        self._tamper(1, "edited")
+        self.assertTrue(self.store.verify().valid)
+        self.assertFalse(self.store.verify(full=True).valid)
+
+    def test_forged_checkpoint_row_is_ignored(self):
+        with patch.dict(os.environ, {audit_log.HMAC_KEY_ENV: "store-checkpoint-key"}):
+            self.store.append_many([_gate_event() for _ in range(4)])
+            self.assertTrue(self.store.verify().valid)
+            self.assertEqual(self.store.get_checkpoint()["seq"], 4)
+
+            # Point the checkpoint past a tampered row without a valid signature
+            self._tamper(2, "edited")
+            conn = sqlite3.connect(str(self.store.db_path))
+            conn.execute("UPDATE audit_checkpoints SET sig = NULL")
+            conn.commit()
+            conn.close()
+
+            self.assertIsNone(self.store.get_checkpoint())
+            result = self.store.verify()
+            self.assertFalse(result.valid)
+            self.assertEqual((result.first_broken_line, result.resumed_from), (2, 0))
+
+    def test_checkpoint_sig_column_added_to_old_db(self):
+        db_path = self.temp_dir / "old.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "CREATE TABLE audit_checkpoints (name TEXT PRIMARY KEY, seq INTEGER NOT NULL, "
+            "chain_hash TEXT NOT NULL, verified_at TEXT NOT NULL)"
+        )
+        conn.commit()
+        conn.close()
+
+        store = AuditStore(db_path)
+        store.append_many([_gate_event() for _ in range(2)])
+        self.assertTrue(store.verify().valid)
+        self.assertEqual(store.verify().resumed_from, 2)
+        store.close()
+
+    def test_export_jsonl_verifies(self):
+        self.store.append_many([_gate_event() for _ in range(3)])
+        out = self.temp_dir / "export.jsonl"
+
+        self.assertEqual(self.store.export_jsonl(out), 3)
+        result = verify_log(out)
+        self.assertTrue(result.valid, result.error)
+        self.assertEqual(result.verified_events, 3)
+
+
+class TestAuditLogSqliteBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.store = AuditStore(self.temp_dir / "audit.db")
+        self.patches = [
+            patch.object(audit_log, "AUDIT_BACKEND", "sqlite"),
+            patch.object(audit_store, "_store", self.store),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.store.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_module_functions_use_store(self):
+        audit_log.append_event(_gate_event(tool="x"))
+        audit_log.append_events([_gate_event(tool="y"), _gate_event(tool="y")])
+
+        self.assertEqual(len(audit_log.query_log(tool="y")), 2)
+        self.assertTrue(audit_log.verify_log().valid)
+        self.assertEqual(audit_log.get_audit_stats()["total_events"], 3)
+        self.assertEqual(self.store.count(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+"""
+Tests for checkpointed, whole-chain audit verification (JSONL backend).
+
+Covers:
+1. The chain verifies across rotated archives and the current log
+2. A second verify only hashes events appended since the checkpoint
+3. full=True re-checks events behind the checkpoint
+4. Forged (unsigned / mis-signed) checkpoints are ignored; an archive edited
+   in place (same size) is re-verified because its digest no longer matches
+5. Unchanged archives (same size and mtime) are not re-digested
+6. Parallel mode verifies archives in a process pool and stitches them
+7. A missing archive is reported as a break at the next segment
+8. A partially written trailing line in the live log is left for the next
+   run, but only while the head still matches; archives and explicit-path
+   verifies reject an unterminated final line
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import audit_log
+from audit_log import AuditEvent, EventType, append_event, verify_log
+
+
+def _append(n: int, reason: str = "test"):
+    for _ in range(n):
+        append_event(AuditEvent(event_type=EventType.GATE_DECISION, tool="t", reason=reason))
+
+
+class TestVerifyCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.patches = [
+            patch.object(audit_log, "AUDIT_DIR", self.temp_dir),
+            patch.object(audit_log, "UNIFIED_AUDIT_FILE", self.temp_dir / "security_audit.jsonl"),
+            patch.object(audit_log, "AUDIT_HEAD_FILE", self.temp_dir / "audit_head.json"),
+            patch.object(audit_log, "VERIFY_CHECKPOINT_FILE", self.temp_dir / "verify_checkpoint.json"),
+            patch.object(audit_log, "AUDIT_BACKEND", "jsonl"),
+            patch.object(audit_log, "should_rotate", return_value=False),
+            patch.dict(os.environ, {audit_log.HMAC_KEY_ENV: "checkpoint-test-key"}),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _archive(self, day: int):
+        """Move the current log aside like rotate_log() does (chain continues via head)."""
+        audit_log.UNIFIED_AUDIT_FILE.rename(self.temp_dir / f"security_audit_202601{day:02d}_000000.jsonl")
+
+    def _build_rotated_chain(self):
+        for day in (1, 2, 3):
+            _append(3)
+            self._archive(day)
+        _append(2)
+
+    def _tamper_same_length(self, path: Path, line_index: int):
+        lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+        record = json.loads(lines[line_index])
+        record["reason"] = "TEST"
+        lines[line_index] = json.dumps(record, sort_keys=True) + "\n"
+        path.write_text("".join(lines), encoding="utf-8")
+
+    def test_chain_verifies_across_archives(self):
+        self._build_rotated_chain()
+
+        result = verify_log()
+        self.assertTrue(result.valid, result.error)
+        self.assertEqual(result.total_events, 11)
+        self.assertEqual(result.verified_events, 11)
+        self.assertEqual(result.segments, 4)
+        self.assertTrue(result.signed and result.signature_valid)
+
+    def test_second_verify_resumes_from_checkpoint(self):
+        self._build_rotated_chain()
+        self.assertEqual(verify_log().resumed_from, 0)
+
+        _append(4)
+        with patch.object(audit_log, "compute_record_hash", wraps=audit_log.compute_record_hash) as hashed:
+            result = verify_log()
+
+        self.assertTrue(result.valid, result.error)
+        self.assertEqual(result.resumed_from, 11)
+        self.assertEqual(result.verified_events, 15)
+        self.assertEqual(hashed.call_count, 4)
+
+    def test_full_verify_catches_edits_behind_checkpoint(self):
+        _append(5)
+        verify_log()
+        self._tamper_same_length(audit_log.UNIFIED_AUDIT_FILE, 1)
+
+        self.assertTrue(verify_log().valid)
+        result = verify_log(full=True)
+        self.assertFalse(result.valid)
+        self.assertEqual(result.first_broken_line, 2)
+        self.assertEqual(result.first_broken_file, "security_audit.jsonl")
+
+    def test_forged_checkpoint_is_ignored(self):
+        _append(3)
+        verify_log()
+
+        checkpoint_file = audit_log.VERIFY_CHECKPOINT_FILE
+        checkpoint = json.loads(checkpoint_file.read_text(encoding="utf-8"))
+        checkpoint["active"]["events"] = 1000
+        checkpoint_file.write_text(json.dumps(checkpoint), encoding="utf-8")
+
+        self.assertIsNone(audit_log.load_verify_checkpoint())
+        result = verify_log()
+        self.assertEqual((result.resumed_from, result.verified_events), (0, 3))
+
+    def test_same_size_archive_edit_is_reverified(self):
+        self._build_rotated_chain()
+        self.assertTrue(verify_log().valid)
+
+        archive = self.temp_dir / "security_audit_20260102_000000.jsonl"
+        size = archive.stat().st_size
+        self._tamper_same_length(archive, 1)
+        self.assertEqual(archive.stat().st_size, size)
+
+        result = verify_log()
+        self.assertFalse(result.valid)
+        self.assertEqual(result.first_broken_file, archive.name)
+        self.assertEqual(result.first_broken_line, 2)
+
+    def test_unchanged_archives_are_not_redigested(self):
+        self._build_rotated_chain()
+        self.assertTrue(verify_log().valid)
+
+        _append(1)
+        with patch.object(audit_log, "_file_sha256", wraps=audit_log._file_sha256) as digested:
+            result = verify_log()
+        self.assertTrue(result.valid, result.error)
+        self.assertEqual(digested.call_count, 0)
+
+    def test_parallel_verify_stitches_segments(self):
+        self._build_rotated_chain()
+
+        result = verify_log(parallel=True)
+        self.assertTrue(result.valid, result.error)
+        self.assertEqual(result.verified_events, 11)
+
+        (self.temp_dir / "security_audit_20260102_000000.jsonl").unlink()
+        result = verify_log(full=True, parallel=True)
+        self.assertFalse(result.valid)
+        self.assertEqual(result.first_broken_file, "security_audit_20260103_000000.jsonl")
+        self.assertIn("Chain break at start", result.error)
+
+    def test_partial_trailing_line_is_deferred(self):
+        _append(2)
+        with open(audit_log.UNIFIED_AUDIT_FILE, "a", encoding="utf-8") as f:
+            f.write('{"event_type": "gate.dec')
+
+        result = verify_log()
+        self.assertTrue(result.valid, result.error)
+        self.assertEqual(result.verified_events, 2)
+
+    def _drop_last_newline(self, path: Path, tamper: bool):
+        lines = path.read_text(encoding="utf-8").splitlines()
+        if tamper:
+            record = json.loads(lines[-1])
+            record["reason"] = "TAMPERED"
+            lines[-1] = json.dumps(record, sort_keys=True)
+        path.write_text("\n".join(lines), encoding="utf-8")
+
+    def test_tampered_unterminated_last_line_fails(self):
+        _append(3)
+        self._drop_last_newline(audit_log.UNIFIED_AUDIT_FILE, tamper=True)
+
+        result = verify_log(audit_log.UNIFIED_AUDIT_FILE)
+        self.assertFalse(result.valid)
+        self.assertEqual(result.error, "Hash mismatch at line 3")
+
+        result = verify_log()
+        self.assertFalse(result.valid)
+        self.assertEqual(result.first_broken_line, 3)
+        self.assertIn("audit_head.json", result.error)
+
+    def test_unterminated_line_fails_outside_live_append(self):
+        _append(3)
+        self._drop_last_newline(audit_log.UNIFIED_AUDIT_FILE, tamper=False)
+        result = verify_log(audit_log.UNIFIED_AUDIT_FILE)
+        self.assertFalse(result.valid)
+        self.assertEqual(result.error, "Unterminated final line 3")
+
+        self._archive(1)
+        _append(1)
+        result = verify_log()
+        self.assertFalse(result.valid)
+        self.assertEqual(result.first_broken_file, "security_audit_20260101_000000.jsonl")
+        self.assertEqual(result.error, "Unterminated final line 3")
+
+
+if __name__ == "__main__":
+    unittest.main()
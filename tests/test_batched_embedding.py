@@ -0,0 +1,141 @@
+"""
+Tests for the batched embedding pipeline.
+
+Covers:
+1. ArtifactStore.embed_artifacts: one model call per chunk, one batch write
+2. Unchanged content + model is skipped (unless force=True)
+3. EmbeddingWorker.process_queue embeds the whole batch with one model call
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from artifacts import ArtifactStore
+from embeddings import EMBEDDING_CONFIG, compute_content_hash
+from embedding_worker import EmbeddingWorker
+from migrations import run_all_pending
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+
+
+def _fact(artifact_id: str, claim: str) -> dict:
+    return {
+        "id": artifact_id,
+        "type": "fact",
+        "version": "1.1",
+        "created_at": "2026-01-01T00:00:00Z",
+        "sensitivity": "public",
+        "tags": ["embedding"],
+        "source": {"workflow": "test"},
+        "data": {"claim": claim, "confidence": 0.5},
+    }
+
+
+def _fake_embed_batch(texts):
+    return [[float(len(t))] * 4 for t in texts]
+
+
+class TestEmbedArtifacts(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.memory_dir = Path(self.temp_dir) / "memory"
+        facts_dir = self.memory_dir / "facts"
+        facts_dir.mkdir(parents=True)
+
+        db_path = self.memory_dir / "index.db"
+        self.store = ArtifactStore(self.memory_dir, db_path)
+        run_all_pending(MIGRATIONS_DIR, str(db_path))
+
+        self.ids = []
+        for i in range(5):
+            artifact = _fact(f"fact_emb_{i}", f"embedding claim {i}")
+            (facts_dir / f"{artifact['id']}.json").write_text(json.dumps(artifact), encoding="utf-8")
+            self.ids.append(artifact["id"])
+        self.store.reconcile_index()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_one_model_call_and_one_write_per_chunk(self):
+        with patch("embeddings.embed_batch", side_effect=_fake_embed_batch) as mock_embed, \
+             patch.object(self.store.index, "upsert_embeddings", side_effect=lambda rows, model_name: len(rows)) as mock_write:
+            result = self.store.embed_artifacts(self.ids)
+
+        self.assertEqual(result["embedded"], 5)
+        self.assertEqual(mock_embed.call_count, 1)
+        self.assertEqual(len(mock_embed.call_args[0][0]), 5)
+        self.assertEqual(mock_write.call_count, 1)
+        self.assertEqual(len(mock_write.call_args[0][0]), 5)
+
+    def test_unchanged_content_is_skipped(self):
+        artifact = self.store.get_artifact(self.ids[0])
+        states = {
+            self.ids[0]: {
+                "content_hash": compute_content_hash(artifact),
+                "embedded_at": "2026-01-01T00:00:00Z",
+                "model": EMBEDDING_CONFIG["model_name"],
+            }
+        }
+        with patch.object(self.store.index, "get_embedding_states", return_value=states), \
+             patch("embeddings.embed_batch", side_effect=_fake_embed_batch) as mock_embed, \
+             patch.object(self.store.index, "upsert_embeddings", side_effect=lambda rows, model_name: len(rows)):
+            result = self.store.embed_artifacts(self.ids)
+            self.assertEqual(result["unchanged"], 1)
+            self.assertEqual(result["embedded"], 4)
+            self.assertEqual(len(mock_embed.call_args[0][0]), 4)
+
+            forced = self.store.embed_artifacts(self.ids, force=True)
+            self.assertEqual(forced["embedded"], 5)
+
+    def test_missing_ids_and_failed_write(self):
+        with patch("embeddings.embed_batch", side_effect=_fake_embed_batch), \
+             patch.object(self.store.index, "upsert_embeddings", return_value=0):
+            result = self.store.embed_artifacts(self.ids[:2] + ["fact_does_not_exist"])
+
+        self.assertEqual(result["missing"], 1)
+        self.assertEqual(result["embedded"], 0)
+        self.assertEqual(result["failed"], 2)
+
+
+class TestEmbeddingWorkerBatching(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.memory_dir = Path(self.temp_dir)
+        self.artifacts = {f"fact_w_{i}": _fact(f"fact_w_{i}", f"worker claim {i}") for i in range(4)}
+        self.stored = []
+        self.worker = EmbeddingWorker(
+            self.memory_dir,
+            artifact_loader=self.artifacts.get,
+            embedding_callback=lambda aid, text, vec: self.stored.append(aid) or True,
+        )
+        for aid in self.artifacts:
+            self.worker.queue.queue_for_embedding(aid)
+        self.worker.queue.queue_for_embedding("fact_deleted")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_process_queue_uses_single_model_call(self):
+        with patch("embedding_worker.is_embedding_available", return_value=True), \
+             patch("embedding_worker.embed_batch", side_effect=_fake_embed_batch) as mock_embed:
+            result = self.worker.process_queue()
+
+        self.assertEqual(mock_embed.call_count, 1)
+        self.assertEqual(result["processed"], 4)
+        self.assertEqual(result["skipped"], 1)
+        self.assertEqual(result["remaining"], 0)
+        self.assertEqual(sorted(self.stored), sorted(self.artifacts))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,10 +8,15 @@ Tests cover:
 - Naming convention checks
 - File length checks
 - Edge cases (empty files, syntax errors)
+- Fused single-walk visitor matches the separate visitors
+- Findings cache and parallel analysis of uncached files
 """
 
+import ast
+import os
 import pytest
 import sys
+import tempfile
 from pathlib import Path
 
 # Add skills to path
@@ -25,7 +30,13 @@ from code_review_verifier import (
     Category,
     DEFAULT_CONFIG,
     SKILL_META,
+    ComplexityVisitor,
+    NestingVisitor,
+    SecurityVisitor,
+    NamingVisitor,
+    ReviewVisitor,
 )
+import code_review_verifier
 
 
 class TestSkillMetadata:
@@ -333,5 +344,184 @@ def greet():
         assert isinstance(findings, list)
 
 
+SAMPLE_MODULE = '''
+import os, subprocess
+
+class bad_name:
+    def Method(self, a, b, c, d, e, f):
+        if a and b or c:
+            for x in [y for y in range(3) if y]:
+                while x:
+                    with open("f") as fh:
+                        try:
+                            eval(fh.read())
+                        except Exception:
+                            pass
+
+        def inner(q):
+            if q:
+                os.system("ls")
+            return q
+        return inner
+
+async def fetch(url):
+    subprocess.run(url, shell=True)
+
+def outer():
+    def nested_one():
+        return 1
+    class Inner:
+        def deep(self):
+            return [i for i in range(3) if i > 1 and i < 3]
+    return nested_one, Inner
+'''
+
+
+def _legacy_walks(code, config):
+    """What the four separate visitors (one walk per function) reported."""
+    tree = ast.parse(code)
+    functions = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            visitor = ComplexityVisitor()
+            visitor.visit(node)
+            functions.append((node.name, node.lineno, visitor.complexity))
+    nesting = NestingVisitor()
+    nesting.visit(tree)
+    security = SecurityVisitor(config["banned_functions"])
+    security.visit(tree)
+    naming = NamingVisitor(config["naming_convention"])
+    naming.visit(tree)
+    return functions, nesting.max_depth, nesting.deepest_location, security.findings, naming.findings
+
+
+class TestFusedVisitor:
+    """The single-walk visitor reports what the separate visitors did."""
+
+    def test_matches_separate_visitors(self):
+        visitor = ReviewVisitor(DEFAULT_CONFIG["banned_functions"], DEFAULT_CONFIG["naming_convention"])
+        visitor.visit(ast.parse(SAMPLE_MODULE))
+
+        functions, max_depth, deepest, security, naming = _legacy_walks(SAMPLE_MODULE, DEFAULT_CONFIG)
+        assert [(n.name, n.lineno, c) for _, _, n, c in visitor.functions] == functions
+        assert (visitor.max_depth, visitor.deepest_location) == (max_depth, deepest)
+        assert visitor.security.findings == security
+        assert visitor.naming.findings == naming
+
+    def test_nested_function_complexity_counts_toward_outer(self):
+        visitor = ReviewVisitor([], "snake_case")
+        visitor.visit(ast.parse(SAMPLE_MODULE))
+        complexity = {n.name: c for _, _, n, c in visitor.functions}
+        assert complexity["inner"] == 2
+        assert complexity["Method"] > complexity["inner"]
+
+
+def _write_project(root, count=4):
+    paths = []
+    for i in range(count):
+        path = root / f"mod_{i}.py"
+        path.write_text(f"def fn_{i}(x):\n    return eval(x)\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _age(path, seconds=10):
+    """Backdate mtime so the stat entry isn't treated as racy."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestReviewCache:
+    """Test the persistent per-file findings cache."""
+
+    def _run(self, paths, cache_dir, **extra):
+        return run({"files": [str(p) for p in paths], "cache_dir": str(cache_dir), **extra}, {}, {})
+
+    def test_unchanged_files_hit_cache(self, tmp_path):
+        paths = _write_project(tmp_path)
+        for path in paths:
+            _age(path)
+        cache_dir = tmp_path / ".review_cache"
+
+        first = self._run(paths, cache_dir)
+        assert first["cache"] == {"hits": 0, "misses": 4}
+
+        second = self._run(paths, cache_dir)
+        assert second["cache"] == {"hits": 4, "misses": 0}
+        assert second["findings"] == first["findings"]
+        assert second["files_reviewed"] == 4
+
+    def test_unchanged_files_are_not_read(self, tmp_path, monkeypatch):
+        paths = _write_project(tmp_path)
+        for path in paths:
+            _age(path)
+        cache_dir = tmp_path / ".review_cache"
+        self._run(paths, cache_dir)
+
+        reads = []
+        tools = {"read_file": lambda p: reads.append(p) or Path(p).read_text(encoding="utf-8")}
+        run({"files": [str(p) for p in paths], "cache_dir": str(cache_dir)}, tools, {})
+        assert reads == []
+
+    def test_edited_file_and_config_change_miss(self, tmp_path):
+        paths = _write_project(tmp_path)
+        cache_dir = tmp_path / ".review_cache"
+        self._run(paths, cache_dir)
+
+        paths[0].write_text("def fn_0(x):\n    return x\n", encoding="utf-8")
+        edited = self._run(paths, cache_dir)
+        assert edited["cache"] == {"hits": 3, "misses": 1}
+        assert not [f for f in edited["findings"] if f["file_path"] == str(paths[0]) and f["severity"] == "error"]
+
+        reconfigured = self._run(paths, cache_dir, config={"banned_functions": []})
+        assert reconfigured["cache"]["hits"] == 0
+
+    def test_identical_files_share_entry_with_own_paths(self, tmp_path):
+        paths = _write_project(tmp_path, count=1)
+        copy = tmp_path / "copy.py"
+        copy.write_text(paths[0].read_text(encoding="utf-8"), encoding="utf-8")
+        cache_dir = tmp_path / ".review_cache"
+
+        self._run(paths, cache_dir)
+        result = self._run([copy], cache_dir)
+        assert result["cache"]["hits"] == 1
+        assert {f["file_path"] for f in result["findings"]} == {str(copy)}
+
+    def test_analyzer_version_change_drops_cache(self, tmp_path, monkeypatch):
+        paths = _write_project(tmp_path)
+        cache_dir = tmp_path / ".review_cache"
+        self._run(paths, cache_dir)
+
+        monkeypatch.setattr(code_review_verifier, "ANALYZER_VERSION", "test-bump")
+        assert self._run(paths, cache_dir)["cache"]["hits"] == 0
+
+    def test_pipeline_cache_stays_out_of_project(self, tmp_path, monkeypatch):
+        sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "code"))
+        import code_pipeline
+
+        monkeypatch.setattr(code_pipeline, "AGENT_HOME", tmp_path / "agent")
+        # src/skills.py shadows the skills/ package on the test path
+        monkeypatch.setitem(sys.modules, "skills.verification.code_review_verifier", code_review_verifier)
+
+        # The stage skips paths containing "test_", which tmp_path does
+        with tempfile.TemporaryDirectory(prefix="project_") as project:
+            _write_project(Path(project), count=2)
+            result = code_pipeline.run_code_review_stage(project, {}, {})
+            assert result.summary.get("files_reviewed") == 2, result.error
+            assert not (Path(project) / ".review_cache").exists()
+
+            cache_dirs = list((tmp_path / "agent" / "cache" / "review").iterdir())
+            assert [d.name for d in cache_dirs] == [Path(code_pipeline._review_cache_dir(project)).name]
+
+    def test_parallel_matches_sequential(self, tmp_path, monkeypatch):
+        paths = _write_project(tmp_path, count=6)
+        sequential = run({"files": [str(p) for p in paths], "workers": 1}, {}, {})
+
+        monkeypatch.setattr(code_review_verifier, "PARALLEL_MIN_FILES", 2)
+        parallel = run({"files": [str(p) for p in paths], "workers": 2}, {}, {})
+        assert parallel["findings"] == sequential["findings"]
+        assert parallel["files_reviewed"] == 6
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
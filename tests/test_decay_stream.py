@@ -0,0 +1,265 @@
+"""
+Tests for the streaming, checkpointed decay pass (decay.apply_decay_to_store).
+
+Tests cover:
+- Confidences after a chunked pass match the old load-everything pass
+- Only facts that can still decay (per the index) have their files loaded,
+  and only decayed facts are rewritten
+- An interrupted pass (max_chunks / should_stop / a failed page read) resumes
+  from its checkpoint
+- Index-only reinforcement protects a fact and is not rolled back
+- ArtifactIndex.get_fact_decay_page keyset paging
+"""
+
+import json
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from artifacts import ArtifactStore
+from decay import (
+    DECAY_CHECKPOINT_FILE,
+    DEFAULT_DECAY_CONFIG,
+    apply_batch_decay,
+    apply_decay_to_store,
+    load_decay_checkpoint,
+)
+from migrations import run_all_pending
+from provenance_signing import clear_key_cache
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+TEST_KEYS = "v1:" + "de" * 32
+
+
+def days_ago(days: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).isoformat().replace("+00:00", "Z")
+
+
+def reference_decay(store: ArtifactStore) -> dict:
+    """The pre-streaming pass: load every fact, decay in memory. Returns {id: confidence}."""
+    entries = store.index.query(artifact_type="fact", limit=100000)
+    facts = [store.get_artifact(e["id"]) for e in entries]
+    apply_batch_decay(facts, DEFAULT_DECAY_CONFIG, dry_run=False)
+    return {f["id"]: f["data"]["confidence"] for f in facts}
+
+
+class DecayStreamTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.memory_dir = Path(self.temp_dir) / "memory"
+        self.memory_dir.mkdir(parents=True)
+        self.db_path = self.memory_dir / "index.db"
+
+        self.patches = [
+            patch.dict(os.environ, {"DURO_PROVENANCE_HMAC_KEYS": TEST_KEYS}),
+            patch("embeddings.embed_artifact", return_value=None),
+        ]
+        for p in self.patches:
+            p.start()
+        clear_key_cache()
+
+        self.store = ArtifactStore(self.memory_dir, self.db_path, write_behind=False)
+        run_all_pending(MIGRATIONS_DIR, str(self.db_path))
+        self.checkpoint_path = self.memory_dir / DECAY_CHECKPOINT_FILE
+
+    def tearDown(self):
+        self.store.index.close()
+        for p in reversed(self.patches):
+            p.stop()
+        clear_key_cache()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_fact(self, i: int, age_days: int, importance: float = 0.5, pinned: bool = False,
+                  reinforcement_count: int = 0, reinforced_days_ago=None, confidence: float = 0.8) -> str:
+        ok, artifact_id, _ = self.store.store_fact(claim=f"decay claim {i}", tags=["decay"], confidence=confidence)
+        self.assertTrue(ok, artifact_id)
+        artifact = self.store.get_artifact(artifact_id)
+        artifact["created_at"] = days_ago(age_days)
+        artifact["data"].update(importance=importance, pinned=pinned, reinforcement_count=reinforcement_count)
+        if reinforced_days_ago is not None:
+            artifact["data"]["last_reinforced_at"] = days_ago(reinforced_days_ago)
+        ok, message = self.store.update_artifact(artifact, re_embed=False)
+        self.assertTrue(ok, message)
+        # The index keeps created_at from the first insert
+        with self.store.index._connect_writer() as conn:
+            conn.execute("UPDATE artifacts SET created_at = ? WHERE id = ?", (artifact["created_at"], artifact_id))
+            conn.commit()
+        return artifact_id
+
+    def make_corpus(self, n: int, seed: int = 0) -> list:
+        rng = random.Random(seed)
+        ids = []
+        for i in range(n):
+            roll = rng.random()
+            if roll < 0.15:
+                ids.append(self.make_fact(i, age_days=rng.randint(0, 400), pinned=True))
+            elif roll < 0.35:
+                ids.append(self.make_fact(i, age_days=rng.randint(0, 6)))  # Grace period
+            elif roll < 0.5:
+                ids.append(self.make_fact(i, age_days=200, reinforcement_count=rng.randint(1, 5),
+                                          reinforced_days_ago=rng.randint(0, 20)))
+            else:
+                ids.append(self.make_fact(i, age_days=rng.randint(8, 900), importance=rng.choice([0.0, 0.3, 0.5, 0.9]),
+                                          confidence=rng.choice([0.05, 0.4, 0.8, 0.99])))
+        return ids
+
+    def confidences(self) -> dict:
+        entries = self.store.index.query(artifact_type="fact", limit=100000)
+        return {e["id"]: self.store.get_artifact(e["id"])["data"]["confidence"] for e in entries}
+
+
+class TestStreamingDecay(DecayStreamTestCase):
+
+    def test_matches_load_everything_pass(self):
+        self.make_corpus(40)
+        expected = reference_decay(self.store)
+
+        dry = apply_decay_to_store(self.store, dry_run=True, chunk_size=7)
+        self.assertNotEqual(self.confidences(), expected)  # Dry run wrote nothing
+        result = apply_decay_to_store(self.store, dry_run=False, chunk_size=7)
+
+        for artifact_id, confidence in self.confidences().items():
+            self.assertAlmostEqual(confidence, expected[artifact_id], places=9, msg=artifact_id)
+        self.assertEqual(result["total"], 40)
+        self.assertEqual(result["chunks"], 6)
+        self.assertTrue(result["complete"])
+        self.assertEqual(result["write_errors"], 0)
+        self.assertEqual({k: dry[k] for k in ("total", "loaded", "decayed", "stale")},
+                         {k: result[k] for k in ("total", "loaded", "decayed", "stale")})
+        self.assertFalse(self.checkpoint_path.exists())
+        self.assertEqual(self.store.get_artifact(next(iter(expected)))["signature_status"], "valid")
+
+    def test_loads_only_candidates_and_writes_only_decayed(self):
+        pinned = self.make_fact(0, age_days=300, pinned=True)
+        fresh = self.make_fact(1, age_days=2)
+        protected = self.make_fact(2, age_days=100, reinforcement_count=2, reinforced_days_ago=10)
+        at_floor = self.make_fact(3, age_days=300, confidence=0.05)
+        decays = self.make_fact(4, age_days=300)
+
+        loaded, written = [], []
+        get_many, update_many = self.store.get_artifacts_many, self.store.update_artifacts_many
+        with patch.object(self.store, "get_artifacts_many", lambda ids: loaded.extend(ids) or get_many(ids)), \
+                patch.object(self.store, "update_artifacts_many",
+                             lambda arts: written.extend(a["id"] for a in arts) or update_many(arts)):
+            result = apply_decay_to_store(self.store, dry_run=False)
+
+        self.assertEqual(sorted(loaded), sorted([at_floor, decays]))
+        self.assertEqual(written, [decays])
+        self.assertEqual((result["skipped_pinned"], result["skipped_grace_period"], result["skipped_reinforcement"]),
+                         (1, 1, 1))
+        self.assertNotIn(pinned, loaded)
+        self.assertNotIn(fresh, loaded)
+        self.assertNotIn(protected, loaded)
+
+    def test_interrupted_pass_resumes(self):
+        self.make_corpus(30, seed=1)
+        expected = reference_decay(self.store)
+
+        first = apply_decay_to_store(self.store, dry_run=False, chunk_size=4, max_chunks=3)
+        self.assertFalse(first["complete"])
+        checkpoint = load_decay_checkpoint(self.checkpoint_path)
+        self.assertEqual(checkpoint["counts"]["total"], 12)
+
+        calls = iter([False, False, True])
+        second = apply_decay_to_store(self.store, dry_run=False, chunk_size=4, should_stop=lambda: next(calls))
+        self.assertFalse(second["complete"])
+        self.assertEqual(second["resumed_from"], checkpoint["after_id"])
+
+        final = apply_decay_to_store(self.store, dry_run=False, chunk_size=4)
+        self.assertTrue(final["complete"])
+        self.assertEqual(final["total"], 30)
+        self.assertFalse(self.checkpoint_path.exists())
+        for artifact_id, confidence in self.confidences().items():
+            self.assertAlmostEqual(confidence, expected[artifact_id], places=9, msg=artifact_id)
+
+    def test_page_read_error_keeps_checkpoint(self):
+        self.make_corpus(12, seed=4)
+        expected = reference_decay(self.store)
+        get_page = self.store.index.get_fact_decay_page
+        pages = iter([get_page, get_page])
+
+        def failing_page(after_id, limit):
+            page = next(pages, None)
+            if page is None:
+                raise sqlite3.OperationalError("database is locked")
+            return page(after_id, limit)
+
+        with patch.object(self.store.index, "get_fact_decay_page", failing_page):
+            with self.assertRaises(sqlite3.OperationalError):
+                apply_decay_to_store(self.store, dry_run=False, chunk_size=4)
+
+        checkpoint = load_decay_checkpoint(self.checkpoint_path)
+        self.assertEqual(checkpoint["counts"]["total"], 8)
+
+        final = apply_decay_to_store(self.store, dry_run=False, chunk_size=4)
+        self.assertTrue(final["complete"])
+        self.assertEqual(final["total"], 12)
+        for artifact_id, confidence in self.confidences().items():
+            self.assertAlmostEqual(confidence, expected[artifact_id], places=9, msg=artifact_id)
+
+    def test_checkpoint_ignored_for_dry_run_and_other_subset(self):
+        self.make_corpus(10, seed=2)
+        apply_decay_to_store(self.store, dry_run=False, chunk_size=4, max_chunks=1)
+        self.assertTrue(self.checkpoint_path.exists())
+
+        self.assertIsNone(apply_decay_to_store(self.store, dry_run=True)["resumed_from"])
+        self.assertIsNone(apply_decay_to_store(self.store, dry_run=False, min_importance=0.4)["resumed_from"])
+
+        self.checkpoint_path.write_text(json.dumps({"version": 0, "after_id": "zzz"}), encoding="utf-8")
+        self.assertEqual(apply_decay_to_store(self.store, dry_run=False)["total"], 10)
+
+    def test_index_only_reinforcement_is_kept(self):
+        artifact_id = self.make_fact(0, age_days=300)
+        for _ in range(3):
+            self.store.index.increment_reinforcement(artifact_id)
+        before = self.store.get_artifact(artifact_id)["data"]["confidence"]
+
+        # Reinforced (index only) long enough ago to decay again
+        older_id = self.make_fact(1, age_days=300)
+        reinforced_at = days_ago(40)
+        with self.store.index._connect_writer() as conn:
+            conn.execute("UPDATE artifacts SET reinforcement_count = 1, last_reinforced_at = ? WHERE id = ?",
+                         (reinforced_at, older_id))
+            conn.commit()
+
+        result = apply_decay_to_store(self.store, dry_run=False)
+        self.assertEqual((result["skipped_grace_period"], result["decayed"]), (1, 1))
+        self.assertEqual(self.store.get_artifact(artifact_id)["data"]["confidence"], before)
+
+        rows = {r["id"]: r for r in self.store.index.get_fact_decay_page(None, 10)}
+        self.assertEqual(rows[artifact_id]["reinforcement_count"], 3)
+        self.assertEqual((rows[older_id]["reinforcement_count"], rows[older_id]["last_reinforced_at"]),
+                         (1, reinforced_at))
+        data = self.store.get_artifact(older_id)["data"]
+        self.assertEqual((data["reinforcement_count"], data["last_reinforced_at"]), (1, reinforced_at))
+
+    def test_decay_page_keyset(self):
+        ids = sorted(self.make_fact(i, age_days=10) for i in range(5))
+        self.store.store_decision(decision="not a fact", rationale="r")
+
+        pages, after_id = [], None
+        while True:
+            page = self.store.index.get_fact_decay_page(after_id, 2)
+            if not page:
+                break
+            pages.append([row["id"] for row in page])
+            after_id = page[-1]["id"]
+        self.assertEqual(pages, [ids[0:2], ids[2:4], ids[4:5]])
+        self.assertEqual(set(self.store.index.get_fact_decay_page(None, 1)[0]),
+                         {"id", "created_at", "file_path", "importance", "pinned",
+                          "last_reinforced_at", "reinforcement_count"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Tests for the query embedding service (micro-batching + LRU cache).
+
+Covers:
+1. Concurrent queries share one batched inference call
+2. Identical in-flight queries are coalesced
+3. Repeated (normalized) queries hit the LRU cache; callers get their own copies
+4. LRU is bounded; histogram counts batch sizes
+5. Unavailable embeddings return None without queuing; failed texts count as errors
+"""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import embedding_service
+from embedding_service import QueryEmbeddingService, normalize_query
+
+
+class FakeModel:
+    """Stands in for embed_batch: records calls, optionally slow."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self.lock:
+            self.calls.append(list(texts))
+        time.sleep(self.delay)
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+class TestQueryEmbeddingService(unittest.TestCase):
+
+    def setUp(self):
+        self.model = FakeModel()
+        self.patches = [
+            patch.object(embedding_service, "embed_batch", self.model),
+            patch.object(embedding_service, "is_embedding_available", return_value=True),
+        ]
+        for p in self.patches:
+            p.start()
+        self.service = QueryEmbeddingService(batch_window_ms=50, max_batch_size=32, cache_size=3)
+
+    def tearDown(self):
+        self.service.stop()
+        for p in self.patches:
+            p.stop()
+
+    def _embed_concurrently(self, queries):
+        results = [None] * len(queries)
+        barrier = threading.Barrier(len(queries))
+
+        def worker(i, q):
+            barrier.wait()
+            results[i] = self.service.embed(q, timeout=5)
+
+        threads = [threading.Thread(target=worker, args=(i, q)) for i, q in enumerate(queries)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results
+
+    def test_concurrent_queries_share_one_batch(self):
+        queries = [f"query number {i}" for i in range(8)]
+        results = self._embed_concurrently(queries)
+
+        self.assertEqual(len(self.model.calls), 1)
+        self.assertEqual(sorted(self.model.calls[0]), sorted(queries))
+        for q, vec in zip(queries, results):
+            self.assertEqual(vec, [float(len(q)), 1.0])
+
+        stats = self.service.get_stats()
+        self.assertEqual(stats["batches"], 1)
+        self.assertEqual(stats["inferences"], 8)
+        self.assertEqual(stats["batch_size_histogram"]["<=8"], 1)
+        self.assertEqual(stats["queue_depth"], 0)
+
+    def test_identical_inflight_queries_coalesce(self):
+        results = self._embed_concurrently(["same query"] * 5 + ["Same   Query "])
+
+        self.assertEqual(len(self.model.calls), 1)
+        self.assertEqual([normalize_query(t) for t in self.model.calls[0]], ["same query"])
+        self.assertTrue(all(r == results[0] for r in results))
+        self.assertEqual(self.service.get_stats()["coalesced"], 5)
+
+    def test_repeat_query_hits_cache(self):
+        first = self.service.embed("cache me", timeout=5)
+        second = self.service.embed("  CACHE   me ", timeout=5)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.model.calls), 1)
+        stats = self.service.get_stats()
+        self.assertEqual(stats["cache_hits"], 1)
+        self.assertEqual(stats["batch_size_histogram"]["<=1"], 1)
+
+    def test_callers_cannot_corrupt_cache(self):
+        first = self.service.embed("mutable", timeout=5)
+        first[0] = -1.0
+        second = self.service.embed("mutable", timeout=5)
+        second.append(99.0)
+
+        self.assertEqual(self.service.embed("mutable", timeout=5), [7.0, 1.0])
+        self.assertIsNot(first, second)
+
+    def test_coalesced_callers_get_separate_lists(self):
+        results = self._embed_concurrently(["shared query"] * 3)
+        self.assertEqual(len({id(r) for r in results}), 3)
+
+    def test_cache_is_bounded_lru(self):
+        for q in ["a", "b", "c"]:
+            self.service.embed(q, timeout=5)
+        self.service.embed("a", timeout=5)  # refresh "a"
+        self.service.embed("d", timeout=5)  # evicts "b"
+
+        self.assertEqual(self.service.get_stats()["cache_size"], 3)
+        calls_before = len(self.model.calls)
+        self.service.embed("a", timeout=5)
+        self.assertEqual(len(self.model.calls), calls_before)
+        self.service.embed("b", timeout=5)
+        self.assertEqual(len(self.model.calls), calls_before + 1)
+
+    def test_model_failure_returns_none(self):
+        def boom(texts):
+            raise RuntimeError("model crashed")
+
+        with patch.object(embedding_service, "embed_batch", boom):
+            self.assertIsNone(self.service.embed("fails", timeout=5))
+        self.assertEqual(self.service.get_stats()["errors"], 1)
+        self.assertEqual(self.service.get_stats()["cache_size"], 0)
+
+    def test_failed_texts_count_as_errors(self):
+        # embed_batch itself logs model errors and returns None per text
+        with patch.object(embedding_service, "embed_batch", lambda texts: [None] * len(texts)):
+            self.assertEqual(self._embed_concurrently(["one", "two"]), [None, None])
+        self.assertEqual(self.service.get_stats()["errors"], 2)
+
+    def test_unavailable_or_empty_returns_none(self):
+        self.assertIsNone(self.service.embed("   "))
+        with patch.object(embedding_service, "is_embedding_available", return_value=False):
+            self.assertIsNone(self.service.embed("anything"))
+        self.assertEqual(self.model.calls, [])
+        self.assertFalse(self.service.get_stats()["running"])
+
+    def test_normalize_query(self):
+        self.assertEqual(normalize_query("  Hello\n\tWorld  "), "hello world")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,12 +13,15 @@ Tests cover:
 - Progress callbacks
 - Resource limits
 - Run function
+- Stage graph: concurrent stages, timings, checkpoint resume
 """
 
 import pytest
 import sys
 import tempfile
 import json
+import threading
+import types
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from dataclasses import dataclass
@@ -41,9 +44,22 @@ from episode_produce import (
     compose_video_assets,
     add_subtitles,
     produce_episode,
+    run_stage_graph,
+    StageNode,
+    AssetCheckpoint,
     SKILL_META,
     DEFAULT_CONFIG,
 )
+import image_generate
+
+
+@pytest.fixture(autouse=True)
+def offline_image_backends(monkeypatch):
+    """The image stage calls image_generate for real; keep tests off the network."""
+    monkeypatch.setattr(
+        image_generate, "generate_image",
+        lambda request, config: Mock(success=False, backend_used=None, error="offline")
+    )
 
 
 class TestSkillMetadata:
@@ -703,5 +719,211 @@ class TestComplexScenarios:
         assert len(scenes[1].dialogue) == 1
 
 
+class StubBackends:
+    """
+    Fake TTS / image modules that write real files and count calls.
+
+    With rendezvous set, the first audio line and the first image block on a
+    shared barrier: both only get past it if the two stages run at once.
+    """
+
+    def __init__(self, fail_compose=False, rendezvous=False):
+        self.fail_compose = fail_compose
+        self.calls = {"audio": 0, "image": 0}
+        self.barrier = threading.Barrier(2, timeout=10) if rendezvous else None
+        self.overlapped = False
+        self._lock = threading.Lock()
+
+    def _work(self, kind, path):
+        with self._lock:
+            self.calls[kind] += 1
+            first = self.calls[kind] == 1
+        if self.barrier and first:
+            self.barrier.wait()  # BrokenBarrierError fails the asset if the stages ran one after another
+            self.overlapped = True
+        Path(path).write_bytes(b"asset")
+
+    def modules(self):
+        def generate_speech(text, voice, output_path):
+            self._work("audio", output_path)
+            return {"success": True, "duration": 1.0}
+
+        def generate_image(request, config):
+            self._work("image", request.output_path)
+            return Mock(success=True, backend_used="stub", error=None)
+
+        return {
+            "generate_tts": types.SimpleNamespace(generate_speech=generate_speech, VOICE_PRESETS={}),
+            "image_generate": types.SimpleNamespace(
+                generate_image=generate_image,
+                ImageRequest=lambda **fields: types.SimpleNamespace(**fields),
+                DEFAULT_CONFIG={},
+            ),
+        }
+
+    def compose(self, image_assets, audio_assets, output_dir, config, progress_callback=None):
+        if self.fail_compose:
+            return StageResult(stage=ProductionStage.COMPOSE_VIDEO, success=False, errors=["ffmpeg missing"])
+        (Path(output_dir) / "episode_raw.mp4").write_bytes(b"video")
+        return StageResult(stage=ProductionStage.COMPOSE_VIDEO, success=True)
+
+    def produce(self, script, **config):
+        with patch.dict("sys.modules", self.modules()), \
+                patch("episode_produce.compose_video_assets", self.compose):
+            return produce_episode(
+                script_content=script,
+                config={"generate_subtitles": False, **config}
+            )
+
+
+GRAPH_SCRIPT = """
+## Scene 1: Opening
+
+[A city at dawn]
+
+**ALICE:**
+"Good morning."
+
+**BOB:**
+"Morning."
+
+## Scene 2: Later
+
+[A quiet street]
+
+**ALICE:**
+"Let's go."
+
+## Scene 3: End
+
+[Sunset]
+"""
+
+
+class TestStageGraph:
+    """Test concurrent stage scheduling and checkpoint resume."""
+
+    def test_independent_stages_overlap(self):
+        stub = StubBackends(rendezvous=True)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = stub.produce(GRAPH_SCRIPT, work_dir=tmpdir, continue_on_error=True)
+
+        assert result.success
+        assert stub.overlapped
+        timings = result.stage_timings
+        assert timings["generate_images"]["start"] < timings["generate_audio"]["end"]
+        assert timings["compose_video"]["start"] >= timings["generate_audio"]["end"]
+
+    def test_assets_in_script_order(self):
+        stub = StubBackends()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = stub.produce(GRAPH_SCRIPT, work_dir=tmpdir, audio_workers=3, image_workers=3)
+
+        audio = [Path(p).name for p in result.assets["audio"]]
+        images = [Path(p).name for p in result.assets["images"]]
+        assert audio == ["alice_scene1_line1.mp3", "bob_scene1_line2.mp3", "alice_scene2_line3.mp3"]
+        assert images == ["scene_001.png", "scene_002.png", "scene_003.png"]
+
+    def test_resume_reuses_checkpointed_assets(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            failed = StubBackends(fail_compose=True)
+            first = failed.produce(GRAPH_SCRIPT, work_dir=tmpdir, resume=True)
+            assert not first.success
+            assert failed.calls == {"audio": 3, "image": 3}
+
+            rerun = StubBackends()
+            second = rerun.produce(GRAPH_SCRIPT, work_dir=tmpdir, resume=True)
+
+        assert second.success
+        assert rerun.calls == {"audio": 0, "image": 0}
+        assert second.resumed_assets == 6
+        assert second.to_dict()["resumed_assets"] == 6
+
+    def test_resume_is_opt_in(self):
+        assert DEFAULT_CONFIG["resume"] is False
+        with tempfile.TemporaryDirectory() as tmpdir:
+            StubBackends().produce(GRAPH_SCRIPT, work_dir=tmpdir, resume=True)
+            stub = StubBackends()
+            result = stub.produce(GRAPH_SCRIPT, work_dir=tmpdir)
+
+        assert result.success
+        assert stub.calls == {"audio": 3, "image": 3}
+        assert result.resumed_assets == 0
+
+    def test_default_resume_dir_is_private(self, tmp_path):
+        with patch("episode_produce.EPISODE_WORK_ROOT", tmp_path / "episodes"):
+            result = StubBackends().produce(GRAPH_SCRIPT, resume=True)
+            rerun = StubBackends().produce(GRAPH_SCRIPT, resume=True)
+
+        work_dirs = list((tmp_path / "episodes").iterdir())
+        assert result.success
+        assert len(work_dirs) == 1
+        assert work_dirs[0].stat().st_mode & 0o777 == 0o700
+        assert rerun.resumed_assets == 6
+
+    def test_checkpoint_ignores_paths_outside_work_dir(self, tmp_path):
+        work_dir = tmp_path / "work"
+        outside = tmp_path / "elsewhere.png"
+        outside.write_bytes(b"planted")
+        work_dir.mkdir()
+        key = AssetCheckpoint.key("image", "scene")
+        (work_dir / AssetCheckpoint.FILENAME).write_text(json.dumps({"assets": {
+            key: {"asset_type": "image", "path": str(outside), "success": True},
+        }}))
+
+        assert AssetCheckpoint(work_dir).get(key) is None
+
+    def test_image_stage_uses_image_request(self, tmp_path):
+        scenes = generate_image_prompts(parse_script(GRAPH_SCRIPT)[0])
+        with patch("image_generate.generate_image") as generate_image:
+            generate_image.side_effect = lambda request, config: Mock(
+                success=True, backend_used=None, error=None
+            )
+            result = generate_image_assets(scenes, tmp_path, {**DEFAULT_CONFIG, "image_workers": 1})
+
+        assert result.success
+        request, config = generate_image.call_args_list[0].args
+        assert request.prompt == scenes[0].image_prompt
+        assert (request.width, request.height) == (DEFAULT_CONFIG["video_width"], DEFAULT_CONFIG["video_height"])
+
+    def test_fatal_stage_stops_dependents(self):
+        ran = []
+
+        def stage(name, success):
+            def run_stage(done):
+                ran.append(name)
+                return StageResult(stage=ProductionStage.COMPOSE_VIDEO, success=success)
+            return run_stage
+
+        results, timings, stopped_by = run_stage_graph([
+            StageNode("a", stage("a", False), fatal=True),
+            StageNode("b", stage("b", True), ("a",)),
+        ])
+
+        assert stopped_by == "a"
+        assert ran == ["a"]
+        assert set(results) == {"a"}
+        assert set(timings) == {"a"}
+
+    def test_dependents_see_finished_results(self):
+        seen = {}
+
+        def first(done):
+            return StageResult(stage=ProductionStage.GENERATE_AUDIO, success=True)
+
+        def second(done):
+            seen.update(done)
+            return None
+
+        results, _, stopped_by = run_stage_graph([
+            StageNode("second", second, ("first",)),
+            StageNode("first", first),
+        ])
+
+        assert stopped_by is None
+        assert list(seen) == ["first"]
+        assert results["second"] is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,117 @@
+"""
+Tests for hybrid_search candidate hydration and filter pushdown.
+
+Tests cover:
+- All candidates are hydrated with a single artifacts query
+- Tag filters are applied before truncation (filtered searches aren't short)
+- Type filters are applied in the candidate SQL
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from index import ArtifactIndex
+from migrations import run_all_pending
+from time_utils import utc_now_iso
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+
+# Topic words mixed into synthetic claims
+VOCAB = [
+    "sqlite", "python", "embedding", "vector", "cache", "deploy", "audit",
+    "schema", "latency", "queue", "worker", "policy", "search", "token",
+    "memory", "thread", "socket", "render", "video", "image", "review",
+    "secret", "decay", "ranking", "index", "backup", "restore", "webhook",
+    "gateway", "monitor", "metric", "budget", "session", "bridge", "parser",
+    "compiler", "runtime", "network", "storage", "snapshot",
+]
+
+
+def _artifact(artifact_id: str, claim: str, tags: list[str], artifact_type: str = "fact") -> dict:
+    return {
+        "id": artifact_id,
+        "type": artifact_type,
+        # Recent, so the recency boost lifts keyword-only hits over min_score
+        "created_at": utc_now_iso(),
+        "sensitivity": "public",
+        "tags": tags,
+        "source": {"workflow": "test"},
+        "data": {"claim": claim, "decision": claim, "rationale": claim},
+    }
+
+
+def _build_index(root: str, count: int, batch: int = 5000) -> ArtifactIndex:
+    db_path = Path(root) / "index.db"
+    index = ArtifactIndex(db_path)
+    run_all_pending(MIGRATIONS_DIR, str(db_path))
+
+    entries = []
+    for i in range(count):
+        tags = ["rare"] if i % 10 == 0 else ["common"]
+        artifact_type = "decision" if i % 3 == 0 else "fact"
+        topic = f"{VOCAB[i % len(VOCAB)]} {VOCAB[(i * 7 + 3) % len(VOCAB)]}"
+        artifact = _artifact(f"art_{i:06d}", f"searchable widget {topic} number {i}", tags, artifact_type)
+        entries.append((artifact, f"facts/art_{i:06d}.json", f"hash{i}"))
+        if len(entries) >= batch:
+            index.upsert_many(entries)
+            entries = []
+    if entries:
+        index.upsert_many(entries)
+    return index
+
+
+class TestHybridSearchHydration(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.index = _build_index(self.temp_dir, 200)
+
+    def tearDown(self):
+        self.index.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_candidates_hydrated_in_one_query(self):
+        statements = []
+        self.index._connect().set_trace_callback(statements.append)
+        try:
+            result = self.index.hybrid_search("widget", limit=20)
+        finally:
+            self.index._connect().set_trace_callback(None)
+
+        self.assertEqual(len(result["results"]), 20)
+        hydration = [sql for sql in statements if "json_each" in sql and "file_path" in sql]
+        per_id = [sql for sql in statements if "WHERE id = ?" in sql or "WHERE id = '" in sql]
+        self.assertEqual(len(hydration), 1)
+        self.assertEqual(per_id, [])
+
+    def test_tag_filter_fills_limit(self):
+        # Only 1 in 10 artifacts is tagged "rare"; post-truncation filtering
+        # would return ~2 of the requested 10.
+        result = self.index.hybrid_search("widget", tags=["rare"], limit=10)
+
+        self.assertEqual(len(result["results"]), 10)
+        for r in result["results"]:
+            self.assertIn("rare", r["tags"])
+
+    def test_tag_filter_matches_whole_tags(self):
+        self.index.upsert(_artifact("art_prefix", "searchable widget prefix", ["rarely"]), "f", "h")
+
+        result = self.index.hybrid_search("prefix", tags=["rare"], limit=10)
+
+        self.assertNotIn("art_prefix", [r["id"] for r in result["results"]])
+
+    def test_type_filter_in_candidates(self):
+        result = self.index.hybrid_search("widget", artifact_type="decision", limit=15)
+
+        self.assertEqual(len(result["results"]), 15)
+        self.assertTrue(all(r["type"] == "decision" for r in result["results"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,6 +15,7 @@ import pytest
 import sys
 import json
 import tempfile
+import threading
 import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -28,6 +29,7 @@ from image_generate import (
     enhance_prompt,
     get_cache_key,
     get_cached_image,
+    get_cache_stats,
     save_to_cache,
     generate_image,
     generate_batch,
@@ -41,6 +43,12 @@ from image_generate import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep each test's media cache out of the working directory."""
+    monkeypatch.setitem(DEFAULT_CONFIG, "cache_dir", str(tmp_path / "image_cache"))
+
+
 class TestSkillMetadata:
     """Test skill metadata is properly defined."""
 
@@ -172,6 +180,45 @@ class TestCaching:
             cached = get_cached_image(req, config)
             assert cached == str(img_path)
 
+    def test_hit_survives_deleted_output(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = {**DEFAULT_CONFIG, "cache_dir": str(Path(tmpdir) / "cache")}
+            first = Path(tmpdir) / "first.png"
+            first.write_bytes(b"rendered bytes")
+            save_to_cache(ImageRequest(prompt="kept", output_path=str(first)), str(first), config)
+            first.unlink()
+
+            second = Path(tmpdir) / "second.png"
+            cached = get_cached_image(ImageRequest(prompt="kept", output_path=str(second)), config)
+
+            assert cached == str(second)
+            assert second.read_bytes() == b"rendered bytes"
+
+    def test_identical_renders_share_blob(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = {**DEFAULT_CONFIG, "cache_dir": str(Path(tmpdir) / "cache")}
+            for prompt in ("stock sunset", "sunset stock photo"):
+                path = Path(tmpdir) / f"{prompt}.png"
+                path.write_bytes(b"same stock image")
+                save_to_cache(ImageRequest(prompt=prompt, output_path=str(path)), str(path), config)
+
+            stats = get_cache_stats(config)
+            assert (stats["entries"], stats["blobs"], stats["deduped"]) == (2, 1, 1)
+
+    def test_cache_bounded_by_size(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = {**DEFAULT_CONFIG, "cache_dir": str(Path(tmpdir) / "cache"), "cache_max_mb": 0.001}
+            for i in range(4):
+                path = Path(tmpdir) / f"img_{i}.png"
+                path.write_bytes(bytes([i]) * 400)
+                save_to_cache(ImageRequest(prompt=f"img {i}", output_path=str(path)), str(path), config)
+
+            stats = get_cache_stats(config)
+            assert stats["total_bytes"] <= 1024 * 1024 * 0.001
+            assert stats["evictions"] == 2
+            assert get_cached_image(ImageRequest(prompt="img 0", output_path=str(Path(tmpdir) / "x.png")), config) is None
+            assert get_cached_image(ImageRequest(prompt="img 3", output_path=str(Path(tmpdir) / "y.png")), config)
+
 
 class TestBackendEnum:
     """Test Backend enum."""
@@ -355,11 +402,8 @@ class TestBatchGeneration:
                 assert all(r.success for r in results)
 
     def test_batch_partial_failure(self):
-        call_count = [0]
-
         def mock_handler(prompt, width, height, out_path, config):
-            call_count[0] += 1
-            if call_count[0] == 2:  # Second call fails
+            if "Image 1" in prompt:  # Second request fails
                 return (False, "Error")
             Path(out_path).write_bytes(b"fake image")
             return (True, None)
@@ -380,6 +424,34 @@ class TestBatchGeneration:
 
                 success_count = sum(1 for r in results if r.success)
                 assert success_count == 2
+                assert not results[1].success
+
+    def test_batch_runs_concurrently_in_order(self):
+        # All four handlers must be in flight at once to get past the barrier
+        in_flight = threading.Barrier(4, timeout=10)
+
+        def mock_handler(prompt, width, height, out_path, config):
+            in_flight.wait()
+            Path(out_path).write_bytes(b"fake image")
+            return (True, None)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict('image_generate.BACKEND_HANDLERS', {Backend.POLLINATIONS: mock_handler}):
+                requests = [
+                    ImageRequest(
+                        prompt=f"Concurrent image {i}",
+                        output_path=str(Path(tmpdir) / f"test_{i}.png"),
+                        backends=[Backend.POLLINATIONS]
+                    )
+                    for i in range(4)
+                ]
+
+                config = {**DEFAULT_CONFIG, "batch_workers": 4, "cache_enabled": False}
+                results = generate_batch(requests, config)
+
+                assert [r.path for r in results] == [r.output_path for r in requests]
+                assert all(r.success for r in results)
+                assert not in_flight.broken
 
 
 class TestRunFunction:
@@ -0,0 +1,136 @@
+"""
+Tests for manifest-driven incremental reindex (ArtifactStore.reconcile_index).
+
+Covers:
+1. First reconcile indexes everything and records the manifest
+2. Second reconcile with no changes re-parses nothing
+3. Added / changed / removed files are detected
+4. Touched files with identical content only refresh the manifest
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from artifacts import ArtifactStore
+from migrations import run_all_pending
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+
+
+def _fact(artifact_id: str, claim: str) -> dict:
+    return {
+        "id": artifact_id,
+        "type": "fact",
+        "version": "1.1",
+        "created_at": "2026-01-01T00:00:00Z",
+        "sensitivity": "public",
+        "tags": ["reindex"],
+        "source": {"workflow": "test"},
+        "data": {"claim": claim, "confidence": 0.5},
+    }
+
+
+class TestReconcileIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.memory_dir = Path(self.temp_dir) / "memory"
+        self.facts_dir = self.memory_dir / "facts"
+        self.facts_dir.mkdir(parents=True)
+
+        db_path = self.memory_dir / "index.db"
+        self.store = ArtifactStore(self.memory_dir, db_path)
+        run_all_pending(MIGRATIONS_DIR, str(db_path))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, artifact: dict) -> Path:
+        path = self.facts_dir / f"{artifact['id']}.json"
+        path.write_text(json.dumps(artifact, indent=2), encoding="utf-8")
+        return path
+
+    def test_first_reconcile_indexes_all(self):
+        for i in range(5):
+            self._write(_fact(f"fact_{i}", f"claim number {i}"))
+
+        diff = self.store.reconcile_index()
+
+        self.assertEqual(diff["scanned"], 5)
+        self.assertEqual(diff["added"], 5)
+        self.assertEqual(diff["errors"], 0)
+        self.assertEqual(self.store.index.count(), 5)
+        self.assertEqual(len(self.store.index.get_file_manifest()), 5)
+
+    def test_unchanged_files_are_not_reparsed(self):
+        for i in range(5):
+            self._write(_fact(f"fact_{i}", f"claim number {i}"))
+        self.store.reconcile_index()
+
+        diff = self.store.reconcile_index()
+
+        self.assertEqual(diff["unchanged"], 5)
+        self.assertEqual(diff["added"] + diff["changed"] + diff["removed"], 0)
+
+    def test_detects_added_changed_removed(self):
+        self._write(_fact("fact_keep", "stays the same"))
+        self._write(_fact("fact_edit", "original claim"))
+        gone = self._write(_fact("fact_gone", "will be deleted"))
+        self.store.reconcile_index()
+
+        self._write(_fact("fact_edit", "edited claim with more text"))
+        gone.unlink()
+        self._write(_fact("fact_new", "brand new"))
+
+        diff = self.store.reconcile_index()
+
+        self.assertEqual(diff["added_ids"], ["fact_new"])
+        self.assertEqual(diff["changed_ids"], ["fact_edit"])
+        self.assertEqual(diff["removed_ids"], ["fact_gone"])
+        self.assertEqual(diff["unchanged"], 1)
+        self.assertIsNone(self.store.index.get_by_id("fact_gone"))
+        self.assertIn("edited", self.store.index.get_by_id("fact_edit")["title"])
+        self.assertNotIn(str(gone), self.store.index.get_file_manifest())
+
+    def test_touched_file_only_refreshes_manifest(self):
+        path = self._write(_fact("fact_touch", "same content"))
+        self.store.reconcile_index()
+
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+        diff = self.store.reconcile_index()
+        self.assertEqual(diff["touched"], 1)
+        self.assertEqual(diff["changed"], 0)
+
+        diff = self.store.reconcile_index()
+        self.assertEqual(diff["unchanged"], 1)
+
+    def test_reconcile_after_full_reindex_is_noop(self):
+        for i in range(3):
+            self._write(_fact(f"fact_{i}", f"claim number {i}"))
+        self.store.reindex()
+
+        diff = self.store.reconcile_index()
+
+        self.assertEqual(diff["unchanged"], 3)
+
+    def test_malformed_file_counted_as_error(self):
+        (self.facts_dir / "broken.json").write_text("{not json", encoding="utf-8")
+
+        diff = self.store.reconcile_index()
+
+        self.assertEqual(diff["errors"], 1)
+        self.assertEqual(diff["error_paths"], [str(self.facts_dir / "broken.json")])
+
+
+if __name__ == "__main__":
+    unittest.main()
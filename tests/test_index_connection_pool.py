@@ -0,0 +1,113 @@
+"""
+Tests for ArtifactIndex connection pooling.
+
+Covers:
+1. Repeated reads and writes reuse pooled connections (no reopen per call)
+2. Each thread gets its own reader connection
+3. Writer connection rolls back on error and is reused afterwards
+4. close() drops pooled connections and the index reopens lazily
+"""
+
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from index import ArtifactIndex
+from migrations import run_all_pending
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+
+
+def _artifact(artifact_id: str) -> dict:
+    return {
+        "id": artifact_id,
+        "type": "fact",
+        "created_at": "2026-01-01T00:00:00Z",
+        "sensitivity": "public",
+        "tags": ["pool"],
+        "source": {"workflow": "test"},
+        "data": {"claim": f"pooled claim {artifact_id}"},
+    }
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        db_path = Path(self.temp_dir) / "index.db"
+        self.index = ArtifactIndex(db_path)
+        run_all_pending(MIGRATIONS_DIR, str(db_path))
+
+    def tearDown(self):
+        self.index.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _opens(self) -> int:
+        return self.index.get_pool_stats()["connection_opens"]
+
+    def test_calls_reuse_connections(self):
+        self.index.upsert(_artifact("fact_pool_0"), "facts/fact_pool_0.json", "hash")
+        self.index.count()
+        opens = self._opens()
+
+        for i in range(1, 20):
+            self.index.upsert(_artifact(f"fact_pool_{i}"), f"facts/fact_pool_{i}.json", "hash")
+            self.index.get_by_id(f"fact_pool_{i}")
+            self.index.query(artifact_type="fact", limit=5)
+            self.index.hybrid_search("pooled claim", limit=5)
+
+        self.assertEqual(self._opens(), opens)
+        self.assertEqual(self.index.count(), 20)
+        self.assertEqual(self.index.get_stats()["connection_pool"]["connection_opens"], opens)
+
+    def test_one_reader_connection_per_thread(self):
+        main_conn = self.index._connect()
+        self.assertIs(self.index._connect(), main_conn)
+
+        seen = []
+
+        def worker():
+            conn = self.index._connect()
+            seen.append(conn)
+            self.assertIs(self.index._connect(), conn)
+            self.assertEqual(self.index.count(), 0)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(len(seen), 1)
+        self.assertIsNot(seen[0], main_conn)
+
+    def test_writer_rolls_back_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with self.index._connect_writer() as conn:
+                conn.execute(
+                    "INSERT INTO artifacts (id, type, created_at, sensitivity, title, file_path, hash) "
+                    "VALUES ('fact_rollback', 'fact', '2026-01-01', 'public', 't', 'f', 'h')"
+                )
+                raise RuntimeError("boom")
+
+        self.assertIsNone(self.index.get_by_id("fact_rollback"))
+        self.assertTrue(self.index.upsert(_artifact("fact_after"), "facts/fact_after.json", "hash"))
+        self.assertEqual(self.index.count(), 1)
+
+    def test_close_reopens_lazily(self):
+        self.index.count()
+        self.assertGreater(self.index.get_pool_stats()["open_connections"], 0)
+
+        self.index.close()
+        self.assertEqual(self.index.get_pool_stats()["open_connections"], 0)
+
+        self.assertTrue(self.index.upsert(_artifact("fact_reopen"), "facts/fact_reopen.json", "hash"))
+        self.assertEqual(self.index.count(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+"""
+Tests for the shared content-addressed media cache.
+
+Covers:
+1. put/get round trip copies bytes to the caller's output path
+2. Keys that render to identical bytes share one blob
+3. LRU eviction keeps the cache under max_bytes, recently read entries survive
+4. A blob shared by two keys is freed only with its last entry
+5. Expired entries and entries with missing blobs are misses and get dropped
+6. Concurrent puts/gets from threads and the shared per-root instance
+7. TTS and video skills reuse cached renders instead of calling the backend
+"""
+
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+SKILLS_DIR = Path(__file__).parent.parent / "skills"
+sys.path.insert(0, str(SKILLS_DIR / "production"))
+sys.path.insert(0, str(SKILLS_DIR / "audio"))
+sys.path.insert(0, str(SKILLS_DIR / "video"))
+
+import generate_tts
+import video_generate
+from media_cache import DEFAULT_CACHE_ROOT, MediaCache, default_cache_dir, get_media_cache, make_key
+
+
+class MediaCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.cache = MediaCache(self.tmp / "cache", max_bytes=1000)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _file(self, name: str, data: bytes) -> Path:
+        path = self.tmp / name
+        path.write_bytes(data)
+        return path
+
+
+class TestMediaCache(MediaCacheTestCase):
+
+    def test_round_trip(self):
+        source = self._file("render.png", b"pixels")
+        self.cache.put("k", source, namespace="image")
+        source.unlink()
+
+        out = self.tmp / "out" / "copy.png"
+        self.assertEqual(self.cache.get("k", namespace="image", dest_path=out), str(out))
+        self.assertEqual(out.read_bytes(), b"pixels")
+        self.assertIsNone(self.cache.get("k", namespace="tts"))
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_lookup_without_index_creates_nothing(self):
+        cache = MediaCache(self.tmp / "never_written")
+        self.assertIsNone(cache.get("k"))
+        self.assertFalse((self.tmp / "never_written").exists())
+
+    def test_identical_bytes_share_blob(self):
+        first = self.cache.put("a", self._file("a.png", b"same"))
+        second = self.cache.put("b", self._file("b.png", b"same"))
+
+        self.assertEqual(first, second)
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["entries"], stats["blobs"], stats["total_bytes"]), (2, 1, 4))
+        self.assertEqual(stats["deduped"], 1)
+
+    def test_replacing_key_releases_old_blob(self):
+        self.cache.put("k", self._file("v1.png", b"one"))
+        self.cache.put("k", self._file("v2.png", b"two!"))
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["entries"], stats["blobs"], stats["total_bytes"]), (1, 1, 4))
+
+    def test_lru_eviction(self):
+        for name in ("a", "b", "c"):
+            self.cache.put(name, self._file(f"{name}.bin", name.encode() * 400))
+            # "a" is read after every put, so it stays most recently used
+            self.cache.get("a")
+
+        stats = self.cache.get_stats()
+        self.assertLessEqual(stats["total_bytes"], 1000)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("c"))
+
+    def test_shared_blob_freed_with_last_entry(self):
+        self.cache.put("a", self._file("a.bin", b"x" * 600))
+        self.cache.put("b", self._file("b.bin", b"x" * 600))
+        self.cache.put("a", self._file("a2.bin", b"y" * 100))
+        self.assertIsNotNone(self.cache.get("b", dest_path=self.tmp / "b_out.bin"))
+        self.cache.get("a")
+
+        # "b" is least recently used; evicting it frees the shared 600 bytes
+        self.cache.put("c", self._file("c.bin", b"z" * 400))
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["entries"], stats["blobs"], stats["total_bytes"]), (2, 2, 500))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(len(list((self.tmp / "cache" / "blobs").rglob("*.bin"))), 2)
+
+    def test_expired_entry_is_dropped(self):
+        self.cache.put("k", self._file("a.png", b"stale"))
+        with patch("media_cache.time.time", return_value=10**10):
+            self.assertIsNone(self.cache.get("k", max_age_seconds=60))
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["expired"], stats["entries"], stats["blobs"]), (1, 0, 0))
+
+    def test_missing_blob_is_a_miss(self):
+        self.cache.put("k", self._file("a.png", b"gone"))
+        for blob in (self.tmp / "cache" / "blobs").rglob("*.png"):
+            blob.unlink()
+
+        self.assertIsNone(self.cache.get("k"))
+        self.assertEqual(self.cache.get_stats()["entries"], 0)
+
+    def test_concurrent_access(self):
+        cache = MediaCache(self.tmp / "shared", max_bytes=10**6)
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(20):
+                    cache.put(f"{n}-{i}", self._file(f"{n}-{i}.bin", bytes([i]) * 10))
+                    self.assertIsNotNone(cache.get(f"{n}-{i}", dest_path=self.tmp / f"out-{n}-{i}.bin"))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        stats = cache.get_stats()
+        self.assertEqual((stats["entries"], stats["blobs"]), (80, 20))
+        cache.close()
+
+    def test_shared_instance_per_root(self):
+        first = get_media_cache(self.tmp / "root")
+        second = get_media_cache(str(self.tmp / "root"), max_bytes=123)
+        self.assertIs(first, second)
+        self.assertEqual(first.max_bytes, 123)
+        first.close()
+
+
+class TestSkillIntegration(MediaCacheTestCase):
+
+    def test_tts_reuses_cached_render(self):
+        calls = []
+
+        def fake_edge_tts(cmd, **kwargs):
+            calls.append(cmd)
+            Path(cmd[cmd.index("--write-media") + 1]).write_bytes(b"mp3 bytes")
+            return unittest.mock.Mock(returncode=0, stderr="")
+
+        cache_dir = str(self.tmp / "media")
+        with patch("generate_tts.subprocess.run", side_effect=fake_edge_tts):
+            first = generate_tts.generate_speech("Hello", "rachel", str(self.tmp / "1.mp3"), cache_dir=cache_dir)
+            second = generate_tts.generate_speech("Hello", "rachel", str(self.tmp / "2.mp3"), cache_dir=cache_dir)
+            other = generate_tts.generate_speech("Hello", "maya", str(self.tmp / "3.mp3"), cache_dir=cache_dir)
+
+        self.assertTrue(first["success"] and second["success"] and other["success"])
+        self.assertTrue(second["cached"])
+        self.assertEqual((self.tmp / "2.mp3").read_bytes(), b"mp3 bytes")
+        self.assertEqual(len(calls), 2)
+        get_media_cache(cache_dir).close()
+
+    def test_video_reuses_cached_render(self):
+        calls = []
+
+        def fake_backend(request, config):
+            calls.append(request.prompt)
+            Path(request.output_path).write_bytes(b"mp4 bytes")
+            return True, request.output_path, None
+
+        config = {**video_generate.DEFAULT_CONFIG, "cache_dir": str(self.tmp / "videos")}
+        backend = video_generate.VideoBackend.MINIMAX
+        with patch.dict(video_generate.BACKEND_HANDLERS, {backend: fake_backend}):
+            results = [
+                video_generate.generate_video(
+                    video_generate.VideoRequest(prompt="waves", output_path=str(self.tmp / f"{i}.mp4"), backends=[backend]),
+                    config
+                )
+                for i in range(2)
+            ]
+
+        self.assertEqual(calls, ["waves"])
+        self.assertFalse(results[0].cached)
+        self.assertTrue(results[1].cached)
+        self.assertEqual(results[1].estimated_cost, 0)
+        self.assertEqual((self.tmp / "1.mp4").read_bytes(), b"mp4 bytes")
+        get_media_cache(config["cache_dir"]).close()
+
+    def test_default_cache_dir_is_per_user(self):
+        self.assertIsNone(video_generate.DEFAULT_CONFIG["cache_dir"])
+        cache = video_generate._media_cache(video_generate.DEFAULT_CONFIG)
+        self.assertEqual(Path(cache.root), default_cache_dir("video").resolve())
+        self.assertTrue(default_cache_dir("video").is_relative_to(DEFAULT_CACHE_ROOT))
+
+
+class TestMakeKey(unittest.TestCase):
+
+    def test_key_is_order_independent(self):
+        self.assertEqual(make_key(a=1, b="x"), make_key(b="x", a=1))
+        self.assertNotEqual(make_key(a=1), make_key(a=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
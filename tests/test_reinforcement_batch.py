@@ -0,0 +1,195 @@
+"""
+Tests for batched retrieval reinforcement and TTL state keys.
+
+Covers:
+1. AutonomyStateStore TTL keys read as missing once expired and are swept
+2. ensure_schema adds the TTL column to an existing autonomy_state table
+3. get_values / set_many read and write several keys at once
+4. track_retrieval: one cooldown query, one index transaction, TTL cooldowns
+5. Cooldown keys written before TTLs existed get one on scheduler start
+"""
+
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from autonomy_scheduler import AutonomyScheduler
+from autonomy_state import AutonomyStateStore
+from index import ArtifactIndex
+from migrations import run_all_pending
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+
+
+def _fact(artifact_id: str) -> dict:
+    return {
+        "id": artifact_id,
+        "type": "fact",
+        "created_at": "2026-01-01T00:00:00Z",
+        "sensitivity": "public",
+        "tags": [],
+        "source": {"workflow": "test"},
+        "data": {"claim": f"claim {artifact_id}"},
+    }
+
+
+class StateTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.db_path = self.temp_dir / "state.db"
+        self.state = AutonomyStateStore(str(self.db_path))
+        self.state.ensure_schema()
+
+    def tearDown(self):
+        self.state.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _raw_keys(self) -> list:
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            return [row[0] for row in conn.execute("SELECT key FROM autonomy_state ORDER BY key")]
+        finally:
+            conn.close()
+
+
+class TestTTLKeys(StateTestCase):
+
+    def test_expired_key_reads_as_missing(self):
+        self.state.set("cooldown.a", "x", ttl_seconds=60)
+        self.state.set("permanent", 1)
+        self.assertEqual(self.state.get("cooldown.a"), "x")
+
+        later = time.time() + 120
+        with patch("autonomy_state.time.time", return_value=later):
+            self.assertIsNone(self.state.get("cooldown.a"))
+            self.assertEqual(self.state.get_values(["cooldown.a", "permanent"]), {"permanent": 1})
+            self.assertEqual(self.state.keys(), ["permanent"])
+            self.assertEqual(self.state.count(), 1)
+            self.assertEqual(self.state.get_many("cooldown."), {})
+
+    def test_set_without_ttl_clears_ttl(self):
+        self.state.set("k", 1, ttl_seconds=60)
+        self.state.set("k", 2)
+        with patch("autonomy_state.time.time", return_value=time.time() + 120):
+            self.assertEqual(self.state.get("k"), 2)
+
+    def test_writes_sweep_expired_rows(self):
+        self.state.set_many({f"cooldown.{i}": i for i in range(5)}, ttl_seconds=60)
+        self.state.set("permanent", 1)
+        self.assertEqual(len(self._raw_keys()), 6)
+
+        later = time.time() + AutonomyStateStore.SWEEP_INTERVAL_SECONDS + 120
+        with patch("autonomy_state.time.time", return_value=later):
+            self.state.set("other", 2)
+        self.assertEqual(self._raw_keys(), ["other", "permanent"])
+
+    def test_sweep_expired(self):
+        self.state.set("cooldown.a", 1, ttl_seconds=1)
+        with patch("autonomy_state.time.time", return_value=time.time() + 10):
+            self.assertEqual(self.state.sweep_expired(), 1)
+        self.assertEqual(self._raw_keys(), [])
+
+    def test_schema_migration_adds_ttl_column(self):
+        old_db = self.temp_dir / "old.db"
+        conn = sqlite3.connect(str(old_db))
+        conn.execute("""
+            CREATE TABLE autonomy_state (
+                key TEXT PRIMARY KEY, value_json TEXT NOT NULL, updated_at_unix INTEGER NOT NULL
+            )
+        """)
+        conn.execute("INSERT INTO autonomy_state VALUES ('reinforcement.recent.f1', '\"t\"', 100)")
+        conn.commit()
+        conn.close()
+
+        state = AutonomyStateStore(str(old_db))
+        state.ensure_schema()
+        state.ensure_schema()  # idempotent
+        self.assertEqual(state.get("reinforcement.recent.f1"), "t")
+        self.assertEqual(state.expire_prefix("reinforcement.recent.", 3600), 1)
+        self.assertIsNone(state.get("reinforcement.recent.f1"))  # updated at 100 + 3600s
+        state.close()
+
+
+class TestTrackRetrieval(StateTestCase):
+
+    def setUp(self):
+        super().setUp()
+        index_path = self.temp_dir / "index.db"
+        self.index = ArtifactIndex(index_path)
+        run_all_pending(MIGRATIONS_DIR, str(index_path))
+        for i in range(5):
+            self.index.upsert(_fact(f"fact_{i}"), f"facts/fact_{i}.json", "hash")
+        self.scheduler = AutonomyScheduler(
+            state=self.state, artifact_store=None, reputation_store=None, index=self.index
+        )
+
+    def tearDown(self):
+        self.index.close()
+        super().tearDown()
+
+    def _counts(self) -> dict:
+        with self.index._connect() as conn:
+            rows = conn.execute("SELECT id, COALESCE(reinforcement_count, 0) FROM artifacts").fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def _results(self, ids) -> list:
+        return [{"id": i, "type": "fact"} for i in ids]
+
+    def test_reinforces_top_facts_in_one_batch(self):
+        results = [{"id": "decision_1", "type": "decision"}] + self._results(
+            ["fact_0", "fact_0", "fact_1", "fact_2", "fact_3"]
+        )
+        with patch.object(self.index, "increment_reinforcement", side_effect=AssertionError("per-id call")), \
+                patch.object(self.state, "get", side_effect=AssertionError("per-key read")), \
+                patch.object(self.index, "increment_reinforcement_many", wraps=self.index.increment_reinforcement_many) as batch:
+            reinforced = self.scheduler.track_retrieval(results, source="semantic_search")
+
+        self.assertEqual(reinforced, 2)  # top 3 facts, fact_0 listed twice
+        batch.assert_called_once_with(["fact_0", "fact_1"])
+        counts = self._counts()
+        self.assertEqual((counts["fact_0"], counts["fact_1"], counts["fact_2"]), (1, 1, 0))
+
+    def test_cooldown_expires(self):
+        ids = ["fact_0", "fact_1"]
+        self.assertEqual(self.scheduler.track_retrieval(self._results(ids)), 2)
+        self.assertEqual(self.scheduler.track_retrieval(self._results(ids)), 0)
+        self.assertEqual(self.state.count("reinforcement.recent."), 2)
+
+        later = time.time() + 61 * 60
+        with patch("autonomy_state.time.time", return_value=later), \
+                patch("autonomy_scheduler.utc_now", return_value=datetime.now(timezone.utc) + timedelta(minutes=61)):
+            self.assertEqual(self.state.count("reinforcement.recent."), 0)
+            self.assertEqual(self.scheduler.track_retrieval(self._results(ids)), 2)
+
+        self.assertEqual(self._counts()["fact_0"], 2)
+
+    def test_proactive_recall_not_reinforced(self):
+        self.assertEqual(self.scheduler.track_retrieval(self._results(["fact_0"]), source="proactive_recall"), 0)
+        self.assertEqual(self._counts()["fact_0"], 0)
+
+    def test_legacy_cooldown_keys_get_ttl(self):
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute(
+            "INSERT INTO autonomy_state (key, value_json, updated_at_unix) VALUES (?, ?, ?)",
+            ("reinforcement.recent.fact_9", '"2020-01-01T00:00:00+00:00"', 1_577_836_800)
+        )
+        conn.commit()
+        conn.close()
+
+        AutonomyScheduler(state=self.state, artifact_store=None, reputation_store=None, index=self.index)
+        self.state.sweep_expired()
+        self.assertNotIn("reinforcement.recent.fact_9", self._raw_keys())
+
+
+if __name__ == "__main__":
+    unittest.main()
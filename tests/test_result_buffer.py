@@ -0,0 +1,226 @@
+"""
+Tests for the heap-indexed, row-persisted surfacing ResultBuffer.
+
+Tests cover:
+- Same order / dedupe / trim / filtered pops as the old sort-the-list buffer
+- With a BufferEventTable only changed rows are written (no JSON blob rewrites)
+- A reloaded buffer sees the same queue in the same order
+- A legacy "autonomy.buffer" JSON queue is migrated to the table once
+"""
+
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from autonomy_state import AutonomyStateStore, BufferEventTable
+from surfacing import ResultBuffer
+
+
+class ReferenceBuffer:
+    """The pre-heap ResultBuffer queue logic (in memory)."""
+
+    MAX_EVENTS = ResultBuffer.MAX_EVENTS
+
+    def __init__(self):
+        self.queue = []
+
+    def _sort_trim(self):
+        self.queue.sort(key=lambda x: (-int(x.get("priority", 0)), -int(x.get("updated_at_unix", 0))))
+        self.queue = self.queue[: self.MAX_EVENTS]
+
+    def enqueue(self, ev_id, event_type, priority, dedupe_key, now):
+        if dedupe_key:
+            for ev in self.queue:
+                if ev["dedupe_key"] == dedupe_key:
+                    ev["priority"] = priority
+                    ev["updated_at_unix"] = now
+                    self._sort_trim()
+                    return ev["id"]
+        self.queue.append({
+            "id": ev_id, "type": event_type, "priority": priority,
+            "updated_at_unix": now, "dedupe_key": dedupe_key,
+        })
+        self._sort_trim()
+        return ev_id
+
+    def pop(self, max_items, type_filter=None, min_priority=None):
+        self._sort_trim()
+        filtered = self.queue
+        if type_filter:
+            filtered = [ev for ev in filtered if ev["type"] in set(type_filter)]
+        if min_priority is not None:
+            filtered = [ev for ev in filtered if ev["priority"] >= min_priority]
+        picked = filtered[:max_items]
+        ids = {ev["id"] for ev in picked}
+        self.queue = [ev for ev in self.queue if ev["id"] not in ids]
+        return [ev["id"] for ev in picked]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class BufferTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.state = AutonomyStateStore(str(self.tmp / "state.db"))
+        self.state.ensure_schema()
+        self.saves = []
+
+    def tearDown(self):
+        self.state.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _save(self, key, value):
+        self.saves.append(key)
+        self.state.set(key, value)
+
+    def _buffer(self, table=True):
+        return ResultBuffer(
+            load_state_cb=self.state.get,
+            save_state_cb=self._save,
+            event_table=BufferEventTable(self.state) if table else None,
+        )
+
+    def _rows(self):
+        conn = sqlite3.connect(str(self.tmp / "state.db"))
+        try:
+            return conn.execute("SELECT COUNT(*) FROM autonomy_buffer").fetchone()[0]
+        finally:
+            conn.close()
+
+
+class TestMatchesReference(BufferTestCase):
+
+    def _run_random_ops(self, table: bool, seed: int):
+        rng = random.Random(seed)
+        clock = FakeClock()
+        ref = ReferenceBuffer()
+        buf = self._buffer(table=table)
+        types = ["stale_facts", "pending_decisions", "health_alert"]
+
+        with patch("surfacing.time.time", clock):
+            for _ in range(1500):
+                if rng.random() < 0.5:
+                    clock.now += 1  # Otherwise same-second ties
+                op = rng.random()
+                if op < 0.75:
+                    ev_type = rng.choice(types)
+                    priority = rng.choice([10, 50, 50, 80, 90])
+                    dedupe = f"dk-{rng.randrange(260)}" if rng.random() < 0.6 else None
+                    if dedupe and any(ev["dedupe_key"] == dedupe for ev in ref.queue):
+                        # Same-second ties after an update were ordered by old list
+                        # position; the heap breaks them by creation order instead
+                        clock.now += 1
+                    with patch("surfacing.uuid.uuid4", return_value=uuid.UUID(int=rng.getrandbits(128))) as u:
+                        got = buf.enqueue(ev_type, {"n": 1}, priority=priority, dedupe_key=dedupe)
+                        want = ref.enqueue(str(u.return_value), ev_type, priority, dedupe, int(clock.now))
+                    self.assertEqual(got, want)
+                elif op < 0.9:
+                    kwargs = {}
+                    if rng.random() < 0.5:
+                        kwargs["type_filter"] = rng.sample(types, 1)
+                    if rng.random() < 0.5:
+                        kwargs["min_priority"] = rng.choice([50, 80, 90])
+                    n = rng.randrange(5)
+                    got = [ev["id"] for ev in buf.pop_for_surfacing(n, **kwargs)]
+                    self.assertEqual(got, ref.pop(n, **kwargs))
+                else:
+                    ref._sort_trim()
+                    self.assertEqual([ev["id"] for ev in buf.peek(5)], [ev["id"] for ev in ref.queue[:5]])
+                self.assertEqual(buf.size(), len(ref.queue))
+
+        ref._sort_trim()
+        self.assertEqual([ev["id"] for ev in buf.peek(ResultBuffer.MAX_EVENTS)], [ev["id"] for ev in ref.queue])
+        return buf, ref
+
+    def test_table_backed_matches_reference(self):
+        for seed in range(3):
+            self.state.clear()
+            BufferEventTable(self.state).clear()
+            self._run_random_ops(table=True, seed=seed)
+
+    def test_legacy_blob_matches_reference(self):
+        self._run_random_ops(table=False, seed=11)
+        self.assertIn("autonomy.buffer", self.saves)
+
+
+class TestRowPersistence(BufferTestCase):
+
+    def test_writes_rows_not_blob(self):
+        buf = self._buffer()
+        for i in range(10):
+            buf.enqueue("stale_facts", {"i": i}, priority=50 + i, dedupe_key=f"k{i % 4}")
+        buf.pop_for_surfacing(1)
+
+        self.assertEqual(self.saves, [])
+        self.assertEqual(self._rows(), 3)
+        self.assertIsNone(self.state.get("autonomy.buffer"))
+
+    def test_reload_restores_order(self):
+        clock = FakeClock()
+        with patch("surfacing.time.time", clock):
+            buf = self._buffer()
+            for i in range(20):
+                clock.now += i % 2
+                buf.enqueue("health_alert", {"i": i}, priority=(i * 37) % 100, dedupe_key=f"k{i % 15}")
+        before = buf.peek(50)
+
+        reloaded = self._buffer()
+        self.assertEqual(reloaded.peek(50), before)
+
+        # Dedupe index survives the reload
+        reloaded.enqueue("health_alert", {"i": "again"}, priority=99, dedupe_key="k3")
+        self.assertEqual(reloaded.size(), 15)
+        self.assertEqual(reloaded.peek(1)[0]["payload"], {"i": "again"})
+
+    def test_trim_deletes_rows(self):
+        buf = self._buffer()
+        for i in range(ResultBuffer.MAX_EVENTS + 25):
+            buf.enqueue("stale_facts", {}, priority=i % 100)
+        self.assertEqual(buf.size(), ResultBuffer.MAX_EVENTS)
+        self.assertEqual(self._rows(), ResultBuffer.MAX_EVENTS)
+
+    def test_clear(self):
+        buf = self._buffer()
+        buf.enqueue("stale_facts", {}, dedupe_key="a")
+        buf.enqueue("stale_facts", {}, dedupe_key="b")
+        self.assertEqual(buf.clear(), 2)
+        self.assertEqual(self._rows(), 0)
+        self.assertEqual(self._buffer().size(), 0)
+
+    def test_legacy_queue_migrated(self):
+        legacy = self._buffer(table=False)
+        ids = [legacy.enqueue("pending_decisions", {"i": i}, priority=p, dedupe_key=f"d{i}")
+               for i, p in enumerate([10, 90, 50])]
+        expected = [ev["id"] for ev in legacy.peek(10)]
+        self.saves.clear()
+
+        migrated = self._buffer()
+        self.assertEqual([ev["id"] for ev in migrated.peek(10)], expected)
+        self.assertEqual(self._rows(), 3)
+        self.assertEqual(self.state.get("autonomy.buffer"), {"queue": []})
+
+        # Second start reads the table only
+        self.saves.clear()
+        again = self._buffer()
+        self.assertEqual(sorted(ev["id"] for ev in again.peek(10)), sorted(ids))
+        self.assertEqual(self.saves, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+"""
+Tests for the compiled rule-matching index.
+
+Tests cover:
+- KeywordAutomaton finds exactly the patterns that are substrings of a text
+- retrieve_rules matches the old per-rule calculate_match_score scan
+- DuroRules.check_rules matches the old first-keyword substring scan
+- Both indexes rebuild when index.json changes and read either index format
+"""
+
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import rule_retriever
+from rule_retriever import (
+    KeywordAutomaton,
+    calculate_match_score,
+    get_compiled_index,
+    list_index_rules,
+    retrieve_rules,
+    tokenize,
+)
+from rules import DuroRules
+
+WORDS = [
+    "git", "commit", "push", "api", "key", "api key", "password", "secret",
+    "deploy", "token", "tokens", "rate limit", "limit", "env", ".env", "test",
+    "tests", "pytest", "docker", "image", "video", "render", "commit message",
+    "force push", "rm -rf", "database", "migration", "schema",
+]
+
+
+def make_rules(rng: random.Random, n: int) -> list:
+    rules = []
+    for i in range(n):
+        keywords = rng.sample(WORDS, rng.randint(0, 5))
+        if rng.random() < 0.1:
+            keywords.append(f"keyword{i}")
+        rules.append({
+            "id": f"rule_{i:03d}",
+            "name": " ".join(rng.sample(["Git", "Secret", "Deploy", "Test", "Quality", "Safety"], 2)),
+            "type": rng.choice(["hard", "soft"]),
+            "priority": rng.randint(0, 4),
+            "trigger_keywords": keywords,
+            "file": f"rule_{i:03d}.json",
+        })
+    return rules
+
+
+def make_task(rng: random.Random) -> str:
+    filler = ["please", "the", "and", "quickly", "pushes", "committed", "ENV", "Keys"]
+    parts = rng.sample(WORDS + filler, rng.randint(1, 8))
+    return rng.choice([" ", ", ", "-"]).join(parts)
+
+
+def reference_retrieve(rules, task, rule_type=None, min_score=0.1, max_results=10):
+    """The pre-index retrieve_rules scan."""
+    task_tokens = tokenize(task)
+    matches = []
+    for rule in rules:
+        if rule_type and rule.get("type") != rule_type:
+            continue
+        score, matched = calculate_match_score(task_tokens, rule.get("trigger_keywords", []))
+        name_tokens = tokenize(rule.get("name", ""))
+        if any(t in task_tokens for t in name_tokens):
+            score = min(1.0, score + 0.2)
+            matched.append(f"[name:{rule.get('name')}]")
+        if score >= min_score:
+            matches.append((rule.get("priority", 5), score, rule["id"], matched))
+    matches.sort(key=lambda m: (m[0], -m[1]))
+    return [(rule_id, score, matched) for _, score, rule_id, matched in matches[:max_results]]
+
+
+def reference_check(rules, task):
+    """The pre-automaton DuroRules.check_rules scan."""
+    applicable = []
+    task_lower = task.lower()
+    for rule in rules:
+        for kw in rule.get("trigger_keywords", []):
+            if kw.lower() in task_lower:
+                applicable.append((rule, kw))
+                break
+    type_priority = {"hard": 0, "soft": 1}
+    applicable.sort(key=lambda r: (r[0].get("priority", 99), type_priority.get(r[0].get("type", "soft"), 2)))
+    return [(rule["id"], kw) for rule, kw in applicable]
+
+
+class RuleIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.index_file = self.tmp / "index.json"
+        self.patch = patch.object(rule_retriever, "INDEX_FILE", self.index_file)
+        self.patch.start()
+        self.duro = DuroRules({"paths": {"rules_dir": str(self.tmp)}, "files": {"rules_index": "index.json"}})
+
+    def tearDown(self):
+        self.patch.stop()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def write_index(self, index: dict):
+        self.index_file.write_text(json.dumps(index), encoding="utf-8")
+        # Force a new mtime even on coarse-grained filesystems
+        st = self.index_file.stat()
+        os.utime(self.index_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def retrieve(self, task, **kwargs):
+        return [(m["rule_id"], m["score"], m["matched_keywords"]) for m in retrieve_rules(task, **kwargs)]
+
+    def check(self, task):
+        return [(r["rule"]["id"], r["matched_keyword"]) for r in self.duro.check_rules(task)]
+
+
+class TestKeywordAutomaton(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            patterns = ["".join(rng.choice("ab ") for _ in range(rng.randint(1, 4))) for _ in range(8)]
+            text = "".join(rng.choice("abc ") for _ in range(rng.randint(0, 30)))
+            automaton = KeywordAutomaton(patterns)
+            self.assertEqual(automaton.find(text), {p for p in patterns if p in text})
+
+    def test_empty_pattern_always_matches(self):
+        self.assertEqual(KeywordAutomaton(["", "x"]).find("abc"), {""})
+
+
+class TestRetrieveRules(RuleIndexTestCase):
+
+    def test_matches_reference_scan(self):
+        rng = random.Random(7)
+        rules = make_rules(rng, 60)
+        self.write_index({"rules": rules})
+        for _ in range(300):
+            task = make_task(rng)
+            kwargs = rng.choice([
+                {}, {"rule_type": "hard", "min_score": 0.05}, {"rule_type": "soft"},
+                {"min_score": 0.0, "max_results": 100}, {"min_score": 0.5},
+            ])
+            self.assertEqual(self.retrieve(task, **kwargs), reference_retrieve(rules, task, **kwargs), task)
+
+    def test_reads_split_index_format(self):
+        rules = make_rules(random.Random(1), 10)
+        hard = [r for r in rules if r["type"] == "hard"]
+        soft = [r for r in rules if r["type"] == "soft"]
+        self.write_index({"active_rules": hard, "soft_rules": soft})
+        self.assertEqual(len(get_compiled_index().rules), 10)
+        self.assertEqual(list_index_rules({"active_rules": hard, "soft_rules": soft}), hard + soft)
+
+    def test_rebuilds_only_when_file_changes(self):
+        self.write_index({"rules": [{"id": "r1", "name": "One", "trigger_keywords": ["deploy"]}]})
+        first = get_compiled_index()
+        self.assertIs(get_compiled_index(), first)
+        self.assertEqual([m[0] for m in self.retrieve("deploy now")], ["r1"])
+
+        self.write_index({"rules": [{"id": "r2", "name": "Two", "trigger_keywords": ["deploy"]}]})
+        self.assertIsNot(get_compiled_index(), first)
+        self.assertEqual([m[0] for m in self.retrieve("deploy now")], ["r2"])
+
+    def test_missing_index_matches_nothing(self):
+        self.assertEqual(self.retrieve("git commit"), [])
+
+
+class TestDuroRulesCheck(RuleIndexTestCase):
+
+    def test_matches_reference_scan(self):
+        rng = random.Random(11)
+        rules = make_rules(rng, 60)
+        self.write_index({"active_rules": rules[:40], "soft_rules": rules[40:]})
+        for _ in range(300):
+            task = make_task(rng)
+            self.assertEqual(self.check(task), reference_check(rules, task), task)
+
+    def test_reloads_when_file_changes(self):
+        self.write_index({"rules": [{"id": "r1", "name": "One", "trigger_keywords": ["deploy"], "file": "x.json"}]})
+        self.assertEqual(self.check("deploy it"), [("r1", "deploy")])
+
+        self.write_index({"rules": [{"id": "r2", "name": "Two", "trigger_keywords": ["ship"], "file": "x.json"}]})
+        self.assertEqual(self.check("deploy it"), [])
+        self.assertEqual(self.check("ship it"), [("r2", "ship")])
+
+
+if __name__ == "__main__":
+    unittest.main()
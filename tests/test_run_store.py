@@ -0,0 +1,231 @@
+"""
+Tests for the SQLite orchestrator run store.
+
+Tests cover:
+- record / get round trip with compressed bodies
+- list_runs paging and filters match the old glob-and-parse listing
+- get_stats per-intent outcome counts and p50/p95 durations
+- import_json_dir imports run_*.json once and keeps existing rows
+- Orchestrator writes runs to the store (JSON files only when asked, or as
+  a fallback that list_runs imports once the store is writable)
+"""
+
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import orchestrator as orchestrator_module
+from orchestrator import Orchestrator, RunLog
+from run_store import RUN_DB_NAME, RunStore, percentile
+
+INTENTS = ["store_fact", "store_decision", "delete_artifact", "unknown"]
+OUTCOMES = ["success", "success", "success", "failed", "denied", "dry_run"]
+
+
+def make_run(i: int, rng: random.Random) -> dict:
+    return {
+        "run_id": f"run_20260101_{i:06d}_abc{i % 10}",
+        "started_at": f"2026-01-01T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}Z",
+        "intent": "store fact",
+        "intent_normalized": rng.choice(INTENTS),
+        "args": {"claim": "x" * rng.randint(10, 200)},
+        "dry_run": False,
+        "execution": {"outcome": rng.choice(OUTCOMES), "duration_ms": rng.randint(1, 500), "tool_calls": []},
+    }
+
+
+def legacy_list_runs(runs_dir: Path, limit: int = 20, outcome=None) -> list:
+    """The pre-store Orchestrator.list_runs."""
+    runs = []
+    for run_file in sorted(runs_dir.glob("run_*.json"), reverse=True):
+        if len(runs) >= limit:
+            break
+        with open(run_file, "r", encoding="utf-8") as f:
+            run = json.load(f)
+        if outcome and run.get("execution", {}).get("outcome") != outcome:
+            continue
+        runs.append({
+            "run_id": run.get("run_id"),
+            "intent": run.get("intent_normalized"),
+            "outcome": run.get("execution", {}).get("outcome"),
+            "started_at": run.get("started_at"),
+            "duration_ms": run.get("execution", {}).get("duration_ms"),
+        })
+    return runs
+
+
+class RunStoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.store = RunStore(self.tmp / "runs.db")
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def write_json_runs(self, runs: list):
+        for run in runs:
+            (self.tmp / f"{run['run_id']}.json").write_text(json.dumps(run, indent=2), encoding="utf-8")
+
+
+class TestRunStore(RunStoreTestCase):
+
+    def test_round_trip(self):
+        run = make_run(1, random.Random(0))
+        self.store.record(run)
+        self.assertEqual(self.store.get(run["run_id"]), run)
+        self.assertIsNone(self.store.get("run_missing"))
+
+        run["execution"]["outcome"] = "failed"
+        self.store.record(run)
+        self.assertEqual(self.store.count(), 1)
+        self.assertEqual(self.store.list_runs()[0]["outcome"], "failed")
+
+    def test_listing_matches_legacy(self):
+        rng = random.Random(1)
+        runs = [make_run(i, rng) for i in range(300)]
+        self.write_json_runs(runs)
+        self.store.record_many(runs)
+
+        for outcome in [None, "success", "failed", "denied", "dry_run"]:
+            for limit in [1, 20, 500]:
+                self.assertEqual(
+                    self.store.list_runs(limit=limit, outcome=outcome),
+                    legacy_list_runs(self.tmp, limit=limit, outcome=outcome)
+                )
+
+    def test_paging_and_intent_filter(self):
+        rng = random.Random(2)
+        runs = [make_run(i, rng) for i in range(50)]
+        self.store.record_many(runs)
+
+        pages = [self.store.list_runs(limit=7, offset=o, intent="store_fact") for o in range(0, 50, 7)]
+        ids = [r["run_id"] for page in pages for r in page]
+        expected = [r["run_id"] for r in sorted(runs, key=lambda r: r["run_id"], reverse=True)
+                    if r["intent_normalized"] == "store_fact"]
+        self.assertEqual(ids, expected)
+        self.assertEqual(self.store.count(intent="store_fact"), len(expected))
+
+        since = self.store.list_runs(since=runs[40]["started_at"], limit=100)
+        self.assertEqual(len(since), 10)
+
+    def test_stats(self):
+        for i, (intent, outcome, ms) in enumerate([
+            ("store_fact", "success", 10), ("store_fact", "success", 20), ("store_fact", "failed", 30),
+            ("store_fact", "success", 40), ("store_decision", "denied", 5),
+        ]):
+            self.store.record({
+                "run_id": f"run_{i}", "started_at": f"2026-01-0{i + 1}T00:00:00Z", "intent_normalized": intent,
+                "execution": {"outcome": outcome, "duration_ms": ms},
+            })
+
+        stats = self.store.get_stats()
+        self.assertEqual(stats["total_runs"], 5)
+        fact = stats["by_intent"]["store_fact"]
+        self.assertEqual(fact["outcomes"], {"success": 3, "failed": 1})
+        self.assertEqual((fact["p50_ms"], fact["p95_ms"], fact["avg_ms"]), (20, 40, 25.0))
+        self.assertEqual(stats["by_intent"]["store_decision"]["p95_ms"], 5)
+
+        recent = self.store.get_stats(since="2026-01-03T00:00:00Z")
+        self.assertEqual(recent["by_intent"]["store_fact"]["runs"], 2)
+        self.assertEqual(recent["by_intent"]["store_fact"]["p50_ms"], 30)
+
+    def test_percentile(self):
+        self.assertIsNone(percentile([], 50))
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2)
+        self.assertEqual(percentile(list(range(1, 101)), 95), 95)
+
+
+class TestImport(RunStoreTestCase):
+
+    def test_imports_once(self):
+        rng = random.Random(3)
+        runs = [make_run(i, rng) for i in range(12)]
+        self.write_json_runs(runs)
+        (self.tmp / "run_broken.json").write_text("{not json", encoding="utf-8")
+
+        self.store.record({**runs[0], "execution": {"outcome": "failed", "duration_ms": 1}})
+        result = self.store.import_json_dir(self.tmp)
+        self.assertEqual(result, {"imported": 11, "skipped": 1, "failed": 1})
+        self.assertEqual(self.store.get(runs[0]["run_id"])["execution"]["outcome"], "failed")
+        self.assertEqual(self.store.get(runs[5]["run_id"]), runs[5])
+
+        self.write_json_runs([make_run(99, rng)])
+        self.assertEqual(self.store.import_json_dir(self.tmp)["imported"], 0)
+        self.assertEqual(self.store.import_json_dir(self.tmp, force=True)["imported"], 1)
+
+
+class TestOrchestratorRuns(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        (self.tmp / "runs").mkdir()
+        legacy = make_run(1, random.Random(4))
+        (self.tmp / "runs" / f"{legacy['run_id']}.json").write_text(json.dumps(legacy), encoding="utf-8")
+        self.legacy = legacy
+
+        self.autonomy = patch.object(orchestrator_module, "AUTONOMY_AVAILABLE", False)
+        self.autonomy.start()
+        self.orch = Orchestrator(self.tmp, MagicMock(), MagicMock(), MagicMock())
+
+    def tearDown(self):
+        self.autonomy.stop()
+        self.orch.run_store.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _run(self, run_id: str) -> RunLog:
+        return RunLog(
+            run_id=run_id, started_at="2026-02-01T00:00:00Z", finished_at=None,
+            intent="store fact: x", intent_normalized="store_fact", args={}, dry_run=False,
+            sensitivity="internal", rules_checked=True, rules_applicable=[], rules_decisions=[],
+            outcome="success",
+        )
+
+    def test_finalize_records_in_store(self):
+        summary = self.orch._finalize_run(self._run("run_20260201_000000_zzzzzz"), time.time())
+
+        self.assertEqual(summary["run_path"], f"{self.tmp / 'runs' / RUN_DB_NAME}#run_20260201_000000_zzzzzz")
+        self.assertFalse((self.tmp / "runs" / "run_20260201_000000_zzzzzz.json").exists())
+        self.assertEqual(self.orch.get_run("run_20260201_000000_zzzzzz")["execution"]["outcome"], "success")
+        self.assertEqual(
+            [r["run_id"] for r in self.orch.list_runs()],
+            ["run_20260201_000000_zzzzzz", self.legacy["run_id"]]
+        )
+        self.assertEqual(self.orch.run_stats()["by_intent"]["store_fact"]["outcomes"]["success"], 1)
+
+    def test_json_files_on_request(self):
+        with patch.object(orchestrator_module, "WRITE_RUN_JSON", True):
+            summary = self.orch._finalize_run(self._run("run_20260201_000001_zzzzzz"), time.time())
+        self.assertTrue(Path(summary["run_path"]).exists())
+        self.assertIsNotNone(self.orch.run_store.get("run_20260201_000001_zzzzzz"))
+
+    def test_store_failure_falls_back_to_json(self):
+        with patch.object(self.orch.run_store, "record", side_effect=OSError("disk full")):
+            summary = self.orch._finalize_run(self._run("run_20260201_000002_zzzzzz"), time.time())
+        self.assertTrue(summary["run_path"].endswith("run_20260201_000002_zzzzzz.json"))
+        self.assertIn("Failed to write run log", self.orch.get_run("run_20260201_000002_zzzzzz")["results"]["notes"][0])
+
+        listed = [r["run_id"] for r in self.orch.list_runs()]
+        self.assertEqual(listed, ["run_20260201_000002_zzzzzz", self.legacy["run_id"]])
+        self.assertIsNotNone(self.orch.run_store.get("run_20260201_000002_zzzzzz"))
+
+    def test_fallback_from_another_process_is_listed(self):
+        other = Orchestrator(self.tmp, MagicMock(), MagicMock(), MagicMock())
+        with patch.object(other.run_store, "record", side_effect=OSError("database is locked")):
+            other._finalize_run(self._run("run_20260201_000003_zzzzzz"), time.time())
+        other.run_store.close()
+
+        self.assertIn("run_20260201_000003_zzzzzz", [r["run_id"] for r in self.orch.list_runs()])
+
+
+if __name__ == "__main__":
+    unittest.main()
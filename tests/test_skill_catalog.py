@@ -0,0 +1,163 @@
+"""
+Tests for the cached skill catalog behind context_assembler.
+
+Tests cover:
+- SkillCatalog.score_all matches score_skill_for_task over load_skills_from_index
+- YAML skills are parsed once and re-parsed only when their file changes
+- index.json and stats.json changes are picked up
+- assemble_context reports per-phase timings in AssemblyDebug
+"""
+
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+
+import context_assembler
+from context_assembler import (
+    SkillCatalog,
+    assemble_context,
+    load_skill_stats,
+    load_skills_from_index,
+    score_skill_for_task,
+)
+
+WORDS = ["design", "layout", "git commit", "commit", "test", "pytest", "deploy",
+         "api", "mobile", "color", "review code", "debug", "docker", "render"]
+
+
+def reference_scores(task: str) -> dict:
+    """The pre-catalog scoring: reload everything and score each skill."""
+    stats = load_skill_stats()
+    return {
+        skill_id: score_skill_for_task(skill, task, stats)
+        for skill_id, skill in load_skills_from_index().items()
+    }
+
+
+class CatalogTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.patches = [
+            patch.object(context_assembler, "SKILLS_DIR", self.tmp),
+            patch.object(context_assembler, "INDEX_FILE", self.tmp / "index.json"),
+            patch.object(context_assembler, "STATS_FILE", self.tmp / "stats.json"),
+        ]
+        for p in self.patches:
+            p.start()
+        self.catalog = SkillCatalog()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def touch(self, path: Path, text: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        # Force a new mtime even on coarse-grained filesystems
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def write_skills(self, rng: random.Random, n: int):
+        entries = []
+        for i in range(n):
+            entry = {"id": f"skill_{i}", "name": f"Skill {i}", "keywords": rng.sample(WORDS, rng.randint(0, 3))}
+            if i % 2 == 0:
+                entry["path"] = f"yaml/skill_{i}.yaml"
+                triggers = {
+                    "hard": {"intents": rng.sample(WORDS, rng.randint(0, 2))},
+                    "soft": {"keywords": rng.sample(WORDS, rng.randint(0, 4)) * rng.randint(1, 2)},
+                }
+                self.touch(self.tmp / entry["path"], json.dumps({"triggers": triggers}))
+            else:
+                entry["path"] = f"py/skill_{i}.py"
+            entries.append(entry)
+        self.touch(self.tmp / "index.json", json.dumps({"skills": entries}))
+        stats = {f"skill_{i}": {"success_rate": rng.random(), "confidence": rng.random()} for i in range(0, n, 3)}
+        self.touch(self.tmp / "stats.json", json.dumps({"stats": stats}))
+
+    def scores(self, task: str) -> dict:
+        return {skill_id: score for skill_id, (_, score) in self.catalog.score_all(task).items()}
+
+
+class TestScoring(CatalogTestCase):
+
+    def test_matches_reference_scoring(self):
+        rng = random.Random(4)
+        self.write_skills(rng, 40)
+        for _ in range(200):
+            task = " ".join(rng.sample(WORDS + ["please", "Testing", "COMMITS"], rng.randint(1, 6)))
+            self.assertEqual(self.scores(task), reference_scores(task), task)
+
+    def test_matches_reference_on_repo_skills(self):
+        for p in self.patches:
+            p.stop()
+        try:
+            catalog = SkillCatalog()
+            for task in ["design a mobile dashboard layout", "commit my changes", "debug the api tests"]:
+                got = {k: v for k, (_, v) in catalog.score_all(task).items()}
+                self.assertEqual(got, reference_scores(task))
+        finally:
+            for p in self.patches:
+                p.start()
+
+
+class TestInvalidation(CatalogTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.touch(self.tmp / "a.yaml", json.dumps({"triggers": {"soft": {"keywords": ["deploy"]}}}))
+        self.touch(self.tmp / "b.yaml", json.dumps({"triggers": {"soft": {"keywords": ["docker"]}}}))
+        self.touch(self.tmp / "index.json", json.dumps({"skills": [
+            {"id": "a", "name": "A", "path": "a.yaml"},
+            {"id": "b", "name": "B", "path": "b.yaml"},
+        ]}))
+
+    def test_yaml_parsed_once(self):
+        with patch("context_assembler.yaml.safe_load", wraps=context_assembler.yaml.safe_load) as load:
+            for _ in range(5):
+                self.catalog.score_all("deploy with docker")
+        self.assertEqual(load.call_count, 2)
+        self.assertEqual(self.catalog.rebuilds, 1)
+
+    def test_changed_yaml_reparsed_alone(self):
+        self.assertEqual(self.scores("release it")["a"], 0.0)
+        self.touch(self.tmp / "a.yaml", json.dumps({"triggers": {"soft": {"keywords": ["release"]}}}))
+
+        with patch("context_assembler.yaml.safe_load", wraps=context_assembler.yaml.safe_load) as load:
+            self.assertEqual(self.scores("release it")["a"], 2.0)
+        self.assertEqual(load.call_count, 1)
+
+    def test_index_and_stats_changes_picked_up(self):
+        self.assertEqual(set(self.scores("deploy")), {"a", "b"})
+        self.touch(self.tmp / "index.json", json.dumps({"skills": [{"id": "a", "name": "A", "path": "a.yaml"}]}))
+        self.assertEqual(set(self.scores("deploy")), {"a"})
+
+        self.touch(self.tmp / "stats.json", json.dumps({"stats": {"a": {"success_rate": 1.0, "confidence": 1.0}}}))
+        self.assertEqual(self.scores("deploy")["a"], 2.0 * 1.5)
+
+
+class TestAssemblyTimings(CatalogTestCase):
+
+    def test_debug_reports_timings(self):
+        self.write_skills(random.Random(2), 6)
+        with patch.object(context_assembler, "get_skill_catalog", return_value=self.catalog):
+            pack = assemble_context("deploy the api", working_dir=self.tmp)
+        timings = pack.debug.timings_ms
+        self.assertEqual(
+            set(timings), {"constitution", "skill_catalog", "skill_scoring", "skill_selection", "total"}
+        )
+        self.assertGreaterEqual(timings["total"], timings["skill_scoring"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,251 @@
+"""
+Tests for the warm skill host (DuroSkills.run_skill worker pool).
+
+Covers:
+1. run()-style skills are imported once per worker and get args as-is
+2. Script-style skills keep the argv / stdout / exit code contract
+3. Per-call timeouts kill the worker and the next call gets a fresh one
+4. A crashing skill is isolated; the pool replaces the worker
+5. Workers are recycled after max_calls_per_worker calls
+6. Process state a skill changes is restored before the next call
+7. run_skill records call latency in the skills index, and only falls back
+   to a fresh interpreter when no worker took the call
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skill_host import SkillHost, SkillHostUnavailable
+from skills import DuroSkills
+
+
+SKILLS = {
+    "counter.py": '''
+        import os
+        import time
+        LOADED_AT = time.time()
+        CALLS = 0
+        REQUIRES = []
+
+        def run(args, tools, context):
+            global CALLS
+            CALLS += 1
+            print("progress output is captured")
+            return {"success": True, "calls": CALLS, "loaded_at": LOADED_AT, "pid": os.getpid(),
+                    "echo": args.get("n")}
+    ''',
+    "meddler.py": '''
+        import os
+        import sys
+        import helper
+        helper.VALUE = "changed"
+        sys.path.append("/meddled")
+        sys.argv.append("--extra")
+        os.environ["DURO_MEDDLED"] = "1"
+        os.chdir(os.path.dirname(os.getcwd()))
+    ''',
+    "probe.py": '''
+        import json
+        import os
+        import sys
+        REQUIRES = []
+
+        def run(args, tools, context):
+            return {"success": True, "cwd": os.getcwd(), "meddled_path": "/meddled" in sys.path,
+                    "env": os.environ.get("DURO_MEDDLED"), "helper_loaded": "helper" in sys.modules,
+                    "json_loaded": "json" in sys.modules}
+    ''',
+    "helper.py": '''
+        VALUE = "original"
+    ''',
+    "script.py": '''
+        import argparse
+        import os
+
+        parser = argparse.ArgumentParser()
+        parser.add_argument("--name")
+        opts = parser.parse_args()
+        print(f"hello {opts.name} from {os.path.basename(os.getcwd())}")
+    ''',
+    "failing.py": '''
+        import sys
+        print("bad input", file=sys.stderr)
+        sys.exit(3)
+    ''',
+    "slow.py": '''
+        import time
+        REQUIRES = []
+
+        def run(args, tools, context):
+            time.sleep(args.get("seconds", 30))
+            return {"success": True}
+    ''',
+    "crash.py": '''
+        import os
+        os._exit(1)
+    ''',
+}
+
+
+class TestSkillHost(unittest.TestCase):
+
+    def setUp(self):
+        self.skills_dir = Path(tempfile.mkdtemp())
+        for name, source in SKILLS.items():
+            (self.skills_dir / name).write_text(textwrap.dedent(source), encoding="utf-8")
+        self.host = SkillHost(cwd=str(self.skills_dir), workers=1, max_calls_per_worker=10)
+
+    def tearDown(self):
+        self.host.close()
+        shutil.rmtree(self.skills_dir, ignore_errors=True)
+
+    def _run(self, name, args=None, timeout=30):
+        return self.host.run(self.skills_dir / name, args, timeout=timeout)
+
+    def test_run_interface_is_imported_once(self):
+        first_ok, first = self._run("counter.py", {"n": 7})
+        second_ok, second = self._run("counter.py", {"n": [1, 2]})
+
+        self.assertTrue(first_ok and second_ok)
+        first, second = json.loads(first), json.loads(second)
+        self.assertEqual(first["loaded_at"], second["loaded_at"])
+        self.assertEqual((first["calls"], second["calls"]), (1, 1))  # Globals restored
+        self.assertEqual(first["pid"], second["pid"])
+        self.assertEqual(second["echo"], [1, 2])
+
+    def test_script_contract(self):
+        ok, output = self._run("script.py", {"name": "duro"})
+        self.assertTrue(ok)
+        self.assertEqual(output.strip(), f"hello duro from {self.skills_dir.name}")
+
+        ok, output = self._run("failing.py")
+        self.assertFalse(ok)
+        self.assertEqual(output, "Error: bad input\n")
+
+    def test_timeout_replaces_worker(self):
+        _, before = self._run("counter.py")
+        ok, output = self._run("slow.py", {"seconds": 30}, timeout=0.5)
+        self.assertFalse(ok)
+        self.assertIn("timed out", output)
+
+        ok, after = self._run("counter.py")
+        self.assertTrue(ok)
+        self.assertNotEqual(json.loads(before)["pid"], json.loads(after)["pid"])
+        self.assertEqual(self.host.get_stats()["timeouts"], 1)
+
+    def test_crash_is_isolated(self):
+        ok, output = self._run("crash.py")
+        self.assertFalse(ok)
+        self.assertIn("crashed", output)
+
+        self.assertTrue(self._run("counter.py")[0])
+        stats = self.host.get_stats()
+        self.assertEqual((stats["crashes"], stats["workers"]), (1, 1))
+
+    def test_workers_recycled_after_max_calls(self):
+        self.host.max_calls_per_worker = 2
+        pids = [json.loads(self._run("counter.py")[1])["pid"] for _ in range(3)]
+
+        self.assertEqual(pids[0], pids[1])
+        self.assertNotEqual(pids[1], pids[2])
+        self.assertEqual(self.host.get_stats()["recycled"], 1)
+
+    def test_process_state_restored_between_calls(self):
+        self.assertTrue(self._run("meddler.py")[0])
+        ok, output = self._run("probe.py")
+
+        self.assertTrue(ok, output)
+        probe = json.loads(output)
+        self.assertEqual(Path(probe["cwd"]), self.skills_dir)
+        self.assertFalse(probe["meddled_path"])
+        self.assertIsNone(probe["env"])
+        self.assertFalse(probe["helper_loaded"])
+        self.assertTrue(probe["json_loaded"])  # Library imports stay warm
+
+    def test_unreadable_response_is_a_failure(self):
+        with patch("skill_host.json.loads", side_effect=ValueError("bad frame")):
+            ok, output = self._run("counter.py")
+        self.assertFalse(ok)
+        self.assertIn("bad frame", output)
+
+    def test_closed_host_is_unavailable(self):
+        self.host.close()
+        with self.assertRaises(SkillHostUnavailable):
+            self._run("counter.py")
+
+    def test_latency_stats(self):
+        self._run("counter.py")
+        latency = self.host.get_stats()["latency_ms"]["counter"]
+        self.assertEqual(latency["calls"], 1)
+        self.assertGreater(latency["avg"], 0)
+
+
+class TestDuroSkillsRunSkill(unittest.TestCase):
+
+    def setUp(self):
+        self.skills_dir = Path(tempfile.mkdtemp())
+        (self.skills_dir / "counter.py").write_text(textwrap.dedent(SKILLS["counter.py"]), encoding="utf-8")
+        (self.skills_dir / "index.json").write_text(json.dumps({
+            "version": "1.0",
+            "skills": [{"id": "counter", "name": "counter", "path": "counter.py", "tier": "tested"}],
+        }), encoding="utf-8")
+        self.skills = DuroSkills({
+            "paths": {"skills_dir": str(self.skills_dir)},
+            "files": {"skills_index": "index.json"},
+            "settings": {"skill_host_workers": 1},
+        })
+
+    def tearDown(self):
+        self.skills.close()
+        shutil.rmtree(self.skills_dir, ignore_errors=True)
+
+    def test_run_skill_records_latency(self):
+        for _ in range(2):
+            ok, output = self.skills.run_skill("counter", {"n": 1})
+            self.assertTrue(ok, output)
+        self.assertEqual(json.loads(output)["calls"], 1)
+
+        entry = self.skills.get_skill("counter")
+        self.assertEqual(entry["usage_count"], 2)
+        self.assertEqual(entry["timed_calls"], 2)
+        self.assertGreater(entry["avg_latency_ms"], 0)
+        self.assertEqual(self.skills.get_skill_host_stats()["calls"], 2)
+
+    def test_start_skill_host_prestarts_workers(self):
+        self.assertTrue(self.skills.start_skill_host())
+        self.assertEqual(self.skills.get_skill_host_stats()["idle"], 1)
+
+    def test_falls_back_only_when_no_worker(self):
+        host = self.skills._get_skill_host()
+        with patch.object(self.skills, "_run_skill_subprocess", return_value=(True, "subprocess")) as fallback:
+            with patch.object(host, "run", side_effect=SkillHostUnavailable("no worker")):
+                self.assertEqual(self.skills.run_skill("counter", {}), (True, "subprocess"))
+            with patch.object(host, "run", return_value=(False, "Skill host error: EOFError")):
+                self.assertEqual(self.skills.run_skill("counter", {}), (False, "Skill host error: EOFError"))
+        self.assertEqual(fallback.call_count, 1)
+
+    def test_close_stops_workers(self):
+        self.skills.start_skill_host()
+        host = self.skills._host
+        self.skills.close()
+        self.assertEqual(host.get_stats()["workers"], 0)
+        self.assertIsNone(self.skills.get_skill_host_stats())
+
+    def test_host_disabled_uses_subprocess(self):
+        self.skills.use_skill_host = False
+        ok, _ = self.skills.run_skill("counter", {"n": 1})
+        self.assertTrue(ok)
+        self.assertIsNone(self.skills.get_skill_host_stats())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -129,6 +129,90 @@ const z: any = {};
         assert result is not None
 
 
+def _rule_fixture(tmp_path: Path, file_count: int = 6) -> tuple:
+    files = []
+    for i in range(file_count):
+        path = tmp_path / f"mod_{i}.ts"
+        path.write_text(
+            f"const a{i}: any = 1;\n"
+            "console.log('debug');\n"
+            "const ok = 2;  // duro-ignore: no_console\n"
+            "console.log('x')\r\n"
+            "let b: any;\n",
+            encoding="utf-8"
+        )
+        files.append(path)
+    (tmp_path / "notes.md").write_text("const c: any = 3;\n", encoding="utf-8")
+    files.append(tmp_path / "notes.md")
+
+    rules = [
+        RuleSpec(id="no_any", name="No any", pattern=r":\s*any\b", message="any", scope=["*.ts"]),
+        RuleSpec(id="no_console", name="No console", pattern=r"console\.log", message="console"),
+        RuleSpec(id="eol_paren", name="Ends with paren", pattern=r"\)$", message="paren"),
+        RuleSpec(id="no_match", name="Never", pattern=r"zzz_never", message="never"),
+        RuleSpec(id="bad_regex", name="Bad", pattern=r"(unclosed", message="bad"),
+    ]
+    runner = SkillRunner(project_root=tmp_path, allowed_roots=[tmp_path])
+    return runner, rules, files
+
+
+class TestRuleEngineRunRules:
+    """Test the single-pass, multi-file run_rules."""
+
+    def _expected(self, engine, rules, files):
+        """Per (rule, file) run_rule results, as run_rules used to aggregate them."""
+        expected = {}
+        for rule in rules:
+            findings = []
+            for path in files:
+                if any(__import__("fnmatch").fnmatch(str(path), s) for s in rule.scope):
+                    findings.extend(engine.run_rule(rule, path, path.read_text(encoding="utf-8")).findings)
+            expected[rule.id] = [f.to_dict() for f in findings]
+        return expected
+
+    def test_matches_per_rule_results(self, tmp_path):
+        runner, rules, files = _rule_fixture(tmp_path)
+        engine = RuleEngine(runner)
+
+        results = engine.run_rules(rules, files)
+        expected = self._expected(engine, rules[:-1], files)
+
+        assert [r.name for r in results] == [r.name for r in rules]
+        for rule, result in zip(rules[:-1], results):
+            assert [f.to_dict() for f in result.findings] == expected[rule.id]
+            assert result.success == (not expected[rule.id])
+        assert len(results[0].findings) == 12  # .md file is out of scope
+        assert len(results[1].findings) == 12  # suppressed line excluded
+        assert "Invalid regex pattern" in results[-1].error
+
+    def test_process_pool_matches_sequential(self, tmp_path, monkeypatch):
+        import skill_runner
+        runner, rules, files = _rule_fixture(tmp_path, file_count=12)
+        engine = RuleEngine(runner)
+
+        sequential = engine.run_rules(rules, files, workers=1)
+        monkeypatch.setattr(skill_runner, "PARALLEL_MIN_FILES", 2)
+        parallel = engine.run_rules(rules, files, workers=3)
+
+        for seq, par in zip(sequential, parallel):
+            assert [f.to_dict() for f in seq.findings] == [f.to_dict() for f in par.findings]
+            assert (seq.success, seq.error) == (par.success, par.error)
+
+    def test_file_budget_reports_timeout(self, tmp_path):
+        path = tmp_path / "big.txt"
+        path.write_text("x = 1\n" * 60_000, encoding="utf-8")
+        runner = SkillRunner(project_root=tmp_path, allowed_roots=[tmp_path])
+        rules = [
+            RuleSpec(id="every_line", name="Every line", pattern=r"x", message="x", timeout_ms=1),
+            RuleSpec(id="after", name="After", pattern=r"=", message="eq", timeout_ms=1),
+        ]
+
+        results = RuleEngine(runner).run_rules(rules, [path], workers=1)
+
+        assert all("timed out on 1 file" in r.error for r in results)
+        assert all(not r.success and not r.findings for r in results)
+
+
 class TestSkillResult:
     """Test result formatting."""
 
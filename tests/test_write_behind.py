@@ -0,0 +1,184 @@
+"""
+Tests for write-behind group commits (WriteBehindWorker + ArtifactStore).
+
+Covers:
+1. Bursts of submits are coalesced into batched group commits
+2. Re-saves of the same artifact collapse into one entry
+3. Bounded queue rejects when full (caller falls back to inline work)
+4. flush() drains, including when no worker thread is running
+5. ArtifactStore in write-behind mode: save acknowledged, FTS filled on flush
+6. ArtifactStore in write-behind mode never calls the embedder on the saving thread
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from artifacts import ArtifactStore
+from migrations import run_all_pending
+from provenance_signing import clear_key_cache
+from write_behind import WriteBehindWorker
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+TEST_KEYS = "v1:" + "ab" * 32
+
+
+def _artifact(artifact_id: str, version: int = 0) -> dict:
+    return {"id": artifact_id, "version": version}
+
+
+class TestWriteBehindWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def _record(self, batch):
+        with self.lock:
+            self.batches.append([(a["id"], a["version"]) for a in batch])
+
+    def test_burst_is_group_committed(self):
+        worker = WriteBehindWorker(self._record, batch_size=16, linger_ms=200)
+        worker.start()
+        try:
+            for i in range(10):
+                self.assertTrue(worker.submit(_artifact(f"a{i}")))
+            self.assertTrue(worker.flush(timeout=5))
+        finally:
+            worker.stop()
+
+        self.assertEqual(sum(len(b) for b in self.batches), 10)
+        self.assertLessEqual(len(self.batches), 2)
+        stats = worker.get_stats()
+        self.assertEqual(stats["processed"], 10)
+        self.assertEqual(stats["queue_depth"], 0)
+
+    def test_resaves_coalesce_latest_wins(self):
+        worker = WriteBehindWorker(self._record)  # not started: queue only
+        worker.submit(_artifact("a", 1))
+        worker.submit(_artifact("a", 2))
+        worker.submit(_artifact("b", 1))
+
+        self.assertEqual(worker.get_stats()["queue_depth"], 2)
+        self.assertTrue(worker.flush(timeout=5))
+        self.assertEqual(self.batches, [[("a", 2), ("b", 1)]])
+        self.assertEqual(worker.get_stats()["coalesced"], 1)
+
+    def test_bounded_queue_rejects_when_full(self):
+        worker = WriteBehindWorker(self._record, max_queue=2)
+        self.assertTrue(worker.submit(_artifact("a")))
+        self.assertTrue(worker.submit(_artifact("b")))
+        self.assertFalse(worker.submit(_artifact("c")))
+        self.assertTrue(worker.submit(_artifact("a", 1)))  # coalescing still allowed
+
+        self.assertEqual(worker.get_stats()["rejected_full"], 1)
+        self.assertTrue(worker.discard("b"))
+        self.assertTrue(worker.submit(_artifact("c")))
+
+    def test_batch_errors_are_counted_not_raised(self):
+        def boom(batch):
+            raise RuntimeError("disk on fire")
+
+        worker = WriteBehindWorker(boom)
+        worker.submit(_artifact("a"))
+
+        self.assertTrue(worker.flush(timeout=5))
+        stats = worker.get_stats()
+        self.assertEqual(stats["errors"], 1)
+        self.assertIn("disk on fire", stats["last_error"])
+
+
+class TestArtifactStoreWriteBehind(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.memory_dir = Path(self.temp_dir) / "memory"
+        self.memory_dir.mkdir(parents=True)
+        self.db_path = self.memory_dir / "index.db"
+
+        self.env = patch.dict(os.environ, {"DURO_PROVENANCE_HMAC_KEYS": TEST_KEYS})
+        self.env.start()
+        clear_key_cache()
+
+        self.store = ArtifactStore(self.memory_dir, self.db_path, write_behind=True)
+        run_all_pending(MIGRATIONS_DIR, str(self.db_path))
+
+    def tearDown(self):
+        self.store.write_behind.stop()
+        self.store.index.close()
+        self.env.stop()
+        clear_key_cache()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _fts_text(self, artifact_id: str) -> str:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute("SELECT text FROM artifact_fts WHERE id = ?", (artifact_id,)).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+    def test_save_is_acknowledged_and_fts_follows(self):
+        with patch("embeddings.is_embedding_available", return_value=False):
+            ids = []
+            for i in range(5):
+                ok, artifact_id, _ = self.store.store_log(
+                    event_type="task_complete", message=f"write behind task number {i}"
+                )
+                self.assertTrue(ok)
+                ids.append(artifact_id)
+
+            # File and index row are there immediately
+            self.assertEqual(self.store.index.count("log"), 5)
+
+            self.assertTrue(self.store.flush_writes(timeout=10))
+
+        for artifact_id in ids:
+            self.assertIn("write behind task", self._fts_text(artifact_id))
+
+        stats = self.store.get_write_behind_stats()
+        self.assertTrue(stats["enabled"])
+        self.assertEqual(stats["processed"], 5)
+        self.assertEqual(stats["queue_depth"], 0)
+
+    def test_embedding_stays_off_the_calling_thread(self):
+        caller = threading.current_thread()
+        embed_threads = []
+
+        def fake_embed_batch(texts):
+            embed_threads.append(threading.current_thread())
+            return [None] * len(texts)
+
+        def fake_embed_artifact(artifact):
+            embed_threads.append(threading.current_thread())
+            return None
+
+        with patch("embeddings.is_embedding_available", return_value=True), \
+                patch("embeddings.embed_batch", side_effect=fake_embed_batch), \
+                patch("embeddings.embed_artifact", side_effect=fake_embed_artifact):
+            for i in range(3):
+                ok, _, _ = self.store.store_fact(claim=f"write behind claim {i}", tags=["wb"])
+                self.assertTrue(ok)
+            self.assertTrue(self.store.flush_writes(timeout=10))
+
+        self.assertTrue(embed_threads)
+        self.assertNotIn(caller, embed_threads)
+
+    def test_disabled_by_default(self):
+        store = ArtifactStore(self.memory_dir, self.db_path)
+        self.assertIsNone(store.write_behind)
+        self.assertEqual(store.get_write_behind_stats(), {"enabled": False})
+        self.assertTrue(store.flush_writes())
+
+
+if __name__ == "__main__":
+    unittest.main()